@@ -0,0 +1,141 @@
+using System.Text.Json;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.IO;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.BatchHost;
+
+// One request line: either {"id": ..., "path": "<fixture.json>"} or an inline fixture-format
+// object ({"name", "input", "options"}). Only input and options are read; expectations are left
+// to the caller. Binary inputs are resolved against the fixture directory (or the working
+// directory for inline requests). A request with an "output" path gets its tetrahedra written to
+// that .m2tb file instead of the response line (see tools/mesh2tetra_client.py).
+internal sealed class BatchRequest
+{
+    private static readonly JsonSerializerOptions JsonOptions = new()
+    {
+        PropertyNameCaseInsensitive = true,
+        ReadCommentHandling = JsonCommentHandling.Skip,
+        AllowTrailingCommas = true,
+    };
+
+    public string? Id { get; init; }
+    public string? Path { get; init; }
+    public string? Output { get; init; }
+    public string? Name { get; init; }
+    public RequestInput? Input { get; init; }
+    public RequestOptions? Options { get; init; }
+
+    // A fixture with a binary sidecar is mapped rather than read; the returned file must stay open
+    // until the item has been converted.
+    public static Mesh2TetraBatchItem Parse(string line, int lineNumber, Mesh2TetraResultCache? cache, out BinaryMeshFile? binary, out string? output)
+    {
+        var request = Deserialize(line, $"request line {lineNumber}");
+        var id = request.Id ?? request.Path ?? request.Name ?? $"line-{lineNumber}";
+        output = request.Output;
+        if (output is not null)
+        {
+            // Reject an unusable output path now rather than after the conversion has run.
+            if (string.IsNullOrWhiteSpace(output))
+            {
+                throw new InvalidDataException($"Request '{id}' has an empty output path.");
+            }
+
+            System.IO.Path.GetFullPath(output);
+        }
+
+        if (request.Path is not null)
+        {
+            if (string.IsNullOrWhiteSpace(request.Path))
+            {
+                throw new InvalidDataException($"Request '{id}' has an empty path.");
+            }
+
+            var fixture = Deserialize(File.ReadAllText(request.Path), request.Path);
+            return fixture.ToItem(id, System.IO.Path.GetDirectoryName(System.IO.Path.GetFullPath(request.Path))!, cache, out binary);
+        }
+
+        return request.ToItem(id, Directory.GetCurrentDirectory(), cache, out binary);
+    }
+
+    private static BatchRequest Deserialize(string json, string source)
+        => JsonSerializer.Deserialize<BatchRequest>(json, JsonOptions)
+            ?? throw new InvalidDataException($"Empty request in {source}.");
+
+    private Mesh2TetraBatchItem ToItem(string id, string baseDirectory, Mesh2TetraResultCache? cache, out BinaryMeshFile? binary)
+    {
+        binary = null;
+        if (Input is null)
+        {
+            throw new InvalidDataException($"Request '{id}' has neither a path nor an input mesh.");
+        }
+
+        // Options are checked before a binary input is mapped, so a bad request leaves nothing open.
+        var options = (Options ?? new RequestOptions()).ToOptions(cache);
+        if (Input.Binary is not null)
+        {
+            if (string.IsNullOrWhiteSpace(Input.Binary))
+            {
+                throw new InvalidDataException($"Request '{id}' has an empty binary input path.");
+            }
+
+            binary = BinaryMeshFile.Open(System.IO.Path.Combine(baseDirectory, Input.Binary));
+            return new Mesh2TetraBatchItem(id, binary.Vertices, binary.Faces, options);
+        }
+
+        if (Input.Vertices is null || Input.Faces is null)
+        {
+            throw new InvalidDataException($"Request '{id}' has a null vertex or face list.");
+        }
+
+        var vertices = Input.Vertices.Select(v => v is { Length: 3 }
+            ? new Vector3d(v[0], v[1], v[2])
+            : throw new InvalidDataException($"Request '{id}' has a vertex without 3 coordinates.")).ToArray();
+        var faces = Input.Faces.Select(f => f is { Length: 3 }
+            ? new Face(f[0], f[1], f[2])
+            : throw new InvalidDataException($"Request '{id}' has a non-triangular face.")).ToArray();
+
+        return new Mesh2TetraBatchItem(id, vertices, faces, options);
+    }
+}
+
+internal sealed class RequestInput
+{
+    public List<double[]> Vertices { get; init; } = [];
+    public List<int[]> Faces { get; init; } = [];
+    public string? Binary { get; init; }
+}
+
+// Mirrors the "options" block of the regression fixtures, plus timeBudgetMs (see
+// Mesh2TetraOptions.TimeBudget). Verbose is ignored: stdout carries the response stream.
+internal sealed class RequestOptions
+{
+    public bool CheckInput { get; init; } = true;
+    public bool? CheckSelfIntersections { get; init; }
+    public bool? AutoResolveIntersections { get; init; }
+    public bool? FailOnSelfIntersections { get; init; }
+    public double PlaneDistanceTolerance { get; init; } = 1e-10;
+    public double Epsilon { get; init; } = 1e-8;
+    public double? TimeBudgetMs { get; init; }
+
+    public Mesh2TetraOptions ToOptions(Mesh2TetraResultCache? cache)
+    {
+        // NaN fails both comparisons.
+        if (TimeBudgetMs is { } budget && !(budget >= 0 && budget < TimeSpan.MaxValue.TotalMilliseconds))
+        {
+            throw new InvalidDataException($"timeBudgetMs must be a non-negative number of milliseconds that fits a TimeSpan, got {budget}.");
+        }
+
+        return new()
+        {
+            Verbose = false,
+            CheckInput = CheckInput,
+            AutoResolveIntersections = AutoResolveIntersections ?? CheckSelfIntersections ?? true,
+            FailOnSelfIntersections = FailOnSelfIntersections ?? CheckSelfIntersections ?? true,
+            PlaneDistanceTolerance = PlaneDistanceTolerance,
+            Epsilon = Epsilon,
+            TimeBudget = TimeBudgetMs is { } ms ? TimeSpan.FromMilliseconds(ms) : null,
+            ResultCache = cache,
+        };
+    }
+}
@@ -0,0 +1,186 @@
+using System.Collections.Concurrent;
+using System.Text.Json;
+using GenMesh.Mesh2Tetra;
+using GenMesh.Mesh2Tetra.BatchHost;
+using GenMesh.Mesh2Tetra.Diagnostics;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.IO;
+using GenMesh.Mesh2Tetra.Models;
+
+// Long-lived converter process for batch runs (see tools/run_batch.py). Reads one JSON request per
+// stdin line, converts on a bounded worker pool and writes one JSON response per stdout line in
+// completion order. Exits once stdin is closed and every accepted request has been answered.
+// Requests naming an output file get their tetrahedra written there as a .m2tb mesh (no vertices
+// or faces), so a client sharing the files through /dev/shm never serializes the arrays. A request
+// that runs out of its timeBudgetMs is answered with the partial tetrahedra and a "status" of
+// "TimedOut".
+var workers = -1;
+var emitTetrahedra = false;
+string? tracePath = null;
+string? cachePath = null;
+var cacheMaxBytes = Mesh2TetraResultCache.DefaultMaxBytes;
+for (var i = 0; i < args.Length; i++)
+{
+    switch (args[i])
+    {
+        case "--workers":
+            workers = int.Parse(args[++i]);
+            break;
+        case "--emit-tetrahedra":
+            emitTetrahedra = true;
+            break;
+        case "--trace":
+            tracePath = args[++i];
+            break;
+        case "--cache":
+            cachePath = args[++i];
+            break;
+        case "--cache-max-mb":
+            cacheMaxBytes = long.Parse(args[++i]) << 20;
+            break;
+        default:
+            Console.Error.WriteLine($"Unknown argument: {args[i]}");
+            Console.Error.WriteLine("Usage: GenMesh.Mesh2Tetra.BatchHost [--workers N] [--emit-tetrahedra] [--trace <file.jsonl>] [--cache <dir> [--cache-max-mb N]]");
+            return 2;
+    }
+}
+
+// Activities of every conversion go to the trace file (see tools/trace_summary.py).
+using var trace = tracePath is null ? null : new TraceFileWriter(tracePath);
+var output = new StreamWriter(Console.OpenStandardOutput()) { AutoFlush = false };
+var outputLock = new object();
+var cache = cachePath is null ? null : new Mesh2TetraResultCache(cachePath, cacheMaxBytes);
+var mappedInputs = new ConcurrentDictionary<Mesh2TetraBatchItem, BinaryMeshFile>(ReferenceEqualityComparer.Instance);
+var outputs = new ConcurrentDictionary<Mesh2TetraBatchItem, string>(ReferenceEqualityComparer.Instance);
+
+await foreach (var result in Mesh2TetraConverter.ConvertBatchAsync(ReadRequests(), maxConcurrency: workers))
+{
+    outputs.TryRemove(result.Item, out var outputPath);
+    Dictionary<string, object?> response;
+    if (!result.Succeeded)
+    {
+        response = Failure(result.Id, result.Error!, result.Elapsed);
+    }
+    else if (outputPath is null)
+    {
+        response = Success(result, emitTetrahedra);
+    }
+    else
+    {
+        try
+        {
+            BinaryMeshFile.Write(outputPath, [], [], result.Tetrahedra!);
+            response = Success(result, emitTetrahedra: false);
+            response["output"] = outputPath;
+        }
+        catch (Exception ex)
+        {
+            // An unwritable output fails its own request, not the host.
+            response = Failure(result.Id, ex, result.Elapsed);
+        }
+    }
+
+    Write(response);
+
+    if (mappedInputs.TryRemove(result.Item, out var binary))
+    {
+        binary.Dispose();
+    }
+}
+
+return 0;
+
+async IAsyncEnumerable<Mesh2TetraBatchItem> ReadRequests()
+{
+    using var input = new StreamReader(Console.OpenStandardInput());
+    var lineNumber = 0;
+    while (await input.ReadLineAsync() is { } line)
+    {
+        lineNumber++;
+        if (string.IsNullOrWhiteSpace(line)) continue;
+
+        Mesh2TetraBatchItem item;
+        try
+        {
+            item = BatchRequest.Parse(line, lineNumber, cache, out var binary, out var outputPath);
+            if (binary is not null)
+            {
+                mappedInputs[item] = binary;
+            }
+
+            if (outputPath is not null)
+            {
+                outputs[item] = outputPath;
+            }
+        }
+        catch (Exception ex)
+        {
+            // Whatever a bad line throws, it fails only its own request; escaping would fault the
+            // batch and drop every request still in flight.
+            Write(Failure(RequestId(line) ?? $"line-{lineNumber}", ex, TimeSpan.Zero));
+            continue;
+        }
+
+        yield return item;
+    }
+}
+
+void Write(Dictionary<string, object?> response)
+{
+    var json = JsonSerializer.Serialize(response);
+    lock (outputLock)
+    {
+        output.WriteLine(json);
+        output.Flush();
+    }
+}
+
+static Dictionary<string, object?> Success(Mesh2TetraBatchResult result, bool emitTetrahedra)
+{
+    var tets = result.Tetrahedra!;
+    var v = result.Item.Vertices;
+    var volume = tets.Sum(t => Math.Abs(Vector3d.Dot(v[t.B] - v[t.A], Vector3d.Cross(v[t.C] - v[t.A], v[t.D] - v[t.A])))) / 6d;
+    var response = new Dictionary<string, object?>
+    {
+        ["id"] = result.Id,
+        ["ok"] = true,
+        ["status"] = result.Status.ToString(),
+        ["tetraCount"] = tets.Count,
+        ["tetraVolume"] = volume,
+        ["elapsedMs"] = result.Elapsed.TotalMilliseconds,
+    };
+
+    if (emitTetrahedra)
+    {
+        response["tetrahedra"] = tets.Select(t => t.Vertices).ToArray();
+    }
+
+    return response;
+}
+
+static Dictionary<string, object?> Failure(string id, Exception error, TimeSpan elapsed)
+    => new()
+    {
+        ["id"] = id,
+        ["ok"] = false,
+        ["error"] = error.GetType().Name,
+        ["message"] = error.Message,
+        ["elapsedMs"] = elapsed.TotalMilliseconds,
+    };
+
+static string? RequestId(string line)
+{
+    try
+    {
+        using var doc = JsonDocument.Parse(line);
+        return doc.RootElement.ValueKind == JsonValueKind.Object
+            && doc.RootElement.TryGetProperty("id", out var id)
+            && id.ValueKind == JsonValueKind.String
+                ? id.GetString()
+                : null;
+    }
+    catch (JsonException)
+    {
+        return null;
+    }
+}
@@ -0,0 +1,67 @@
+using System.Diagnostics;
+using GenMesh.Mesh2Tetra.Algorithms;
+
+namespace GenMesh.Mesh2Tetra.Benchmarks;
+
+internal static class BroadPhaseBenchmark
+{
+    private static readonly int[] DefaultSizes = [1_000, 2_000, 5_000, 10_000, 20_000, 50_000, 100_000];
+
+    public static int Run(string[] args)
+    {
+        var maxBruteFaces = 20_000;
+        var sizes = DefaultSizes;
+        for (var i = 0; i < args.Length; i++)
+        {
+            switch (args[i])
+            {
+                case "--max-brute-faces":
+                    maxBruteFaces = int.Parse(args[++i]);
+                    break;
+                case "--sizes":
+                    sizes = args[++i].Split(',').Select(int.Parse).ToArray();
+                    break;
+                default:
+                    Console.Error.WriteLine($"Unknown argument: {args[i]}");
+                    return 2;
+            }
+        }
+
+        Console.WriteLine("| Faces | Tree build (ms) | Tree pairs (ms) | Brute force (ms) | Speedup | Pairs |");
+        Console.WriteLine("|---:|---:|---:|---:|---:|---:|");
+
+        foreach (var size in sizes)
+        {
+            var mesh = SyntheticMeshes.Sphere(size);
+
+            var sw = Stopwatch.StartNew();
+            var tree = FaceBoundsTree.Build(mesh.Vertices, mesh.Faces);
+            var buildMs = sw.Elapsed.TotalMilliseconds;
+
+            sw.Restart();
+            var pairs = GeometryPredicates.FindIntersectingFacePairs(mesh.Vertices, mesh.Faces, tree);
+            var queryMs = sw.Elapsed.TotalMilliseconds;
+
+            var bruteCell = "skipped";
+            var speedupCell = "-";
+            if (mesh.Faces.Count <= maxBruteFaces)
+            {
+                sw.Restart();
+                var brute = GeometryPredicates.FindIntersectingFacePairsBruteForce(mesh.Vertices, mesh.Faces);
+                var bruteMs = sw.Elapsed.TotalMilliseconds;
+                if (!brute.SequenceEqual(pairs))
+                {
+                    Console.Error.WriteLine($"Pair mismatch at {mesh.Faces.Count} faces: tree={pairs.Count}, brute={brute.Count}");
+                    return 1;
+                }
+
+                bruteCell = $"{bruteMs:0.0}";
+                speedupCell = $"{bruteMs / (buildMs + queryMs):0.0}x";
+            }
+
+            Console.WriteLine($"| {mesh.Faces.Count} | {buildMs:0.0} | {queryMs:0.0} | {bruteCell} | {speedupCell} | {pairs.Count} |");
+        }
+
+        return 0;
+    }
+}
@@ -0,0 +1,78 @@
+using System.Diagnostics;
+using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Benchmarks;
+
+internal static class ComponentParallelismBenchmark
+{
+    public static int Run(string[] args)
+    {
+        var components = 32;
+        var facesPerComponent = 400;
+        var degrees = new[] { 1, 2, 4, Environment.ProcessorCount }.Distinct().Order().ToArray();
+        for (var i = 0; i < args.Length; i++)
+        {
+            switch (args[i])
+            {
+                case "--components":
+                    components = int.Parse(args[++i]);
+                    break;
+                case "--faces":
+                    facesPerComponent = int.Parse(args[++i]);
+                    break;
+                case "--degrees":
+                    degrees = args[++i].Split(',').Select(int.Parse).ToArray();
+                    break;
+                default:
+                    Console.Error.WriteLine($"Unknown argument: {args[i]}");
+                    return 2;
+            }
+        }
+
+        var (vertices, faces) = Assembly(components, facesPerComponent);
+        Console.WriteLine($"{components} disjoint spheres, {faces.Count} faces in total");
+        Console.WriteLine("| Max degree of parallelism | Delaunay phase (ms) | Speedup | Tets |");
+        Console.WriteLine("|---:|---:|---:|---:|");
+
+        double? serialMs = null;
+        IReadOnlyList<Tetrahedron>? serial = null;
+        foreach (var dop in degrees)
+        {
+            var options = new Mesh2TetraOptions { Verbose = false, MaxDegreeOfParallelism = dop };
+            var sw = Stopwatch.StartNew();
+            var (tets, _) = DelaunayInside3D.Build(vertices, faces, options);
+            var ms = sw.Elapsed.TotalMilliseconds;
+
+            serialMs ??= ms;
+            serial ??= tets;
+            if (!serial.SequenceEqual(tets))
+            {
+                Console.Error.WriteLine($"Output differs from the serial run at degree {dop}");
+                return 1;
+            }
+
+            Console.WriteLine($"| {dop} | {ms:0.0} | {serialMs.Value / ms:0.00}x | {tets.Count} |");
+        }
+
+        return 0;
+    }
+
+    private static (List<Vector3d> Vertices, List<Face> Faces) Assembly(int components, int facesPerComponent)
+    {
+        var vertices = new List<Vector3d>();
+        var faces = new List<Face>();
+        var perRow = (int)Math.Ceiling(Math.Sqrt(components));
+        for (var k = 0; k < components; k++)
+        {
+            var center = new Vector3d(3d * (k % perRow), 3d * (k / perRow), 0d);
+            var sphere = SyntheticMeshes.Sphere(facesPerComponent, 1d, center);
+            var offset = vertices.Count;
+            vertices.AddRange(sphere.Vertices);
+            faces.AddRange(sphere.Faces.Select(f => new Face(f.A + offset, f.B + offset, f.C + offset)));
+        }
+
+        return (vertices, faces);
+    }
+}
@@ -0,0 +1,85 @@
+using System.Diagnostics;
+using GenMesh.Mesh2Tetra.Geometry;
+
+namespace GenMesh.Mesh2Tetra.Benchmarks;
+
+internal static class DelaunayBackendBenchmark
+{
+    private static readonly int[] DefaultSizes = [1_000, 10_000, 100_000];
+
+    public static int Run(string[] args)
+    {
+        var sizes = DefaultSizes;
+        var maxMIConvexHullPoints = 100_000;
+        for (var i = 0; i < args.Length; i++)
+        {
+            switch (args[i])
+            {
+                case "--sizes":
+                    sizes = args[++i].Split(',').Select(int.Parse).ToArray();
+                    break;
+                case "--max-miconvexhull-points":
+                    maxMIConvexHullPoints = int.Parse(args[++i]);
+                    break;
+                default:
+                    Console.Error.WriteLine($"Unknown argument: {args[i]}");
+                    return 2;
+            }
+        }
+
+        Console.WriteLine("| Points | Layout | Backend | Cells | Time (ms) | Allocated (MB) |");
+        Console.WriteLine("|---:|---|---|---:|---:|---:|");
+
+        IDelaunayBackend[] backends = [new MIConvexHullDelaunayBackend(), new IncrementalDelaunayBackend()];
+        foreach (var size in sizes)
+        {
+            foreach (var (layout, points) in new[] { ("random", RandomPoints(size)), ("grid", GridPoints(size)) })
+            {
+                foreach (var backend in backends)
+                {
+                    if (backend is MIConvexHullDelaunayBackend && points.Count > maxMIConvexHullPoints)
+                    {
+                        Console.WriteLine($"| {points.Count} | {layout} | {backend.Name} | - | skipped | - |");
+                        continue;
+                    }
+
+                    var cells = new List<int>();
+                    var allocated = GC.GetAllocatedBytesForCurrentThread();
+                    var sw = Stopwatch.StartNew();
+                    if (!backend.TryTetrahedralize(points, 1e-10, cells))
+                    {
+                        Console.Error.WriteLine($"{backend.Name} failed on {points.Count} {layout} points");
+                        return 1;
+                    }
+
+                    var ms = sw.Elapsed.TotalMilliseconds;
+                    var mb = (GC.GetAllocatedBytesForCurrentThread() - allocated) / (1024d * 1024d);
+                    Console.WriteLine($"| {points.Count} | {layout} | {backend.Name} | {cells.Count / 4} | {ms:0.0} | {mb:0.0} |");
+                }
+            }
+        }
+
+        return 0;
+    }
+
+    private static List<Vector3d> RandomPoints(int count)
+    {
+        var rng = new Random(1234);
+        return Enumerable.Range(0, count).Select(_ => new Vector3d(rng.NextDouble(), rng.NextDouble(), rng.NextDouble())).ToList();
+    }
+
+    // Cospherical everywhere: every grid cube ties the in-sphere test.
+    private static List<Vector3d> GridPoints(int count)
+    {
+        var side = Math.Max(2, (int)Math.Round(Math.Cbrt(count)));
+        var points = new List<Vector3d>(side * side * side);
+        for (var x = 0; x < side; x++)
+        for (var y = 0; y < side; y++)
+        for (var z = 0; z < side; z++)
+        {
+            points.Add(new Vector3d(x, y, z) / side);
+        }
+
+        return points;
+    }
+}
@@ -0,0 +1,78 @@
+using System.Diagnostics;
+using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Geometry;
+
+namespace GenMesh.Mesh2Tetra.Benchmarks;
+
+internal static class InsideClassificationBenchmark
+{
+    private static readonly int[] DefaultSizes = [1_000, 5_000, 20_000, 100_000];
+
+    public static int Run(string[] args)
+    {
+        var points = 20_000;
+        var maxBruteFaces = 20_000;
+        var sizes = DefaultSizes;
+        for (var i = 0; i < args.Length; i++)
+        {
+            switch (args[i])
+            {
+                case "--points":
+                    points = int.Parse(args[++i]);
+                    break;
+                case "--max-brute-faces":
+                    maxBruteFaces = int.Parse(args[++i]);
+                    break;
+                case "--sizes":
+                    sizes = args[++i].Split(',').Select(int.Parse).ToArray();
+                    break;
+                default:
+                    Console.Error.WriteLine($"Unknown argument: {args[i]}");
+                    return 2;
+            }
+        }
+
+        Console.WriteLine("| Faces | Points | Classifier build (ms) | Classify (ms) | Per-point rays (ms) | Speedup |");
+        Console.WriteLine("|---:|---:|---:|---:|---:|---:|");
+
+        var rng = new Random(1234);
+        foreach (var size in sizes)
+        {
+            var mesh = SyntheticMeshes.Sphere(size);
+            var queries = Enumerable.Range(0, points)
+                .Select(_ => new Vector3d((rng.NextDouble() * 2.4) - 1.2, (rng.NextDouble() * 2.4) - 1.2, (rng.NextDouble() * 2.4) - 1.2))
+                .ToArray();
+
+            var sw = Stopwatch.StartNew();
+            var classifier = new ClosedMeshClassifier(mesh.Vertices, mesh.Faces);
+            var buildMs = sw.Elapsed.TotalMilliseconds;
+
+            sw.Restart();
+            var inside = classifier.Classify(queries);
+            var classifyMs = sw.Elapsed.TotalMilliseconds;
+
+            var bruteCell = "skipped";
+            var speedupCell = "-";
+            if (mesh.Faces.Count <= maxBruteFaces)
+            {
+                sw.Restart();
+                for (var i = 0; i < queries.Length; i++)
+                {
+                    if (GeometryPredicates.PointInsideClosedMesh(queries[i], mesh.Vertices, mesh.Faces) != inside[i])
+                    {
+                        Console.Error.WriteLine($"Classification mismatch at {mesh.Faces.Count} faces, point {i}");
+                        return 1;
+                    }
+                }
+
+                var bruteMs = sw.Elapsed.TotalMilliseconds;
+                bruteCell = $"{bruteMs:0.0}";
+                speedupCell = $"{bruteMs / (buildMs + classifyMs):0.0}x";
+            }
+
+            Console.WriteLine($"| {mesh.Faces.Count} | {points} | {buildMs:0.0} | {classifyMs:0.0} | {bruteCell} | {speedupCell} |");
+        }
+
+        return 0;
+    }
+}
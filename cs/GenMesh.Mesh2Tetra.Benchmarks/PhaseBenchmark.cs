@@ -0,0 +1,244 @@
+using System.Diagnostics;
+using System.Runtime.InteropServices;
+using System.Text.Json;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.IO;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Benchmarks;
+
+// Times each phase of Mesh2TetraConverter.Convert (preprocessing, Delaunay, boundary collapse)
+// on the regression fixtures and on UV spheres, and optionally writes the results as JSON for
+// tools/run_benchmarks.py to compare against a recorded baseline.
+internal static class PhaseBenchmark
+{
+    private static readonly JsonSerializerOptions JsonOptions = new()
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+        WriteIndented = true,
+    };
+
+    public static int Run(string[] args)
+    {
+        var fixtureDirectory = Path.Combine("GenMesh.Mesh2Tetra.Tests", "Fixtures");
+        int[] sizes = [1000, 4000];
+        var repeat = 5;
+        string? output = null;
+        string? filter = null;
+        for (var i = 0; i < args.Length; i++)
+        {
+            switch (args[i])
+            {
+                case "--fixtures":
+                    fixtureDirectory = args[++i];
+                    break;
+                case "--sizes":
+                    sizes = args[++i].Split(',', StringSplitOptions.RemoveEmptyEntries).Select(int.Parse).ToArray();
+                    break;
+                case "--repeat":
+                    repeat = Math.Max(1, int.Parse(args[++i]));
+                    break;
+                case "--output":
+                    output = args[++i];
+                    break;
+                case "--filter":
+                    filter = args[++i];
+                    break;
+                default:
+                    Console.Error.WriteLine($"Unknown argument: {args[i]}");
+                    return 2;
+            }
+        }
+
+        var cases = new List<PhaseBenchmarkCase>();
+        if (Directory.Exists(fixtureDirectory))
+        {
+            cases.AddRange(Directory.GetFiles(fixtureDirectory, "*.json").Order(StringComparer.Ordinal).Select(LoadFixture).OfType<PhaseBenchmarkCase>());
+        }
+        else
+        {
+            Console.Error.WriteLine($"Fixture directory not found, running synthetic cases only: {fixtureDirectory}");
+        }
+
+        foreach (var size in sizes)
+        {
+            var sphere = SyntheticMeshes.Sphere(size);
+            cases.Add(new PhaseBenchmarkCase($"sphere_{size}", "synthetic", sphere.Vertices, sphere.Faces, new Mesh2TetraOptions { Verbose = false }));
+        }
+
+        if (filter is not null)
+        {
+            cases = cases.Where(c => c.Name.Contains(filter, StringComparison.OrdinalIgnoreCase)).ToList();
+        }
+
+        Console.WriteLine($"{cases.Count} cases, median of {repeat} runs after one warm-up run");
+        Console.WriteLine("| Case | Faces | Tets | Preprocessing (ms) | Delaunay (ms) | Boundary collapse (ms) | Allocated (KB) |");
+        Console.WriteLine("|---|---:|---:|---:|---:|---:|---:|");
+
+        var results = new List<PhaseBenchmarkResult>(cases.Count);
+        foreach (var benchmarkCase in cases)
+        {
+            var result = Measure(benchmarkCase, repeat);
+            results.Add(result);
+            if (result.Error is not null)
+            {
+                Console.WriteLine($"| {result.Name} | {result.Faces} | - | failed: {result.Error} | | | |");
+                continue;
+            }
+
+            var phases = result.Phases;
+            Console.WriteLine(
+                $"| {result.Name} | {result.Faces} | {result.Tetrahedra} | {phases["preprocessing"].Milliseconds:0.000} | " +
+                $"{phases["delaunay"].Milliseconds:0.000} | {phases["boundaryCollapse"].Milliseconds:0.000} | " +
+                $"{phases.Values.Sum(p => p.AllocatedBytes) / 1024d:0.0} |");
+        }
+
+        if (output is not null)
+        {
+            var report = new PhaseBenchmarkReport(
+                RuntimeInformation.FrameworkDescription,
+                RuntimeInformation.OSDescription,
+                Environment.ProcessorCount,
+                repeat,
+                results);
+            File.WriteAllText(output, JsonSerializer.Serialize(report, JsonOptions) + Environment.NewLine);
+            Console.WriteLine($"Wrote {output}");
+        }
+
+        return 0;
+    }
+
+    private static PhaseBenchmarkResult Measure(PhaseBenchmarkCase benchmarkCase, int repeat)
+    {
+        var phaseCount = Enum.GetValues<ConversionPhase>().Length;
+        var milliseconds = new double[phaseCount][];
+        var allocated = new long[phaseCount];
+        Array.Fill(allocated, long.MaxValue);
+        for (var p = 0; p < phaseCount; p++)
+        {
+            milliseconds[p] = new double[repeat];
+        }
+
+        var tetrahedra = 0;
+        try
+        {
+            for (var run = -1; run < repeat; run++)
+            {
+                var sw = Stopwatch.StartNew();
+                var lastTicks = 0L;
+                var lastAllocated = GC.GetTotalAllocatedBytes(precise: true);
+                var sample = run;
+                var tets = Mesh2TetraConverter.Convert(benchmarkCase.Vertices, benchmarkCase.Faces, benchmarkCase.Options, phase =>
+                {
+                    var ticks = sw.ElapsedTicks;
+                    var bytes = GC.GetTotalAllocatedBytes(precise: true);
+                    if (sample >= 0)
+                    {
+                        var p = (int)phase;
+                        milliseconds[p][sample] = (ticks - lastTicks) * 1000d / Stopwatch.Frequency;
+                        allocated[p] = Math.Min(allocated[p], bytes - lastAllocated);
+                    }
+
+                    // Exclude the allocation probe itself from the next phase.
+                    lastAllocated = GC.GetTotalAllocatedBytes(precise: true);
+                    lastTicks = sw.ElapsedTicks;
+                });
+                tetrahedra = tets.Count;
+            }
+        }
+        catch (Exception ex)
+        {
+            return new PhaseBenchmarkResult(benchmarkCase.Name, benchmarkCase.Source, benchmarkCase.Vertices.Count, benchmarkCase.Faces.Count, 0, [], ex.Message);
+        }
+
+        var phases = new Dictionary<string, PhaseSample>();
+        foreach (var phase in Enum.GetValues<ConversionPhase>())
+        {
+            var p = (int)phase;
+            phases[JsonNamingPolicy.CamelCase.ConvertName(phase.ToString())] = new PhaseSample(Median(milliseconds[p]), milliseconds[p].Min(), allocated[p]);
+        }
+
+        return new PhaseBenchmarkResult(benchmarkCase.Name, benchmarkCase.Source, benchmarkCase.Vertices.Count, benchmarkCase.Faces.Count, tetrahedra, phases, null);
+    }
+
+    private static double Median(double[] values)
+    {
+        var sorted = values.Order().ToArray();
+        var mid = sorted.Length / 2;
+        return sorted.Length % 2 == 1 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2d;
+    }
+
+    // Reads the input and options of a fixture; fixtures that expect an exception are not timed.
+    private static PhaseBenchmarkCase? LoadFixture(string path)
+    {
+        using var document = JsonDocument.Parse(File.ReadAllText(path));
+        var root = document.RootElement;
+        if (root.GetProperty("expected").TryGetProperty("expectedExceptionContains", out _))
+        {
+            return null;
+        }
+
+        var name = Path.GetFileNameWithoutExtension(path);
+        var options = ReadOptions(root.GetProperty("options"));
+        var input = root.GetProperty("input");
+        if (input.TryGetProperty("binary", out var binary))
+        {
+            // Copied out of the mapping so timings do not include page faults on the sidecar.
+            using var file = BinaryMeshFile.Open(Path.Combine(Path.GetDirectoryName(path)!, binary.GetString()!));
+            return new PhaseBenchmarkCase(name, "fixture", file.Vertices.ToArray(), file.Faces.ToArray(), options);
+        }
+
+        var vertices = input.GetProperty("vertices").EnumerateArray()
+            .Select(v => new Vector3d(v[0].GetDouble(), v[1].GetDouble(), v[2].GetDouble()))
+            .ToArray();
+        var faces = input.GetProperty("faces").EnumerateArray()
+            .Select(f => new Face(f[0].GetInt32(), f[1].GetInt32(), f[2].GetInt32()))
+            .ToArray();
+        return new PhaseBenchmarkCase(name, "fixture", vertices, faces, options);
+    }
+
+    // Same defaults and legacy checkSelfIntersections fallback as the regression tests.
+    private static Mesh2TetraOptions ReadOptions(JsonElement options)
+    {
+        bool? Flag(string key) => options.TryGetProperty(key, out var value) ? value.GetBoolean() : null;
+        double Number(string key, double fallback) => options.TryGetProperty(key, out var value) ? value.GetDouble() : fallback;
+
+        var legacy = Flag("checkSelfIntersections");
+        return new Mesh2TetraOptions
+        {
+            Verbose = false,
+            CheckInput = Flag("checkInput") ?? true,
+            AutoResolveIntersections = Flag("autoResolveIntersections") ?? legacy ?? true,
+            FailOnSelfIntersections = Flag("failOnSelfIntersections") ?? legacy ?? true,
+            PlaneDistanceTolerance = Number("planeDistanceTolerance", 1e-10),
+            Epsilon = Number("epsilon", 1e-8),
+        };
+    }
+
+    private sealed record PhaseBenchmarkCase(
+        string Name,
+        string Source,
+        IReadOnlyList<Vector3d> Vertices,
+        IReadOnlyList<Face> Faces,
+        Mesh2TetraOptions Options);
+
+    // The regression check compares MinMilliseconds, which is far less sensitive to machine noise
+    // than the median.
+    private sealed record PhaseSample(double Milliseconds, double MinMilliseconds, long AllocatedBytes);
+
+    private sealed record PhaseBenchmarkResult(
+        string Name,
+        string Source,
+        int Vertices,
+        int Faces,
+        int Tetrahedra,
+        Dictionary<string, PhaseSample> Phases,
+        string? Error);
+
+    private sealed record PhaseBenchmarkReport(
+        string Runtime,
+        string OS,
+        int ProcessorCount,
+        int Repeat,
+        List<PhaseBenchmarkResult> Cases);
+}
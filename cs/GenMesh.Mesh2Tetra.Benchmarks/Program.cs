@@ -0,0 +1,38 @@
+using GenMesh.Mesh2Tetra.Benchmarks;
+
+if (args.Length == 0)
+{
+    PrintUsage();
+    return 2;
+}
+
+return args[0] switch
+{
+    "broadphase" => BroadPhaseBenchmark.Run(args[1..]),
+    "inside" => InsideClassificationBenchmark.Run(args[1..]),
+    "components" => ComponentParallelismBenchmark.Run(args[1..]),
+    "phases" => PhaseBenchmark.Run(args[1..]),
+    "delaunay" => DelaunayBackendBenchmark.Run(args[1..]),
+    "subdomains" => SubdomainBenchmark.Run(args[1..]),
+    _ => PrintUsage(),
+};
+
+static int PrintUsage()
+{
+    Console.Error.WriteLine("Usage: dotnet run -c Release --project GenMesh.Mesh2Tetra.Benchmarks -- <benchmark> [options]");
+    Console.Error.WriteLine();
+    Console.Error.WriteLine("Benchmarks:");
+    Console.Error.WriteLine("  broadphase [--sizes 1000,10000,100000] [--max-brute-faces 20000]");
+    Console.Error.WriteLine("      Face-pair intersection search: AABB tree vs. all-pairs scan on UV spheres.");
+    Console.Error.WriteLine("  inside [--sizes 1000,100000] [--points 20000] [--max-brute-faces 20000]");
+    Console.Error.WriteLine("      Inside/outside classification: projected face grid vs. per-point ray casting.");
+    Console.Error.WriteLine("  components [--components 32] [--faces 400] [--degrees 1,2,4,8]");
+    Console.Error.WriteLine("      Delaunay phase on an assembly of disjoint spheres at several MaxDegreeOfParallelism values.");
+    Console.Error.WriteLine("  phases [--fixtures <dir>] [--sizes 1000,4000] [--repeat 5] [--filter <text>] [--output <file.json>]");
+    Console.Error.WriteLine("      Per-phase wall time and allocations of Convert on the fixture corpus and UV spheres.");
+    Console.Error.WriteLine("  delaunay [--sizes 1000,10000,100000] [--max-miconvexhull-points 100000]");
+    Console.Error.WriteLine("      Delaunay tetrahedralization of random and grid points with each IDelaunayBackend.");
+    Console.Error.WriteLine("  subdomains [--size 200] [--max-points 4000] [--degrees 1,2,4,8]");
+    Console.Error.WriteLine("      Delaunay phase on one large plate, undivided and split into subdomains at several MaxDegreeOfParallelism values.");
+    return 2;
+}
@@ -0,0 +1,74 @@
+using System.Diagnostics;
+using GenMesh.Mesh2Tetra.Algorithms;
+
+namespace GenMesh.Mesh2Tetra.Benchmarks;
+
+internal static class SubdomainBenchmark
+{
+    public static int Run(string[] args)
+    {
+        var size = 200;
+        var maxPoints = 4000;
+        var degrees = new[] { 1, 2, 4, Environment.ProcessorCount }.Distinct().Order().ToArray();
+        for (var i = 0; i < args.Length; i++)
+        {
+            switch (args[i])
+            {
+                case "--size":
+                    size = int.Parse(args[++i]);
+                    break;
+                case "--max-points":
+                    maxPoints = int.Parse(args[++i]);
+                    break;
+                case "--degrees":
+                    degrees = args[++i].Split(',').Select(int.Parse).ToArray();
+                    break;
+                default:
+                    Console.Error.WriteLine($"Unknown argument: {args[i]}");
+                    return 2;
+            }
+        }
+
+        var plate = SyntheticMeshes.Plate(size, size, 3d);
+        var volume = GeometryPredicates.FaceMeshVolume(plate.Vertices, plate.Faces);
+        Console.WriteLine($"{size}x{size} plate, {plate.Vertices.Count} vertices, {plate.Faces.Count} faces, incremental backend");
+        Console.WriteLine("| Max subdomain points | Max degree of parallelism | Delaunay phase (ms) | Speedup | Tets | Residual faces |");
+        Console.WriteLine("|---:|---:|---:|---:|---:|---:|");
+
+        double? wholeMs = null;
+        wholeMs = Measure(0, 1);
+        if (wholeMs is null) return 1;
+
+        foreach (var dop in degrees)
+        {
+            if (Measure(maxPoints, dop) is null) return 1;
+        }
+
+        return 0;
+
+        double? Measure(int subdomainPoints, int dop)
+        {
+            var options = new Mesh2TetraOptions
+            {
+                Verbose = false,
+                DelaunayBackend = new IncrementalDelaunayBackend(),
+                MaxSubdomainPoints = subdomainPoints,
+                MaxDegreeOfParallelism = dop,
+            };
+            var sw = Stopwatch.StartNew();
+            var (tets, remaining) = DelaunayInside3D.Build(plate.Vertices, plate.Faces, options);
+            var ms = sw.Elapsed.TotalMilliseconds;
+
+            var covered = GeometryPredicates.TetraMeshVolume(plate.Vertices, tets) + GeometryPredicates.FaceMeshVolume(plate.Vertices, remaining);
+            if (Math.Abs(covered - volume) > 1e-8 * volume)
+            {
+                Console.Error.WriteLine($"Volume mismatch at {subdomainPoints} subdomain points, degree {dop}: {covered} vs {volume}");
+                return null;
+            }
+
+            var speedup = wholeMs is { } w ? w / ms : 1d;
+            Console.WriteLine($"| {subdomainPoints} | {dop} | {ms:0.0} | {speedup:0.00}x | {tets.Count} | {remaining.Count} |");
+            return ms;
+        }
+    }
+}
@@ -0,0 +1,125 @@
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Benchmarks;
+
+internal static class SyntheticMeshes
+{
+    // Closed, outward-oriented UV sphere with roughly targetFaces triangles.
+    public static MeshData Sphere(int targetFaces, double radius = 1d, Vector3d center = default)
+    {
+        var rings = Math.Max(2, (int)Math.Round(Math.Sqrt(targetFaces / 4d))) + 1;
+        var segments = 2 * (rings - 1);
+
+        var vertices = new List<Vector3d>(2 + ((rings - 1) * segments)) { center + new Vector3d(0, 0, radius) };
+        for (var r = 1; r < rings; r++)
+        {
+            var theta = Math.PI * r / rings;
+            for (var s = 0; s < segments; s++)
+            {
+                var phi = 2d * Math.PI * s / segments;
+                vertices.Add(center + new Vector3d(
+                    radius * Math.Sin(theta) * Math.Cos(phi),
+                    radius * Math.Sin(theta) * Math.Sin(phi),
+                    radius * Math.Cos(theta)));
+            }
+        }
+
+        var south = vertices.Count;
+        vertices.Add(center + new Vector3d(0, 0, -radius));
+
+        var faces = new List<Face>(2 * segments * (rings - 1));
+        for (var s = 0; s < segments; s++)
+        {
+            faces.Add(new Face(0, Ring(1, s), Ring(1, s + 1)));
+        }
+
+        for (var r = 1; r < rings - 1; r++)
+        {
+            for (var s = 0; s < segments; s++)
+            {
+                faces.Add(new Face(Ring(r, s), Ring(r + 1, s), Ring(r + 1, s + 1)));
+                faces.Add(new Face(Ring(r, s), Ring(r + 1, s + 1), Ring(r, s + 1)));
+            }
+        }
+
+        for (var s = 0; s < segments; s++)
+        {
+            faces.Add(new Face(south, Ring(rings - 1, s + 1), Ring(rings - 1, s)));
+        }
+
+        return new MeshData(vertices, faces);
+
+        int Ring(int r, int s) => 1 + ((r - 1) * segments) + (s % segments);
+    }
+
+    // Closed, outward-oriented plate of nx by ny grid squares of size 1 and the given thickness.
+    // Vertices are jittered within their side and every grid quad is split along its Delaunay
+    // diagonal, so the surface is part of the Delaunay tetrahedralization of the vertices.
+    public static MeshData Plate(int nx, int ny, double thickness)
+    {
+        var rng = new Random(7);
+        var vertices = new List<Vector3d>(2 * (nx + 1) * (ny + 1));
+        for (var layer = 0; layer < 2; layer++)
+        {
+            for (var j = 0; j <= ny; j++)
+            {
+                for (var i = 0; i <= nx; i++)
+                {
+                    var dx = i > 0 && i < nx ? 0.1 * rng.NextDouble() : 0;
+                    var dy = j > 0 && j < ny ? 0.1 * rng.NextDouble() : 0;
+                    vertices.Add(new Vector3d(i + dx, j + dy, layer * thickness));
+                }
+            }
+        }
+
+        var faces = new List<Face>((4 * nx * ny) + (4 * (nx + ny)));
+        for (var j = 0; j < ny; j++)
+        {
+            for (var i = 0; i < nx; i++)
+            {
+                Quad(Top(i, j), Top(i + 1, j), Top(i + 1, j + 1), Top(i, j + 1));
+                Quad(Bottom(i, j), Bottom(i, j + 1), Bottom(i + 1, j + 1), Bottom(i + 1, j));
+            }
+        }
+
+        // The rim, counterclockwise seen from above, walled outward.
+        var rim = new List<(int I, int J)>();
+        for (var i = 0; i < nx; i++) rim.Add((i, 0));
+        for (var j = 0; j < ny; j++) rim.Add((nx, j));
+        for (var i = nx; i > 0; i--) rim.Add((i, ny));
+        for (var j = ny; j > 0; j--) rim.Add((0, j));
+        for (var k = 0; k < rim.Count; k++)
+        {
+            var (p, q) = (rim[k], rim[(k + 1) % rim.Count]);
+            Quad(Bottom(p.I, p.J), Bottom(q.I, q.J), Top(q.I, q.J), Top(p.I, p.J));
+        }
+
+        return new MeshData(vertices, faces);
+
+        int Bottom(int i, int j) => (j * (nx + 1)) + i;
+        int Top(int i, int j) => ((nx + 1) * (ny + 1)) + Bottom(i, j);
+
+        // Planar quad a, b, c, d: diagonal a-c is Delaunay when the angles at b and d sum to at most pi.
+        void Quad(int a, int b, int c, int d)
+        {
+            if (Angle(a, b, c) + Angle(c, d, a) <= Math.PI)
+            {
+                faces.Add(new Face(a, b, c));
+                faces.Add(new Face(a, c, d));
+            }
+            else
+            {
+                faces.Add(new Face(a, b, d));
+                faces.Add(new Face(b, c, d));
+            }
+        }
+
+        double Angle(int a, int apex, int c)
+        {
+            var u = vertices[a] - vertices[apex];
+            var v = vertices[c] - vertices[apex];
+            return Math.Acos(Vector3d.Dot(u, v) / (u.Norm() * v.Norm()));
+        }
+    }
+}
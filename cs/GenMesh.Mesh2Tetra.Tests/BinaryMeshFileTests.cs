@@ -0,0 +1,73 @@
+using Xunit;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.IO;
+using GenMesh.Mesh2Tetra.Models;
+using GenMesh.Mesh2Tetra.Tests.TestData;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class BinaryMeshFileTests
+{
+    private static readonly Vector3d[] Vertices = [.. TestMeshes.TetraVertices, new(0.25, 0.25, 0.25)];
+    private static readonly Face[] Faces = TestMeshes.TetraFaces;
+
+    [Fact]
+    public void RoundTripsMeshAndTetrahedra()
+    {
+        var path = Path.Combine(Path.GetTempPath(), $"{Guid.NewGuid():N}{BinaryMeshFile.Extension}");
+        try
+        {
+            BinaryMeshFile.Write(path, Vertices, Faces, [new Tetrahedron(0, 1, 2, 3)]);
+
+            using var file = BinaryMeshFile.Open(path);
+            Assert.Equal(5, file.VertexCount);
+            Assert.Equal(4, file.FaceCount);
+            Assert.Equal(1, file.TetrahedronCount);
+            Assert.Equal(Vertices, file.Vertices);
+            Assert.Equal(Faces, file.Faces);
+            Assert.Equal(new Tetrahedron(0, 1, 2, 3), file.GetTetrahedron(0));
+            Assert.Equal(15, file.Coordinates.Length);
+            Assert.Equal(0.25, file.Coordinates.Span[14]);
+        }
+        finally
+        {
+            File.Delete(path);
+        }
+    }
+
+    [Fact]
+    public void ConvertsDirectlyFromMappedBuffers()
+    {
+        var path = Path.Combine(Path.GetTempPath(), $"{Guid.NewGuid():N}{BinaryMeshFile.Extension}");
+        try
+        {
+            BinaryMeshFile.Write(path, Vertices[..4], Faces);
+
+            using var file = BinaryMeshFile.Open(path);
+            var writer = new System.Buffers.ArrayBufferWriter<int>();
+            var count = Mesh2TetraConverter.Convert(file.Coordinates, file.FaceIndices, writer, new Mesh2TetraOptions { Verbose = false });
+
+            Assert.Equal(1, count);
+            Assert.Equal([0, 1, 2, 3], writer.WrittenSpan.ToArray().Order());
+        }
+        finally
+        {
+            File.Delete(path);
+        }
+    }
+
+    [Fact]
+    public void RejectsFilesWithoutHeader()
+    {
+        var path = Path.Combine(Path.GetTempPath(), $"{Guid.NewGuid():N}{BinaryMeshFile.Extension}");
+        try
+        {
+            File.WriteAllText(path, new string('x', 128));
+            Assert.Throws<InvalidDataException>(() => BinaryMeshFile.Open(path));
+        }
+        finally
+        {
+            File.Delete(path);
+        }
+    }
+}
@@ -0,0 +1,56 @@
+using Xunit;
+using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class BoundaryCollapseOrderTests
+{
+    [Theory]
+    [InlineData(CollapseCandidateOrder.Sequential)]
+    [InlineData(CollapseCandidateOrder.BestShapeFirst)]
+    public void FillsBipyramidWithItsVolume(CollapseCandidateOrder order)
+    {
+        // Hexagonal bipyramid with an irregular equator, outward-oriented faces.
+        const int ring = 6;
+        var vertices = new List<Vector3d> { new(0.1, -0.05, 1.3), new(-0.05, 0.1, -0.9) };
+        for (var i = 0; i < ring; i++)
+        {
+            var angle = 2 * Math.PI * i / ring;
+            var radius = 1d + 0.15 * (i % 3);
+            vertices.Add(new Vector3d(radius * Math.Cos(angle), radius * Math.Sin(angle), 0.05 * (i % 2)));
+        }
+
+        var faces = new List<Face>();
+        for (var i = 0; i < ring; i++)
+        {
+            var a = 2 + i;
+            var b = 2 + (i + 1) % ring;
+            faces.Add(new Face(0, a, b));
+            faces.Add(new Face(1, b, a));
+        }
+
+        var shellVolume = GeometryPredicates.FaceMeshVolume(vertices, faces);
+        var options = new Mesh2TetraOptions { Verbose = false, CollapseCandidateOrder = order };
+
+        var tets = BoundaryCollapse3D.FillResidualVolume(vertices, faces, [], options);
+
+        Assert.NotEmpty(tets);
+        Assert.InRange(Math.Abs(GeometryPredicates.TetraMeshVolume(vertices, tets) - shellVolume), 0d, 1e-9);
+        foreach (var t in tets)
+        {
+            Assert.True(GeometryPredicates.TetraShapeQuality(vertices[t.A], vertices[t.B], vertices[t.C], vertices[t.D]) > 0d);
+        }
+    }
+
+    [Fact]
+    public void ShapeQualityIsOneForRegularTetrahedronAndZeroWhenFlat()
+    {
+        var regular = GeometryPredicates.TetraShapeQuality(new(1, 1, 1), new(1, -1, -1), new(-1, 1, -1), new(-1, -1, 1));
+        var flat = GeometryPredicates.TetraShapeQuality(new(0, 0, 0), new(1, 0, 0), new(0, 1, 0), new(1, 1, 0));
+
+        Assert.InRange(regular, 1d - 1e-12, 1d + 1e-12);
+        Assert.Equal(0d, flat, 12);
+    }
+}
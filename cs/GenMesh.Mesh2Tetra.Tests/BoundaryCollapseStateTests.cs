@@ -0,0 +1,131 @@
+using Xunit;
+using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class BoundaryCollapseStateTests
+{
+    private static readonly Vector3d[] Vertices =
+    [
+        new(0, 0, 0),
+        new(1, 0, 0),
+        new(0, 1, 0),
+        new(0, 0, 1),
+        new(0.2, 0.2, -0.5),
+        new(0.2, 0.2, 0.5),
+        new(0.6, -0.3, 0.1),
+    ];
+
+    private static readonly Face[] TetraShell =
+    [
+        new(0, 2, 1),
+        new(0, 1, 3),
+        new(1, 2, 3),
+        new(0, 3, 2),
+    ];
+
+    [Fact]
+    public void TracksVolumeAndOrientationOfClosedShell()
+    {
+        var state = new BoundaryCollapseState(Vertices, TetraShell, []);
+
+        Assert.InRange(Math.Abs(state.Volume - (1d / 6d)), 0d, 1e-12);
+        Assert.False(state.HasOrientationImbalance);
+        Assert.False(state.HasIntersections);
+    }
+
+    [Fact]
+    public void RollbackRestoresBoundaryTetrahedraAndChecks()
+    {
+        var state = new BoundaryCollapseState(Vertices, TetraShell, []);
+        var volume = state.Volume;
+
+        state.BeginEdit();
+        state.RemoveFaceAt(1);
+        state.AddFace(new Face(4, 5, 6));
+        state.AddTetrahedron(new Tetrahedron(0, 1, 2, 3));
+
+        Assert.True(state.HasOrientationImbalance);
+        Assert.True(state.HasIntersections);
+        Assert.NotEqual(volume, state.Volume);
+
+        state.Rollback();
+
+        Assert.Equal(TetraShell, state.Boundary);
+        Assert.Empty(state.Tetrahedra);
+        Assert.Equal(volume, state.Volume);
+        Assert.False(state.HasOrientationImbalance);
+        Assert.False(state.HasIntersections);
+    }
+
+    [Fact]
+    public void ClosingTheShellIntoOneTetrahedronConservesVolume()
+    {
+        var state = new BoundaryCollapseState(Vertices, TetraShell, []);
+        var volume = state.Volume;
+
+        state.BeginEdit();
+        for (var i = 3; i >= 1; i--)
+        {
+            state.RemoveFaceAt(i);
+        }
+
+        var existing = state.IndexOfCanonical(new Face(1, 2, 0));
+        Assert.Equal(0, existing);
+        state.RemoveFaceAt(existing);
+        state.AddTetrahedron(new Tetrahedron(0, 1, 2, 3));
+        state.Commit();
+
+        Assert.Empty(state.Boundary);
+        Assert.InRange(Math.Abs(state.Volume - volume), 0d, 1e-12);
+        Assert.False(state.TetrahedraIntersectBoundary(state.Tetrahedra));
+    }
+
+    [Fact]
+    public void PositionsFollowInterleavedRemovalsAndAdditions()
+    {
+        var rng = new Random(3);
+        var vertices = Enumerable.Range(0, 800).Select(_ => new Vector3d(rng.NextDouble(), rng.NextDouble(), rng.NextDouble())).ToArray();
+        var faces = Enumerable.Range(0, 40).Select(i => new Face(3 * i, (3 * i) + 1, (3 * i) + 2)).ToList();
+        var state = new BoundaryCollapseState(vertices, faces, []);
+        var expected = new List<Face>(faces);
+        var next = 120;
+
+        for (var round = 0; round < 60; round++)
+        {
+            state.BeginEdit();
+            var before = new List<Face>(expected);
+            for (var k = 0; k < 3 && expected.Count > 0; k++)
+            {
+                var index = rng.Next(expected.Count);
+                state.RemoveFaceAt(index);
+                expected.RemoveAt(index);
+                var added = new Face(next, next + 1, next + 2);
+                next += 3;
+                state.AddFace(added);
+                expected.Add(added);
+            }
+
+            if (round % 3 == 0)
+            {
+                state.Rollback();
+                expected = before;
+            }
+            else
+            {
+                state.Commit();
+            }
+
+            Assert.Equal(expected, state.Boundary);
+            for (var i = 0; i < expected.Count; i++)
+            {
+                var handle = state.HandleAt(i);
+                Assert.Equal(expected[i], state.FaceOfHandle(handle));
+                Assert.Equal(i, state.IndexOfHandle(handle));
+                Assert.Equal(i, state.IndexOfCanonical(new Face(expected[i].C, expected[i].A, expected[i].B)));
+            }
+        }
+    }
+}
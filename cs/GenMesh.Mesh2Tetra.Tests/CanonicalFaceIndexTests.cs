@@ -0,0 +1,65 @@
+using Xunit;
+using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class CanonicalFaceIndexTests
+{
+    [Fact]
+    public void MatchesFacesInAnyOrientationAndKeepsOwnersInInsertionOrder()
+    {
+        var index = new CanonicalFaceIndex();
+        index.Add(new Face(0, 1, 2), 3);
+        index.Add(new Face(4, 5, 6), 0);
+        index.Add(new Face(2, 1, 0), 5);
+        index.Add(new Face(1, 2, 0), 7);
+
+        Assert.Equal(2, index.Count);
+        Assert.Equal([3, 5, 7], Owners(index, new Face(0, 2, 1)));
+        Assert.Equal(-1, index.First(new Face(0, 1, 3)));
+
+        Assert.True(index.Remove(new Face(0, 1, 2), 5));
+        Assert.False(index.Remove(new Face(0, 1, 2), 5));
+        Assert.Equal([3, 7], Owners(index, new Face(0, 1, 2)));
+
+        Assert.True(index.Remove(new Face(2, 0, 1), 3));
+        Assert.True(index.Remove(new Face(2, 0, 1), 7));
+        Assert.False(index.Contains(new Face(0, 1, 2)));
+        Assert.Equal(1, index.Count);
+    }
+
+    [Fact]
+    public void TetrahedronFaceIndexFindsLowestTetrahedronPerFace()
+    {
+        Tetrahedron[] tets = [new(0, 1, 2, 3), new(1, 2, 3, 4)];
+
+        var index = MeshTopology.IndexTetrahedronFaces(tets);
+
+        Assert.Equal(7, index.Count);
+        Assert.Equal([0, 1], Owners(index, new Face(3, 2, 1)).Select(o => o / 4));
+        Assert.Equal(1, index.First(new Face(2, 3, 4)) / 4);
+        Assert.Equal(-1, index.First(new Face(0, 1, 4)));
+    }
+
+    [Fact]
+    public void RemoveAtAllKeepsOrderOfRemainingElements()
+    {
+        List<int> values = [10, 11, 12, 13, 14, 15];
+
+        MeshTopology.RemoveAtAll(values, new HashSet<int> { 4, 0, 2 });
+
+        Assert.Equal([11, 13, 15], values);
+    }
+
+    private static List<int> Owners(CanonicalFaceIndex index, Face face)
+    {
+        var owners = new List<int>();
+        for (var o = index.First(face); o >= 0; o = index.Next(o))
+        {
+            owners.Add(o);
+        }
+
+        return owners;
+    }
+}
@@ -0,0 +1,56 @@
+using Xunit;
+using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Tests.TestData;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class ClosedMeshClassifierTests
+{
+    [Theory]
+    [InlineData(0.5, 0.5, 0.5, true)]
+    [InlineData(0.25, 0.5, 0.5, true)]
+    [InlineData(0.5, 0.25, 0.25, true)]
+    [InlineData(0.9, 0.1, 0.1, true)]
+    [InlineData(-1.0, 0.5, 0.5, false)]
+    [InlineData(-1.0, 0.0, 0.5, false)]
+    [InlineData(-1.0, 1.0, 1.0, false)]
+    [InlineData(2.0, 0.5, 0.5, false)]
+    [InlineData(0.5, 1.5, 0.5, false)]
+    public void ClassifiesRaysThroughSharedEdgesAndVertices(double x, double y, double z, bool expected)
+    {
+        var p = new Vector3d(x, y, z);
+        var classifier = new ClosedMeshClassifier(TestMeshes.CubeVertices, TestMeshes.CubeFaces);
+
+        Assert.Equal(expected, GeometryPredicates.PointInsideClosedMesh(p, TestMeshes.CubeVertices, TestMeshes.CubeFaces));
+        Assert.Equal(expected, classifier.Contains(p));
+    }
+
+    [Fact]
+    public void BatchedClassificationMatchesPerPointRayCasting()
+    {
+        var rng = new Random(7);
+        var points = Enumerable.Range(0, 2000)
+            .Select(_ => new Vector3d(
+                Math.Round((rng.NextDouble() * 1.4) - 0.2, 2),
+                Math.Round((rng.NextDouble() * 1.4) - 0.2, 2),
+                Math.Round((rng.NextDouble() * 1.4) - 0.2, 2)))
+            .ToArray();
+
+        var inside = new ClosedMeshClassifier(TestMeshes.CubeVertices, TestMeshes.CubeFaces).Classify(points);
+
+        for (var i = 0; i < points.Length; i++)
+        {
+            Assert.Equal(GeometryPredicates.PointInsideClosedMesh(points[i], TestMeshes.CubeVertices, TestMeshes.CubeFaces), inside[i]);
+            var p = points[i];
+            if (p.X > 0 && p.X < 1 && p.Y > 0 && p.Y < 1 && p.Z > 0 && p.Z < 1)
+            {
+                Assert.True(inside[i]);
+            }
+            else if (p.X < 0 || p.X > 1 || p.Y < 0 || p.Y > 1 || p.Z < 0 || p.Z > 1)
+            {
+                Assert.False(inside[i]);
+            }
+        }
+    }
+}
@@ -0,0 +1,84 @@
+using System.Diagnostics;
+using Xunit;
+using GenMesh.Mesh2Tetra.Diagnostics;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+using GenMesh.Mesh2Tetra.Tests.TestData;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class ConversionBudgetTests
+{
+    // A unit tetrahedron, which the Delaunay phase meshes, next to a unit cube, which it leaves
+    // entirely to the boundary collapse.
+    private static readonly Vector3d[] Vertices =
+    [
+        .. TestMeshes.TetraVertices,
+        .. TestMeshes.CubeVertices.Select(v => v + new Vector3d(3, 0, 0)),
+    ];
+
+    private static readonly Face[] Tetra = TestMeshes.TetraFaces;
+
+    private static readonly Face[] Faces =
+    [
+        .. Tetra,
+        .. TestMeshes.CubeFaces.Select(f => new Face(f.A + 4, f.B + 4, f.C + 4)),
+    ];
+
+    [Fact]
+    public void GenerousBudgetGivesTheConvertResult()
+    {
+        var options = new Mesh2TetraOptions { Verbose = false, TimeBudget = TimeSpan.FromMinutes(5) };
+
+        var result = Mesh2TetraConverter.ConvertWithinBudget(Vertices[..4], Tetra, options);
+
+        Assert.True(result.IsComplete);
+        Assert.Null(result.StoppedIn);
+        Assert.Equal(0, result.ResidualFaces);
+        Assert.Equal(1.0, result.VolumeFraction, 12);
+        Assert.Equal(Mesh2TetraConverter.Convert(Vertices[..4], Tetra, new Mesh2TetraOptions { Verbose = false }), result.Tetrahedra);
+    }
+
+    [Fact]
+    public void ExhaustedBudgetStopsWithoutTetrahedra()
+    {
+        var options = new Mesh2TetraOptions { Verbose = false, TimeBudget = TimeSpan.Zero };
+
+        var result = Mesh2TetraConverter.ConvertWithinBudget(Vertices, Faces, options);
+
+        Assert.Equal(ConversionStatus.TimedOut, result.Status);
+        Assert.Equal(ConversionPhase.Preprocessing, result.StoppedIn);
+        Assert.Empty(result.Tetrahedra);
+        Assert.Equal(Faces.Length, result.ResidualFaces);
+        Assert.Equal(0.0, result.VolumeFraction);
+        Assert.Throws<OperationCanceledException>(() => Mesh2TetraConverter.Convert(Vertices, Faces, options));
+    }
+
+    [Fact]
+    public void CancelledCollapseKeepsTheValidatedTetrahedra()
+    {
+        using var cancel = new CancellationTokenSource();
+        var options = new Mesh2TetraOptions { Verbose = false, CancellationToken = cancel.Token };
+
+        // Cancel as soon as this conversion's Delaunay phase ends.
+        using var root = new Activity("test").Start();
+        using var listener = new ActivityListener
+        {
+            ShouldListenTo = source => source.Name == Mesh2TetraDiagnostics.ActivitySourceName,
+            Sample = (ref ActivityCreationOptions<ActivityContext> _) => ActivitySamplingResult.AllDataAndRecorded,
+            ActivityStopped = activity =>
+            {
+                if (activity.OperationName == nameof(ConversionPhase.Delaunay) && activity.TraceId == root.TraceId) cancel.Cancel();
+            },
+        };
+        ActivitySource.AddActivityListener(listener);
+
+        var result = Mesh2TetraConverter.ConvertWithinBudget(Vertices, Faces, options);
+
+        Assert.Equal(ConversionStatus.Cancelled, result.Status);
+        Assert.Equal(ConversionPhase.BoundaryCollapse, result.StoppedIn);
+        Assert.Equal(Mesh2TetraConverter.Convert(Vertices[..4], Tetra, new Mesh2TetraOptions { Verbose = false }), result.Tetrahedra);
+        Assert.Equal(12, result.ResidualFaces);
+        Assert.Equal(1.0 / 7.0, result.VolumeFraction, 12);
+    }
+}
@@ -0,0 +1,19 @@
+using Xunit;
+using GenMesh.Mesh2Tetra.Models;
+using GenMesh.Mesh2Tetra.Tests.TestData;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class ConversionPhaseTests
+{
+    [Fact]
+    public void ReportsEachPhaseOnceInPipelineOrder()
+    {
+        var phases = new List<ConversionPhase>();
+
+        var tets = Mesh2TetraConverter.Convert(TestMeshes.TetraVertices, TestMeshes.TetraFaces, new Mesh2TetraOptions { Verbose = false }, phases.Add);
+
+        Assert.Single(tets);
+        Assert.Equal([ConversionPhase.Preprocessing, ConversionPhase.Delaunay, ConversionPhase.BoundaryCollapse], phases);
+    }
+}
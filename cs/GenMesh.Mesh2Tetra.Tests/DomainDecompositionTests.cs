@@ -0,0 +1,181 @@
+using Xunit;
+using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class DomainDecompositionTests
+{
+    [Fact]
+    public void PartitionPutsEveryPointInOneBoundedCell()
+    {
+        var rng = new Random(11);
+        var points = Enumerable.Range(0, 1000).Select(_ => new Vector3d(rng.NextDouble() * 4, rng.NextDouble(), rng.Next(5))).ToList();
+
+        var cells = DomainDecomposition.Partition(points, 64);
+
+        Assert.True(cells.Count >= 1000 / 64);
+        Assert.Equal(Enumerable.Range(0, points.Count), cells.SelectMany(c => c.Points).Order());
+        foreach (var cell in cells)
+        {
+            Assert.InRange(cell.Points.Length, 1, 64);
+            foreach (var p in cell.Points.Select(i => points[i]))
+            {
+                Assert.True(p.X > cell.Lower.X && p.X <= cell.Upper.X);
+                Assert.True(p.Y > cell.Lower.Y && p.Y <= cell.Upper.Y);
+                Assert.True(p.Z > cell.Lower.Z && p.Z <= cell.Upper.Z);
+            }
+        }
+    }
+
+    [Fact]
+    public void CircumsphereMustClearTheSplitPlanes()
+    {
+        var open = double.PositiveInfinity;
+        var cell = new DomainDecomposition.Cell([], new Vector3d(-open, -open, -open), new Vector3d(1, open, open));
+        Vector3d[] tet = [new(0, 0, 0), new(0.5, 0, 0), new(0, 0.5, 0), new(0, 0, 0.5)];
+
+        // Circumcenter (0.25, 0.25, 0.25), radius sqrt(3) / 4.
+        Assert.True(DomainDecomposition.CircumsphereInside(cell, tet[0], tet[1], tet[2], tet[3]));
+        Assert.False(DomainDecomposition.CircumsphereInside(cell, tet[0] * 2, tet[1] * 2, tet[2] * 2, tet[3] * 2));
+        Assert.False(DomainDecomposition.CircumsphereInside(cell, tet[0], tet[1], tet[2], new Vector3d(0.25, 0.25, 0)));
+    }
+
+    [Fact]
+    public void SubdomainTetrahedraAreCellsOfTheWholeTetrahedralization()
+    {
+        var (vertices, faces) = Plate(24, 16);
+        var options = new Mesh2TetraOptions
+        {
+            Verbose = false,
+            DelaunayBackend = new IncrementalDelaunayBackend(),
+            MaxSubdomainPoints = 100,
+            MaxDelaunayRecursionDepth = 0,
+        };
+
+        var (tets, remaining) = DelaunayInside3D.Build(vertices, faces, options);
+        var (whole, _) = DelaunayInside3D.Build(vertices, faces, new Mesh2TetraOptions { Verbose = false, DelaunayBackend = new IncrementalDelaunayBackend() });
+
+        // Only the subdomain pass ran: part of the plate, all of it Delaunay, nothing overlapping.
+        Assert.NotEmpty(tets);
+        Assert.NotEmpty(remaining);
+        var wholeCells = whole.Select(Corners).ToHashSet();
+        Assert.True(tets.All(t => wholeCells.Contains(Corners(t))));
+        Assert.Equal(
+            GeometryPredicates.FaceMeshVolume(vertices, faces),
+            GeometryPredicates.TetraMeshVolume(vertices, tets) + GeometryPredicates.FaceMeshVolume(vertices, remaining),
+            9);
+    }
+
+    [Fact]
+    public void StitchedSubdomainsFillTheComponent()
+    {
+        var (vertices, faces) = Plate(24, 16);
+        var whole = new Mesh2TetraOptions { Verbose = false, DelaunayBackend = new IncrementalDelaunayBackend() };
+        var split = new Mesh2TetraOptions
+        {
+            Verbose = false,
+            DelaunayBackend = new IncrementalDelaunayBackend(),
+            MaxSubdomainPoints = 100,
+            MaxDegreeOfParallelism = 2,
+        };
+
+        var (tets, remaining) = DelaunayInside3D.Build(vertices, faces, split);
+
+        Assert.Empty(remaining);
+        Assert.Equal(GeometryPredicates.FaceMeshVolume(vertices, faces), GeometryPredicates.TetraMeshVolume(vertices, tets), 9);
+        Assert.Equal(
+            Mesh2TetraConverter.Convert(vertices, faces, whole).Select(Corners).Order(),
+            Mesh2TetraConverter.Convert(vertices, faces, split).Select(Corners).Order());
+    }
+
+    [Fact]
+    public void StitchPassIsCachedApartFromUndecomposedComponents()
+    {
+        var (vertices, faces) = Plate(4, 4);
+        var undecomposed = new Mesh2TetraOptions();
+        var decomposed = new Mesh2TetraOptions { MaxSubdomainPoints = 100 };
+
+        // The residual of a decomposed component is meshed with a limit of 0 but oriented cells.
+        Assert.NotEqual(
+            Mesh2TetraResultCache.ComponentKey(vertices, faces, undecomposed, 3, subdomainPoints: 0),
+            Mesh2TetraResultCache.ComponentKey(vertices, faces, decomposed, 3, subdomainPoints: 0));
+    }
+
+    [Fact]
+    public void TooFewSubdomainPointsAreRejected()
+    {
+        var (vertices, faces) = Plate(4, 4);
+        var options = new Mesh2TetraOptions { Verbose = false, MaxSubdomainPoints = 3 };
+
+        Assert.Throws<ArgumentOutOfRangeException>(() => DelaunayInside3D.Build(vertices, faces, options));
+    }
+
+    private static string Corners(Tetrahedron t) => string.Join(",", new[] { t.A, t.B, t.C, t.D }.Order());
+
+    // Closed plate of nx by ny grid squares, 0.3 thick. Vertices are jittered within their side
+    // and every grid quad is split along its Delaunay diagonal, so the surface is part of the
+    // Delaunay tetrahedralization of the vertices.
+    private static (List<Vector3d> Vertices, List<Face> Faces) Plate(int nx, int ny)
+    {
+        var rng = new Random(7);
+        var vertices = new List<Vector3d>();
+        for (var layer = 0; layer < 2; layer++)
+        for (var j = 0; j <= ny; j++)
+        for (var i = 0; i <= nx; i++)
+        {
+            var dx = i > 0 && i < nx ? 0.01 * rng.NextDouble() : 0;
+            var dy = j > 0 && j < ny ? 0.01 * rng.NextDouble() : 0;
+            vertices.Add(new Vector3d((i * 0.1) + dx, (j * 0.1) + dy, layer * 0.3));
+        }
+
+        int Bottom(int i, int j) => (j * (nx + 1)) + i;
+        int Top(int i, int j) => ((nx + 1) * (ny + 1)) + Bottom(i, j);
+
+        var faces = new List<Face>();
+        for (var j = 0; j < ny; j++)
+        for (var i = 0; i < nx; i++)
+        {
+            Quad(Top(i, j), Top(i + 1, j), Top(i + 1, j + 1), Top(i, j + 1));
+            Quad(Bottom(i, j), Bottom(i, j + 1), Bottom(i + 1, j + 1), Bottom(i + 1, j));
+        }
+
+        // The rim, counterclockwise seen from above, walled outward.
+        var rim = new List<(int I, int J)>();
+        for (var i = 0; i < nx; i++) rim.Add((i, 0));
+        for (var j = 0; j < ny; j++) rim.Add((nx, j));
+        for (var i = nx; i > 0; i--) rim.Add((i, ny));
+        for (var j = ny; j > 0; j--) rim.Add((0, j));
+        for (var k = 0; k < rim.Count; k++)
+        {
+            var p = rim[k];
+            var q = rim[(k + 1) % rim.Count];
+            Quad(Bottom(p.I, p.J), Bottom(q.I, q.J), Top(q.I, q.J), Top(p.I, p.J));
+        }
+
+        return (vertices, faces);
+
+        // Planar quad a, b, c, d: diagonal a-c is Delaunay when the angles at b and d sum to at most pi.
+        void Quad(int a, int b, int c, int d)
+        {
+            if (Angle(a, b, c) + Angle(c, d, a) <= Math.PI)
+            {
+                faces.Add(new Face(a, b, c));
+                faces.Add(new Face(a, c, d));
+            }
+            else
+            {
+                faces.Add(new Face(a, b, d));
+                faces.Add(new Face(b, c, d));
+            }
+        }
+
+        double Angle(int a, int apex, int c)
+        {
+            var u = vertices[a] - vertices[apex];
+            var v = vertices[c] - vertices[apex];
+            return Math.Acos(Vector3d.Dot(u, v) / (u.Norm() * v.Norm()));
+        }
+    }
+}
@@ -0,0 +1,71 @@
+using Xunit;
+using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class FaceGridIndexTests
+{
+    [Fact]
+    public void LargeFacesAmongSmallOnesStayOutOfTheGridAndAreStillFound()
+    {
+        // A fine fillet strip along x between large planar faces: the mean extent is small, so each
+        // large face would otherwise cover hundreds of thousands of cells.
+        var vertices = new List<Vector3d>();
+        var faces = new List<Face>();
+        for (var i = 0; i < 2000; i++)
+        {
+            var x = i * 0.01;
+            var v = vertices.Count;
+            vertices.Add(new Vector3d(x, 0, 0));
+            vertices.Add(new Vector3d(x + 0.01, 0, 0));
+            vertices.Add(new Vector3d(x, 0.01, 0.01));
+            faces.Add(new Face(v, v + 1, v + 2));
+        }
+
+        for (var k = 0; k < 4; k++)
+        {
+            var v = vertices.Count;
+            vertices.Add(new Vector3d(0, -100 * (k + 1), 0));
+            vertices.Add(new Vector3d(100, -100 * (k + 1), 0));
+            vertices.Add(new Vector3d(0, 0, 100 * (k + 1)));
+            faces.Add(new Face(v, v + 1, v + 2));
+        }
+
+        var grid = new FaceGridIndex(FaceGridIndex.SuggestCellSize(vertices, faces));
+        var boxes = faces.Select(f => FaceGridIndex.FaceBounds(vertices[f.A], vertices[f.B], vertices[f.C])).ToArray();
+        var live = new SortedSet<int>();
+        for (var i = 0; i < boxes.Length; i++)
+        {
+            grid.Insert(i, boxes[i].Min, boxes[i].Max);
+            live.Add(i);
+        }
+
+        Assert.Equal(4, grid.OversizedCount);
+        AssertMatchesScan(grid, boxes, live, new Vector3d(5, 0, 0), new Vector3d(5.02, 0.01, 0.01));
+        AssertMatchesScan(grid, boxes, live, new Vector3d(50, -150, 0), new Vector3d(50, -150, 0));
+        AssertMatchesScan(grid, boxes, live, new Vector3d(-1000, -1000, -1000), new Vector3d(1000, 1000, 1000));
+
+        foreach (var id in new[] { faces.Count - 1, 10 })
+        {
+            Assert.True(grid.Remove(id));
+            live.Remove(id);
+        }
+
+        Assert.Equal(3, grid.OversizedCount);
+        AssertMatchesScan(grid, boxes, live, new Vector3d(0, -400, 0), new Vector3d(0.2, 0, 0));
+    }
+
+    private static void AssertMatchesScan(FaceGridIndex grid, (Vector3d Min, Vector3d Max)[] boxes, SortedSet<int> live, Vector3d min, Vector3d max)
+    {
+        var found = new List<int>();
+        grid.Query(min, max, found);
+
+        var expected = live.Where(i =>
+            boxes[i].Min.X <= max.X && boxes[i].Max.X >= min.X
+            && boxes[i].Min.Y <= max.Y && boxes[i].Max.Y >= min.Y
+            && boxes[i].Min.Z <= max.Z && boxes[i].Max.Z >= min.Z);
+        Assert.Equal(expected, found.Order());
+    }
+}
@@ -0,0 +1,72 @@
+using System.Buffers;
+using Xunit;
+using GenMesh.Mesh2Tetra.Models;
+using GenMesh.Mesh2Tetra.Tests.TestData;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class FlatBufferApiTests
+{
+    public static IEnumerable<object[]> Fixtures => RegressionFixtureLoader.LoadFixtureCases();
+
+    [Theory]
+    [MemberData(nameof(Fixtures))]
+    public void FlatOverloadsMatchListOverload(RegressionFixture fixture, string _)
+    {
+        if (!string.IsNullOrWhiteSpace(fixture.Expected.ExpectedExceptionContains)) return;
+
+        var (vertices, faces) = fixture.Input.ToMesh();
+        var coordinates = vertices.SelectMany(v => new[] { v.X, v.Y, v.Z }).ToArray();
+        var indices = faces.SelectMany(f => new[] { f.A, f.B, f.C }).ToArray();
+        var options = new Mesh2TetraOptions
+        {
+            CheckInput = fixture.Options.CheckInput,
+            AutoResolveIntersections = fixture.Options.ResolveAutoResolveIntersections(),
+            FailOnSelfIntersections = fixture.Options.ResolveFailOnSelfIntersections(),
+            Verbose = false,
+            PlaneDistanceTolerance = fixture.Options.PlaneDistanceTolerance,
+            Epsilon = fixture.Options.Epsilon,
+        };
+
+        IReadOnlyList<Tetrahedron> expected;
+        try
+        {
+            expected = Mesh2TetraConverter.Convert(vertices, faces, options);
+        }
+        catch (InvalidOperationException)
+        {
+            return;
+        }
+
+        var expectedFlat = expected.SelectMany(t => t.Vertices).ToArray();
+
+        var writer = new ArrayBufferWriter<int>();
+        var written = Mesh2TetraConverter.Convert(coordinates.AsMemory(), indices.AsMemory(), writer, options);
+        Assert.Equal(expected.Count, written);
+        Assert.Equal(expectedFlat, writer.WrittenSpan.ToArray());
+
+        var buffer = new int[expectedFlat.Length + 8];
+        written = Mesh2TetraConverter.Convert(coordinates.AsSpan(), indices.AsSpan(), buffer.AsSpan(), options);
+        Assert.Equal(expected.Count, written);
+        Assert.Equal(expectedFlat, buffer[..(written * 4)]);
+    }
+
+    [Fact]
+    public void SpanOverloadRejectsTooSmallDestination()
+    {
+        double[] coordinates = [0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1];
+        int[] faces = [0, 2, 1, 0, 1, 3, 1, 2, 3, 0, 3, 2];
+        var options = new Mesh2TetraOptions { Verbose = false };
+
+        Assert.Throws<ArgumentException>(() => Mesh2TetraConverter.Convert(coordinates.AsSpan(), faces.AsSpan(), new int[3].AsSpan(), options));
+        Assert.Equal(1, Mesh2TetraConverter.Convert(coordinates.AsSpan(), faces.AsSpan(), new int[4].AsSpan(), options));
+    }
+
+    [Fact]
+    public void RejectsRaggedBuffers()
+    {
+        var writer = new ArrayBufferWriter<int>();
+        Assert.Throws<ArgumentException>(() => Mesh2TetraConverter.Convert(new double[11].AsMemory(), new int[12].AsMemory(), writer));
+        Assert.Throws<ArgumentException>(() => Mesh2TetraConverter.Convert(new double[12].AsMemory(), new int[13].AsMemory(), writer));
+    }
+}
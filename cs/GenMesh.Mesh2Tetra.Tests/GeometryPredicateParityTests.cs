@@ -1,6 +1,7 @@
 using Xunit;
 using GenMesh.Mesh2Tetra.Algorithms;
 using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
 
 namespace GenMesh.Mesh2Tetra.Tests;
 
@@ -47,4 +48,93 @@ public sealed class GeometryPredicateParityTests
         Assert.InRange(center.Norm(), 0d, 1e-10);
         Assert.InRange(Math.Abs(radius - 1d), 0d, 1e-10);
     }
+
+    [Fact]
+    public void BroadPhaseFindsSameIntersectingPairsAsAllPairsScan()
+    {
+        var rng = new Random(42);
+        var vertices = new List<Vector3d>();
+        var faces = new List<Face>();
+        for (var i = 0; i < 400; i++)
+        {
+            var origin = new Vector3d(rng.NextDouble(), rng.NextDouble(), rng.NextDouble());
+            var start = vertices.Count;
+            for (var k = 0; k < 3; k++)
+            {
+                vertices.Add(origin + new Vector3d(rng.NextDouble() * 0.2, rng.NextDouble() * 0.2, rng.NextDouble() * 0.2));
+            }
+
+            faces.Add(new Face(start, start + 1, start + 2));
+        }
+
+        var expected = GeometryPredicates.FindIntersectingFacePairsBruteForce(vertices, faces);
+        var tree = FaceBoundsTree.Build(vertices, faces);
+
+        Assert.NotEmpty(expected);
+        Assert.Equal(expected, GeometryPredicates.FindIntersectingFacePairs(vertices, faces));
+        Assert.Equal(expected, GeometryPredicates.FindIntersectingFacePairs(vertices, faces, tree));
+        Assert.Equal(
+            GeometryPredicates.FindIntersectingFacePairsBruteForce(vertices, faces, maxOuterFaces: 50),
+            GeometryPredicates.FindIntersectingFacePairs(vertices, faces, tree, maxOuterFaces: 50));
+    }
+
+    [Fact]
+    public void CachedFaceGeometryGivesSameIntersectionAnswers()
+    {
+        // Pairs that share corners, lie in one plane, touch along an edge or nearly touch, where
+        // the early plane-side exit and the tolerances matter.
+        var rng = new Random(7);
+        var vertices = new List<Vector3d>();
+        for (var i = 0; i < 40; i++)
+        {
+            var p = new Vector3d(rng.Next(4) * 0.5, rng.Next(4) * 0.5, rng.Next(3) == 0 ? 0d : rng.NextDouble());
+            vertices.Add(p);
+            vertices.Add(p + new Vector3d(1e-13, 0, rng.Next(2) * 1e-11));
+        }
+
+        var faces = new List<Face>();
+        for (var i = 0; i < 600; i++)
+        {
+            var a = rng.Next(vertices.Count);
+            var b = rng.Next(vertices.Count);
+            var c = rng.Next(vertices.Count);
+            if (a != b && b != c && a != c) faces.Add(new Face(a, b, c));
+        }
+
+        var geometry = FaceGeometryCache.Build(vertices, faces);
+        var hits = 0;
+        for (var i = 0; i < faces.Count; i++)
+        for (var j = 0; j < faces.Count; j++)
+        {
+            var p = faces[i];
+            var o = faces[j];
+            foreach (var ignoreCorners in new[] { true, false })
+            {
+                var expected = GeometryPredicates.TriangleTriangleIntersection(
+                    vertices[p.A], vertices[p.B], vertices[p.C], vertices[o.A], vertices[o.B], vertices[o.C], ignoreCorners);
+                Assert.Equal(expected, geometry.Intersects(i, geometry, j, ignoreCorners));
+                if (expected) hits++;
+            }
+        }
+
+        Assert.True(hits > 0);
+
+        var all = Enumerable.Range(0, faces.Count).ToArray();
+        var batch = new bool[faces.Count];
+        foreach (var ignoreCorners in new[] { true, false })
+        {
+            for (var i = 0; i < faces.Count; i++)
+            {
+                var count = geometry.IntersectsEach(i, geometry, all.AsSpan(i % 3), ignoreCorners, batch);
+                var expected = 0;
+                for (var j = i % 3; j < faces.Count; j++)
+                {
+                    Assert.Equal(geometry.Intersects(i, geometry, j, ignoreCorners), batch[j - (i % 3)]);
+                    if (batch[j - (i % 3)]) expected++;
+                }
+
+                Assert.Equal(expected, count);
+            }
+        }
+    }
 }
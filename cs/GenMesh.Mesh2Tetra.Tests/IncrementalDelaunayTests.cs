@@ -0,0 +1,194 @@
+using System.Numerics;
+using Xunit;
+using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class IncrementalDelaunayTests
+{
+    [Fact]
+    public void InSphereSignFollowsOrientation()
+    {
+        var a = new Vector3d(0, 0, 0);
+        var b = new Vector3d(1, 0, 0);
+        var c = new Vector3d(0, 1, 0);
+        var d = new Vector3d(0, 0, 1);
+        Assert.Equal(1, RobustPredicates.Orient3D(a, b, c, d));
+
+        Assert.Equal(1, RobustPredicates.InSphere(a, b, c, d, new Vector3d(0.25, 0.25, 0.25)));
+        Assert.Equal(-1, RobustPredicates.InSphere(a, b, c, d, new Vector3d(2, 2, 2)));
+        Assert.Equal(0, RobustPredicates.InSphere(a, b, c, d, new Vector3d(1, 1, 1)));
+    }
+
+    [Fact]
+    public void InSphereIsExactForNearCosphericalPoints()
+    {
+        var rng = new Random(5);
+        for (var i = 0; i < 500; i++)
+        {
+            // Corners of a box with large integer coordinates are cospherical; nudging the far one
+            // by half a unit moves it just inside or outside. Differences are exact here.
+            var lo = new Vector3d(rng.NextInt64(1L << 40), rng.NextInt64(1L << 40), rng.NextInt64(1L << 40));
+            var hi = lo + new Vector3d(rng.NextInt64(1, 1L << 40), rng.NextInt64(1, 1L << 40), rng.NextInt64(1, 1L << 40));
+            var e = new Vector3d(hi.X, hi.Y, hi.Z + (rng.Next(-2, 3) * 0.5));
+            AssertInSphere(lo, new Vector3d(hi.X, lo.Y, lo.Z), new Vector3d(lo.X, hi.Y, lo.Z), new Vector3d(lo.X, lo.Y, hi.Z), e);
+
+            // Rounded points of the unit sphere, which mostly do not subtract exactly.
+            var p = Enumerable.Range(0, 5).Select(_ => UnitVector(rng)).ToArray();
+            if (RobustPredicates.Orient3D(p[0], p[1], p[2], p[3]) < 0) (p[0], p[1]) = (p[1], p[0]);
+            AssertInSphere(p[0], p[1], p[2], p[3], p[4]);
+        }
+
+        static void AssertInSphere(Vector3d a, Vector3d b, Vector3d c, Vector3d d, Vector3d e)
+            => Assert.Equal(ExactInSphere(a, b, c, d, e), RobustPredicates.InSphere(a, b, c, d, e));
+
+        static Vector3d UnitVector(Random rng)
+        {
+            var v = new Vector3d(rng.NextDouble() - 0.5, rng.NextDouble() - 0.5, rng.NextDouble() - 0.5);
+            return v / Math.Sqrt(Vector3d.Dot(v, v));
+        }
+    }
+
+    [Fact]
+    public void RandomPointsGiveADelaunayTetrahedralizationOfTheirHull()
+    {
+        var rng = new Random(3);
+        var points = Enumerable.Range(0, 300).Select(_ => new Vector3d(rng.NextDouble(), rng.NextDouble(), rng.NextDouble())).ToList();
+
+        var cells = new List<int>();
+        Assert.True(new IncrementalDelaunayBackend().TryTetrahedralize(points, 1e-10, cells));
+        var tets = Tetrahedra(cells);
+
+        // Empty spheres...
+        foreach (var t in tets)
+        {
+            Assert.Equal(1, RobustPredicates.Orient3D(points[t.A], points[t.B], points[t.C], points[t.D]));
+            foreach (var p in points)
+            {
+                Assert.True(RobustPredicates.InSphere(points[t.A], points[t.B], points[t.C], points[t.D], p) <= 0);
+            }
+        }
+
+        // ...and a convex outer boundary, so no cell along the hull went missing.
+        foreach (var f in MeshTopology.GetRemainingFaces(tets, []))
+        {
+            var sides = points.Select(p => RobustPredicates.Orient3D(points[f.A], points[f.B], points[f.C], p)).ToHashSet();
+            Assert.False(sides.Contains(1) && sides.Contains(-1));
+        }
+    }
+
+    [Fact]
+    public void GridPointsFillTheirBoxWithoutFlatCells()
+    {
+        // Every cube of a grid is cospherical, so the in-sphere test ties everywhere.
+        var points = new List<Vector3d>();
+        for (var x = 0; x < 5; x++)
+        for (var y = 0; y < 5; y++)
+        for (var z = 0; z < 5; z++)
+        {
+            points.Add(new Vector3d(x * 0.1, y * 0.1, z * 0.1));
+        }
+
+        // A repeated point is inserted once, whichever copy comes first.
+        points.Add(points[37]);
+
+        var cells = new List<int>();
+        Assert.True(new IncrementalDelaunayBackend().TryTetrahedralize(points, 1e-10, cells));
+
+        var tets = Tetrahedra(cells);
+        foreach (var t in tets)
+        {
+            Assert.Equal(1, RobustPredicates.Orient3D(points[t.A], points[t.B], points[t.C], points[t.D]));
+        }
+
+        Assert.Equal(125, cells.Distinct().Count());
+
+        Assert.Equal(0.064, GeometryPredicates.TetraMeshVolume(points, tets), 12);
+
+        // Every face not shared by two cells is half of a grid square on the box.
+        var hull = MeshTopology.GetRemainingFaces(tets, []);
+        Assert.Equal(6 * 16 * 2, hull.Count);
+        foreach (var f in hull)
+        {
+            Assert.True(OnBoxSide(points, f));
+        }
+    }
+
+    [Fact]
+    public void CoplanarPointsSpanNoVolume()
+    {
+        var points = Enumerable.Range(0, 10).Select(i => new Vector3d(i % 3, i / 3, 0)).ToList();
+        var cells = new List<int>();
+
+        Assert.False(new IncrementalDelaunayBackend().TryTetrahedralize(points, 1e-10, cells));
+        Assert.Empty(cells);
+    }
+
+    [Fact]
+    public void RestrictedOrderFollowsTheParentOrder()
+    {
+        var rank = SpatialSort.Ranks([4, 2, 0, 3, 1]);
+
+        Assert.Equal([1, 0, 2], SpatialSort.RestrictOrder(rank, [0, 4, 3]));
+    }
+
+    private static List<Tetrahedron> Tetrahedra(List<int> cells)
+    {
+        var tets = new List<Tetrahedron>();
+        for (var i = 0; i < cells.Count; i += 4)
+        {
+            tets.Add(new Tetrahedron(cells[i], cells[i + 1], cells[i + 2], cells[i + 3]));
+        }
+
+        return tets;
+    }
+
+    private static bool OnBoxSide(List<Vector3d> points, Face f)
+    {
+        var (a, b, c) = (points[f.A], points[f.B], points[f.C]);
+        return (a.X == b.X && b.X == c.X && (a.X == 0 || Math.Abs(a.X - 0.4) < 1e-12))
+            || (a.Y == b.Y && b.Y == c.Y && (a.Y == 0 || Math.Abs(a.Y - 0.4) < 1e-12))
+            || (a.Z == b.Z && b.Z == c.Z && (a.Z == 0 || Math.Abs(a.Z - 0.4) < 1e-12));
+    }
+
+    private static int ExactInSphere(Vector3d a, Vector3d b, Vector3d c, Vector3d d, Vector3d e)
+    {
+        BigInteger[] Row(Vector3d p)
+        {
+            var x = Exact(p.X) - Exact(e.X);
+            var y = Exact(p.Y) - Exact(e.Y);
+            var z = Exact(p.Z) - Exact(e.Z);
+            return [x, y, z, (x * x) + (y * y) + (z * z)];
+        }
+
+        // For a positively oriented tetrahedron this determinant is negative inside the sphere.
+        return -Determinant([Row(a), Row(b), Row(c), Row(d)]).Sign;
+    }
+
+    // x * 2^1074, an integer for every double.
+    private static BigInteger Exact(double x)
+    {
+        var bits = BitConverter.DoubleToInt64Bits(x);
+        var exponent = (int)((bits >> 52) & 0x7FF);
+        var mantissa = bits & 0xFFFFFFFFFFFFFL;
+        var value = exponent == 0 ? new BigInteger(mantissa) : new BigInteger(mantissa | (1L << 52)) << (exponent - 1);
+        return x < 0 ? -value : value;
+    }
+
+    private static BigInteger Determinant(BigInteger[][] m)
+    {
+        if (m.Length == 1) return m[0][0];
+
+        var det = BigInteger.Zero;
+        for (var col = 0; col < m.Length; col++)
+        {
+            var minor = m.Skip(1).Select(row => row.Where((_, j) => j != col).ToArray()).ToArray();
+            var term = m[0][col] * Determinant(minor);
+            det += col % 2 == 0 ? term : -term;
+        }
+
+        return det;
+    }
+}
@@ -13,22 +13,8 @@ public sealed class MatlabRegressionTests
     [MemberData(nameof(Fixtures))]
     public void ConvertsFixtureWithExpectedParity(RegressionFixture fixture, string _)
     {
-        var vertices = fixture.Input.Vertices
-            .Select(v => new Vector3d(v[0], v[1], v[2]))
-            .ToArray();
-        var faces = fixture.Input.Faces
-            .Select(f => new Face(f[0], f[1], f[2]))
-            .ToArray();
-
-        var options = new Mesh2TetraOptions
-        {
-            CheckInput = fixture.Options.CheckInput,
-            AutoResolveIntersections = fixture.Options.ResolveAutoResolveIntersections(),
-            FailOnSelfIntersections = fixture.Options.ResolveFailOnSelfIntersections(),
-            Verbose = fixture.Options.Verbose,
-            PlaneDistanceTolerance = fixture.Options.PlaneDistanceTolerance,
-            Epsilon = fixture.Options.Epsilon,
-        };
+        var (vertices, faces) = ToMesh(fixture);
+        var options = ToOptions(fixture);
 
         if (!string.IsNullOrWhiteSpace(fixture.Expected.ExpectedExceptionContains))
         {
@@ -66,6 +52,87 @@ public sealed class MatlabRegressionTests
         }
     }
 
+    [Theory]
+    [MemberData(nameof(Fixtures))]
+    public void ParallelDelaunayMatchesSerialOutput(RegressionFixture fixture, string _)
+    {
+        var (vertices, faces) = ToMesh(fixture);
+
+        var serial = RunOrError(vertices, faces, ToOptions(fixture));
+        var parallel = RunOrError(vertices, faces, ToOptions(fixture, maxDegreeOfParallelism: 4));
+
+        Assert.Equal(serial, parallel);
+    }
+
+    [Theory]
+    [MemberData(nameof(Fixtures))]
+    public void SpeculativeCollapseMatchesSerialOutput(RegressionFixture fixture, string _)
+    {
+        var (vertices, faces) = ToMesh(fixture);
+
+        var serial = RunOrError(vertices, faces, ToOptions(fixture));
+        var speculative = RunOrError(vertices, faces, ToOptions(fixture, speculativeCollapseWorkers: 3));
+
+        Assert.Equal(serial, speculative);
+    }
+
+    // The incremental backend may split cospherical points differently, so only the volume has
+    // to match.
+    [Theory]
+    [MemberData(nameof(Fixtures))]
+    public void IncrementalDelaunayBackendKeepsFixtureVolume(RegressionFixture fixture, string _)
+    {
+        if (!string.IsNullOrWhiteSpace(fixture.Expected.ExpectedExceptionContains))
+        {
+            return;
+        }
+
+        var (vertices, faces) = ToMesh(fixture);
+        var options = ToOptions(fixture, delaunayBackend: new IncrementalDelaunayBackend());
+
+        var tets = Mesh2TetraConverter.Convert(vertices, faces, options);
+
+        var outputVolume = tets.Sum(t => Math.Abs(SignedVolume(vertices[t.A], vertices[t.B], vertices[t.C], vertices[t.D])));
+        Assert.InRange(
+            Math.Abs(outputVolume - fixture.Expected.TetraVolume),
+            0,
+            fixture.Expected.VolumeTolerance);
+    }
+
+    private static (IReadOnlyList<Vector3d> Vertices, IReadOnlyList<Face> Faces) ToMesh(RegressionFixture fixture)
+        => fixture.Input.ToMesh();
+
+    // Tetrahedra in output order, or the exception, for comparing two runs.
+    private static string RunOrError(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, Mesh2TetraOptions options)
+    {
+        try
+        {
+            return string.Join(";", Mesh2TetraConverter.Convert(vertices, faces, options));
+        }
+        catch (Exception ex)
+        {
+            return $"{ex.GetType().Name}: {ex.Message}";
+        }
+    }
+
+    private static Mesh2TetraOptions ToOptions(
+        RegressionFixture fixture,
+        int maxDegreeOfParallelism = 1,
+        IDelaunayBackend? delaunayBackend = null,
+        int speculativeCollapseWorkers = 1)
+        => new()
+        {
+            CheckInput = fixture.Options.CheckInput,
+            AutoResolveIntersections = fixture.Options.ResolveAutoResolveIntersections(),
+            FailOnSelfIntersections = fixture.Options.ResolveFailOnSelfIntersections(),
+            Verbose = fixture.Options.Verbose,
+            PlaneDistanceTolerance = fixture.Options.PlaneDistanceTolerance,
+            Epsilon = fixture.Options.Epsilon,
+            MaxDegreeOfParallelism = maxDegreeOfParallelism,
+            SpeculativeCollapseWorkers = speculativeCollapseWorkers,
+            DelaunayBackend = delaunayBackend ?? new MIConvexHullDelaunayBackend(),
+        };
+
     private static double SignedVolume(Vector3d p1, Vector3d p2, Vector3d p3, Vector3d p4)
     {
         var a = p2 - p1;
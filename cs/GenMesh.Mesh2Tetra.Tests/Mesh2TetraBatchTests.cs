@@ -0,0 +1,121 @@
+using Xunit;
+using GenMesh.Mesh2Tetra.Models;
+using GenMesh.Mesh2Tetra.Tests.TestData;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class Mesh2TetraBatchTests
+{
+    private static readonly Mesh2TetraOptions Quiet = new() { Verbose = false };
+
+    [Fact]
+    public async Task BatchMatchesSingleConversionForEveryFixture()
+    {
+        var items = RegressionFixtureLoader.LoadFixtureCases()
+            .Select(c => ToItem((RegressionFixture)c[0], (string)c[1]))
+            .ToList();
+
+        var results = new List<Mesh2TetraBatchResult>();
+        await foreach (var result in Mesh2TetraConverter.ConvertBatchAsync(items, Quiet, maxConcurrency: 3))
+        {
+            results.Add(result);
+        }
+
+        Assert.Equal(Enumerable.Range(0, items.Count), results.Select(r => r.Index).Order());
+        foreach (var result in results)
+        {
+            var item = items[result.Index];
+            Assert.Equal(item.Id, result.Id);
+            Assert.Equal(Describe(() => Mesh2TetraConverter.Convert(item.Vertices, item.Faces, item.Options)), Describe(result));
+        }
+    }
+
+    [Fact]
+    public async Task FailingMeshIsReportedWithoutStoppingTheBatch()
+    {
+        Face[] broken = [new(0, 2, 1), new(0, 1, 3), new(1, 2, 3), new(0, 3, 7)];
+        Mesh2TetraBatchItem[] items =
+        [
+            new("first", TestMeshes.TetraVertices, TestMeshes.TetraFaces),
+            new("broken", TestMeshes.TetraVertices, broken),
+            new("last", TestMeshes.TetraVertices, TestMeshes.TetraFaces),
+        ];
+
+        var results = new Dictionary<string, Mesh2TetraBatchResult>();
+        await foreach (var result in Mesh2TetraConverter.ConvertBatchAsync(items, Quiet, maxConcurrency: 2))
+        {
+            results.Add(result.Id, result);
+        }
+
+        Assert.Equal(3, results.Count);
+        Assert.True(results["first"].Succeeded);
+        Assert.True(results["last"].Succeeded);
+        Assert.False(results["broken"].Succeeded);
+        Assert.Null(results["broken"].Tetrahedra);
+        Assert.NotNull(results["broken"].Error);
+    }
+
+    [Fact]
+    public async Task ItemOutOfTimeSucceedsWithItsStatus()
+    {
+        Mesh2TetraBatchItem[] items =
+        [
+            new("budgeted", TestMeshes.TetraVertices, TestMeshes.TetraFaces, new Mesh2TetraOptions { Verbose = false, TimeBudget = TimeSpan.Zero }),
+            new("unlimited", TestMeshes.TetraVertices, TestMeshes.TetraFaces),
+        ];
+
+        var results = new Dictionary<string, Mesh2TetraBatchResult>();
+        await foreach (var result in Mesh2TetraConverter.ConvertBatchAsync(items, Quiet, maxConcurrency: 2))
+        {
+            results.Add(result.Id, result);
+        }
+
+        Assert.True(results["budgeted"].Succeeded);
+        Assert.Equal(ConversionStatus.TimedOut, results["budgeted"].Status);
+        Assert.Empty(results["budgeted"].Tetrahedra!);
+        Assert.Equal(ConversionStatus.Completed, results["unlimited"].Status);
+        Assert.Single(results["unlimited"].Tetrahedra!);
+    }
+
+    [Fact]
+    public void RejectsInvalidConcurrency()
+    {
+        Assert.Throws<ArgumentOutOfRangeException>(() =>
+            Mesh2TetraConverter.ConvertBatchAsync([], Quiet, maxConcurrency: 0).GetAsyncEnumerator().MoveNextAsync().AsTask().GetAwaiter().GetResult());
+    }
+
+    private static Mesh2TetraBatchItem ToItem(RegressionFixture fixture, string id)
+    {
+        var (vertices, faces) = fixture.Input.ToMesh();
+        return new(
+            id,
+            vertices,
+            faces,
+            new Mesh2TetraOptions
+            {
+                CheckInput = fixture.Options.CheckInput,
+                AutoResolveIntersections = fixture.Options.ResolveAutoResolveIntersections(),
+                FailOnSelfIntersections = fixture.Options.ResolveFailOnSelfIntersections(),
+                Verbose = false,
+                PlaneDistanceTolerance = fixture.Options.PlaneDistanceTolerance,
+                Epsilon = fixture.Options.Epsilon,
+            });
+    }
+
+    private static string Describe(Func<IReadOnlyList<Tetrahedron>> convert)
+    {
+        try
+        {
+            return string.Join(";", convert());
+        }
+        catch (Exception ex)
+        {
+            return $"{ex.GetType().Name}: {ex.Message}";
+        }
+    }
+
+    private static string Describe(Mesh2TetraBatchResult result)
+        => result.Succeeded
+            ? string.Join(";", result.Tetrahedra!)
+            : $"{result.Error!.GetType().Name}: {result.Error.Message}";
+}
@@ -0,0 +1,42 @@
+using Xunit;
+using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class MeshPreprocessingTests
+{
+    [Fact]
+    public void RepairsIndependentIntersectionClustersByLocalCollapse()
+    {
+        // Two far-apart triangular bipyramids, each with its top apex folded through its own
+        // bottom fan. One pass collapses both apexes, leaving two closed tetrahedron shells.
+        var vertices = new List<Vector3d>();
+        var faces = new List<Face>();
+        foreach (var offset in new[] { 0d, 10d })
+        {
+            var b = vertices.Count;
+            vertices.Add(new Vector3d(offset + 2, 2, -0.5));
+            vertices.Add(new Vector3d(offset + 0.3, 0.3, -0.9));
+            vertices.Add(new Vector3d(offset, 0, 0));
+            vertices.Add(new Vector3d(offset + 1, 0, 0));
+            vertices.Add(new Vector3d(offset, 1, 0));
+            faces.AddRange([
+                new(b, b + 2, b + 3), new(b, b + 3, b + 4), new(b, b + 4, b + 2),
+                new(b + 1, b + 3, b + 2), new(b + 1, b + 4, b + 3), new(b + 1, b + 2, b + 4),
+            ]);
+        }
+
+        Assert.True(GeometryPredicates.HasMeshIntersections(vertices, faces));
+
+        var result = MeshPreprocessing.PreprocessBoundaryFaces(
+            vertices,
+            faces,
+            new Mesh2TetraOptions { Verbose = false, FailOnSelfIntersections = false, MaxSolveIntersectionIterations = 1 });
+
+        Assert.Equal(8, result.Count);
+        Assert.False(GeometryPredicates.HasMeshIntersections(vertices, result));
+        Assert.Equal(2, MeshTopology.SeparateFaceObjects(result).Count);
+    }
+}
@@ -0,0 +1,125 @@
+using System.Diagnostics.Metrics;
+using Xunit;
+using GenMesh.Mesh2Tetra.Diagnostics;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+using GenMesh.Mesh2Tetra.Tests.TestData;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class ResultCacheTests : IDisposable
+{
+    private readonly string _directory = Path.Combine(Path.GetTempPath(), $"m2tc-{Guid.NewGuid():N}");
+
+    public void Dispose()
+    {
+        if (Directory.Exists(_directory)) Directory.Delete(_directory, recursive: true);
+    }
+
+    [Fact]
+    public void RepeatedConversionIsServedFromTheCache()
+    {
+        var cache = new Mesh2TetraResultCache(_directory);
+        var options = new Mesh2TetraOptions { Verbose = false, ResultCache = cache };
+
+        var first = Mesh2TetraConverter.Convert(TestMeshes.CubeVertices, TestMeshes.CubeFaces, options);
+        var key = Mesh2TetraResultCache.ResultKey(TestMeshes.CubeVertices, TestMeshes.CubeFaces, options);
+        Assert.True(cache.TryGet(key, "result", out var stored));
+        Assert.Equal(first, stored);
+        Assert.True(cache.SizeBytes > 0);
+
+        var lookups = CountLookups(() => Assert.Equal(first, Mesh2TetraConverter.Convert(TestMeshes.CubeVertices, TestMeshes.CubeFaces, options)));
+        Assert.Equal(["result:hit"], lookups);
+
+        // Options that change the output change the key; the cache itself and verbosity do not.
+        Assert.NotEqual(key, Mesh2TetraResultCache.ResultKey(TestMeshes.CubeVertices, TestMeshes.CubeFaces, new Mesh2TetraOptions { Epsilon = 1e-9 }));
+        Assert.Equal(key, Mesh2TetraResultCache.ResultKey(TestMeshes.CubeVertices, TestMeshes.CubeFaces, new Mesh2TetraOptions()));
+    }
+
+    [Fact]
+    public void AssemblyReusesUnchangedComponents()
+    {
+        var cache = new Mesh2TetraResultCache(_directory);
+        var options = new Mesh2TetraOptions { Verbose = false, ResultCache = cache };
+        var (vertices, faces) = Assembly(new Vector3d(3, 0, 0));
+        var first = Mesh2TetraConverter.Convert(vertices, faces, options);
+
+        var (moved, movedFaces) = Assembly(new Vector3d(5, 0, 0));
+        IReadOnlyList<Tetrahedron>? second = null;
+        var lookups = CountLookups(() => second = Mesh2TetraConverter.Convert(moved, movedFaces, options));
+
+        Assert.Equal(["result:miss", "component:hit", "component:miss"], lookups);
+        Assert.Equal(first.Count, second!.Count);
+        Assert.Equal(Mesh2TetraConverter.Convert(moved, movedFaces, new Mesh2TetraOptions { Verbose = false }), second);
+    }
+
+    [Fact]
+    public void EvictsLeastRecentlyUsedEntries()
+    {
+        var cache = new Mesh2TetraResultCache(_directory, maxBytes: 3 * (16 + (4 * 16)));
+        Tetrahedron[] tets = [new(0, 1, 2, 3), new(1, 2, 3, 4), new(2, 3, 4, 5), new(3, 4, 5, 6)];
+        var start = DateTime.UtcNow.AddMinutes(-10);
+        for (var i = 0; i < 3; i++)
+        {
+            cache.Store($"k{i}", tets);
+            File.SetLastWriteTimeUtc(cache.EntryPath($"k{i}"), start.AddMinutes(i));
+        }
+
+        // Reading k0 makes it the most recently used entry, so k1 goes first.
+        Assert.True(cache.TryGet("k0", "result", out _));
+        cache.Store("k3", tets);
+
+        Assert.False(File.Exists(cache.EntryPath("k1")));
+        Assert.True(File.Exists(cache.EntryPath("k0")));
+        Assert.True(File.Exists(cache.EntryPath("k2")));
+        Assert.True(File.Exists(cache.EntryPath("k3")));
+        Assert.Equal(3 * (16 + (4 * 16)), cache.SizeBytes);
+    }
+
+    [Fact]
+    public void CorruptEntryIsAMiss()
+    {
+        var cache = new Mesh2TetraResultCache(_directory);
+        cache.Store("k", [new Tetrahedron(0, 1, 2, 3)]);
+        File.WriteAllBytes(cache.EntryPath("k"), [1, 2, 3]);
+
+        Assert.False(cache.TryGet("k", "result", out _));
+        Assert.False(File.Exists(cache.EntryPath("k")));
+    }
+
+    // Two cubes side by side; the second one is translated by offset.
+    private static (Vector3d[] Vertices, Face[] Faces) Assembly(Vector3d offset)
+    {
+        var vertices = TestMeshes.CubeVertices.Concat(TestMeshes.CubeVertices.Select(v => v + offset)).ToArray();
+        var faces = TestMeshes.CubeFaces.Concat(TestMeshes.CubeFaces.Select(f => new Face(f.A + 8, f.B + 8, f.C + 8))).ToArray();
+        return (vertices, faces);
+    }
+
+    private static List<string> CountLookups(Action action)
+    {
+        var lookups = new List<string>();
+        using var listener = new MeterListener();
+        listener.InstrumentPublished = (instrument, l) =>
+        {
+            if (instrument.Meter.Name == Mesh2TetraDiagnostics.MeterName && instrument.Name == "mesh2tetra.cache.lookups")
+            {
+                l.EnableMeasurementEvents(instrument);
+            }
+        };
+        listener.SetMeasurementEventCallback<long>((_, _, tags, _) =>
+        {
+            string? kind = null;
+            string? outcome = null;
+            foreach (var tag in tags)
+            {
+                if (tag.Key == "kind") kind = (string?)tag.Value;
+                if (tag.Key == "outcome") outcome = (string?)tag.Value;
+            }
+
+            lock (lookups) lookups.Add($"{kind}:{outcome}");
+        });
+        listener.Start();
+        action();
+        return lookups;
+    }
+}
@@ -0,0 +1,155 @@
+using System.Numerics;
+using Xunit;
+using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class RobustPredicatesTests
+{
+    [Fact]
+    public void Orient3DMatchesExactArithmeticForNearCoplanarPoints()
+    {
+        // Large integer coordinates, so BigInteger gives the exact sign and d lands within a unit of
+        // the plane abc.
+        var rng = new Random(7);
+        var roundedWrong = 0;
+        for (var i = 0; i < 2000; i++)
+        {
+            var a = RandomPoint(rng);
+            var b = RandomPoint(rng);
+            var c = RandomPoint(rng);
+            var s = rng.Next(-3, 4);
+            var t = rng.Next(-3, 4);
+            var d = a + ((b - a) * s) + ((c - a) * t) + new Vector3d(rng.Next(-1, 2), rng.Next(-1, 2), rng.Next(-1, 2));
+
+            var expected = ExactOrientation(a, b, c, d);
+            Assert.Equal(expected, RobustPredicates.Orient3D(a, b, c, d));
+            Assert.Equal(-expected, RobustPredicates.Orient3D(b, a, c, d));
+            if (Math.Sign(GeometryPredicates.SignedTetraVolume(a, b, c, d)) != expected) roundedWrong++;
+        }
+
+        // The plain floating-point volume gets some of these wrong.
+        Assert.True(roundedWrong > 0);
+    }
+
+    [Fact]
+    public void Orient3DSignFollowsSignedVolume()
+    {
+        var a = new Vector3d(0, 0, 0);
+        var b = new Vector3d(1, 0, 0);
+        var c = new Vector3d(0, 1, 0);
+
+        Assert.Equal(1, RobustPredicates.Orient3D(a, b, c, new Vector3d(0.2, 0.2, 1e-300)));
+        Assert.Equal(-1, RobustPredicates.Orient3D(a, b, c, new Vector3d(0.2, 0.2, -1)));
+        Assert.Equal(0, RobustPredicates.Orient3D(a, b, c, new Vector3d(5, -3, 0)));
+    }
+
+    [Theory]
+    [InlineData(0d)]
+    [InlineData(1e7)]
+    [InlineData(-3.5e9)]
+    public void TrianglesCrossIgnoresSharedCornersAtAnyOffset(double offset)
+    {
+        var o = new Vector3d(offset, offset, offset);
+        var a = new Vector3d(0, 0, 0) + o;
+        var b = new Vector3d(1, 0, 0) + o;
+        var c = new Vector3d(0, 1, 0) + o;
+
+        // Pierces the interior of abc.
+        Assert.True(RobustPredicates.TrianglesCross(a, b, c, new Vector3d(0.25, 0.25, -1) + o, new Vector3d(0.25, 0.25, 1) + o, new Vector3d(2, 2, 0.5) + o));
+
+        // Shares the edge ab, and the corner a.
+        Assert.False(RobustPredicates.TrianglesCross(a, b, c, a, b, new Vector3d(0.5, -1, 0.5) + o));
+        Assert.False(RobustPredicates.TrianglesCross(a, b, c, a, new Vector3d(-1, 0, 1) + o, new Vector3d(0, -1, 1) + o));
+
+        // Touches the edge bc from above, and lies in the same plane.
+        Assert.False(RobustPredicates.TrianglesCross(a, b, c, new Vector3d(0.5, 0.5, 0) + o, new Vector3d(1, 1, 1) + o, new Vector3d(0, 1, 1) + o));
+        Assert.False(RobustPredicates.TrianglesCross(a, b, c, new Vector3d(0.1, 0.1, 0) + o, new Vector3d(2, 0.1, 0) + o, new Vector3d(0.1, 2, 0) + o));
+    }
+
+    [Fact]
+    public void TrianglesCrossIgnoresContactsLostToDecimalRounding()
+    {
+        // Diagonals 0-5 and 2-3 of the planar quad (0, 2, 5, 3) meet in (0.15, 0.6, 0.7), which the
+        // rounded decimal coordinates miss by about 1e-16.
+        var v0 = new Vector3d(0, 0, 0);
+        var v2 = new Vector3d(0.2, 1.3, 0);
+        var v3 = new Vector3d(0.1, -0.1, 1.4);
+        var v4 = new Vector3d(2.1, 0.1, 1.4);
+        var v5 = new Vector3d(0.3, 1.2, 1.4);
+
+        Assert.False(RobustPredicates.TrianglesCross(v0, v5, v4, v2, v0, v3));
+        Assert.False(GeometryPredicates.TriangleTriangleIntersection(v0, v5, v4, v2, v0, v3, ignoreCorners: true));
+    }
+
+    [Fact]
+    public void TrianglesCrossAgreesWithToleranceTestInGeneralPosition()
+    {
+        var rng = new Random(11);
+        var hits = 0;
+        for (var i = 0; i < 3000; i++)
+        {
+            var p = new[] { Point(rng), Point(rng), Point(rng) };
+            var q = new[] { Point(rng), Point(rng), Point(rng) };
+            var expected = GeometryPredicates.TriangleTriangleIntersection(p[0], p[1], p[2], q[0], q[1], q[2], ignoreCorners: true);
+            Assert.Equal(expected, RobustPredicates.TrianglesCross(p[0], p[1], p[2], q[0], q[1], q[2]));
+            if (expected) hits++;
+        }
+
+        Assert.True(hits > 100);
+
+        static Vector3d Point(Random rng) => new(rng.NextDouble(), rng.NextDouble(), rng.NextDouble());
+    }
+
+    [Fact]
+    public void ExactPredicatesFillShellFarFromTheOrigin()
+    {
+        // Hexagonal bipyramid moved ten million units away: plain volume sums lose every digit
+        // the 1e-7 check looks at.
+        var offset = new Vector3d(1e7, -2e7, 3e7);
+        var vertices = new List<Vector3d> { new Vector3d(0.1, -0.05, 1.3) + offset, new Vector3d(-0.05, 0.1, -0.9) + offset };
+        const int ring = 6;
+        for (var i = 0; i < ring; i++)
+        {
+            var angle = 2 * Math.PI * i / ring;
+            var radius = 1d + 0.15 * (i % 3);
+            vertices.Add(new Vector3d(radius * Math.Cos(angle), radius * Math.Sin(angle), 0.05 * (i % 2)) + offset);
+        }
+
+        var faces = new List<Face>();
+        for (var i = 0; i < ring; i++)
+        {
+            faces.Add(new Face(0, 2 + i, 2 + ((i + 1) % ring)));
+            faces.Add(new Face(1, 2 + ((i + 1) % ring), 2 + i));
+        }
+
+        var shellVolume = GeometryPredicates.FaceMeshVolume(vertices, faces, offset);
+        Assert.Throws<InvalidOperationException>(() => BoundaryCollapse3D.FillResidualVolume(vertices, faces, [], new Mesh2TetraOptions { Verbose = false }));
+
+        var tets = BoundaryCollapse3D.FillResidualVolume(vertices, faces, [], new Mesh2TetraOptions { Verbose = false, ExactPredicates = true });
+
+        Assert.NotEmpty(tets);
+        Assert.InRange(Math.Abs(GeometryPredicates.TetraMeshVolume(vertices, tets) - shellVolume), 0d, 1e-6);
+        foreach (var t in tets)
+        {
+            Assert.NotEqual(0, RobustPredicates.Orient3D(vertices[t.A], vertices[t.B], vertices[t.C], vertices[t.D]));
+        }
+    }
+
+    private static Vector3d RandomPoint(Random rng)
+        => new(rng.NextInt64(1L << 49), rng.NextInt64(1L << 49), rng.NextInt64(1L << 49));
+
+    private static int ExactOrientation(Vector3d a, Vector3d b, Vector3d c, Vector3d d)
+    {
+        var (bx, by, bz) = Difference(b, a);
+        var (cx, cy, cz) = Difference(c, a);
+        var (dx, dy, dz) = Difference(d, a);
+        var det = (bx * ((cy * dz) - (cz * dy))) - (by * ((cx * dz) - (cz * dx))) + (bz * ((cx * dy) - (cy * dx)));
+        return det.Sign;
+    }
+
+    private static (BigInteger X, BigInteger Y, BigInteger Z) Difference(Vector3d u, Vector3d v)
+        => (new BigInteger(u.X) - new BigInteger(v.X), new BigInteger(u.Y) - new BigInteger(v.Y), new BigInteger(u.Z) - new BigInteger(v.Z));
+}
@@ -0,0 +1,183 @@
+using System.Text;
+using Xunit;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.IO;
+using GenMesh.Mesh2Tetra.Models;
+using GenMesh.Mesh2Tetra.Tests.TestData;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class StreamingOutputTests
+{
+    // The incremental backend keeps these tests independent of the convex-hull package.
+    private static readonly Mesh2TetraOptions Options = new() { Verbose = false, DelaunayBackend = new IncrementalDelaunayBackend() };
+
+    [Fact]
+    public void SingleComponentStreamsTheConvertResult()
+    {
+        var sink = new CollectingSink();
+
+        var count = Mesh2TetraConverter.Convert(TestMeshes.CubeVertices, TestMeshes.CubeFaces, sink, Options);
+
+        Assert.True(sink.Completed);
+        Assert.Equal(TestMeshes.CubeVertices, sink.Vertices);
+        Assert.Single(sink.Components);
+        Assert.Equal(Mesh2TetraConverter.Convert(TestMeshes.CubeVertices, TestMeshes.CubeFaces, Options), sink.Components[0]);
+        Assert.Equal(sink.Components[0].Count, count);
+    }
+
+    [Fact]
+    public void SeparateObjectsArriveAsSeparateComponents()
+    {
+        var (vertices, faces) = TwoCubes();
+        var sink = new CollectingSink();
+
+        var count = Mesh2TetraConverter.Convert(vertices, faces, sink, Options);
+
+        Assert.Equal(2, sink.Components.Count);
+        Assert.Equal(sink.Components.Sum(c => c.Count), count);
+
+        // Each object is meshed as if it were converted on its own.
+        Assert.Equal(Mesh2TetraConverter.Convert(vertices, faces[..12], Options), sink.Components[0]);
+        Assert.Equal(Mesh2TetraConverter.Convert(vertices, faces[12..], Options), sink.Components[1]);
+    }
+
+    [Fact]
+    public void BinaryWriterProducesAReadableMeshFile()
+    {
+        var (vertices, faces) = TwoCubes();
+        var expected = new CollectingSink();
+        Mesh2TetraConverter.Convert(vertices, faces, expected, Options);
+
+        var path = Path.Combine(Path.GetTempPath(), $"{Guid.NewGuid():N}{BinaryMeshFile.Extension}");
+        try
+        {
+            using (var writer = new BinaryTetrahedronWriter(path))
+            {
+                var written = Mesh2TetraConverter.Convert(vertices, faces, writer, Options);
+                Assert.Equal(written, writer.TetrahedronCount);
+            }
+
+            using var file = BinaryMeshFile.Open(path);
+            Assert.Equal(vertices, file.Vertices);
+            Assert.Equal(0, file.FaceCount);
+            var tets = expected.Components.SelectMany(c => c).ToList();
+            Assert.Equal(tets.Count, file.TetrahedronCount);
+            for (var i = 0; i < tets.Count; i++)
+            {
+                Assert.Equal(tets[i], file.GetTetrahedron(i));
+            }
+        }
+        finally
+        {
+            File.Delete(path);
+        }
+    }
+
+    [Fact]
+    public void BinaryWriterPatchesTheCountAfterAStreamPrefix()
+    {
+        byte[] prefix = [1, 2, 3, 4, 5];
+        var tets = new[] { new Tetrahedron(0, 1, 3, 4), new Tetrahedron(1, 2, 3, 6) };
+        using var stream = new MemoryStream();
+        stream.Write(prefix);
+        using (var writer = new BinaryTetrahedronWriter(stream, leaveOpen: true))
+        {
+            writer.Begin(TestMeshes.CubeVertices);
+            writer.WriteComponent(tets);
+            writer.Complete();
+        }
+
+        var bytes = stream.ToArray();
+        Assert.Equal(prefix, bytes[..prefix.Length]);
+
+        var path = Path.Combine(Path.GetTempPath(), $"{Guid.NewGuid():N}{BinaryMeshFile.Extension}");
+        try
+        {
+            File.WriteAllBytes(path, bytes[prefix.Length..]);
+            using var file = BinaryMeshFile.Open(path);
+            Assert.Equal(TestMeshes.CubeVertices, file.Vertices);
+            Assert.Equal(2, file.TetrahedronCount);
+            Assert.Equal(tets[1], file.GetTetrahedron(1));
+        }
+        finally
+        {
+            File.Delete(path);
+        }
+    }
+
+    [Fact]
+    public void GmshWriterCountsElementsOnceComplete()
+    {
+        var tets = new[] { new Tetrahedron(0, 1, 2, 4), new Tetrahedron(1, 3, 2, 4) };
+        var lines = WriteText(stream => new GmshTetrahedronWriter(stream, leaveOpen: true), [tets[..1], tets[1..]]);
+
+        Assert.Equal("$MeshFormat", lines[0]);
+        Assert.Equal("2.2 0 8", lines[1]);
+        var nodes = Array.IndexOf(lines, "$Nodes");
+        Assert.Equal("8", lines[nodes + 1]);
+        Assert.Equal("2 1 0 0", lines[nodes + 3]);
+
+        var elements = Array.IndexOf(lines, "$Elements");
+        Assert.Equal("2", lines[elements + 1].Trim());
+        Assert.Equal("1 4 2 1 1 1 2 3 5", lines[elements + 2]);
+        Assert.Equal("2 4 2 1 2 2 4 3 5", lines[elements + 3]);
+        Assert.Equal("$EndElements", lines[elements + 4]);
+    }
+
+    [Fact]
+    public void VtkWriterCountsCellsOnceComplete()
+    {
+        var tets = new[] { new Tetrahedron(0, 1, 2, 4), new Tetrahedron(1, 3, 2, 4) };
+        var lines = WriteText(stream => new VtkTetrahedronWriter(stream, leaveOpen: true), [tets]);
+
+        Assert.Equal("DATASET UNSTRUCTURED_GRID", lines[3]);
+        Assert.Equal("POINTS 8 double", lines[4]);
+        Assert.Equal("1 1 1", lines[11]);
+        Assert.Equal("CELLS 2 10", lines[13].Trim());
+        Assert.Equal("4 0 1 2 4", lines[14]);
+        Assert.Equal("CELL_TYPES 2", lines[16]);
+        Assert.Equal(["10", "10"], lines[17..19]);
+    }
+
+    private static string[] WriteText<T>(Func<Stream, T> create, Tetrahedron[][] components)
+        where T : ITetrahedronSink, IDisposable
+    {
+        using var stream = new MemoryStream();
+        using (var writer = create(stream))
+        {
+            writer.Begin(TestMeshes.CubeVertices);
+            foreach (var component in components)
+            {
+                writer.WriteComponent(component);
+            }
+
+            writer.Complete();
+        }
+
+        return Encoding.UTF8.GetString(stream.ToArray()).Split('\n', StringSplitOptions.RemoveEmptyEntries);
+    }
+
+    private static (Vector3d[] Vertices, Face[] Faces) TwoCubes()
+    {
+        var offset = new Vector3d(3, 0, 0);
+        var vertices = TestMeshes.CubeVertices.Concat(TestMeshes.CubeVertices.Select(v => v + offset)).ToArray();
+        var faces = TestMeshes.CubeFaces.Concat(TestMeshes.CubeFaces.Select(f => new Face(f.A + 8, f.B + 8, f.C + 8))).ToArray();
+        return (vertices, faces);
+    }
+
+    private sealed class CollectingSink : ITetrahedronSink
+    {
+        public IReadOnlyList<Vector3d>? Vertices { get; private set; }
+
+        public List<List<Tetrahedron>> Components { get; } = [];
+
+        public bool Completed { get; private set; }
+
+        public void Begin(IReadOnlyList<Vector3d> vertices) => Vertices = vertices;
+
+        public void WriteComponent(IReadOnlyList<Tetrahedron> tetrahedra) => Components.Add([.. tetrahedra]);
+
+        public void Complete() => Completed = true;
+    }
+}
@@ -1,4 +1,5 @@
 using System.Text.Json;
+using GenMesh.Mesh2Tetra.IO;
 
 namespace GenMesh.Mesh2Tetra.Tests.TestData;
 
@@ -32,36 +33,56 @@ public static class RegressionFixtureLoader
         var fixture = JsonSerializer.Deserialize<RegressionFixture>(content, JsonOptions)
             ?? throw new InvalidDataException($"Failed to parse fixture file: {path}");
 
+        if (fixture.Input.Binary is not null)
+        {
+            LoadBinaryInput(fixture, path);
+        }
+
         ValidateFixture(fixture, path);
         return fixture;
     }
 
+    // The sidecar stays mapped for the lifetime of the test run; the mesh is read in place.
+    private static void LoadBinaryInput(RegressionFixture fixture, string path)
+    {
+        if (fixture.Input.Vertices.Count > 0 || fixture.Input.Faces.Count > 0)
+        {
+            throw new InvalidDataException($"Fixture '{path}' has both inline and binary input.");
+        }
+
+        var binary = BinaryMeshFile.Open(Path.Combine(Path.GetDirectoryName(path)!, fixture.Input.Binary!));
+        fixture.Input.BinaryMesh = binary;
+        if (fixture.Expected.ExactTetrahedraInBinary)
+        {
+            fixture.Expected.ExactTetrahedra = Enumerable.Range(0, binary.TetrahedronCount)
+                .Select(i => binary.GetTetrahedron(i).Vertices)
+                .ToList();
+        }
+    }
+
     private static void ValidateFixture(RegressionFixture fixture, string path)
     {
-        if (fixture.Input.Vertices.Count < 4)
+        if (fixture.Input.VertexCount < 4)
         {
             throw new InvalidDataException($"Fixture '{path}' has fewer than 4 vertices.");
         }
 
-        if (fixture.Input.Faces.Count < 4)
+        if (fixture.Input.FaceCount < 4)
         {
             throw new InvalidDataException($"Fixture '{path}' has fewer than 4 faces.");
         }
 
-        var vertexCount = fixture.Input.Vertices.Count;
-        foreach (var face in fixture.Input.Faces)
+        if (fixture.Input.Faces.Any(face => face.Length != 3))
         {
-            if (face.Length != 3)
-            {
-                throw new InvalidDataException($"Fixture '{path}' has a non-triangular face.");
-            }
+            throw new InvalidDataException($"Fixture '{path}' has a non-triangular face.");
+        }
 
-            foreach (var vertexId in face)
+        var vertexCount = fixture.Input.VertexCount;
+        foreach (var face in fixture.Input.ToMesh().Faces)
+        {
+            if (face.A < 0 || face.A >= vertexCount || face.B < 0 || face.B >= vertexCount || face.C < 0 || face.C >= vertexCount)
             {
-                if (vertexId < 0 || vertexId >= vertexCount)
-                {
-                    throw new InvalidDataException($"Fixture '{path}' face index is out of range.");
-                }
+                throw new InvalidDataException($"Fixture '{path}' face index is out of range.");
             }
         }
     }
@@ -1,4 +1,7 @@
 using System.Text.Json.Serialization;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.IO;
+using GenMesh.Mesh2Tetra.Models;
 
 namespace GenMesh.Mesh2Tetra.Tests.TestData;
 
@@ -14,6 +17,21 @@ public sealed class FixtureInput
 {
     public List<double[]> Vertices { get; init; } = [];
     public List<int[]> Faces { get; init; } = [];
+
+    // Sidecar .m2tb file (relative to the fixture JSON) holding the mesh instead of the arrays above.
+    public string? Binary { get; init; }
+
+    [JsonIgnore]
+    public BinaryMeshFile? BinaryMesh { get; internal set; }
+
+    public int VertexCount => BinaryMesh?.VertexCount ?? Vertices.Count;
+
+    public int FaceCount => BinaryMesh?.FaceCount ?? Faces.Count;
+
+    public (IReadOnlyList<Vector3d> Vertices, IReadOnlyList<Face> Faces) ToMesh()
+        => BinaryMesh is not null
+            ? (BinaryMesh.Vertices, BinaryMesh.Faces)
+            : (Vertices.Select(v => new Vector3d(v[0], v[1], v[2])).ToArray(), Faces.Select(f => new Face(f[0], f[1], f[2])).ToArray());
 }
 
 public sealed class FixtureExpected
@@ -23,7 +41,10 @@ public sealed class FixtureExpected
     public double VolumeTolerance { get; init; } = 1e-8;
 
     [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
-    public List<int[]>? ExactTetrahedra { get; init; }
+    public List<int[]>? ExactTetrahedra { get; internal set; }
+
+    // Exact tetrahedra are stored in the tetrahedron section of the input's binary sidecar.
+    public bool ExactTetrahedraInBinary { get; init; }
 
     public string? ExpectedExceptionContains { get; init; }
 }
@@ -0,0 +1,32 @@
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Tests.TestData;
+
+// Small closed meshes shared by the unit tests, with outward-facing faces. The arrays are shared
+// between tests and must not be modified.
+public static class TestMeshes
+{
+    // Corner tetrahedron of the unit cube.
+    public static readonly Vector3d[] TetraVertices = [new(0, 0, 0), new(1, 0, 0), new(0, 1, 0), new(0, 0, 1)];
+
+    public static readonly Face[] TetraFaces = [new(0, 2, 1), new(0, 1, 3), new(1, 2, 3), new(0, 3, 2)];
+
+    // Unit cube; every square is split along a diagonal, so axis-aligned rays through the cube
+    // centre run exactly through shared edges.
+    public static readonly Vector3d[] CubeVertices =
+    [
+        new(0, 0, 0), new(1, 0, 0), new(1, 1, 0), new(0, 1, 0),
+        new(0, 0, 1), new(1, 0, 1), new(1, 1, 1), new(0, 1, 1),
+    ];
+
+    public static readonly Face[] CubeFaces =
+    [
+        new(0, 2, 1), new(0, 3, 2),
+        new(4, 5, 6), new(4, 6, 7),
+        new(0, 1, 5), new(0, 5, 4),
+        new(1, 2, 6), new(1, 6, 5),
+        new(2, 3, 7), new(2, 7, 6),
+        new(3, 0, 4), new(3, 4, 7),
+    ];
+}
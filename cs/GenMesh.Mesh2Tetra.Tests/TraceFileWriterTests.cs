@@ -0,0 +1,43 @@
+using System.Diagnostics;
+using System.Text.Json;
+using Xunit;
+using GenMesh.Mesh2Tetra.Diagnostics;
+using GenMesh.Mesh2Tetra.Tests.TestData;
+
+namespace GenMesh.Mesh2Tetra.Tests;
+
+public sealed class TraceFileWriterTests
+{
+    [Fact]
+    public void WritesPhaseTreeWithCounts()
+    {
+        var output = new StringWriter();
+
+        // The listener is process-wide; the parent activity's trace id separates this test's spans
+        // from conversions running in parallel tests.
+        string traceId;
+        using (new TraceFileWriter(output))
+        using (var parent = new Activity(nameof(WritesPhaseTreeWithCounts)).SetIdFormat(ActivityIdFormat.W3C).Start())
+        {
+            traceId = parent.TraceId.ToHexString();
+            Mesh2TetraConverter.Convert(TestMeshes.TetraVertices, TestMeshes.TetraFaces, new Mesh2TetraOptions { Verbose = false });
+        }
+
+        var spans = output.ToString()
+            .Split('\n', StringSplitOptions.RemoveEmptyEntries)
+            .Select(line => JsonDocument.Parse(line).RootElement)
+            .Where(span => span.GetProperty("traceId").GetString() == traceId)
+            .ToDictionary(span => span.GetProperty("name").GetString()!);
+
+        var convert = spans["Convert"];
+        Assert.Equal(4, convert.GetProperty("tags").GetProperty("faces").GetInt32());
+        Assert.Equal(1, convert.GetProperty("tags").GetProperty("tetrahedra").GetInt32());
+        foreach (var phase in new[] { "Preprocessing", "Delaunay", "BoundaryCollapse" })
+        {
+            Assert.Equal(convert.GetProperty("id").GetString(), spans[phase].GetProperty("parentId").GetString());
+        }
+
+        Assert.Equal("meshed", spans["DelaunayComponent"].GetProperty("tags").GetProperty("outcome").GetString());
+        Assert.Equal(0, spans["BoundaryCollapse"].GetProperty("tags").GetProperty("candidates").GetInt64());
+    }
+}
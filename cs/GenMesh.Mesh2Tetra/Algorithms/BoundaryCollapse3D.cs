@@ -1,3 +1,5 @@
+using System.Diagnostics;
+using GenMesh.Mesh2Tetra.Diagnostics;
 using GenMesh.Mesh2Tetra.Geometry;
 using GenMesh.Mesh2Tetra.Models;
 
@@ -9,32 +11,96 @@ internal static class BoundaryCollapse3D
         IReadOnlyList<Vector3d> vertices,
         IReadOnlyList<Face> residualFaces,
         IReadOnlyList<Tetrahedron> existing,
-        Mesh2TetraOptions options)
+        Mesh2TetraOptions options,
+        CancellationToken cancellationToken = default)
     {
-        var boundary = residualFaces.ToList();
-        var tetrahedra = existing.ToList();
-        var originalVolume = GeometryPredicates.FaceMeshVolume(vertices, boundary) + GeometryPredicates.TetraMeshVolume(vertices, tetrahedra);
+        var state = new BoundaryCollapseState(vertices, residualFaces, existing, options.ExactPredicates);
+        var originalVolume = options.ExactPredicates
+            ? state.Volume
+            : GeometryPredicates.FaceMeshVolume(vertices, state.Boundary) + GeometryPredicates.TetraMeshVolume(vertices, state.Tetrahedra);
         var rng = new Random(1234);
 
+        // The BoundaryCollapse phase activity, when a listener is attached.
+        var activity = Activity.Current?.Source == Mesh2TetraDiagnostics.Source ? Activity.Current : null;
+        var stats = new CollapseStatistics();
+        try
+        {
+            return Fill(vertices, state, originalVolume, rng, options, stats, activity, cancellationToken);
+        }
+        finally
+        {
+            stats.Publish(activity);
+        }
+    }
+
+    private static IReadOnlyList<Tetrahedron> Fill(
+        IReadOnlyList<Vector3d> vertices,
+        BoundaryCollapseState state,
+        double originalVolume,
+        Random rng,
+        Mesh2TetraOptions options,
+        CollapseStatistics stats,
+        Activity? activity,
+        CancellationToken cancellationToken)
+    {
+        var boundary = state.Boundary;
+        var tetrahedra = state.Tetrahedra;
+        var queue = options.CollapseCandidateOrder == CollapseCandidateOrder.BestShapeFirst
+            ? new CollapseCandidateQueue(vertices)
+            : null;
+        var workers = SpeculativeWorkers(options);
+        using var speculation = queue is null && workers > 1
+            ? new SpeculativeValidation(vertices, state, workers, originalVolume)
+            : null;
         var retry = 0;
         var mode = 0;
         var collapseExhausted = false;
         while (boundary.Count > 0)
         {
             var countBefore = tetrahedra.Count;
-            var collapsed = TryCollapseEdge(vertices, boundary, tetrahedra, originalVolume, mode, rng, options);
+            bool collapsed;
+            try
+            {
+                cancellationToken.ThrowIfCancellationRequested();
+                collapsed = queue is null
+                    ? TryCollapseEdge(vertices, state, originalVolume, mode, rng, stats, speculation, cancellationToken)
+                    : TryCollapseBestFirst(vertices, state, queue, originalVolume, stats, cancellationToken);
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                // Rejected candidates are rolled back before this point, so the state holds
+                // exactly the collapses accepted so far.
+                stats.Interrupted = true;
+                throw new CollapseInterruptedException([.. tetrahedra], boundary.Count, cancellationToken);
+            }
+
             if (!collapsed)
             {
                 mode = 1;
                 retry++;
-                RetryRemoveTetrahedrons(boundary, tetrahedra);
-                if (retry % 5 == 0) RetryRemoveTetrahedrons(boundary, tetrahedra);
-                if (retry % 10 == 0) RetryRemoveTetrahedrons(boundary, tetrahedra);
+                var faces = boundary.ToList();
+                var removed = RetryRemoveTetrahedrons(faces, tetrahedra);
+                if (retry % 5 == 0) removed += RetryRemoveTetrahedrons(faces, tetrahedra);
+                if (retry % 10 == 0) removed += RetryRemoveTetrahedrons(faces, tetrahedra);
+                state.Rebuild(faces);
+                queue?.Invalidate();
+                speculation?.Resync();
+                stats.RetryRounds++;
+                stats.RemovedTetrahedra += removed;
+                activity?.AddEvent(new ActivityEvent("RetryRound", tags: new ActivityTagsCollection
+                {
+                    ["retry"] = retry,
+                    ["removedTetrahedra"] = removed,
+                    ["boundaryFaces"] = boundary.Count,
+                    ["tetrahedra"] = tetrahedra.Count,
+                }));
+
                 if (retry > 25)
                 {
                     // For certain irregular shells, collapse heuristics can stall even though
                     // a valid partial tetra set already exists from earlier stages.
                     collapseExhausted = true;
+                    stats.Exhausted = true;
                     break;
                 }
             }
@@ -56,7 +122,7 @@ internal static class BoundaryCollapse3D
         }
 
         var finalVolume = GeometryPredicates.TetraMeshVolume(vertices, tetrahedra);
-        if (Math.Abs(finalVolume - originalVolume) > 1e-6)
+        if (VolumeMismatch(state, finalVolume, originalVolume, 1e-6))
         {
             throw new InvalidOperationException($"Boundary collapse volume mismatch. expected={originalVolume}, actual={finalVolume}");
         }
@@ -64,64 +130,127 @@ internal static class BoundaryCollapse3D
         return tetrahedra;
     }
 
+    private static int SpeculativeWorkers(Mesh2TetraOptions options)
+    {
+        var workers = options.SpeculativeCollapseWorkers;
+        if (workers == 0 || workers < -1)
+        {
+            throw new ArgumentOutOfRangeException(
+                nameof(options),
+                $"SpeculativeCollapseWorkers must be -1 or a positive value, got {workers}.");
+        }
+
+        return workers == -1 ? Environment.ProcessorCount : workers;
+    }
+
+    // Matlab order: boundary vertices in order of first use (shuffled after a failed round), each
+    // with its neighbours in order of first use, restarting from the first vertex after every
+    // accepted collapse. Incident faces come from the state's vertex adjacency. With speculation
+    // the candidates are handed over in windows instead of being tried one by one.
     private static bool TryCollapseEdge(
         IReadOnlyList<Vector3d> vertices,
-        List<Face> boundary,
-        List<Tetrahedron> tetrahedra,
+        BoundaryCollapseState state,
         double originalVolume,
         int mode,
         Random rng,
-        Mesh2TetraOptions options)
+        CollapseStatistics stats,
+        SpeculativeValidation? speculation,
+        CancellationToken cancellationToken)
     {
-        var vertexIds = boundary.SelectMany(f => new[] { f.A, f.B, f.C }).Distinct().ToList();
+        var boundary = state.Boundary;
+        var vertexIds = new List<int>();
+        var seen = new HashSet<int>();
+        foreach (var f in boundary)
+        {
+            if (seen.Add(f.A)) vertexIds.Add(f.A);
+            if (seen.Add(f.B)) vertexIds.Add(f.B);
+            if (seen.Add(f.C)) vertexIds.Add(f.C);
+        }
+
         if (mode == 1)
         {
             vertexIds = vertexIds.OrderBy(_ => rng.NextDouble()).ToList();
         }
 
+        var localRows = new List<int>();
+        var localFaces = new List<Face>();
+        var localNeighbors = new List<int>();
         foreach (var vertexId in vertexIds)
         {
-            var localRows = boundary.Select((f, idx) => (f, idx)).Where(x => HasVertex(x.f, vertexId)).ToList();
-            var localFaces = localRows.Select(x => x.f).ToList();
-            var localNeighbors = localFaces.SelectMany(f => new[] { f.A, f.B, f.C }).Distinct().Where(v => v != vertexId).ToList();
+            cancellationToken.ThrowIfCancellationRequested();
+            localRows.Clear();
+            foreach (var h in state.FacesAround(vertexId))
+            {
+                localRows.Add(state.IndexOfHandle(h));
+            }
 
-            foreach (var localVertex in localNeighbors)
+            localRows.Sort();
+            localFaces.Clear();
+            localNeighbors.Clear();
+            foreach (var row in localRows)
             {
-                var localNew = localFaces
-                    .Select(f => ReplaceVertex(f, vertexId, localVertex))
-                    .Where(f => !IsDegenerate(f))
-                    .ToList();
+                var f = boundary[row];
+                localFaces.Add(f);
+                if (f.A != vertexId && !localNeighbors.Contains(f.A)) localNeighbors.Add(f.A);
+                if (f.B != vertexId && !localNeighbors.Contains(f.B)) localNeighbors.Add(f.B);
+                if (f.C != vertexId && !localNeighbors.Contains(f.C)) localNeighbors.Add(f.C);
+            }
 
-                if (localNew.Count == 0)
+            if (speculation is not null)
+            {
+                int[] rows = [.. localRows];
+                Face[] faces = [.. localFaces];
+                foreach (var localVertex in localNeighbors)
                 {
-                    continue;
+                    if (speculation.Add(new CollapseCandidate(rows, faces, vertexId, localVertex), stats)) return true;
                 }
 
-                var b2 = boundary.ToList();
-                var t2 = tetrahedra.ToList();
-                var addedTets = Process(b2, t2, localRows.Select(x => x.idx).ToList(), localFaces, localNew, vertexId);
-
-                if (HasVolumeError(vertices, b2, t2, originalVolume)) continue;
-                if (GeometryPredicates.HasOrientationImbalance(b2)) continue;
-                if (!GeometryPredicates.CheckMoveInside3D(vertices, localNew, vertexId)) continue;
-                if (GeometryPredicates.HasMeshIntersections(vertices, b2)) continue;
+                continue;
+            }
 
-                if (addedTets.Count > 0)
+            foreach (var localVertex in localNeighbors)
+            {
+                if (TryCandidate(vertices, state, localRows, localFaces, vertexId, localVertex, originalVolume, stats, cancellationToken))
                 {
-                    var newTetFaces = addedTets
-                        .SelectMany(MeshTopology.GetTetFaces)
-                        .Concat(b2)
-                        .ToList();
-                    if (GeometryPredicates.HasMeshIntersections(vertices, newTetFaces, maxOuterFaces: addedTets.Count * 4))
-                    {
-                        continue;
-                    }
+                    return true;
                 }
+            }
+        }
+
+        return speculation?.Flush(stats) ?? false;
+    }
+
+    // Best-shaped candidate first (CollapseCandidateOrder.BestShapeFirst); the queue persists
+    // across calls and is rescored only around each accepted collapse.
+    private static bool TryCollapseBestFirst(
+        IReadOnlyList<Vector3d> vertices,
+        BoundaryCollapseState state,
+        CollapseCandidateQueue queue,
+        double originalVolume,
+        CollapseStatistics stats,
+        CancellationToken cancellationToken)
+    {
+        var localRows = new List<int>();
+        var localFaces = new List<Face>();
+        while (queue.TryDequeue(state, out var vertexId, out var neighbour))
+        {
+            cancellationToken.ThrowIfCancellationRequested();
+            localRows.Clear();
+            foreach (var h in state.FacesAround(vertexId))
+            {
+                localRows.Add(state.IndexOfHandle(h));
+            }
 
-                boundary.Clear();
-                boundary.AddRange(b2);
-                tetrahedra.Clear();
-                tetrahedra.AddRange(t2);
+            localRows.Sort();
+            localFaces.Clear();
+            foreach (var row in localRows)
+            {
+                localFaces.Add(state.Boundary[row]);
+            }
+
+            if (TryCandidate(vertices, state, localRows, localFaces, vertexId, neighbour, originalVolume, stats, cancellationToken))
+            {
+                queue.Touch(state, localFaces.SelectMany(f => new[] { f.A, f.B, f.C }).Distinct());
                 return true;
             }
         }
@@ -129,48 +258,144 @@ internal static class BoundaryCollapse3D
         return false;
     }
 
-    private static List<Tetrahedron> Process(List<Face> boundary, List<Tetrahedron> tetrahedra, List<int> localRows, List<Face> localFaces, List<Face> localNew, int vertexId)
+    // Collapses vertexId onto localVertex: the faces around vertexId (localRows, ascending
+    // boundary positions) are replaced by the moved faces, each closed by a tetrahedron.
+    private static bool TryCandidate(
+        IReadOnlyList<Vector3d> vertices,
+        BoundaryCollapseState state,
+        IReadOnlyList<int> localRows,
+        IReadOnlyList<Face> localFaces,
+        int vertexId,
+        int localVertex,
+        double originalVolume,
+        CollapseStatistics stats,
+        CancellationToken cancellationToken)
+    {
+        var outcome = Evaluate(vertices, state, new CollapseCandidate(localRows, localFaces, vertexId, localVertex), originalVolume, commit: true, cancellationToken);
+        stats.Count(outcome);
+        return outcome == CandidateOutcome.Accepted;
+    }
+
+    // Applies the candidate and checks it; an accepted candidate stays applied when commit is set,
+    // everything else is rolled back. A cancelled check is rolled back before it throws.
+    private static CandidateOutcome Evaluate(
+        IReadOnlyList<Vector3d> vertices,
+        BoundaryCollapseState state,
+        CollapseCandidate candidate,
+        double originalVolume,
+        bool commit,
+        CancellationToken cancellationToken = default)
+    {
+        var localNew = MovedFaces(candidate);
+        if (localNew.Count == 0) return CandidateOutcome.Degenerate;
+
+        state.BeginEdit();
+        var outcome = CandidateOutcome.Degenerate;
+        try
+        {
+            var addedTets = Process(state, candidate.Rows, localNew, candidate.VertexId);
+            outcome = CheckCollapse(vertices, state, addedTets, localNew, candidate.VertexId, originalVolume, cancellationToken);
+        }
+        finally
+        {
+            if (commit && outcome == CandidateOutcome.Accepted) state.Commit();
+            else state.Rollback();
+        }
+
+        return outcome;
+    }
+
+    // Applies a candidate known to pass, without checking it again.
+    private static void Apply(BoundaryCollapseState state, CollapseCandidate candidate)
+    {
+        state.BeginEdit();
+        Process(state, candidate.Rows, MovedFaces(candidate), candidate.VertexId);
+        state.Commit();
+    }
+
+    private static List<Face> MovedFaces(CollapseCandidate candidate)
+    {
+        var localNew = new List<Face>(candidate.Faces.Count);
+        foreach (var f in candidate.Faces)
+        {
+            var moved = ReplaceVertex(f, candidate.VertexId, candidate.LocalVertex);
+            if (!IsDegenerate(moved)) localNew.Add(moved);
+        }
+
+        return localNew;
+    }
+
+    // Cheapest checks first; cancellation is only observed before the expensive ones.
+    private static CandidateOutcome CheckCollapse(
+        IReadOnlyList<Vector3d> vertices,
+        BoundaryCollapseState state,
+        List<Tetrahedron> addedTets,
+        List<Face> localNew,
+        int vertexId,
+        double originalVolume,
+        CancellationToken cancellationToken)
+    {
+        if (VolumeMismatch(state, state.Volume, originalVolume, 1e-7)) return CandidateOutcome.Volume;
+        if (state.HasOrientationImbalance) return CandidateOutcome.Orientation;
+        cancellationToken.ThrowIfCancellationRequested();
+        if (!GeometryPredicates.CheckMoveInside3D(vertices, localNew, vertexId, state.ExactPredicates)) return CandidateOutcome.MoveInside;
+        cancellationToken.ThrowIfCancellationRequested();
+        if (state.HasIntersections) return CandidateOutcome.SelfIntersection;
+        cancellationToken.ThrowIfCancellationRequested();
+        return addedTets.Count == 0 || !state.TetrahedraIntersectBoundary(addedTets)
+            ? CandidateOutcome.Accepted
+            : CandidateOutcome.TetIntersection;
+    }
+
+    // Matlab's absolute tolerances; with exact predicates they are relative to the enclosed volume,
+    // so the checks hold at any coordinate scale.
+    private static bool VolumeMismatch(BoundaryCollapseState state, double volume, double expected, double tolerance)
+        => Math.Abs(volume - expected) > (state.ExactPredicates ? tolerance * expected : tolerance);
+
+    private static List<Tetrahedron> Process(BoundaryCollapseState state, IReadOnlyList<int> localRows, List<Face> localNew, int vertexId)
     {
         foreach (var idx in localRows.OrderByDescending(v => v))
         {
-            boundary.RemoveAt(idx);
+            state.RemoveFaceAt(idx);
         }
 
         var added = new List<Tetrahedron>(localNew.Count);
         foreach (var f in localNew)
         {
-            var existingIdx = boundary.FindIndex(x => MeshTopology.Canonical(x) == MeshTopology.Canonical(f));
+            var existingIdx = state.IndexOfCanonical(f);
             if (existingIdx >= 0)
             {
-                boundary.RemoveAt(existingIdx);
+                state.RemoveFaceAt(existingIdx);
             }
             else
             {
-                boundary.Add(f);
+                state.AddFace(f);
             }
 
             var tet = new Tetrahedron(f.A, f.B, f.C, vertexId);
-            tetrahedra.Add(tet);
+            state.AddTetrahedron(tet);
             added.Add(tet);
         }
 
         return added;
     }
 
-    private static void RetryRemoveTetrahedrons(List<Face> boundary, List<Tetrahedron> tetrahedra)
+    // Returns the number of tetrahedra removed.
+    private static int RetryRemoveTetrahedrons(List<Face> boundary, List<Tetrahedron> tetrahedra)
     {
-        if (boundary.Count == 0 || tetrahedra.Count == 0) return;
+        if (boundary.Count == 0 || tetrahedra.Count == 0) return 0;
 
         var removeTetra = new HashSet<int>();
         var removeFace = new HashSet<int>();
 
+        // First tetrahedron using each boundary face, from the face -> tetra adjacency.
+        var tetFaces = MeshTopology.IndexTetrahedronFaces(tetrahedra);
         for (var i = 0; i < boundary.Count; i++)
         {
-            var f = boundary[i];
-            var j = tetrahedra.FindIndex(t => MeshTopology.ContainsAllVertices(t, f));
-            if (j >= 0)
+            var owner = tetFaces.First(boundary[i]);
+            if (owner >= 0)
             {
-                removeTetra.Add(j);
+                removeTetra.Add(owner / 4);
                 removeFace.Add(i);
             }
         }
@@ -186,21 +411,218 @@ internal static class BoundaryCollapse3D
         var counts = newFaces.GroupBy(MeshTopology.Canonical).ToDictionary(g => g.Key, g => g.Count());
         var outerFaces = newFaces.Where(f => !removedBoundaryCanon.Contains(MeshTopology.Canonical(f)) && counts[MeshTopology.Canonical(f)] == 1).ToList();
 
-        foreach (var i in removeFace.OrderByDescending(v => v)) boundary.RemoveAt(i);
-        foreach (var i in removeTetra.OrderByDescending(v => v)) tetrahedra.RemoveAt(i);
+        MeshTopology.RemoveAtAll(boundary, removeFace);
+        MeshTopology.RemoveAtAll(tetrahedra, removeTetra);
         boundary.AddRange(outerFaces);
+        return removeTetra.Count;
     }
 
-    private static bool HasVolumeError(IReadOnlyList<Vector3d> vertices, List<Face> boundary, List<Tetrahedron> tetrahedra, double originalVolume)
+    private static Face ReplaceVertex(Face f, int from, int to)
+        => new(f.A == from ? to : f.A, f.B == from ? to : f.B, f.C == from ? to : f.C);
+
+    private static bool IsDegenerate(Face f) => f.A == f.B || f.B == f.C || f.A == f.C;
+
+    // Collapse of VertexId onto LocalVertex; Rows are the ascending boundary positions of Faces,
+    // the faces around VertexId.
+    private readonly record struct CollapseCandidate(IReadOnlyList<int> Rows, IReadOnlyList<Face> Faces, int VertexId, int LocalVertex);
+
+    // Validates windows of Sequential-order candidates concurrently (SpeculativeCollapseWorkers).
+    // Every worker owns a replica of the boundary state built from the same input, and every
+    // accepted collapse is applied to the main state and replayed on each replica, so all of them
+    // hold the same faces, handles and running sums and a candidate gets the same verdict on any
+    // of them as serially. Workers take candidates in window order; once a candidate passes and
+    // every earlier one has been rejected, later checks still running are cancelled, and that
+    // candidate is committed. Outcome counts cover exactly the candidates a serial run would try.
+    private sealed class SpeculativeValidation : IDisposable
     {
-        var v = GeometryPredicates.FaceMeshVolume(vertices, boundary) + GeometryPredicates.TetraMeshVolume(vertices, tetrahedra);
-        return Math.Abs(v - originalVolume) > 1e-7;
+        private const int Pending = -1;
+
+        private readonly IReadOnlyList<Vector3d> _vertices;
+        private readonly BoundaryCollapseState _state;
+        private readonly BoundaryCollapseState[] _replicas;
+        private readonly double _originalVolume;
+        private readonly List<CollapseCandidate> _window = [];
+        private readonly int _windowSize;
+        private readonly int[] _outcomes;
+        private CancellationTokenSource _cancel = new();
+        private int _next;
+        private int _winner;
+
+        public SpeculativeValidation(IReadOnlyList<Vector3d> vertices, BoundaryCollapseState state, int workers, double originalVolume)
+        {
+            _vertices = vertices;
+            _state = state;
+            _originalVolume = originalVolume;
+            _windowSize = 2 * workers;
+            _outcomes = new int[_windowSize];
+            _replicas = new BoundaryCollapseState[workers];
+            for (var w = 0; w < workers; w++)
+            {
+                _replicas[w] = new BoundaryCollapseState(vertices, state.Boundary, state.Tetrahedra, state.ExactPredicates);
+            }
+        }
+
+        // Queues a candidate; validates the window once it is full. True when one was committed.
+        public bool Add(CollapseCandidate candidate, CollapseStatistics stats)
+        {
+            _window.Add(candidate);
+            return _window.Count == _windowSize && Flush(stats);
+        }
+
+        public bool Flush(CollapseStatistics stats)
+        {
+            if (_window.Count == 0) return false;
+
+            Array.Fill(_outcomes, Pending);
+            _next = -1;
+            _winner = _window.Count;
+            if (!_cancel.TryReset())
+            {
+                _cancel.Dispose();
+                _cancel = new CancellationTokenSource();
+            }
+
+            var workers = Math.Min(_replicas.Length, _window.Count);
+            Parallel.For(0, workers, new ParallelOptions { MaxDegreeOfParallelism = workers }, Work);
+
+            var found = _winner < _window.Count;
+            var counted = found ? _winner + 1 : _window.Count;
+            for (var i = 0; i < counted; i++)
+            {
+                stats.Count((CandidateOutcome)_outcomes[i]);
+            }
+
+            if (found)
+            {
+                var accepted = _window[_winner];
+                Apply(_state, accepted);
+                Parallel.For(0, _replicas.Length, new ParallelOptions { MaxDegreeOfParallelism = _replicas.Length }, w => Apply(_replicas[w], accepted));
+            }
+
+            _window.Clear();
+            return found;
+        }
+
+        // After the main state was rebuilt from edited lists.
+        public void Resync()
+        {
+            foreach (var replica in _replicas)
+            {
+                replica.Tetrahedra.Clear();
+                replica.Tetrahedra.AddRange(_state.Tetrahedra);
+                replica.Rebuild(_state.Boundary);
+            }
+        }
+
+        public void Dispose() => _cancel.Dispose();
+
+        private void Work(int worker)
+        {
+            var replica = _replicas[worker];
+            var token = _cancel.Token;
+            while (true)
+            {
+                var i = Interlocked.Increment(ref _next);
+                if (i >= _window.Count || i > Volatile.Read(ref _winner)) return;
+
+                CandidateOutcome outcome;
+                try
+                {
+                    outcome = Evaluate(_vertices, replica, _window[i], _originalVolume, commit: false, token);
+                }
+                catch (OperationCanceledException) when (token.IsCancellationRequested)
+                {
+                    return;
+                }
+
+                Volatile.Write(ref _outcomes[i], (int)outcome);
+                if (outcome == CandidateOutcome.Accepted)
+                {
+                    var winner = Volatile.Read(ref _winner);
+                    while (i < winner)
+                    {
+                        var seen = Interlocked.CompareExchange(ref _winner, i, winner);
+                        if (seen == winner) break;
+                        winner = seen;
+                    }
+                }
+
+                if (Decided()) _cancel.Cancel();
+            }
+        }
+
+        // The first passing candidate is known once every candidate before it has an outcome.
+        private bool Decided()
+        {
+            var winner = Volatile.Read(ref _winner);
+            if (winner >= _window.Count) return false;
+            for (var k = 0; k < winner; k++)
+            {
+                if (Volatile.Read(ref _outcomes[k]) == Pending) return false;
+            }
+
+            return true;
+        }
+    }
+
+    // Why an edge-collapse candidate was accepted or rejected, in the order the checks run.
+    private enum CandidateOutcome
+    {
+        Accepted,
+        Degenerate,
+        Volume,
+        Orientation,
+        MoveInside,
+        SelfIntersection,
+        TetIntersection,
     }
 
-    private static bool HasVertex(Face f, int id) => f.A == id || f.B == id || f.C == id;
+    // Per-run counts, published as activity tags and meter measurements once the run ends.
+    private sealed class CollapseStatistics
+    {
+        private static readonly CandidateOutcome[] Outcomes = Enum.GetValues<CandidateOutcome>();
+        private static readonly string[] OutcomeNames = Outcomes.Select(o => char.ToLowerInvariant(o.ToString()[0]) + o.ToString()[1..]).ToArray();
 
-    private static Face ReplaceVertex(Face f, int from, int to)
-        => new(f.A == from ? to : f.A, f.B == from ? to : f.B, f.C == from ? to : f.C);
+        private readonly long[] _candidates = new long[Outcomes.Length];
 
-    private static bool IsDegenerate(Face f) => f.A == f.B || f.B == f.C || f.A == f.C;
+        public int RetryRounds { get; set; }
+        public int RemovedTetrahedra { get; set; }
+        public bool Exhausted { get; set; }
+        public bool Interrupted { get; set; }
+
+        public void Count(CandidateOutcome outcome) => _candidates[(int)outcome]++;
+
+        public void Publish(Activity? activity)
+        {
+            if (activity is not null)
+            {
+                activity.SetTag("candidates", _candidates.Sum());
+                for (var i = 0; i < _candidates.Length; i++)
+                {
+                    activity.SetTag($"candidates.{OutcomeNames[i]}", _candidates[i]);
+                }
+
+                activity.SetTag("retryRounds", RetryRounds);
+                activity.SetTag("retryRemovedTetrahedra", RemovedTetrahedra);
+                activity.SetTag("exhausted", Exhausted);
+                activity.SetTag("interrupted", Interrupted);
+            }
+
+            if (Mesh2TetraDiagnostics.CollapseCandidates.Enabled)
+            {
+                for (var i = 0; i < _candidates.Length; i++)
+                {
+                    if (_candidates[i] > 0)
+                    {
+                        Mesh2TetraDiagnostics.CollapseCandidates.Add(_candidates[i], new KeyValuePair<string, object?>("outcome", OutcomeNames[i]));
+                    }
+                }
+            }
+
+            if (RetryRounds > 0)
+            {
+                Mesh2TetraDiagnostics.CollapseRetryRounds.Add(RetryRounds);
+            }
+        }
+    }
 }
@@ -0,0 +1,453 @@
+using System.Runtime.InteropServices;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// Residual boundary + tetra set for the boundary-collapse phase, with the bookkeeping needed to
+// validate a candidate collapse locally: a spatial index of boundary faces with the set of
+// intersecting face pairs, directed edge counts for the orientation check, a vertex-to-face
+// adjacency for finding collapse candidates, a canonical face index for matching faces, cached
+// per-face geometry for the intersection tests, and running volume sums. Candidates are applied
+// in place between BeginEdit and Commit/Rollback; Rollback replays an undo log instead of
+// restoring copies of the face and tetra lists. Boundary faces sit in slots that are freed on
+// removal instead of shifting the faces after them; a SlotRankIndex turns slots into positions
+// and back in O(log n), and freed slots are dropped on Commit once they outnumber the faces.
+// Newly attached faces are only tested against their grid neighbours when HasIntersections is
+// read, so candidates that fail the cheap volume/orientation checks never pay for the narrow
+// phase. With exact predicates the face sums are taken relative to the centre of the initial
+// bounding box.
+internal sealed class BoundaryCollapseState
+{
+    private readonly IReadOnlyList<Vector3d> _vertices;
+    private readonly List<int> _slots = [];
+    private readonly List<int> _slotOfHandle = [];
+    private readonly SlotRankIndex _ranks = new();
+    private readonly List<Face> _faceByHandle = [];
+    private readonly List<List<int>> _partners = [];
+    private readonly Dictionary<(int, int), int> _edgeCounts = new();
+    private readonly CanonicalFaceIndex _byCanonical = new();
+    private readonly FaceGeometryCache _geometry;
+    private readonly FaceGeometryCache _tetFaceGeometry;
+    private readonly Dictionary<int, List<int>> _facesByVertex = new();
+    private readonly List<int> _candidates = [];
+    private bool[] _hits = new bool[16];
+    private readonly HashSet<int> _pending = [];
+    private readonly List<EditStep> _undo = [];
+    private FaceGridIndex _grid;
+    private int _unbalancedEdges;
+    private int _intersectingPairs;
+    private double _signedFaceSum;
+    private double _tetVolume;
+    private bool _editing;
+    private int _editTetCount;
+    private double _editSignedFaceSum;
+    private double _editTetVolume;
+
+    public BoundaryCollapseState(IReadOnlyList<Vector3d> vertices, IEnumerable<Face> boundary, IEnumerable<Tetrahedron> tetrahedra, bool exact = false)
+    {
+        _vertices = vertices;
+        var faces = boundary.ToList();
+        Boundary = new BoundaryView(this);
+        Tetrahedra = tetrahedra.ToList();
+        ExactPredicates = exact;
+        var origin = exact
+            ? GeometryPredicates.Bounds(vertices, faces.SelectMany(f => new[] { f.A, f.B, f.C })).Center
+            : default;
+        _geometry = new FaceGeometryCache(vertices, exact: exact, volumeOrigin: origin);
+        _tetFaceGeometry = new FaceGeometryCache(vertices, exact: exact);
+        _grid = new FaceGridIndex(FaceGridIndex.SuggestCellSize(vertices, faces));
+        Rebuild(faces);
+    }
+
+    // Boundary faces in order. Replace them with Rebuild(faces), outside an edit.
+    public IReadOnlyList<Face> Boundary { get; }
+
+    // Mutate this list directly only outside an edit, and call Rebuild afterwards.
+    public List<Tetrahedron> Tetrahedra { get; }
+
+    public bool ExactPredicates { get; }
+
+    public double Volume => Math.Abs(_signedFaceSum / 6d) + _tetVolume;
+
+    public bool HasOrientationImbalance => _unbalancedEdges > 0;
+
+    // Vertices used by at least one boundary face, in no particular order.
+    public IEnumerable<int> BoundaryVertices => _facesByVertex.Keys;
+
+    // Face handles stay fixed while a face is on the boundary; Rebuild renumbers them.
+    public int HandleAt(int index) => _slots[_ranks.Select(index)];
+
+    // Boundary position of the face, or -1 when it is not on the boundary.
+    public int IndexOfHandle(int handle)
+    {
+        var slot = handle < _slotOfHandle.Count ? _slotOfHandle[handle] : -1;
+        return slot >= 0 ? _ranks.Rank(slot) : -1;
+    }
+
+    public Face FaceOfHandle(int handle) => _faceByHandle[handle];
+
+    // Handles of the boundary faces using the vertex, in no particular order. The list is live:
+    // copy it before editing the boundary.
+    public IReadOnlyList<int> FacesAround(int vertex)
+        => _facesByVertex.TryGetValue(vertex, out var handles) ? handles : [];
+
+    public bool HasIntersections => IntersectingPairCount > 0;
+
+    public int IntersectingPairCount
+    {
+        get
+        {
+            FlushPending();
+            return _intersectingPairs;
+        }
+    }
+
+    public bool IsIntersecting(int handle)
+    {
+        FlushPending();
+        return _partners[handle].Count > 0;
+    }
+
+    // Renumbers the handles after Tetrahedra was edited, and replaces the boundary faces when
+    // given.
+    public void Rebuild(IEnumerable<Face>? boundary = null)
+    {
+        if (_editing) throw new InvalidOperationException("Cannot rebuild during an edit.");
+
+        var faces = (boundary ?? Boundary).ToArray();
+        _slots.Clear();
+        _slotOfHandle.Clear();
+        _ranks.Clear();
+        _faceByHandle.Clear();
+        _partners.Clear();
+        _edgeCounts.Clear();
+        _byCanonical.Clear();
+        _facesByVertex.Clear();
+        _pending.Clear();
+        _grid = new FaceGridIndex(FaceGridIndex.SuggestCellSize(_vertices, faces));
+        _unbalancedEdges = 0;
+        _intersectingPairs = 0;
+        _signedFaceSum = 0d;
+
+        foreach (var f in faces)
+        {
+            Attach(NewHandle(f), null);
+        }
+
+        _tetVolume = GeometryPredicates.TetraMeshVolume(_vertices, Tetrahedra);
+    }
+
+    public void BeginEdit()
+    {
+        if (_editing) throw new InvalidOperationException("An edit is already in progress.");
+
+        // Faces restored by Rollback keep their recorded partners, which is only exact when no
+        // face outside the edit is still waiting for its neighbour tests.
+        FlushPending();
+        _editing = true;
+        _undo.Clear();
+        _editTetCount = Tetrahedra.Count;
+        _editSignedFaceSum = _signedFaceSum;
+        _editTetVolume = _tetVolume;
+    }
+
+    public void Commit()
+    {
+        EnsureEditing();
+        _editing = false;
+        _undo.Clear();
+        if (_slots.Count > (2 * _ranks.Count) + 64) CompactSlots();
+    }
+
+    public void Rollback()
+    {
+        EnsureEditing();
+        for (var k = _undo.Count - 1; k >= 0; k--)
+        {
+            var step = _undo[k];
+            if (step.Added)
+            {
+                // The newest handle, in the last slot.
+                Detach(step.Handle);
+                _slots.RemoveAt(_slots.Count - 1);
+                _ranks.RemoveLast();
+                _slotOfHandle.RemoveAt(_slotOfHandle.Count - 1);
+                _faceByHandle.RemoveAt(_faceByHandle.Count - 1);
+                _partners.RemoveAt(_partners.Count - 1);
+            }
+            else
+            {
+                Attach(step.Handle, step.Partners, step.Slot);
+            }
+        }
+
+        Tetrahedra.RemoveRange(_editTetCount, Tetrahedra.Count - _editTetCount);
+        _signedFaceSum = _editSignedFaceSum;
+        _tetVolume = _editTetVolume;
+        _undo.Clear();
+        _editing = false;
+    }
+
+    public void RemoveFaceAt(int index)
+    {
+        EnsureEditing();
+        var slot = _ranks.Select(index);
+        var handle = _slots[slot];
+        var partners = _pending.Contains(handle) ? null : _partners[handle].ToArray();
+        Detach(handle);
+        _undo.Add(new EditStep(false, slot, handle, partners));
+    }
+
+    public void AddFace(Face face)
+    {
+        EnsureEditing();
+        var handle = NewHandle(face);
+        Attach(handle, null);
+        _undo.Add(new EditStep(true, _slotOfHandle[handle], handle, null));
+    }
+
+    // Boundary position of the first face with the same vertices (any orientation), or -1.
+    // Slots are in boundary order, so the first face is the one in the lowest slot.
+    public int IndexOfCanonical(Face face)
+    {
+        var slot = -1;
+        for (var h = _byCanonical.First(face); h >= 0; h = _byCanonical.Next(h))
+        {
+            var s = _slotOfHandle[h];
+            if (slot < 0 || s < slot) slot = s;
+        }
+
+        return slot < 0 ? -1 : _ranks.Rank(slot);
+    }
+
+    public void AddTetrahedron(Tetrahedron tet)
+    {
+        EnsureEditing();
+        Tetrahedra.Add(tet);
+        _tetVolume += Math.Abs(GeometryPredicates.SignedTetraVolume(_vertices[tet.A], _vertices[tet.B], _vertices[tet.C], _vertices[tet.D]));
+    }
+
+    // Faces of the given tetrahedra against each other and against the current boundary, matching
+    // HasMeshIntersections(tetFaces ++ boundary, maxOuterFaces: tetFaces.Count).
+    public bool TetrahedraIntersectBoundary(IReadOnlyList<Tetrahedron> tetrahedra)
+    {
+        var tetFaces = tetrahedra.SelectMany(MeshTopology.GetTetFaces).ToList();
+        if (GeometryPredicates.HasMeshIntersections(_vertices, tetFaces, exact: ExactPredicates)) return true;
+
+        for (var k = 0; k < tetFaces.Count; k++)
+        {
+            var tf = tetFaces[k];
+            _tetFaceGeometry.Set(k, tf);
+            var (min, max) = FaceGridIndex.FaceBounds(_vertices[tf.A], _vertices[tf.B], _vertices[tf.C]);
+            _candidates.Clear();
+            _grid.Query(min, max, _candidates);
+            if (IntersectingCandidates(tf, _tetFaceGeometry, k, skip: -1, skipPending: false) > 0) return true;
+        }
+
+        return false;
+    }
+
+    private int NewHandle(Face face)
+    {
+        _faceByHandle.Add(face);
+        _partners.Add([]);
+        _slotOfHandle.Add(-1);
+        _geometry.Set(_faceByHandle.Count - 1, face);
+        return _faceByHandle.Count - 1;
+    }
+
+    // A null partner list marks the face as pending; otherwise it is restored with exactly the
+    // intersecting partners it had when it was detached. A new face goes into a new last slot, a
+    // restored one back into the slot it was removed from.
+    private void Attach(int handle, int[]? partners, int slot = -1)
+    {
+        var f = _faceByHandle[handle];
+        var a = _vertices[f.A];
+        var b = _vertices[f.B];
+        var c = _vertices[f.C];
+        var (min, max) = FaceGridIndex.FaceBounds(a, b, c);
+
+        if (partners is null)
+        {
+            _pending.Add(handle);
+        }
+        else
+        {
+            foreach (var other in partners)
+            {
+                _partners[handle].Add(other);
+                _partners[other].Add(handle);
+                _intersectingPairs++;
+            }
+        }
+
+        _grid.Insert(handle, min, max);
+        if (slot < 0)
+        {
+            slot = _ranks.Append();
+            _slots.Add(handle);
+        }
+        else
+        {
+            _ranks.Set(slot, true);
+            _slots[slot] = handle;
+        }
+
+        _slotOfHandle[handle] = slot;
+        AddEdge(f.A, f.B, 1);
+        AddEdge(f.B, f.C, 1);
+        AddEdge(f.C, f.A, 1);
+        _byCanonical.Add(f, handle);
+        LinkVertex(f.A, handle);
+        if (f.B != f.A) LinkVertex(f.B, handle);
+        if (f.C != f.A && f.C != f.B) LinkVertex(f.C, handle);
+        _signedFaceSum += _geometry.VolumeTerm(handle);
+    }
+
+    private void Detach(int handle)
+    {
+        var f = _faceByHandle[handle];
+
+        _grid.Remove(handle);
+        _pending.Remove(handle);
+        foreach (var other in _partners[handle])
+        {
+            _partners[other].Remove(handle);
+            _intersectingPairs--;
+        }
+
+        _partners[handle].Clear();
+        var slot = _slotOfHandle[handle];
+        _ranks.Set(slot, false);
+        _slots[slot] = -1;
+        _slotOfHandle[handle] = -1;
+        AddEdge(f.A, f.B, -1);
+        AddEdge(f.B, f.C, -1);
+        AddEdge(f.C, f.A, -1);
+        _byCanonical.Remove(f, handle);
+        UnlinkVertex(f.A, handle);
+        UnlinkVertex(f.B, handle);
+        UnlinkVertex(f.C, handle);
+        _signedFaceSum -= _geometry.VolumeTerm(handle);
+    }
+
+    // Drops the freed slots; positions and handles stay as they are.
+    private void CompactSlots()
+    {
+        var kept = 0;
+        _ranks.Clear();
+        for (var s = 0; s < _slots.Count; s++)
+        {
+            var handle = _slots[s];
+            if (handle < 0) continue;
+            _slots[kept] = handle;
+            _slotOfHandle[handle] = _ranks.Append();
+            kept++;
+        }
+
+        _slots.RemoveRange(kept, _slots.Count - kept);
+    }
+
+    private void FlushPending()
+    {
+        if (_pending.Count == 0) return;
+
+        foreach (var handle in _pending.ToArray())
+        {
+            _pending.Remove(handle);
+            var f = _faceByHandle[handle];
+            var (min, max) = FaceGridIndex.FaceBounds(_vertices[f.A], _vertices[f.B], _vertices[f.C]);
+            _candidates.Clear();
+            _grid.Query(min, max, _candidates);
+            if (IntersectingCandidates(f, _geometry, handle, skip: handle, skipPending: true) == 0) continue;
+            for (var k = 0; k < _candidates.Count; k++)
+            {
+                if (!_hits[k]) continue;
+                var other = _candidates[k];
+                _partners[handle].Add(other);
+                _partners[other].Add(handle);
+                _intersectingPairs++;
+            }
+        }
+    }
+
+    private void LinkVertex(int vertex, int handle)
+    {
+        if (!_facesByVertex.TryGetValue(vertex, out var handles))
+        {
+            handles = [];
+            _facesByVertex[vertex] = handles;
+        }
+
+        handles.Add(handle);
+    }
+
+    private void UnlinkVertex(int vertex, int handle)
+    {
+        if (!_facesByVertex.TryGetValue(vertex, out var handles)) return;
+
+        var k = handles.IndexOf(handle);
+        if (k < 0) return;
+        handles[k] = handles[^1];
+        handles.RemoveAt(handles.Count - 1);
+        if (handles.Count == 0) _facesByVertex.Remove(vertex);
+    }
+
+    private void AddEdge(int from, int to, int delta)
+    {
+        var wasBalanced = EdgeCount(from, to) == EdgeCount(to, from);
+        var count = EdgeCount(from, to) + delta;
+        if (count == 0) _edgeCounts.Remove((from, to));
+        else _edgeCounts[(from, to)] = count;
+        var isBalanced = count == EdgeCount(to, from);
+        if (wasBalanced && !isBalanced) _unbalancedEdges++;
+        else if (!wasBalanced && isBalanced) _unbalancedEdges--;
+    }
+
+    private int EdgeCount(int from, int to) => _edgeCounts.TryGetValue((from, to), out var c) ? c : 0;
+
+    // Face p (id in pGeometry) against the boundary faces in _candidates, except the handle skip,
+    // copies of p and optionally pending faces. Leaves the tested handles in _candidates and the
+    // answers in _hits.
+    private int IntersectingCandidates(Face p, FaceGeometryCache pGeometry, int pId, int skip, bool skipPending)
+    {
+        var key = MeshTopology.Canonical(p);
+        var kept = 0;
+        for (var k = 0; k < _candidates.Count; k++)
+        {
+            var o = _candidates[k];
+            if (o == skip || (skipPending && _pending.Contains(o)) || MeshTopology.Canonical(_faceByHandle[o]) == key) continue;
+            _candidates[kept++] = o;
+        }
+
+        _candidates.RemoveRange(kept, _candidates.Count - kept);
+        if (kept == 0) return 0;
+        if (_hits.Length < _candidates.Count) _hits = new bool[Math.Max(_candidates.Count, _hits.Length * 2)];
+        return pGeometry.IntersectsEach(pId, _geometry, CollectionsMarshal.AsSpan(_candidates), ignoreCorners: true, _hits);
+    }
+
+    private void EnsureEditing()
+    {
+        if (!_editing) throw new InvalidOperationException("No edit is in progress.");
+    }
+
+    private readonly record struct EditStep(bool Added, int Slot, int Handle, int[]? Partners);
+
+    private sealed class BoundaryView(BoundaryCollapseState state) : IReadOnlyList<Face>
+    {
+        public int Count => state._ranks.Count;
+
+        public Face this[int index] => state._faceByHandle[state.HandleAt(index)];
+
+        public IEnumerator<Face> GetEnumerator()
+        {
+            foreach (var handle in state._slots)
+            {
+                if (handle >= 0) yield return state._faceByHandle[handle];
+            }
+        }
+
+        System.Collections.IEnumerator System.Collections.IEnumerable.GetEnumerator() => GetEnumerator();
+    }
+}
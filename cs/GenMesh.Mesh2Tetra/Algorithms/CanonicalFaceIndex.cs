@@ -0,0 +1,68 @@
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// Canonical face (sorted vertex triple) -> owners, e.g. positions in a face list, face handles or
+// tetrahedron indices. Owners are small non-negative ids; owners of the same face are chained in
+// the order they were added, so First returns the earliest one like a FindIndex scan would:
+//   for (var o = index.First(f); o >= 0; o = index.Next(o)) { ... }
+// Add and Remove cost O(1) plus the length of the chain (one or two owners in a valid mesh).
+internal sealed class CanonicalFaceIndex
+{
+    private readonly Dictionary<(int, int, int), int> _first;
+    private readonly List<int> _next = [];
+
+    public CanonicalFaceIndex(int capacity = 0)
+    {
+        _first = new Dictionary<(int, int, int), int>(capacity);
+    }
+
+    // Number of distinct faces.
+    public int Count => _first.Count;
+
+    public bool Contains(Face face) => _first.ContainsKey(MeshTopology.Canonical(face));
+
+    public int First(Face face) => _first.TryGetValue(MeshTopology.Canonical(face), out var owner) ? owner : -1;
+
+    public int Next(int owner) => _next[owner];
+
+    public void Add(Face face, int owner)
+    {
+        while (_next.Count <= owner) _next.Add(-1);
+        _next[owner] = -1;
+
+        var key = MeshTopology.Canonical(face);
+        if (!_first.TryGetValue(key, out var o))
+        {
+            _first[key] = owner;
+            return;
+        }
+
+        while (_next[o] >= 0) o = _next[o];
+        _next[o] = owner;
+    }
+
+    public bool Remove(Face face, int owner)
+    {
+        var key = MeshTopology.Canonical(face);
+        if (!_first.TryGetValue(key, out var o)) return false;
+
+        if (o == owner)
+        {
+            if (_next[o] >= 0) _first[key] = _next[o];
+            else _first.Remove(key);
+            return true;
+        }
+
+        while (_next[o] >= 0 && _next[o] != owner) o = _next[o];
+        if (_next[o] < 0) return false;
+        _next[o] = _next[owner];
+        return true;
+    }
+
+    public void Clear()
+    {
+        _first.Clear();
+        _next.Clear();
+    }
+}
@@ -0,0 +1,116 @@
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// Inside/outside classification against one closed boundary component. Faces are binned by their
+// (Y, Z) bounds into a 2D grid, so the +X parity ray of GeometryPredicates.RayAlongXCrossesFace only
+// visits the faces whose projection covers the query point. Answers match PointInsideClosedMesh.
+internal sealed class ClosedMeshClassifier
+{
+    private readonly IReadOnlyList<Vector3d> _vertices;
+    private readonly IReadOnlyList<Face> _faces;
+    private readonly double _minY;
+    private readonly double _minZ;
+    private readonly double _maxY;
+    private readonly double _maxZ;
+    private readonly double _cellY;
+    private readonly double _cellZ;
+    private readonly int _ny;
+    private readonly int _nz;
+    private readonly int[] _cellStart;
+    private readonly int[] _cellFaces;
+
+    public ClosedMeshClassifier(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces)
+    {
+        _vertices = vertices;
+        _faces = faces;
+
+        _minY = _minZ = double.PositiveInfinity;
+        _maxY = _maxZ = double.NegativeInfinity;
+        foreach (var f in faces)
+        {
+            foreach (var v in (ReadOnlySpan<int>)[f.A, f.B, f.C])
+            {
+                var p = vertices[v];
+                _minY = Math.Min(_minY, p.Y);
+                _minZ = Math.Min(_minZ, p.Z);
+                _maxY = Math.Max(_maxY, p.Y);
+                _maxZ = Math.Max(_maxZ, p.Z);
+            }
+        }
+
+        // About one cell per face: a closed shell projects onto each cell only a few layers deep.
+        var spanY = Math.Max(_maxY - _minY, 0d);
+        var spanZ = Math.Max(_maxZ - _minZ, 0d);
+        var cellSize = Math.Sqrt(spanY * spanZ / Math.Max(faces.Count, 1));
+        _ny = cellSize > 0d ? Math.Clamp((int)Math.Ceiling(spanY / cellSize), 1, 4096) : 1;
+        _nz = cellSize > 0d ? Math.Clamp((int)Math.Ceiling(spanZ / cellSize), 1, 4096) : 1;
+        _cellY = spanY > 0d ? spanY / _ny : 1d;
+        _cellZ = spanZ > 0d ? spanZ / _nz : 1d;
+
+        var counts = new int[(_ny * _nz) + 1];
+        ForEachCell(faces, (cell, _) => counts[cell + 1]++);
+        for (var i = 1; i < counts.Length; i++)
+        {
+            counts[i] += counts[i - 1];
+        }
+
+        _cellStart = counts;
+        _cellFaces = new int[counts[^1]];
+        var fill = (int[])counts.Clone();
+        ForEachCell(faces, (cell, faceIndex) => _cellFaces[fill[cell]++] = faceIndex);
+    }
+
+    public bool Contains(Vector3d p)
+    {
+        if (p.Y < _minY || p.Y > _maxY || p.Z < _minZ || p.Z > _maxZ) return false;
+
+        var cell = (CellY(p.Y) * _nz) + CellZ(p.Z);
+        var hitCount = 0;
+        for (var k = _cellStart[cell]; k < _cellStart[cell + 1]; k++)
+        {
+            if (GeometryPredicates.RayAlongXCrossesFace(p, _vertices, _faces[_cellFaces[k]]))
+            {
+                hitCount++;
+            }
+        }
+
+        return (hitCount % 2) == 1;
+    }
+
+    public bool[] Classify(IReadOnlyList<Vector3d> points)
+    {
+        var inside = new bool[points.Count];
+        for (var i = 0; i < points.Count; i++)
+        {
+            inside[i] = Contains(points[i]);
+        }
+
+        return inside;
+    }
+
+    private void ForEachCell(IReadOnlyList<Face> faces, Action<int, int> visit)
+    {
+        for (var i = 0; i < faces.Count; i++)
+        {
+            var f = faces[i];
+            var a = _vertices[f.A];
+            var b = _vertices[f.B];
+            var c = _vertices[f.C];
+            var y0 = CellY(Math.Min(a.Y, Math.Min(b.Y, c.Y)));
+            var y1 = CellY(Math.Max(a.Y, Math.Max(b.Y, c.Y)));
+            var z0 = CellZ(Math.Min(a.Z, Math.Min(b.Z, c.Z)));
+            var z1 = CellZ(Math.Max(a.Z, Math.Max(b.Z, c.Z)));
+            for (var y = y0; y <= y1; y++)
+            for (var z = z0; z <= z1; z++)
+            {
+                visit((y * _nz) + z, i);
+            }
+        }
+    }
+
+    private int CellY(double y) => Math.Clamp((int)((y - _minY) / _cellY), 0, _ny - 1);
+
+    private int CellZ(double z) => Math.Clamp((int)((z - _minZ) / _cellZ), 0, _nz - 1);
+}
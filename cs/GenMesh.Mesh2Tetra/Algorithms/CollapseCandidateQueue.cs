@@ -0,0 +1,132 @@
+using GenMesh.Mesh2Tetra.Geometry;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// Edge-collapse candidates (vertex -> neighbour) for BoundaryCollapse3D, best shape first. The
+// score of a candidate is the worst TetraShapeQuality among the tetrahedra it would create, so it
+// only depends on the faces around the collapsing vertex. After a collapse only the vertices of
+// the touched neighbourhood are rescored; their older entries are skipped through a per-vertex
+// version stamp instead of being removed from the heap.
+internal sealed class CollapseCandidateQueue
+{
+    private readonly IReadOnlyList<Vector3d> _vertices;
+    private readonly PriorityQueue<Candidate, (double Score, int Vertex, int Neighbour)> _heap = new();
+    private readonly Dictionary<int, int> _versions = new();
+    private readonly List<int> _neighbours = [];
+    private bool _seeded;
+    private bool _changedSinceSeed;
+
+    public CollapseCandidateQueue(IReadOnlyList<Vector3d> vertices)
+    {
+        _vertices = vertices;
+    }
+
+    // Call after the boundary was rebuilt outside of a collapse (face handles are renumbered).
+    public void Invalidate() => _seeded = false;
+
+    // Next candidate that is still current. A failed candidate is not offered again until its
+    // vertex is touched, or until a full reseed: when the heap runs dry after a collapse was
+    // accepted, every vertex is scored again once, because a change elsewhere can make an earlier
+    // rejection (e.g. a boundary intersection) pass. Returns false when a full pass over every
+    // candidate produced no collapse.
+    public bool TryDequeue(BoundaryCollapseState state, out int vertex, out int neighbour)
+    {
+        while (true)
+        {
+            if (!_seeded)
+            {
+                Seed(state);
+            }
+
+            while (_heap.TryDequeue(out var candidate, out _))
+            {
+                if (Version(candidate.Vertex) == candidate.Version)
+                {
+                    vertex = candidate.Vertex;
+                    neighbour = candidate.Neighbour;
+                    return true;
+                }
+            }
+
+            if (!_changedSinceSeed)
+            {
+                vertex = neighbour = -1;
+                return false;
+            }
+
+            _seeded = false;
+        }
+    }
+
+    // Rescore the vertices whose faces changed with an accepted collapse.
+    public void Touch(BoundaryCollapseState state, IEnumerable<int> vertices)
+    {
+        _changedSinceSeed = true;
+        foreach (var v in vertices)
+        {
+            _versions[v] = Version(v) + 1;
+            Push(state, v);
+        }
+    }
+
+    private void Seed(BoundaryCollapseState state)
+    {
+        _heap.Clear();
+        _versions.Clear();
+        foreach (var v in state.BoundaryVertices)
+        {
+            Push(state, v);
+        }
+
+        _seeded = true;
+        _changedSinceSeed = false;
+    }
+
+    private void Push(BoundaryCollapseState state, int vertex)
+    {
+        var around = state.FacesAround(vertex);
+        _neighbours.Clear();
+        foreach (var h in around)
+        {
+            var f = state.FaceOfHandle(h);
+            if (f.A != vertex && !_neighbours.Contains(f.A)) _neighbours.Add(f.A);
+            if (f.B != vertex && !_neighbours.Contains(f.B)) _neighbours.Add(f.B);
+            if (f.C != vertex && !_neighbours.Contains(f.C)) _neighbours.Add(f.C);
+        }
+
+        var version = Version(vertex);
+        foreach (var u in _neighbours)
+        {
+            var score = Score(state, around, vertex, u);
+            if (score >= 0d)
+            {
+                // Min-heap on the negated score; ties resolve by vertex ids for a stable order.
+                _heap.Enqueue(new Candidate(vertex, u, version), (-score, vertex, u));
+            }
+        }
+    }
+
+    // Worst shape quality of the tetrahedra (f with vertex -> neighbour, vertex); -1 when every
+    // face around the vertex also uses the neighbour, so the collapse would create nothing.
+    private double Score(BoundaryCollapseState state, IReadOnlyList<int> around, int vertex, int neighbour)
+    {
+        var worst = double.MaxValue;
+        var apex = _vertices[vertex];
+        foreach (var h in around)
+        {
+            var f = state.FaceOfHandle(h);
+            if (f.A == neighbour || f.B == neighbour || f.C == neighbour) continue;
+
+            var a = _vertices[f.A == vertex ? neighbour : f.A];
+            var b = _vertices[f.B == vertex ? neighbour : f.B];
+            var c = _vertices[f.C == vertex ? neighbour : f.C];
+            worst = Math.Min(worst, GeometryPredicates.TetraShapeQuality(a, b, c, apex));
+        }
+
+        return worst == double.MaxValue ? -1d : worst;
+    }
+
+    private int Version(int vertex) => _versions.TryGetValue(vertex, out var v) ? v : 0;
+
+    private readonly record struct Candidate(int Vertex, int Neighbour, int Version);
+}
@@ -0,0 +1,14 @@
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// Thrown by BoundaryCollapse3D when the conversion is cancelled between collapses. Tetrahedra is
+// the consistent tetra set at that point (Delaunay tetrahedra and accepted collapses), which
+// leaves ResidualFaces boundary faces open.
+internal sealed class CollapseInterruptedException(IReadOnlyList<Tetrahedron> tetrahedra, int residualFaces, CancellationToken token)
+    : OperationCanceledException("Boundary collapse was stopped before the residual volume was filled.", token)
+{
+    public IReadOnlyList<Tetrahedron> Tetrahedra { get; } = tetrahedra;
+
+    public int ResidualFaces { get; } = residualFaces;
+}
@@ -1,6 +1,8 @@
+using System.Diagnostics;
+using System.Runtime.ExceptionServices;
+using GenMesh.Mesh2Tetra.Diagnostics;
 using GenMesh.Mesh2Tetra.Geometry;
 using GenMesh.Mesh2Tetra.Models;
-using MIConvexHull;
 
 namespace GenMesh.Mesh2Tetra.Algorithms;
 
@@ -9,117 +11,364 @@ internal static class DelaunayInside3D
     public static (IReadOnlyList<Tetrahedron> Tetrahedra, IReadOnlyList<Face> RemainingFaces) Build(
         IReadOnlyList<Vector3d> vertices,
         IReadOnlyList<Face> boundaryFaces,
-        Mesh2TetraOptions options)
+        Mesh2TetraOptions options,
+        CancellationToken cancellationToken = default)
     {
-        var tetrahedra = BuildRecursive(vertices, boundaryFaces, options, depth: 0);
+        if (options.MaxSubdomainPoints is < 0 or > 0 and < 4)
+        {
+            throw new ArgumentOutOfRangeException(
+                nameof(options),
+                $"MaxSubdomainPoints must be 0 or at least 4, got {options.MaxSubdomainPoints}.");
+        }
+
+        var parallel = CreateParallelOptions(options, cancellationToken);
+        var tetrahedra = BuildRecursive(vertices, boundaryFaces, options, depth: 0, options.MaxSubdomainPoints, parallel, rank: null, cancellationToken);
         var remainingFaces = MeshTopology.GetRemainingFaces(tetrahedra, boundaryFaces);
         return (tetrahedra, remainingFaces);
     }
 
+    // All nested loops share one scheduler, so the concurrency cap holds across recursion levels.
+    // A loop whose workers are all busy runs its iterations on the calling thread instead of waiting.
+    // Cancellation stops a loop with a single OperationCanceledException.
+    private static ParallelOptions? CreateParallelOptions(Mesh2TetraOptions options, CancellationToken cancellationToken)
+    {
+        var dop = options.MaxDegreeOfParallelism;
+        if (dop == 0 || dop < -1)
+        {
+            throw new ArgumentOutOfRangeException(
+                nameof(options),
+                $"MaxDegreeOfParallelism must be -1 or a positive value, got {dop}.");
+        }
+
+        if (dop == -1) dop = Environment.ProcessorCount;
+        if (dop == 1) return null;
+
+        var scheduler = new ConcurrentExclusiveSchedulerPair(TaskScheduler.Default, dop).ConcurrentScheduler;
+        return new ParallelOptions { MaxDegreeOfParallelism = dop, TaskScheduler = scheduler, CancellationToken = cancellationToken };
+    }
+
+    // rank is the incremental backend's insertion position of every vertex at the parent level,
+    // null at the top level and for other backends. Components with more than subdomainPoints
+    // points (when positive) are decomposed; the residual of a decomposed component is not, so
+    // the recursion stitches its subdomains together across the split planes.
     private static List<Tetrahedron> BuildRecursive(
         IReadOnlyList<Vector3d> vertices,
         IReadOnlyList<Face> faces,
         Mesh2TetraOptions options,
-        int depth)
+        int depth,
+        int subdomainPoints,
+        ParallelOptions? parallel,
+        int[]? rank,
+        CancellationToken cancellationToken)
     {
         var objects = MeshTopology.SeparateFaceObjects(faces);
-        var total = new List<Tetrahedron>();
+        var perObject = new List<Tetrahedron>[objects.Count];
+
+        For(objects.Count, parallel, i => perObject[i] = BuildObject(vertices, objects[i], options, depth, subdomainPoints, parallel, rank, cancellationToken));
+        return Concatenate(perObject);
+    }
 
-        foreach (var obj in objects)
+    private static void For(int count, ParallelOptions? parallel, Action<int> body)
+    {
+        if (parallel is not null && count > 1)
         {
-            var (localVertices, localFaces, globalVertexIds) = MeshTopology.InsidePoints3D(vertices, obj);
-            if (localVertices.Count < 4 || localFaces.Count < 4)
+            try
             {
-                continue;
+                Parallel.For(0, count, parallel, body);
             }
-
-            var localTets = BuildLocal(localVertices, localFaces, options);
-            if (localTets.Count == 0)
+            catch (AggregateException ex) when (ex.InnerExceptions.Count == 1)
             {
-                continue;
+                ExceptionDispatchInfo.Capture(ex.InnerExceptions[0]).Throw();
+                throw;
             }
-
-            var localRemaining = MeshTopology.GetRemainingFaces(localTets, localFaces);
-            var localBoundaryVolume = GeometryPredicates.FaceMeshVolume(localVertices, localFaces);
-            var localTetVolume = GeometryPredicates.TetraMeshVolume(localVertices, localTets);
-            var localRemainVolume = GeometryPredicates.FaceMeshVolume(localVertices, localRemaining);
-            var diff = (localRemainVolume + localTetVolume) - localBoundaryVolume;
-
-            if (Math.Abs(diff) > 1e-8)
+        }
+        else
+        {
+            for (var i = 0; i < count; i++)
             {
-                continue;
+                body(i);
             }
+        }
+    }
 
-            if (GeometryPredicates.HasMeshIntersections(localVertices, localRemaining))
-            {
-                continue;
-            }
+    // Concatenating in index order keeps the result independent of scheduling.
+    private static List<Tetrahedron> Concatenate(List<Tetrahedron>[] parts)
+    {
+        var total = new List<Tetrahedron>(parts.Sum(x => x.Count));
+        foreach (var part in parts)
+        {
+            total.AddRange(part);
+        }
 
-            if (localRemaining.Count > 0 && depth < options.MaxDelaunayRecursionDepth)
-            {
-                var recurse = BuildRecursive(localVertices, localRemaining, options, depth + 1);
-                localTets.AddRange(recurse);
-                localRemaining = MeshTopology.GetRemainingFaces(localTets, localFaces);
-            }
+        return total;
+    }
 
-            foreach (var lt in localTets)
-            {
-                total.Add(new Tetrahedron(
-                    globalVertexIds[lt.A],
-                    globalVertexIds[lt.B],
-                    globalVertexIds[lt.C],
-                    globalVertexIds[lt.D]));
-            }
+    private static List<Tetrahedron> BuildObject(
+        IReadOnlyList<Vector3d> vertices,
+        List<Face> obj,
+        Mesh2TetraOptions options,
+        int depth,
+        int subdomainPoints,
+        ParallelOptions? parallel,
+        int[]? rank,
+        CancellationToken cancellationToken)
+    {
+        cancellationToken.ThrowIfCancellationRequested();
+        using var activity = Mesh2TetraDiagnostics.Source.StartActivity("DelaunayComponent");
+        activity?.SetTag("depth", depth);
+        activity?.SetTag("faces", obj.Count);
+
+        var (localVertices, localFaces, globalVertexIds) = MeshTopology.InsidePoints3D(vertices, obj);
+        activity?.SetTag("vertices", localVertices.Length);
+        if (localVertices.Length < 4 || localFaces.Length < 4)
+        {
+            return Rejected(activity, depth, obj.Count, "tooSmall");
         }
 
-        return total;
+        // Components are cached in local numbering, so a part repeated anywhere in an assembly (or
+        // in another mesh) with the same coordinates is found again.
+        var cache = options.ResultCache;
+        var cacheKey = cache is null
+            ? null
+            : Mesh2TetraResultCache.ComponentKey(localVertices, localFaces, options, options.MaxDelaunayRecursionDepth - depth, subdomainPoints);
+        if (cache is null || !cache.TryGet(cacheKey!, "component", out var localTets))
+        {
+            var order = rank is null ? null : SpatialSort.RestrictOrder(rank, globalVertexIds);
+            localTets = BuildObjectLocal(activity, localVertices, localFaces, options, depth, subdomainPoints, parallel, order, cancellationToken);
+            cache?.Store(cacheKey!, localTets);
+        }
+        else
+        {
+            activity?.SetTag("cache", "hit");
+            RecordComponent(activity, depth, obj.Count, "cached");
+        }
+
+        var result = new List<Tetrahedron>(localTets.Count);
+        foreach (var lt in localTets)
+        {
+            result.Add(new Tetrahedron(
+                globalVertexIds[lt.A],
+                globalVertexIds[lt.B],
+                globalVertexIds[lt.C],
+                globalVertexIds[lt.D]));
+        }
+
+        return result;
+    }
+
+    // Tetrahedra of one component in its local numbering, residual recursion included; empty when
+    // the component is rejected. order is the parent's insertion order restricted to the component.
+    private static List<Tetrahedron> BuildObjectLocal(
+        Activity? activity,
+        Vector3d[] localVertices,
+        Face[] localFaces,
+        Mesh2TetraOptions options,
+        int depth,
+        int subdomainPoints,
+        ParallelOptions? parallel,
+        int[]? order,
+        CancellationToken cancellationToken)
+    {
+        var decompose = subdomainPoints > 0 && localVertices.Length > subdomainPoints;
+        var localTets = decompose
+            ? BuildDecomposed(activity, localVertices, localFaces, options, subdomainPoints, parallel, ref order, cancellationToken)
+            : BuildLocal(localVertices, localFaces, options, ref order, cancellationToken);
+        if (localTets.Count == 0)
+        {
+            return Rejected(activity, depth, localFaces.Length, "noInsideCells");
+        }
+
+        var localRemaining = MeshTopology.GetRemainingFaces(localTets, localFaces);
+        var origin = options.ExactPredicates ? GeometryPredicates.Bounds(localVertices, Enumerable.Range(0, localVertices.Length)).Center : default;
+        var localBoundaryVolume = GeometryPredicates.FaceMeshVolume(localVertices, localFaces, origin);
+        var localTetVolume = GeometryPredicates.TetraMeshVolume(localVertices, localTets);
+        var localRemainVolume = GeometryPredicates.FaceMeshVolume(localVertices, localRemaining, origin);
+        var diff = (localRemainVolume + localTetVolume) - localBoundaryVolume;
+
+        // With exact predicates the tolerance is relative to the component's volume.
+        if (Math.Abs(diff) > (options.ExactPredicates ? 1e-8 * localBoundaryVolume : 1e-8))
+        {
+            return Rejected(activity, depth, localFaces.Length, "volumeMismatch");
+        }
+
+        if (GeometryPredicates.HasMeshIntersections(localVertices, localRemaining, exact: options.ExactPredicates))
+        {
+            return Rejected(activity, depth, localFaces.Length, "residualIntersections");
+        }
+
+        activity?.SetTag("tetrahedra", localTets.Count);
+        activity?.SetTag("residualFaces", localRemaining.Count);
+        if (localRemaining.Count > 0 && depth < options.MaxDelaunayRecursionDepth)
+        {
+            var recurse = BuildRecursive(localVertices, localRemaining, options, depth + 1, decompose ? 0 : subdomainPoints, parallel, order is null ? null : SpatialSort.Ranks(order), cancellationToken);
+            localTets.AddRange(recurse);
+        }
+        else if (localRemaining.Count > 0)
+        {
+            activity?.SetTag("depthLimitReached", true);
+        }
+
+        RecordComponent(activity, depth, localFaces.Length, "meshed");
+        return localTets;
     }
 
+    private static List<Tetrahedron> Rejected(Activity? activity, int depth, int faces, string outcome)
+    {
+        RecordComponent(activity, depth, faces, outcome);
+        return [];
+    }
+
+    private static void RecordComponent(Activity? activity, int depth, int faces, string outcome)
+    {
+        activity?.SetTag("outcome", outcome);
+        if (Mesh2TetraDiagnostics.DelaunayComponentFaces.Enabled)
+        {
+            Mesh2TetraDiagnostics.DelaunayComponentFaces.Record(
+                faces,
+                new KeyValuePair<string, object?>("depth", depth),
+                new KeyValuePair<string, object?>("outcome", outcome));
+        }
+    }
+
+    // The incremental backend inserts in order when given one and hands back the order it used,
+    // so the residual recursion can reuse it; other backends leave order null.
     private static List<Tetrahedron> BuildLocal(
         IReadOnlyList<Vector3d> localVertices,
         IReadOnlyList<Face> localFaces,
-        Mesh2TetraOptions options)
+        Mesh2TetraOptions options,
+        ref int[]? order,
+        CancellationToken cancellationToken)
     {
-        var dverts = localVertices.Select((v, i) => new DVertex(i, v)).ToList();
-
-        DelaunayTriangulation<DVertex, DefaultTriangulationCell<DVertex>> triangulation;
-        try
+        if (options.DelaunayBackend is IncrementalDelaunayBackend)
         {
-            triangulation = DelaunayTriangulation<DVertex, DefaultTriangulationCell<DVertex>>.Create(
-                dverts,
-                options.PlaneDistanceTolerance);
+            order ??= SpatialSort.BrioOrder(localVertices);
         }
-        catch (ConvexHullGenerationException)
+        else
+        {
+            order = null;
+        }
+
+        var cells = new List<int>();
+        if (!Tetrahedralize(localVertices, options, order, cells, cancellationToken))
         {
             return TrySingleTetraFallback(localVertices, localFaces, options);
         }
 
-        var result = new List<Tetrahedron>();
-        foreach (var cell in triangulation.Cells)
+        // The backend call itself cannot be interrupted (except the incremental one).
+        cancellationToken.ThrowIfCancellationRequested();
+        var classifier = new ClosedMeshClassifier(localVertices, localFaces);
+        return InsideCells(localVertices, cells, classifier, MinTetraVolume(localVertices, options), options.MaxSubdomainPoints > 0, subdomain: null);
+    }
+
+    // Large components: the cells of a k-d decomposition (DomainDecomposition) are tetrahedralized
+    // and filtered independently, concurrently when parallel is set, and each keeps only the
+    // tetrahedra that are final for the whole component. Every worker holds one cell's points and
+    // tetrahedra. The gaps along the split planes come back as residual faces, which the residual
+    // recursion meshes without decomposition.
+    private static List<Tetrahedron> BuildDecomposed(
+        Activity? activity,
+        Vector3d[] localVertices,
+        Face[] localFaces,
+        Mesh2TetraOptions options,
+        int subdomainPoints,
+        ParallelOptions? parallel,
+        ref int[]? order,
+        CancellationToken cancellationToken)
+    {
+        int[]? rank = null;
+        if (options.DelaunayBackend is IncrementalDelaunayBackend)
+        {
+            order ??= SpatialSort.BrioOrder(localVertices);
+            rank = SpatialSort.Ranks(order);
+        }
+        else
         {
-            var ids = cell.Vertices.Select(v => v.Id).ToArray();
-            var centroid = (localVertices[ids[0]] + localVertices[ids[1]] + localVertices[ids[2]] + localVertices[ids[3]]) / 4d;
-            if (!GeometryPredicates.PointInsideClosedMesh(centroid, localVertices, localFaces))
+            order = null;
+        }
+
+        var subdomains = DomainDecomposition.Partition(localVertices, subdomainPoints);
+        activity?.SetTag("subdomains", subdomains.Count);
+        var classifier = new ClosedMeshClassifier(localVertices, localFaces);
+        var minVolume = MinTetraVolume(localVertices, options);
+        var perSubdomain = new List<Tetrahedron>[subdomains.Count];
+        For(subdomains.Count, parallel, i =>
+        {
+            cancellationToken.ThrowIfCancellationRequested();
+            var subdomain = subdomains[i];
+            var ids = subdomain.Points;
+            var points = new Vector3d[ids.Length];
+            for (var k = 0; k < ids.Length; k++)
             {
-                continue;
+                points[k] = localVertices[ids[k]];
             }
 
-            var tet = new Tetrahedron(ids[0], ids[1], ids[2], ids[3]);
-            var volume = Math.Abs(GeometryPredicates.SignedTetraVolume(
-                localVertices[tet.A],
-                localVertices[tet.B],
-                localVertices[tet.C],
-                localVertices[tet.D]));
-            if (volume > options.Epsilon)
+            var cells = new List<int>();
+            var subOrder = rank is null ? null : SpatialSort.RestrictOrder(rank, ids);
+            if (!Tetrahedralize(points, options, subOrder, cells, cancellationToken))
             {
-                result.Add(tet);
+                perSubdomain[i] = [];
+                return;
             }
+
+            cancellationToken.ThrowIfCancellationRequested();
+            var tets = InsideCells(points, cells, classifier, minVolume, orient: true, subdomain);
+            for (var k = 0; k < tets.Count; k++)
+            {
+                var t = tets[k];
+                tets[k] = new Tetrahedron(ids[t.A], ids[t.B], ids[t.C], ids[t.D]);
+            }
+
+            perSubdomain[i] = tets;
+        });
+
+        return Concatenate(perSubdomain);
+    }
+
+    private static bool Tetrahedralize(
+        IReadOnlyList<Vector3d> points,
+        Mesh2TetraOptions options,
+        int[]? order,
+        List<int> cells,
+        CancellationToken cancellationToken)
+    {
+        return order is not null
+            ? IncrementalDelaunay.TryTetrahedralize(points, order, cells, cancellationToken)
+            : options.DelaunayBackend.TryTetrahedralize(points, options.PlaneDistanceTolerance, cells);
+    }
+
+    // Cells whose centroid is inside the boundary and whose volume is above minVolume; with a
+    // subdomain, only those whose circumsphere stays inside it. Backends return cells in either
+    // orientation, and the residual faces of a component only balance its volume check when every
+    // cell has negative signed volume or the cells cover the whole component. Decomposed
+    // components never do, so with decomposition on (orient) cells are turned the right way.
+    private static List<Tetrahedron> InsideCells(
+        IReadOnlyList<Vector3d> points,
+        List<int> cells,
+        ClosedMeshClassifier classifier,
+        double minVolume,
+        bool orient,
+        DomainDecomposition.Cell? subdomain)
+    {
+        var result = new List<Tetrahedron>();
+        for (var o = 0; o < cells.Count; o += 4)
+        {
+            var a = points[cells[o]];
+            var b = points[cells[o + 1]];
+            var c = points[cells[o + 2]];
+            var d = points[cells[o + 3]];
+            if (subdomain is not null && !DomainDecomposition.CircumsphereInside(subdomain, a, b, c, d)) continue;
+            if (!classifier.Contains((a + b + c + d) / 4d)) continue;
+            var volume = GeometryPredicates.SignedTetraVolume(a, b, c, d);
+            if (Math.Abs(volume) <= minVolume) continue;
+
+            result.Add(orient && volume > 0
+                ? new Tetrahedron(cells[o + 1], cells[o], cells[o + 2], cells[o + 3])
+                : new Tetrahedron(cells[o], cells[o + 1], cells[o + 2], cells[o + 3]));
         }
 
         return result;
     }
 
-
     private static List<Tetrahedron> TrySingleTetraFallback(
         IReadOnlyList<Vector3d> localVertices,
         IReadOnlyList<Face> localFaces,
@@ -137,7 +386,7 @@ internal static class DelaunayInside3D
             localVertices[tet.C],
             localVertices[tet.D]));
 
-        if (volume <= options.Epsilon)
+        if (volume <= MinTetraVolume(localVertices, options))
         {
             return [];
         }
@@ -151,9 +400,13 @@ internal static class DelaunayInside3D
         return [tet];
     }
 
-    private sealed class DVertex(int id, Vector3d p) : IVertex
+    // Cells at most this large are dropped as flat. Epsilon is an absolute volume; with exact
+    // predicates it is taken relative to the cube of the component's extent instead.
+    private static double MinTetraVolume(IReadOnlyList<Vector3d> localVertices, Mesh2TetraOptions options)
     {
-        public int Id { get; } = id;
-        public double[] Position { get; } = [p.X, p.Y, p.Z];
+        if (!options.ExactPredicates) return options.Epsilon;
+
+        var extent = GeometryPredicates.Bounds(localVertices, Enumerable.Range(0, localVertices.Count)).Extent;
+        return options.Epsilon * extent * extent * extent;
     }
 }
@@ -0,0 +1,126 @@
+using GenMesh.Mesh2Tetra.Geometry;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// k-d decomposition of one large Delaunay component (Mesh2TetraOptions.MaxSubdomainPoints). A cell
+// is split at the median of its longest axis until it holds at most maxPoints points. Points on a
+// split plane go to the lower side, so the upper side only holds points strictly above it and the
+// convex hulls of different cells never overlap. Every cell keeps the planes that bound it; sides
+// facing the outside of the component stay open.
+//
+// A tetrahedron of a cell's own Delaunay tetrahedralization is final when its circumsphere lies
+// strictly inside the cell: no point of another cell can then lie in the sphere, so it is also a
+// cell of the tetrahedralization of the whole component. What the final tetrahedra leave open,
+// the space along the split planes, is meshed by the residual recursion.
+internal static class DomainDecomposition
+{
+    public sealed class Cell(int[] points, Vector3d lower, Vector3d upper)
+    {
+        // Component vertex ids.
+        public int[] Points { get; } = points;
+
+        // Split planes bounding the cell, infinite on open sides. The cell is lower < p <= upper.
+        public Vector3d Lower { get; } = lower;
+        public Vector3d Upper { get; } = upper;
+    }
+
+    public static List<Cell> Partition(IReadOnlyList<Vector3d> points, int maxPoints)
+    {
+        var open = new Vector3d(double.PositiveInfinity, double.PositiveInfinity, double.PositiveInfinity);
+        var cells = new List<Cell>();
+        var pending = new Stack<Cell>();
+        pending.Push(new Cell([.. Enumerable.Range(0, points.Count)], open * -1, open));
+        while (pending.Count > 0)
+        {
+            var cell = pending.Pop();
+            var ids = cell.Points;
+            var axis = LongestAxis(points, ids);
+            if (ids.Length <= maxPoints || axis < 0)
+            {
+                cells.Add(cell);
+                continue;
+            }
+
+            var keys = new double[ids.Length];
+            for (var i = 0; i < ids.Length; i++)
+            {
+                keys[i] = Coordinate(points[ids[i]], axis);
+            }
+
+            ids = (int[])ids.Clone();
+            Array.Sort(keys, ids);
+
+            // First point above the median value; when the median ties with the maximum, the first
+            // point at the maximum. The axis has some extent, so both sides get points.
+            var split = ids.Length / 2;
+            while (split < keys.Length && keys[split] == keys[split - 1]) split++;
+            if (split == keys.Length)
+            {
+                split = ids.Length / 2;
+                while (keys[split - 1] == keys[^1]) split--;
+            }
+
+            var plane = keys[split - 1];
+
+            // Pushed upper first, so cells come out in ascending order along each split.
+            pending.Push(new Cell(ids[split..], WithCoordinate(cell.Lower, axis, plane), cell.Upper));
+            pending.Push(new Cell(ids[..split], cell.Lower, WithCoordinate(cell.Upper, axis, plane)));
+        }
+
+        return cells;
+    }
+
+    // Whether the circumsphere of (a, b, c, d), slightly enlarged against rounding, stays clear of
+    // the cell's split planes. Flat tetrahedra are never final.
+    public static bool CircumsphereInside(Cell cell, Vector3d a, Vector3d b, Vector3d c, Vector3d d)
+    {
+        var ab = b - a;
+        var ac = c - a;
+        var ad = d - a;
+        var det = 2d * Vector3d.Dot(ab, Vector3d.Cross(ac, ad));
+        if (det == 0d) return false;
+
+        var offset = ((Vector3d.Dot(ab, ab) * Vector3d.Cross(ac, ad))
+            + (Vector3d.Dot(ac, ac) * Vector3d.Cross(ad, ab))
+            + (Vector3d.Dot(ad, ad) * Vector3d.Cross(ab, ac))) / det;
+        var radius = offset.Norm() * (1d + 1e-9);
+        var center = a + offset;
+        if (!double.IsFinite(radius)) return false;
+
+        return center.X - radius > cell.Lower.X && center.X + radius < cell.Upper.X
+            && center.Y - radius > cell.Lower.Y && center.Y + radius < cell.Upper.Y
+            && center.Z - radius > cell.Lower.Z && center.Z + radius < cell.Upper.Z;
+    }
+
+    // -1 when all points coincide.
+    private static int LongestAxis(IReadOnlyList<Vector3d> points, int[] ids)
+    {
+        var min = points[ids[0]];
+        var max = min;
+        foreach (var id in ids)
+        {
+            var p = points[id];
+            min = new Vector3d(Math.Min(min.X, p.X), Math.Min(min.Y, p.Y), Math.Min(min.Z, p.Z));
+            max = new Vector3d(Math.Max(max.X, p.X), Math.Max(max.Y, p.Y), Math.Max(max.Z, p.Z));
+        }
+
+        var extent = max - min;
+        if (extent.X <= 0 && extent.Y <= 0 && extent.Z <= 0) return -1;
+        if (extent.X >= extent.Y && extent.X >= extent.Z) return 0;
+        return extent.Y >= extent.Z ? 1 : 2;
+    }
+
+    private static double Coordinate(Vector3d p, int axis) => axis switch
+    {
+        0 => p.X,
+        1 => p.Y,
+        _ => p.Z,
+    };
+
+    private static Vector3d WithCoordinate(Vector3d p, int axis, double value) => axis switch
+    {
+        0 => new Vector3d(value, p.Y, p.Z),
+        1 => new Vector3d(p.X, value, p.Z),
+        _ => new Vector3d(p.X, p.Y, value),
+    };
+}
@@ -0,0 +1,160 @@
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// Static AABB tree over one face set. Build it once per face set and query it per face so the
+// broad phase of intersection search is O(F log F) instead of the all-pairs O(F^2) scan.
+internal sealed class FaceBoundsTree
+{
+    private const int LeafSize = 4;
+    private const int MaxStackDepth = 64;
+
+    private readonly double[] _faceBounds;
+    private readonly int[] _order;
+    private readonly Node[] _nodes;
+
+    private FaceBoundsTree(double[] faceBounds, int[] order, Node[] nodes)
+    {
+        _faceBounds = faceBounds;
+        _order = order;
+        _nodes = nodes;
+    }
+
+    public int Count => _order.Length;
+
+    public static FaceBoundsTree Build(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces)
+    {
+        var n = faces.Count;
+        var faceBounds = new double[n * 6];
+        var centroids = new double[n * 3];
+        for (var i = 0; i < n; i++)
+        {
+            var f = faces[i];
+            var a = vertices[f.A];
+            var b = vertices[f.B];
+            var c = vertices[f.C];
+            var o = i * 6;
+            faceBounds[o] = Math.Min(a.X, Math.Min(b.X, c.X));
+            faceBounds[o + 1] = Math.Min(a.Y, Math.Min(b.Y, c.Y));
+            faceBounds[o + 2] = Math.Min(a.Z, Math.Min(b.Z, c.Z));
+            faceBounds[o + 3] = Math.Max(a.X, Math.Max(b.X, c.X));
+            faceBounds[o + 4] = Math.Max(a.Y, Math.Max(b.Y, c.Y));
+            faceBounds[o + 5] = Math.Max(a.Z, Math.Max(b.Z, c.Z));
+            centroids[i * 3] = (a.X + b.X + c.X) / 3d;
+            centroids[(i * 3) + 1] = (a.Y + b.Y + c.Y) / 3d;
+            centroids[(i * 3) + 2] = (a.Z + b.Z + c.Z) / 3d;
+        }
+
+        var order = new int[n];
+        for (var i = 0; i < n; i++)
+        {
+            order[i] = i;
+        }
+
+        var nodes = new List<Node>(Math.Max(1, (2 * n / LeafSize) + 1));
+        if (n > 0)
+        {
+            BuildNode(0, n, faceBounds, centroids, order, new double[n], nodes);
+        }
+
+        return new FaceBoundsTree(faceBounds, order, nodes.ToArray());
+    }
+
+    // Appends every face whose box overlaps the box of faceIndex, the face itself included.
+    // Touching boxes count as overlapping, matching SeparatedByAabb in GeometryPredicates.
+    public void Query(int faceIndex, List<int> results)
+    {
+        var o = faceIndex * 6;
+        Query(
+            new Vector3d(_faceBounds[o], _faceBounds[o + 1], _faceBounds[o + 2]),
+            new Vector3d(_faceBounds[o + 3], _faceBounds[o + 4], _faceBounds[o + 5]),
+            results);
+    }
+
+    public void Query(Vector3d min, Vector3d max, List<int> results)
+    {
+        if (_nodes.Length == 0) return;
+
+        Span<int> stack = stackalloc int[MaxStackDepth];
+        var top = 0;
+        stack[top++] = 0;
+        while (top > 0)
+        {
+            var nodeIndex = stack[--top];
+            ref readonly var node = ref _nodes[nodeIndex];
+            if (!Overlaps(node.Min, node.Max, min, max)) continue;
+
+            if (node.Count > 0)
+            {
+                for (var k = node.Start; k < node.Start + node.Count; k++)
+                {
+                    var fi = _order[k];
+                    var o = fi * 6;
+                    if (_faceBounds[o] <= max.X && _faceBounds[o + 3] >= min.X
+                        && _faceBounds[o + 1] <= max.Y && _faceBounds[o + 4] >= min.Y
+                        && _faceBounds[o + 2] <= max.Z && _faceBounds[o + 5] >= min.Z)
+                    {
+                        results.Add(fi);
+                    }
+                }
+
+                continue;
+            }
+
+            stack[top++] = nodeIndex + 1;
+            stack[top++] = node.Start;
+        }
+    }
+
+    private static int BuildNode(int start, int end, double[] faceBounds, double[] centroids, int[] order, double[] keys, List<Node> nodes)
+    {
+        var min = new Vector3d(double.PositiveInfinity, double.PositiveInfinity, double.PositiveInfinity);
+        var max = new Vector3d(double.NegativeInfinity, double.NegativeInfinity, double.NegativeInfinity);
+        var cMin = min;
+        var cMax = max;
+        for (var k = start; k < end; k++)
+        {
+            var fi = order[k];
+            var o = fi * 6;
+            min = new Vector3d(Math.Min(min.X, faceBounds[o]), Math.Min(min.Y, faceBounds[o + 1]), Math.Min(min.Z, faceBounds[o + 2]));
+            max = new Vector3d(Math.Max(max.X, faceBounds[o + 3]), Math.Max(max.Y, faceBounds[o + 4]), Math.Max(max.Z, faceBounds[o + 5]));
+            var c = new Vector3d(centroids[fi * 3], centroids[(fi * 3) + 1], centroids[(fi * 3) + 2]);
+            cMin = new Vector3d(Math.Min(cMin.X, c.X), Math.Min(cMin.Y, c.Y), Math.Min(cMin.Z, c.Z));
+            cMax = new Vector3d(Math.Max(cMax.X, c.X), Math.Max(cMax.Y, c.Y), Math.Max(cMax.Z, c.Z));
+        }
+
+        var index = nodes.Count;
+        var count = end - start;
+        if (count <= LeafSize)
+        {
+            nodes.Add(new Node(min, max, start, count));
+            return index;
+        }
+
+        // Median split on the axis with the largest centroid spread keeps the tree depth at log2(F).
+        var extent = cMax - cMin;
+        var axis = extent.X >= extent.Y && extent.X >= extent.Z ? 0 : (extent.Y >= extent.Z ? 1 : 2);
+        for (var k = start; k < end; k++)
+        {
+            keys[k] = centroids[(order[k] * 3) + axis];
+        }
+
+        Array.Sort(keys, order, start, count);
+        var mid = start + (count / 2);
+
+        nodes.Add(default);
+        BuildNode(start, mid, faceBounds, centroids, order, keys, nodes);
+        var right = BuildNode(mid, end, faceBounds, centroids, order, keys, nodes);
+        nodes[index] = new Node(min, max, right, 0);
+        return index;
+    }
+
+    private static bool Overlaps(Vector3d aMin, Vector3d aMax, Vector3d bMin, Vector3d bMax)
+        => aMin.X <= bMax.X && aMax.X >= bMin.X
+        && aMin.Y <= bMax.Y && aMax.Y >= bMin.Y
+        && aMin.Z <= bMax.Z && aMax.Z >= bMin.Z;
+
+    // Leaf when Count > 0; otherwise the left child directly follows this node and Start is the right child.
+    private readonly record struct Node(Vector3d Min, Vector3d Max, int Start, int Count);
+}
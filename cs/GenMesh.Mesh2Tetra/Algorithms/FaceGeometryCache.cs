@@ -0,0 +1,549 @@
+using System.Numerics;
+using System.Runtime.Intrinsics;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// Per-face geometry for predicates that test the same faces over and over, kept in parallel
+// arrays indexed by a face id (a list position or a BoundaryCollapseState handle): unit normal and
+// plane offset, bounding box, the signed-volume term a . (b x c), and the 2D projection and
+// barycentric coefficients of GeometryPredicates.LineTriangleIntersection. Set overwrites an id,
+// so ids can be reused once their face is gone.
+//
+// Intersects evaluates the same expressions as GeometryPredicates.TriangleTriangleIntersection on
+// the cached values, so it gives the same answers. It adds one early exit: when every corner of one
+// face lies clearly on one side of the other face's plane, no edge can cross either face.
+// IntersectsEach tests one face against blocks of four candidates in Vector256 lanes: bounding
+// boxes and the plane-side exit first, then the six segment tests for blocks with a survivor.
+//
+// An exact cache (Mesh2TetraOptions.ExactPredicates) answers with RobustPredicates.TrianglesCross
+// after the bounding-box test instead, one candidate at a time and always ignoring corners. Volume
+// terms are taken relative to volumeOrigin, which keeps their rounding proportional to the size of
+// the mesh rather than to its distance from 0.
+internal sealed class FaceGeometryCache
+{
+    // Relative to the larger face and to how well the normal is determined (see _conditioning), so
+    // only corners well away from the plane take the early exit.
+    private const double PlaneSideMargin = 1e-9;
+
+    private const int Lanes = 4;
+
+    private readonly IReadOnlyList<Vector3d> _vertices;
+    private readonly bool _exact;
+    private readonly Vector3d _volumeOrigin;
+    private Vector3d[] _a = [];
+    private Vector3d[] _b = [];
+    private Vector3d[] _c = [];
+    private double[] _normalX = [];
+    private double[] _normalY = [];
+    private double[] _normalZ = [];
+    private double[] _planeD = [];
+    private bool[] _flat = [];
+    private double[] _minX = [];
+    private double[] _minY = [];
+    private double[] _minZ = [];
+    private double[] _maxX = [];
+    private double[] _maxY = [];
+    private double[] _maxZ = [];
+    private double[] _scale = [];
+    // scale^2 / |(a - c) x (b - c)|, at least 1: a sliver's normal carries a relative error of about
+    // machine epsilon times this, and so do plane distances computed with it.
+    private double[] _conditioning = [];
+    private double[] _volumeTerm = [];
+    private Projection[] _projection = [];
+
+    public FaceGeometryCache(IReadOnlyList<Vector3d> vertices, int capacity = 0, bool exact = false, Vector3d volumeOrigin = default)
+    {
+        _vertices = vertices;
+        _exact = exact;
+        _volumeOrigin = volumeOrigin;
+        Resize(capacity);
+    }
+
+    public static FaceGeometryCache Build(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, bool exact = false)
+    {
+        var cache = new FaceGeometryCache(vertices, faces.Count, exact);
+        for (var i = 0; i < faces.Count; i++)
+        {
+            cache.Set(i, faces[i]);
+        }
+
+        return cache;
+    }
+
+    // a . (b x c) with the corners relative to the volume origin; the face's share of 6x the signed
+    // volume of a closed mesh.
+    public double VolumeTerm(int id) => _volumeTerm[id];
+
+    public void Set(int id, Face face)
+    {
+        if (id >= _a.Length) Resize(Math.Max(id + 1, _a.Length * 2));
+
+        var a = _vertices[face.A];
+        var b = _vertices[face.B];
+        var c = _vertices[face.C];
+        _a[id] = a;
+        _b[id] = b;
+        _c[id] = c;
+        _minX[id] = Math.Min(a.X, Math.Min(b.X, c.X));
+        _minY[id] = Math.Min(a.Y, Math.Min(b.Y, c.Y));
+        _minZ[id] = Math.Min(a.Z, Math.Min(b.Z, c.Z));
+        _maxX[id] = Math.Max(a.X, Math.Max(b.X, c.X));
+        _maxY[id] = Math.Max(a.Y, Math.Max(b.Y, c.Y));
+        _maxZ[id] = Math.Max(a.Z, Math.Max(b.Z, c.Z));
+        _scale[id] = Math.Max(_maxX[id] - _minX[id], Math.Max(_maxY[id] - _minY[id], _maxZ[id] - _minZ[id]));
+        var o = _volumeOrigin;
+        _volumeTerm[id] = Vector3d.Dot(a - o, Vector3d.Cross(b - o, c - o));
+
+        var n = Vector3d.Cross(a - c, b - c);
+        var nNorm = n.Norm();
+        _flat[id] = nNorm <= 1e-12;
+        if (_flat[id])
+        {
+            _normalX[id] = _normalY[id] = _normalZ[id] = _planeD[id] = 0d;
+            _projection[id] = default;
+            return;
+        }
+
+        n /= nNorm;
+        _conditioning[id] = Math.Max(1d, _scale[id] * _scale[id] / nNorm);
+        _normalX[id] = n.X;
+        _normalY[id] = n.Y;
+        _normalZ[id] = n.Z;
+        _planeD[id] = Vector3d.Dot(n, c);
+        _projection[id] = Projection.Of(a, b, c, n);
+    }
+
+    public bool Intersects(int p, FaceGeometryCache other, int o, bool ignoreCorners)
+    {
+        if (_minX[p] > other._maxX[o] || _minY[p] > other._maxY[o] || _minZ[p] > other._maxZ[o]
+            || _maxX[p] < other._minX[o] || _maxY[p] < other._minY[o] || _maxZ[p] < other._minZ[o])
+        {
+            return false;
+        }
+
+        if (_exact)
+        {
+            return RobustPredicates.TrianglesCross(_a[p], _b[p], _c[p], other._a[o], other._b[o], other._c[o]);
+        }
+
+        var margin = PlaneSideMargin * Math.Max(_scale[p], other._scale[o]);
+        if (OnOneSide(p, other._a[o], other._b[o], other._c[o], margin)
+            || other.OnOneSide(o, _a[p], _b[p], _c[p], margin))
+        {
+            return false;
+        }
+
+        return EdgesCross(p, other, o, ignoreCorners);
+    }
+
+    // hits[k] = Intersects(p, other, candidates[k], ignoreCorners); returns the number of hits.
+    // Blocks of candidates are tested in Vector256 lanes with the same expressions, lane by lane.
+    public int IntersectsEach(int p, FaceGeometryCache other, ReadOnlySpan<int> candidates, bool ignoreCorners, Span<bool> hits)
+    {
+        var count = 0;
+        var k = 0;
+        if (Vector256.IsHardwareAccelerated && candidates.Length >= Lanes && !_exact)
+        {
+            Span<int> self = [p, p, p, p];
+            var face = new FaceLanes(this, self);
+            var p1 = PointLanes.Of(_a, self);
+            var p2 = PointLanes.Of(_b, self);
+            var p3 = PointLanes.Of(_c, self);
+            var mv = Vector256.Create(ignoreCorners ? 1e-8 : 0d);
+            var vv = Vector256.Create(ignoreCorners ? (1d - 1e-8) : 1d);
+            for (; k + Lanes <= candidates.Length; k += Lanes)
+            {
+                var block = candidates.Slice(k, Lanes);
+                var mask = other.Survivors(this, p, block);
+                if (mask != 0)
+                {
+                    var blockFace = new FaceLanes(other, block);
+                    var o1 = PointLanes.Of(other._a, block);
+                    var o2 = PointLanes.Of(other._b, block);
+                    var o3 = PointLanes.Of(other._c, block);
+                    var crossing = SegmentHits(face, o1, o2, mv, vv)
+                        | SegmentHits(face, o2, o3, mv, vv)
+                        | SegmentHits(face, o3, o1, mv, vv)
+                        | SegmentHits(blockFace, p1, p2, mv, vv)
+                        | SegmentHits(blockFace, p2, p3, mv, vv)
+                        | SegmentHits(blockFace, p3, p1, mv, vv);
+                    mask &= crossing.ExtractMostSignificantBits();
+                }
+
+                for (var lane = 0; lane < Lanes; lane++)
+                {
+                    hits[k + lane] = (mask & (1u << lane)) != 0;
+                }
+
+                count += BitOperations.PopCount(mask);
+            }
+        }
+
+        for (; k < candidates.Length; k++)
+        {
+            hits[k] = Intersects(p, other, candidates[k], ignoreCorners);
+            if (hits[k]) count++;
+        }
+
+        return count;
+    }
+
+    private void Resize(int capacity)
+    {
+        Array.Resize(ref _a, capacity);
+        Array.Resize(ref _b, capacity);
+        Array.Resize(ref _c, capacity);
+        Array.Resize(ref _normalX, capacity);
+        Array.Resize(ref _normalY, capacity);
+        Array.Resize(ref _normalZ, capacity);
+        Array.Resize(ref _planeD, capacity);
+        Array.Resize(ref _flat, capacity);
+        Array.Resize(ref _minX, capacity);
+        Array.Resize(ref _minY, capacity);
+        Array.Resize(ref _minZ, capacity);
+        Array.Resize(ref _maxX, capacity);
+        Array.Resize(ref _maxY, capacity);
+        Array.Resize(ref _maxZ, capacity);
+        Array.Resize(ref _scale, capacity);
+        Array.Resize(ref _conditioning, capacity);
+        Array.Resize(ref _volumeTerm, capacity);
+        Array.Resize(ref _projection, capacity);
+    }
+
+    private bool OnOneSide(int id, Vector3d u, Vector3d v, Vector3d w, double margin)
+    {
+        if (_flat[id]) return false;
+
+        margin *= _conditioning[id];
+        var su = (_normalX[id] * u.X) + (_normalY[id] * u.Y) + (_normalZ[id] * u.Z) - _planeD[id];
+        var sv = (_normalX[id] * v.X) + (_normalY[id] * v.Y) + (_normalZ[id] * v.Z) - _planeD[id];
+        var sw = (_normalX[id] * w.X) + (_normalY[id] * w.Y) + (_normalZ[id] * w.Z) - _planeD[id];
+        return (su > margin && sv > margin && sw > margin) || (su < -margin && sv < -margin && sw < -margin);
+    }
+
+    // Lane mask of the faces o in block that pass the bounding-box test and the plane-side exit of
+    // Intersects against face p of pGeometry. Same expressions as the scalar path, lane by lane.
+    private uint Survivors(FaceGeometryCache pGeometry, int p, ReadOnlySpan<int> block)
+    {
+        var minX = Gather(_minX, block);
+        var minY = Gather(_minY, block);
+        var minZ = Gather(_minZ, block);
+        var maxX = Gather(_maxX, block);
+        var maxY = Gather(_maxY, block);
+        var maxZ = Gather(_maxZ, block);
+        var separated = Vector256.LessThan(maxX, Vector256.Create(pGeometry._minX[p]))
+            | Vector256.LessThan(maxY, Vector256.Create(pGeometry._minY[p]))
+            | Vector256.LessThan(maxZ, Vector256.Create(pGeometry._minZ[p]))
+            | Vector256.GreaterThan(minX, Vector256.Create(pGeometry._maxX[p]))
+            | Vector256.GreaterThan(minY, Vector256.Create(pGeometry._maxY[p]))
+            | Vector256.GreaterThan(minZ, Vector256.Create(pGeometry._maxZ[p]));
+        if (separated.ExtractMostSignificantBits() == (1u << Lanes) - 1) return 0;
+
+        var margin = Vector256.Create(PlaneSideMargin) * Vector256.Max(Vector256.Create(pGeometry._scale[p]), Gather(_scale, block));
+
+        // Corners of p against the planes of the block.
+        var nx = Gather(_normalX, block);
+        var ny = Gather(_normalY, block);
+        var nz = Gather(_normalZ, block);
+        var d = Gather(_planeD, block);
+        var oneSide = OnOneSide(nx, ny, nz, d, margin * Gather(_conditioning, block), pGeometry._a[p], pGeometry._b[p], pGeometry._c[p])
+            & ~Mask(_flat[block[0]], _flat[block[1]], _flat[block[2]], _flat[block[3]]);
+
+        // Corners of the block against the plane of p.
+        if (!pGeometry._flat[p])
+        {
+            oneSide |= OnOneSide(
+                Vector256.Create(pGeometry._normalX[p]),
+                Vector256.Create(pGeometry._normalY[p]),
+                Vector256.Create(pGeometry._normalZ[p]),
+                Vector256.Create(pGeometry._planeD[p]),
+                margin * Vector256.Create(pGeometry._conditioning[p]),
+                PointLanes.Of(_a, block),
+                PointLanes.Of(_b, block),
+                PointLanes.Of(_c, block));
+        }
+
+        return ~(separated | oneSide).ExtractMostSignificantBits() & ((1u << Lanes) - 1);
+    }
+
+    private static Vector256<double> OnOneSide(
+        Vector256<double> nx, Vector256<double> ny, Vector256<double> nz, Vector256<double> d, Vector256<double> margin,
+        Vector3d u, Vector3d v, Vector3d w)
+        => OnOneSide(nx, ny, nz, d, margin, PointLanes.Of(u), PointLanes.Of(v), PointLanes.Of(w));
+
+    private static Vector256<double> OnOneSide(
+        Vector256<double> nx, Vector256<double> ny, Vector256<double> nz, Vector256<double> d, Vector256<double> margin,
+        in PointLanes u, in PointLanes v, in PointLanes w)
+    {
+        var su = (nx * u.X) + (ny * u.Y) + (nz * u.Z) - d;
+        var sv = (nx * v.X) + (ny * v.Y) + (nz * v.Z) - d;
+        var sw = (nx * w.X) + (ny * w.Y) + (nz * w.Z) - d;
+        var below = -margin;
+        return (Vector256.GreaterThan(su, margin) & Vector256.GreaterThan(sv, margin) & Vector256.GreaterThan(sw, margin))
+            | (Vector256.LessThan(su, below) & Vector256.LessThan(sv, below) & Vector256.LessThan(sw, below));
+    }
+
+    private static Vector256<double> Gather(double[] values, ReadOnlySpan<int> block)
+        => Vector256.Create(values[block[0]], values[block[1]], values[block[2]], values[block[3]]);
+
+    // SegmentHits lane by lane: all bits set in the lanes where the segment p1 -> p2 crosses the face.
+    private static Vector256<double> SegmentHits(
+        in FaceLanes f, in PointLanes p1, in PointLanes p2, Vector256<double> mv, Vector256<double> vv)
+    {
+        var missed = f.Skip
+            | Vector256.GreaterThan(f.MinX, Vector256.Max(p1.X, p2.X))
+            | Vector256.GreaterThan(f.MinY, Vector256.Max(p1.Y, p2.Y))
+            | Vector256.GreaterThan(f.MinZ, Vector256.Max(p1.Z, p2.Z))
+            | Vector256.LessThan(f.MaxX, Vector256.Min(p1.X, p2.X))
+            | Vector256.LessThan(f.MaxY, Vector256.Min(p1.Y, p2.Y))
+            | Vector256.LessThan(f.MaxZ, Vector256.Min(p1.Z, p2.Z));
+
+        var vx = p2.X - p1.X;
+        var vy = p2.Y - p1.Y;
+        var vz = p2.Z - p1.Z;
+        var numerator = (f.NX * (f.CX - p1.X)) + (f.NY * (f.CY - p1.Y)) + (f.NZ * (f.CZ - p1.Z));
+        var denominator = (f.NX * vx) + (f.NY * vy) + (f.NZ * vz) + Vector256.Create(1e-16);
+        var t = numerator / denominator;
+        missed |= Vector256.LessThan(t, Vector256<double>.Zero) | Vector256.GreaterThan(t, Vector256<double>.One);
+
+        var px = p1.X + (vx * t);
+        var py = p1.Y + (vy * t);
+        var pz = p1.Z + (vz * t);
+        var rx = Axis(f.I, px, py, pz);
+        var ry = Axis(f.J, px, py, pz);
+        missed |= Vector256.LessThan(rx, f.ProjectedMinX) | Vector256.GreaterThan(rx, f.ProjectedMaxX)
+            | Vector256.LessThan(ry, f.ProjectedMinY) | Vector256.GreaterThan(ry, f.ProjectedMaxY);
+
+        var l1 = (f.U1 * rx) + (f.V1 * ry) + f.C1;
+        var l2 = (f.U2 * rx) + (f.V2 * ry) + f.C2;
+        var l3 = (f.U3 * rx) + (f.V3 * ry) + f.C3;
+        var inside = Vector256.GreaterThanOrEqual(l1, mv) & Vector256.LessThanOrEqual(l1, vv)
+            & Vector256.GreaterThanOrEqual(l2, mv) & Vector256.LessThanOrEqual(l2, vv)
+            & Vector256.GreaterThanOrEqual(l3, mv) & Vector256.LessThanOrEqual(l3, vv);
+        return Vector256.AndNot(inside, missed);
+    }
+
+    private static Vector256<double> Axis(Vector256<double> axis, Vector256<double> x, Vector256<double> y, Vector256<double> z)
+        => Vector256.ConditionalSelect(
+            Vector256.Equals(axis, Vector256<double>.Zero),
+            x,
+            Vector256.ConditionalSelect(Vector256.Equals(axis, Vector256<double>.One), y, z));
+
+    private static Vector256<double> Mask(bool b0, bool b1, bool b2, bool b3)
+        => Vector256.Create(b0 ? -1L : 0L, b1 ? -1L : 0L, b2 ? -1L : 0L, b3 ? -1L : 0L).AsDouble();
+
+    // The six segment tests of TriangleTriangleIntersection.
+    private bool EdgesCross(int p, FaceGeometryCache other, int o, bool ignoreCorners)
+    {
+        var p1 = _a[p];
+        var p2 = _b[p];
+        var p3 = _c[p];
+        var o1 = other._a[o];
+        var o2 = other._b[o];
+        var o3 = other._c[o];
+        return SegmentHits(p, o1, o2, ignoreCorners)
+            || SegmentHits(p, o2, o3, ignoreCorners)
+            || SegmentHits(p, o3, o1, ignoreCorners)
+            || other.SegmentHits(o, p1, p2, ignoreCorners)
+            || other.SegmentHits(o, p2, p3, ignoreCorners)
+            || other.SegmentHits(o, p3, p1, ignoreCorners);
+    }
+
+    // GeometryPredicates.LineTriangleIntersection(a, b, c, p1, p2) with the face's values cached.
+    private bool SegmentHits(int id, Vector3d p1, Vector3d p2, bool ignoreCorners)
+    {
+        if (_minX[id] > Math.Max(p1.X, p2.X) || _minY[id] > Math.Max(p1.Y, p2.Y) || _minZ[id] > Math.Max(p1.Z, p2.Z)
+            || _maxX[id] < Math.Min(p1.X, p2.X) || _maxY[id] < Math.Min(p1.Y, p2.Y) || _maxZ[id] < Math.Min(p1.Z, p2.Z))
+        {
+            return false;
+        }
+
+        if (_flat[id]) return false;
+
+        var n = new Vector3d(_normalX[id], _normalY[id], _normalZ[id]);
+        var vLine = p2 - p1;
+        var numerator = Vector3d.Dot(n, _c[id] - p1);
+        var denominator = Vector3d.Dot(n, vLine) + 1e-16;
+        var t = numerator / denominator;
+        if (t < 0 || t > 1)
+        {
+            return false;
+        }
+
+        var p = p1 + new Vector3d(vLine.X * t, vLine.Y * t, vLine.Z * t);
+        return _projection[id].Contains(p, ignoreCorners);
+    }
+
+    // Projection of the face onto the two axes its normal is least aligned with, and the
+    // barycentric coordinates as linear functions of the projected point (l = U * x + V * y + C).
+    private readonly record struct Projection(
+        int I,
+        int J,
+        double MinX,
+        double MinY,
+        double MaxX,
+        double MaxY,
+        bool Degenerate,
+        double U1,
+        double V1,
+        double C1,
+        double U2,
+        double V2,
+        double C2,
+        double U3,
+        double V3,
+        double C3)
+    {
+        public static Projection Of(Vector3d a, Vector3d b, Vector3d c, Vector3d n)
+        {
+            var absX = Math.Abs(n.X);
+            var absY = Math.Abs(n.Y);
+            var absZ = Math.Abs(n.Z);
+            var (i, j) = absX > absY
+                ? (absX > absZ ? (1, 2) : (0, 1))
+                : (absY > absZ ? (0, 2) : (0, 1));
+
+            var (x0, y0) = (Axis(a, i), Axis(a, j));
+            var (x1, y1) = (Axis(b, i), Axis(b, j));
+            var (x2, y2) = (Axis(c, i), Axis(c, j));
+
+            var f12 = ((y1 - y2) * x0) + ((x2 - x1) * y0) + (x1 * y2) - (x2 * y1);
+            var f20 = ((y2 - y0) * x1) + ((x0 - x2) * y1) + (x2 * y0) - (x0 * y2);
+            var f01 = ((y0 - y1) * x2) + ((x1 - x0) * y2) + (x0 * y1) - (x1 * y0);
+
+            return new Projection(
+                i,
+                j,
+                Math.Min(x0, Math.Min(x1, x2)),
+                Math.Min(y0, Math.Min(y1, y2)),
+                Math.Max(x0, Math.Max(x1, x2)),
+                Math.Max(y0, Math.Max(y1, y2)),
+                Math.Abs(f12) < 1e-16 || Math.Abs(f20) < 1e-16 || Math.Abs(f01) < 1e-16,
+                (y1 - y2) / f12,
+                (x2 - x1) / f12,
+                ((x1 * y2) - (x2 * y1)) / f12,
+                (y2 - y0) / f20,
+                (x0 - x2) / f20,
+                ((x2 * y0) - (x0 * y2)) / f20,
+                (y0 - y1) / f01,
+                (x1 - x0) / f01,
+                ((x0 * y1) - (x1 * y0)) / f01);
+        }
+
+        public bool Contains(Vector3d p, bool ignoreCorners)
+        {
+            var rx = Axis(p, I);
+            var ry = Axis(p, J);
+            if (rx < MinX || rx > MaxX || ry < MinY || ry > MaxY || Degenerate)
+            {
+                return false;
+            }
+
+            var l1 = (U1 * rx) + (V1 * ry) + C1;
+            var l2 = (U2 * rx) + (V2 * ry) + C2;
+            var l3 = (U3 * rx) + (V3 * ry) + C3;
+            var mv = ignoreCorners ? 1e-8 : 0d;
+            var vv = ignoreCorners ? (1d - 1e-8) : 1d;
+            return l1 >= mv && l1 <= vv
+                && l2 >= mv && l2 <= vv
+                && l3 >= mv && l3 <= vv;
+        }
+
+        private static double Axis(Vector3d v, int axis) => axis switch
+        {
+            0 => v.X,
+            1 => v.Y,
+            _ => v.Z,
+        };
+    }
+
+    private readonly struct PointLanes(Vector256<double> x, Vector256<double> y, Vector256<double> z)
+    {
+        public readonly Vector256<double> X = x;
+        public readonly Vector256<double> Y = y;
+        public readonly Vector256<double> Z = z;
+
+        public static PointLanes Of(Vector3d p) => new(Vector256.Create(p.X), Vector256.Create(p.Y), Vector256.Create(p.Z));
+
+        public static PointLanes Of(Vector3d[] points, ReadOnlySpan<int> block)
+        {
+            var (p0, p1, p2, p3) = (points[block[0]], points[block[1]], points[block[2]], points[block[3]]);
+            return new(
+                Vector256.Create(p0.X, p1.X, p2.X, p3.X),
+                Vector256.Create(p0.Y, p1.Y, p2.Y, p3.Y),
+                Vector256.Create(p0.Z, p1.Z, p2.Z, p3.Z));
+        }
+    }
+
+    // What SegmentHits reads of a face, one face per lane. Skip marks flat faces and degenerate
+    // projections, which never report a hit.
+    private readonly struct FaceLanes
+    {
+        public readonly Vector256<double> MinX;
+        public readonly Vector256<double> MinY;
+        public readonly Vector256<double> MinZ;
+        public readonly Vector256<double> MaxX;
+        public readonly Vector256<double> MaxY;
+        public readonly Vector256<double> MaxZ;
+        public readonly Vector256<double> NX;
+        public readonly Vector256<double> NY;
+        public readonly Vector256<double> NZ;
+        public readonly Vector256<double> CX;
+        public readonly Vector256<double> CY;
+        public readonly Vector256<double> CZ;
+        public readonly Vector256<double> Skip;
+        public readonly Vector256<double> I;
+        public readonly Vector256<double> J;
+        public readonly Vector256<double> ProjectedMinX;
+        public readonly Vector256<double> ProjectedMinY;
+        public readonly Vector256<double> ProjectedMaxX;
+        public readonly Vector256<double> ProjectedMaxY;
+        public readonly Vector256<double> U1;
+        public readonly Vector256<double> V1;
+        public readonly Vector256<double> C1;
+        public readonly Vector256<double> U2;
+        public readonly Vector256<double> V2;
+        public readonly Vector256<double> C2;
+        public readonly Vector256<double> U3;
+        public readonly Vector256<double> V3;
+        public readonly Vector256<double> C3;
+
+        public FaceLanes(FaceGeometryCache cache, ReadOnlySpan<int> block)
+        {
+            MinX = Gather(cache._minX, block);
+            MinY = Gather(cache._minY, block);
+            MinZ = Gather(cache._minZ, block);
+            MaxX = Gather(cache._maxX, block);
+            MaxY = Gather(cache._maxY, block);
+            MaxZ = Gather(cache._maxZ, block);
+            NX = Gather(cache._normalX, block);
+            NY = Gather(cache._normalY, block);
+            NZ = Gather(cache._normalZ, block);
+            var c = PointLanes.Of(cache._c, block);
+            CX = c.X;
+            CY = c.Y;
+            CZ = c.Z;
+
+            var (q0, q1, q2, q3) = (cache._projection[block[0]], cache._projection[block[1]], cache._projection[block[2]], cache._projection[block[3]]);
+            Skip = Mask(cache._flat[block[0]] || q0.Degenerate, cache._flat[block[1]] || q1.Degenerate,
+                cache._flat[block[2]] || q2.Degenerate, cache._flat[block[3]] || q3.Degenerate);
+            I = Vector256.Create((double)q0.I, q1.I, q2.I, q3.I);
+            J = Vector256.Create((double)q0.J, q1.J, q2.J, q3.J);
+            ProjectedMinX = Vector256.Create(q0.MinX, q1.MinX, q2.MinX, q3.MinX);
+            ProjectedMinY = Vector256.Create(q0.MinY, q1.MinY, q2.MinY, q3.MinY);
+            ProjectedMaxX = Vector256.Create(q0.MaxX, q1.MaxX, q2.MaxX, q3.MaxX);
+            ProjectedMaxY = Vector256.Create(q0.MaxY, q1.MaxY, q2.MaxY, q3.MaxY);
+            U1 = Vector256.Create(q0.U1, q1.U1, q2.U1, q3.U1);
+            V1 = Vector256.Create(q0.V1, q1.V1, q2.V1, q3.V1);
+            C1 = Vector256.Create(q0.C1, q1.C1, q2.C1, q3.C1);
+            U2 = Vector256.Create(q0.U2, q1.U2, q2.U2, q3.U2);
+            V2 = Vector256.Create(q0.V2, q1.V2, q2.V2, q3.V2);
+            C2 = Vector256.Create(q0.C2, q1.C2, q2.C2, q3.C2);
+            U3 = Vector256.Create(q0.U3, q1.U3, q2.U3, q3.U3);
+            V3 = Vector256.Create(q0.V3, q1.V3, q2.V3, q3.V3);
+            C3 = Vector256.Create(q0.C3, q1.C3, q2.C3, q3.C3);
+        }
+    }
+}
@@ -0,0 +1,148 @@
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// Uniform hash grid over face bounding boxes. Unlike FaceBoundsTree it supports insertion and
+// removal, so it can follow a boundary that is edited locally one collapse at a time. A face whose
+// box would cover more than MaxCellsPerFace cells (a large planar face among small fillet faces)
+// is kept in a separate list that every query scans, so no face costs more than that many entries.
+internal sealed class FaceGridIndex
+{
+    public const int MaxCellsPerFace = 64;
+
+    private readonly double _cellSize;
+    private readonly Dictionary<(long X, long Y, long Z), List<int>> _cells = new();
+    private readonly HashSet<int> _oversized = new();
+    private readonly Dictionary<int, (Vector3d Min, Vector3d Max)> _bounds = new();
+    private readonly HashSet<int> _seen = new();
+
+    public FaceGridIndex(double cellSize)
+    {
+        if (!(cellSize > 0d) || double.IsInfinity(cellSize))
+        {
+            throw new ArgumentOutOfRangeException(nameof(cellSize), "Cell size must be a positive finite value.");
+        }
+
+        _cellSize = cellSize;
+    }
+
+    public int Count => _bounds.Count;
+
+    // Faces kept outside the grid because they exceed MaxCellsPerFace.
+    public int OversizedCount => _oversized.Count;
+
+    // Mean of the largest box extent per face: most faces then touch a handful of cells.
+    public static double SuggestCellSize(IReadOnlyList<Vector3d> vertices, IEnumerable<Face> faces)
+    {
+        var sum = 0d;
+        var count = 0;
+        foreach (var f in faces)
+        {
+            var (min, max) = FaceBounds(vertices[f.A], vertices[f.B], vertices[f.C]);
+            var extent = max - min;
+            sum += Math.Max(extent.X, Math.Max(extent.Y, extent.Z));
+            count++;
+        }
+
+        var size = count == 0 ? 1d : sum / count;
+        return size > 0d && !double.IsInfinity(size) ? size : 1d;
+    }
+
+    public static (Vector3d Min, Vector3d Max) FaceBounds(Vector3d a, Vector3d b, Vector3d c)
+        => (new Vector3d(Math.Min(a.X, Math.Min(b.X, c.X)), Math.Min(a.Y, Math.Min(b.Y, c.Y)), Math.Min(a.Z, Math.Min(b.Z, c.Z))),
+            new Vector3d(Math.Max(a.X, Math.Max(b.X, c.X)), Math.Max(a.Y, Math.Max(b.Y, c.Y)), Math.Max(a.Z, Math.Max(b.Z, c.Z))));
+
+    public void Insert(int id, Vector3d min, Vector3d max)
+    {
+        _bounds.Add(id, (min, max));
+        var (lo, hi) = CellRange(min, max);
+        if (CellCount(lo, hi) > MaxCellsPerFace)
+        {
+            _oversized.Add(id);
+            return;
+        }
+
+        for (var x = lo.X; x <= hi.X; x++)
+        for (var y = lo.Y; y <= hi.Y; y++)
+        for (var z = lo.Z; z <= hi.Z; z++)
+        {
+            if (!_cells.TryGetValue((x, y, z), out var list))
+            {
+                list = [];
+                _cells[(x, y, z)] = list;
+            }
+
+            list.Add(id);
+        }
+    }
+
+    public bool Remove(int id)
+    {
+        if (!_bounds.Remove(id, out var box)) return false;
+        if (_oversized.Remove(id)) return true;
+
+        var (lo, hi) = CellRange(box.Min, box.Max);
+        for (var x = lo.X; x <= hi.X; x++)
+        for (var y = lo.Y; y <= hi.Y; y++)
+        for (var z = lo.Z; z <= hi.Z; z++)
+        {
+            if (!_cells.TryGetValue((x, y, z), out var list)) continue;
+            var at = list.IndexOf(id);
+            if (at < 0) continue;
+            list[at] = list[^1];
+            list.RemoveAt(list.Count - 1);
+            if (list.Count == 0) _cells.Remove((x, y, z));
+        }
+
+        return true;
+    }
+
+    // Appends each indexed id whose box overlaps [min, max] exactly once. Touching boxes overlap.
+    public void Query(Vector3d min, Vector3d max, List<int> results)
+    {
+        var (lo, hi) = CellRange(min, max);
+
+        // A query box spanning more cells than there are faces is answered by checking every face.
+        if (CellCount(lo, hi) > _bounds.Count)
+        {
+            foreach (var (id, box) in _bounds)
+            {
+                if (Overlaps(box, min, max)) results.Add(id);
+            }
+
+            return;
+        }
+
+        foreach (var id in _oversized)
+        {
+            if (Overlaps(_bounds[id], min, max)) results.Add(id);
+        }
+
+        _seen.Clear();
+        for (var x = lo.X; x <= hi.X; x++)
+        for (var y = lo.Y; y <= hi.Y; y++)
+        for (var z = lo.Z; z <= hi.Z; z++)
+        {
+            if (!_cells.TryGetValue((x, y, z), out var list)) continue;
+            foreach (var id in list)
+            {
+                if (_seen.Add(id) && Overlaps(_bounds[id], min, max)) results.Add(id);
+            }
+        }
+    }
+
+    private static bool Overlaps((Vector3d Min, Vector3d Max) box, Vector3d min, Vector3d max)
+        => box.Min.X <= max.X && box.Max.X >= min.X
+            && box.Min.Y <= max.Y && box.Max.Y >= min.Y
+            && box.Min.Z <= max.Z && box.Max.Z >= min.Z;
+
+    // In double: a huge box would overflow a long product.
+    private static double CellCount((long X, long Y, long Z) lo, (long X, long Y, long Z) hi)
+        => ((double)hi.X - lo.X + 1) * ((double)hi.Y - lo.Y + 1) * ((double)hi.Z - lo.Z + 1);
+
+    private ((long X, long Y, long Z) Lo, (long X, long Y, long Z) Hi) CellRange(Vector3d min, Vector3d max)
+        => ((Cell(min.X), Cell(min.Y), Cell(min.Z)), (Cell(max.X), Cell(max.Y), Cell(max.Z)));
+
+    private long Cell(double v) => (long)Math.Floor(v / _cellSize);
+}
@@ -1,3 +1,4 @@
+using System.Runtime.InteropServices;
 using GenMesh.Mesh2Tetra.Geometry;
 using GenMesh.Mesh2Tetra.Models;
 
@@ -13,6 +14,18 @@ internal static class GeometryPredicates
         return Vector3d.Dot(a, Vector3d.Cross(b, c)) / 6d;
     }
 
+    // Mean-ratio style shape measure: 6*sqrt(2)*|V| / rms(edge length)^3, 1 for a regular
+    // tetrahedron and 0 for a flat one. Independent of scale.
+    public static double TetraShapeQuality(Vector3d p1, Vector3d p2, Vector3d p3, Vector3d p4)
+    {
+        var squaredEdges = Vector3d.Dot(p2 - p1, p2 - p1) + Vector3d.Dot(p3 - p1, p3 - p1) + Vector3d.Dot(p4 - p1, p4 - p1)
+            + Vector3d.Dot(p3 - p2, p3 - p2) + Vector3d.Dot(p4 - p2, p4 - p2) + Vector3d.Dot(p4 - p3, p4 - p3);
+        if (squaredEdges <= 0d) return 0d;
+
+        var rms = Math.Sqrt(squaredEdges / 6d);
+        return 6d * Math.Sqrt(2d) * Math.Abs(SignedTetraVolume(p1, p2, p3, p4)) / (rms * rms * rms);
+    }
+
     public static bool PointInTetrahedron(Vector3d p, Vector3d a, Vector3d b, Vector3d c, Vector3d d, double eps)
     {
         var v = Math.Abs(SignedTetraVolume(a, b, c, d));
@@ -26,14 +39,16 @@ internal static class GeometryPredicates
         return Math.Abs((v1 + v2 + v3 + v4) - v) <= eps;
     }
 
-    public static double FaceMeshVolume(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces)
+    // Volume enclosed by a closed face mesh. Any origin gives the same volume; one near the mesh
+    // keeps the rounding proportional to its size.
+    public static double FaceMeshVolume(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, Vector3d origin = default)
     {
         var acc = 0d;
         foreach (var f in faces)
         {
-            var a = vertices[f.A];
-            var b = vertices[f.B];
-            var c = vertices[f.C];
+            var a = vertices[f.A] - origin;
+            var b = vertices[f.B] - origin;
+            var c = vertices[f.C] - origin;
             acc += Vector3d.Dot(a, Vector3d.Cross(b, c));
         }
 
@@ -51,6 +66,22 @@ internal static class GeometryPredicates
         return acc;
     }
 
+    // Centre and largest side of the bounding box of the given vertices.
+    public static (Vector3d Center, double Extent) Bounds(IReadOnlyList<Vector3d> vertices, IEnumerable<int> ids)
+    {
+        var min = new Vector3d(double.PositiveInfinity, double.PositiveInfinity, double.PositiveInfinity);
+        var max = new Vector3d(double.NegativeInfinity, double.NegativeInfinity, double.NegativeInfinity);
+        foreach (var id in ids)
+        {
+            var v = vertices[id];
+            min = new Vector3d(Math.Min(min.X, v.X), Math.Min(min.Y, v.Y), Math.Min(min.Z, v.Z));
+            max = new Vector3d(Math.Max(max.X, v.X), Math.Max(max.Y, v.Y), Math.Max(max.Z, v.Z));
+        }
+
+        if (min.X > max.X) return (default, 0d);
+        return ((min + max) / 2d, Math.Max(max.X - min.X, Math.Max(max.Y - min.Y, max.Z - min.Z)));
+    }
+
     public static bool HasOrientationImbalance(IReadOnlyList<Face> faces)
     {
         var edgeCounts = new Dictionary<(int, int), int>();
@@ -81,9 +112,20 @@ internal static class GeometryPredicates
         }
     }
 
-    public static bool CheckMoveInside3D(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> newFaces, int vertexId)
+    // With exact predicates the moved vertex has to lie strictly on the outer side of every new face.
+    public static bool CheckMoveInside3D(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> newFaces, int vertexId, bool exact = false)
     {
         var p = vertices[vertexId];
+        if (exact)
+        {
+            foreach (var f in newFaces)
+            {
+                if (RobustPredicates.Orient3D(vertices[f.A], vertices[f.B], vertices[f.C], p) <= 0) return false;
+            }
+
+            return true;
+        }
+
         foreach (var f in newFaces)
         {
             var a = vertices[f.A];
@@ -111,10 +153,96 @@ internal static class GeometryPredicates
         return true;
     }
 
-    public static bool HasMeshIntersections(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, int maxOuterFaces = -1)
-        => FindIntersectingFacePairs(vertices, faces, maxOuterFaces).Count > 0;
+    // Below this many outer faces a direct scan is cheaper than building the tree.
+    private const int BroadPhaseMinOuterFaces = 16;
+
+    // exact: decide each pair with RobustPredicates.TrianglesCross (Mesh2TetraOptions.ExactPredicates).
+    public static bool HasMeshIntersections(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, int maxOuterFaces = -1, bool exact = false)
+        => FindIntersectingFacePairs(vertices, faces, maxOuterFaces, stopAtFirst: true, exact).Count > 0;
+
+    public static bool HasMeshIntersections(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, FaceBoundsTree tree, int maxOuterFaces = -1, bool exact = false)
+        => FindIntersectingFacePairs(vertices, faces, tree, maxOuterFaces, stopAtFirst: true, exact).Count > 0;
+
+    public static List<(int I, int J)> FindIntersectingFacePairs(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, int maxOuterFaces = -1, bool exact = false)
+        => FindIntersectingFacePairs(vertices, faces, maxOuterFaces, stopAtFirst: false, exact);
+
+    public static List<(int I, int J)> FindIntersectingFacePairs(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, FaceBoundsTree tree, int maxOuterFaces = -1, bool exact = false)
+        => FindIntersectingFacePairs(vertices, faces, tree, maxOuterFaces, stopAtFirst: false, exact);
+
+    private static List<(int I, int J)> FindIntersectingFacePairs(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, int maxOuterFaces, bool stopAtFirst, bool exact)
+    {
+        var nF = faces.Count;
+        if (nF <= 1) return [];
+        var nMax = maxOuterFaces < 0 ? nF - 1 : Math.Min(maxOuterFaces, nF - 1);
+        if (nMax < BroadPhaseMinOuterFaces)
+        {
+            return FindIntersectingFacePairsBruteForce(vertices, faces, maxOuterFaces, stopAtFirst, exact);
+        }
+
+        return FindIntersectingFacePairs(vertices, faces, FaceBoundsTree.Build(vertices, faces), maxOuterFaces, stopAtFirst, exact);
+    }
 
-    public static List<(int I, int J)> FindIntersectingFacePairs(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, int maxOuterFaces = -1)
+    private static List<(int I, int J)> FindIntersectingFacePairs(
+        IReadOnlyList<Vector3d> vertices,
+        IReadOnlyList<Face> faces,
+        FaceBoundsTree tree,
+        int maxOuterFaces,
+        bool stopAtFirst,
+        bool exact)
+    {
+        if (tree.Count != faces.Count)
+        {
+            throw new ArgumentException("Face bounds tree was built for a different face set.", nameof(tree));
+        }
+
+        var pairs = new List<(int I, int J)>();
+        var nF = faces.Count;
+        if (nF <= 1) return pairs;
+        var nMax = maxOuterFaces < 0 ? nF - 1 : Math.Min(maxOuterFaces, nF - 1);
+
+        // Every face meets several candidates, so its normal, projection etc. are computed once.
+        var geometry = FaceGeometryCache.Build(vertices, faces, exact);
+        var candidates = new List<int>();
+        var eligible = new List<int>();
+        var hits = new bool[16];
+        for (var j = 0; j < nMax; j++)
+        {
+            candidates.Clear();
+            tree.Query(j, candidates);
+            if (candidates.Count <= 1) continue;
+
+            // Sorting keeps the (j, i) pair order identical to the all-pairs scan.
+            candidates.Sort();
+
+            var fj = faces[j];
+            eligible.Clear();
+            foreach (var i in candidates)
+            {
+                if (i > j && !SameFace(faces[i], fj)) eligible.Add(i);
+            }
+
+            if (eligible.Count == 0) continue;
+            if (hits.Length < eligible.Count) hits = new bool[Math.Max(eligible.Count, hits.Length * 2)];
+
+            var span = CollectionsMarshal.AsSpan(eligible);
+            if (geometry.IntersectsEach(j, geometry, span, ignoreCorners: true, hits) == 0) continue;
+            for (var k = 0; k < span.Length; k++)
+            {
+                if (!hits[k]) continue;
+                pairs.Add((j, span[k]));
+                if (stopAtFirst) return pairs;
+            }
+        }
+
+        return pairs;
+    }
+
+    public static List<(int I, int J)> FindIntersectingFacePairsBruteForce(
+        IReadOnlyList<Vector3d> vertices,
+        IReadOnlyList<Face> faces,
+        int maxOuterFaces = -1,
+        bool stopAtFirst = false,
+        bool exact = false)
     {
         var pairs = new List<(int I, int J)>();
         var nF = faces.Count;
@@ -136,9 +264,13 @@ internal static class GeometryPredicates
                 var p1 = vertices[fi.A];
                 var p2 = vertices[fi.B];
                 var p3 = vertices[fi.C];
-                if (TriangleTriangleIntersection(p1, p2, p3, o1, o2, o3, ignoreCorners: true))
+                var crosses = exact
+                    ? !SeparatedByAabb(p1, p2, p3, o1, o2, o3) && RobustPredicates.TrianglesCross(p1, p2, p3, o1, o2, o3)
+                    : TriangleTriangleIntersection(p1, p2, p3, o1, o2, o3, ignoreCorners: true);
+                if (crosses)
                 {
                     pairs.Add((j, i));
+                    if (stopAtFirst) return pairs;
                 }
             }
         }
@@ -297,11 +429,14 @@ internal static class GeometryPredicates
         return pMinX > oMaxX || pMinY > oMaxY || pMinZ > oMaxZ || pMaxX < oMinX || pMaxY < oMinY || pMaxZ < oMinZ;
     }
 
-    private static Vector2d Pick(Vector3d v, int i, int j)
+    private static Vector2d Pick(Vector3d v, int i, int j) => new(Axis(v, i), Axis(v, j));
+
+    private static double Axis(Vector3d v, int axis) => axis switch
     {
-        var values = new[] { v.X, v.Y, v.Z };
-        return new Vector2d(values[i], values[j]);
-    }
+        0 => v.X,
+        1 => v.Y,
+        _ => v.Z,
+    };
 
     public static Vector3d PointToClosestPointOnPlane(Vector3d a, Vector3d b, Vector3d c, Vector3d p)
     {
@@ -463,12 +598,11 @@ internal static class GeometryPredicates
 
     public static bool PointInsideClosedMesh(Vector3d p, IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces)
     {
-        var dir = new Vector3d(1, 0.137, 0.071);
         var hitCount = 0;
 
         foreach (var face in faces)
         {
-            if (RayIntersectsTriangle(p, dir, vertices[face.A], vertices[face.B], vertices[face.C]))
+            if (RayAlongXCrossesFace(p, vertices, face))
             {
                 hitCount++;
             }
@@ -477,26 +611,37 @@ internal static class GeometryPredicates
         return (hitCount % 2) == 1;
     }
 
-    private static bool RayIntersectsTriangle(Vector3d origin, Vector3d dir, Vector3d v0, Vector3d v1, Vector3d v2)
+    // Crossing test for the ray p + t * (1, 0, 0), t > 0. The (Y, Z) projection test perturbs p by
+    // (0, eps, eps^2) symbolically, and every edge is evaluated from its lower vertex id, so a ray
+    // through a shared edge or vertex is counted exactly once for a closed manifold instead of
+    // zero or two times as with a fixed oblique direction.
+    public static bool RayAlongXCrossesFace(Vector3d p, IReadOnlyList<Vector3d> vertices, Face face)
+    {
+        var s1 = EdgeSideYZ(vertices, face.A, face.B, p);
+        if (s1 == 0) return false;
+        if (EdgeSideYZ(vertices, face.B, face.C, p) != s1) return false;
+        if (EdgeSideYZ(vertices, face.C, face.A, p) != s1) return false;
+
+        var a = vertices[face.A];
+        var n = Vector3d.Cross(vertices[face.B] - a, vertices[face.C] - a);
+        if (n.X == 0d) return false;
+
+        var x = a.X - (((n.Y * (p.Y - a.Y)) + (n.Z * (p.Z - a.Z))) / n.X);
+        return x > p.X;
+    }
+
+    private static int EdgeSideYZ(IReadOnlyList<Vector3d> vertices, int from, int to, Vector3d p)
     {
-        const double eps = 1e-12;
-        var e1 = v1 - v0;
-        var e2 = v2 - v0;
-        var p = Vector3d.Cross(dir, e2);
-        var det = Vector3d.Dot(e1, p);
-        if (Math.Abs(det) < eps) return false;
-
-        var invDet = 1.0 / det;
-        var t = origin - v0;
-        var u = Vector3d.Dot(t, p) * invDet;
-        if (u < 0 || u > 1) return false;
-
-        var q = Vector3d.Cross(t, e1);
-        var v = Vector3d.Dot(dir, q) * invDet;
-        if (v < 0 || (u + v) > 1) return false;
-
-        var distance = Vector3d.Dot(e2, q) * invDet;
-        return distance > eps;
+        var flip = from > to;
+        if (flip) (from, to) = (to, from);
+
+        var a = vertices[from];
+        var b = vertices[to];
+        var dy = b.Y - a.Y;
+        var dz = b.Z - a.Z;
+        var o = (dy * (p.Z - a.Z)) - (dz * (p.Y - a.Y));
+        var side = o > 0d ? 1 : o < 0d ? -1 : dz != 0d ? -Math.Sign(dz) : Math.Sign(dy);
+        return flip ? -side : side;
     }
 
     private readonly record struct Vector2d(double X, double Y);
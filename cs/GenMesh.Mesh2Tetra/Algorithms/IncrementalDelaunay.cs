@@ -0,0 +1,344 @@
+using GenMesh.Mesh2Tetra.Geometry;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// Bowyer-Watson Delaunay tetrahedralization over flat arrays. Points are inserted one by one: a
+// visibility walk from the last new cell finds the cell containing the point, the cells whose
+// circumsphere strictly contains it are removed, and the hole is refilled with cells joining the
+// point to its boundary. Orientation and in-sphere tests are exact (RobustPredicates), which keeps
+// the hole star-shaped around the point, so no tolerance is needed and cospherical input (grids,
+// boxes) cannot corrupt the mesh.
+//
+// Every convex-hull face also carries an infinite cell, whose fourth corner is a ghost vertex
+// (index points.Count, no coordinates). A point beyond a hull face conflicts with its infinite cell, so
+// points outside the current hull are inserted the same way as points inside it, and the result
+// is the Delaunay tetrahedralization of exactly the convex hull.
+internal sealed class IncrementalDelaunay
+{
+    // Corners of the face opposite corner i, ordered so corner i lies on its positive side.
+    private static readonly int[] FaceCorners = [1, 3, 2, 0, 2, 3, 0, 3, 1, 0, 1, 2];
+
+    private readonly Vector3d[] _points;
+    private readonly int _ghost;
+    private readonly List<int> _free = [];
+    private readonly Stack<int> _pending = new();
+    private readonly List<int> _cavity = [];
+    private readonly List<int> _boundary = [];
+    private readonly Dictionary<long, int> _openEdges = [];
+    private int[] _corners;
+    private int[] _neighbors;
+    private int[] _marks;
+    private int _count;
+    private int _stamp;
+    private int _last;
+
+    private IncrementalDelaunay(Vector3d[] points)
+    {
+        _points = points;
+        _ghost = points.Length;
+
+        var capacity = (7 * points.Length) + 16;
+        _corners = new int[capacity * 4];
+        _neighbors = new int[capacity * 4];
+        _marks = new int[capacity];
+    }
+
+    // Appends the cells of the Delaunay tetrahedralization of points, inserted in the given order,
+    // to cells as four positively oriented point indices each. Returns false when the points are
+    // coplanar. Repeated points are inserted once. Cancellation is checked every few thousand points.
+    public static bool TryTetrahedralize(
+        IReadOnlyList<Vector3d> points,
+        ReadOnlySpan<int> order,
+        List<int> cells,
+        CancellationToken cancellationToken = default)
+    {
+        var mesh = new IncrementalDelaunay(points as Vector3d[] ?? [.. points]);
+        if (!mesh.TryCreateFirstCell(order, out var first)) return false;
+
+        for (var i = 0; i < order.Length; i++)
+        {
+            if ((i & 4095) == 0) cancellationToken.ThrowIfCancellationRequested();
+            if (Array.IndexOf(first, order[i]) >= 0) continue;
+            mesh.Insert(order[i]);
+        }
+
+        mesh.CollectCells(cells);
+        return true;
+    }
+
+    // The first four affinely independent points in insertion order, as one finite cell with an
+    // infinite cell on each face.
+    private bool TryCreateFirstCell(ReadOnlySpan<int> order, out int[] first)
+    {
+        first = [];
+        if (order.Length < 4) return false;
+
+        var a = order[0];
+        var b = -1;
+        var c = -1;
+        var d = -1;
+        foreach (var i in order)
+        {
+            if (b < 0)
+            {
+                if (_points[i] != _points[a]) b = i;
+            }
+            else if (c < 0)
+            {
+                if (!Collinear(_points[a], _points[b], _points[i])) c = i;
+            }
+            else if (RobustPredicates.Orient3D(_points[a], _points[b], _points[c], _points[i]) != 0)
+            {
+                d = i;
+                break;
+            }
+        }
+
+        if (d < 0) return false;
+        if (RobustPredicates.Orient3D(_points[a], _points[b], _points[c], _points[d]) < 0) (a, b) = (b, a);
+
+        var t = Allocate();
+        SetCorners(t, a, b, c, d);
+
+        // Each face reversed, so the ghost lies outside it, plus the ghost.
+        _openEdges.Clear();
+        for (var f = 0; f < 4; f++)
+        {
+            var x = _corners[(4 * t) + FaceCorners[3 * f]];
+            var y = _corners[(4 * t) + FaceCorners[(3 * f) + 1]];
+            var z = _corners[(4 * t) + FaceCorners[(3 * f) + 2]];
+            var infinite = Allocate();
+            SetCorners(infinite, y, x, z, _ghost);
+            _neighbors[(4 * infinite) + 3] = t;
+            _neighbors[(4 * t) + f] = infinite;
+            Link(infinite, 0, x, z);
+            Link(infinite, 1, y, z);
+            Link(infinite, 2, y, x);
+        }
+
+        _last = t;
+        first = [a, b, c, d];
+        return true;
+    }
+
+    private void Insert(int point)
+    {
+        var p = _points[point];
+        var start = Locate(p);
+
+        // The containing cell's sphere holds every point of the cell except its corners, so only a
+        // repeated point fails this.
+        if (!InConflict(start, p)) return;
+
+        // Cavity: the connected cells in conflict with p. Marks are 2 * stamp for cavity cells and
+        // 2 * stamp + 1 for cells tested and kept.
+        _stamp++;
+        var inside = 2 * _stamp;
+        _cavity.Clear();
+        _boundary.Clear();
+        _marks[start] = inside;
+        _pending.Push(start);
+        while (_pending.Count > 0)
+        {
+            var t = _pending.Pop();
+            _cavity.Add(t);
+            for (var f = 0; f < 4; f++)
+            {
+                var nb = _neighbors[(4 * t) + f];
+                if (_marks[nb] == inside) continue;
+                if (_marks[nb] != inside + 1)
+                {
+                    if (InConflict(nb, p))
+                    {
+                        _marks[nb] = inside;
+                        _pending.Push(nb);
+                        continue;
+                    }
+
+                    _marks[nb] = inside + 1;
+                }
+
+                // Boundary face: its corners, the cell beyond and the cavity cell it belonged to.
+                _boundary.Add(_corners[(4 * t) + FaceCorners[3 * f]]);
+                _boundary.Add(_corners[(4 * t) + FaceCorners[(3 * f) + 1]]);
+                _boundary.Add(_corners[(4 * t) + FaceCorners[(3 * f) + 2]]);
+                _boundary.Add(nb);
+                _boundary.Add(t);
+            }
+        }
+
+        // Every boundary face sees p from inside the cavity, so (a, b, c, p) is positively oriented
+        // (for faces through the ghost, in the sense of the infinite cells). New cells meet along
+        // the edges of the boundary, each shared by two boundary faces.
+        _openEdges.Clear();
+        for (var i = 0; i < _boundary.Count; i += 5)
+        {
+            var a = _boundary[i];
+            var b = _boundary[i + 1];
+            var c = _boundary[i + 2];
+            var outside = _boundary[i + 3];
+            var t = Allocate();
+            SetCorners(t, a, b, c, point);
+            _neighbors[(4 * t) + 3] = outside;
+            ReplaceNeighbor(outside, _boundary[i + 4], t);
+
+            Link(t, 0, b, c);
+            Link(t, 1, a, c);
+            Link(t, 2, a, b);
+            _last = t;
+        }
+
+        // Released only now: boundary records name cavity cells by id, so new cells must not take
+        // those ids while the outside neighbours are rewired.
+        foreach (var t in _cavity)
+        {
+            _corners[4 * t] = -1;
+            _free.Add(t);
+        }
+    }
+
+    // Visibility walk through finite cells: step through any face that has p strictly on its far
+    // side. In a Delaunay triangulation the walk cannot cycle. Stepping out of the hull ends in the
+    // infinite cell of the hull face p lies beyond.
+    private int Locate(Vector3d p)
+    {
+        var t = _last;
+        var ghostAt = GhostCorner(t);
+        if (ghostAt >= 0) t = _neighbors[(4 * t) + ghostAt];
+
+        var steps = 0;
+        while (true)
+        {
+            var o = 4 * t;
+            var next = -1;
+            for (var k = 0; k < 4; k++)
+            {
+                var f = (k + steps) & 3;
+                var a = _points[_corners[o + FaceCorners[3 * f]]];
+                var b = _points[_corners[o + FaceCorners[(3 * f) + 1]]];
+                var c = _points[_corners[o + FaceCorners[(3 * f) + 2]]];
+                if (RobustPredicates.Orient3D(a, b, c, p) < 0)
+                {
+                    next = _neighbors[o + f];
+                    break;
+                }
+            }
+
+            if (next < 0) return t;
+            if (GhostCorner(next) >= 0) return next;
+            t = next;
+            steps++;
+        }
+    }
+
+    // A finite cell conflicts with p when p is strictly inside its circumsphere. An infinite cell
+    // does when p is strictly beyond its hull face, or on the face's plane and strictly inside the
+    // face's circumcircle, which is where the finite cell behind the face conflicts with it.
+    private bool InConflict(int t, Vector3d p)
+    {
+        var o = 4 * t;
+        var ghostAt = GhostCorner(t);
+        if (ghostAt < 0)
+        {
+            return RobustPredicates.InSphere(
+                _points[_corners[o]],
+                _points[_corners[o + 1]],
+                _points[_corners[o + 2]],
+                _points[_corners[o + 3]],
+                p) > 0;
+        }
+
+        var side = RobustPredicates.Orient3D(
+            _points[_corners[o + FaceCorners[3 * ghostAt]]],
+            _points[_corners[o + FaceCorners[(3 * ghostAt) + 1]]],
+            _points[_corners[o + FaceCorners[(3 * ghostAt) + 2]]],
+            p);
+        return side != 0 ? side > 0 : InConflict(_neighbors[o + ghostAt], p);
+    }
+
+    private int GhostCorner(int t)
+    {
+        var o = 4 * t;
+        if (_corners[o] == _ghost) return 0;
+        if (_corners[o + 1] == _ghost) return 1;
+        if (_corners[o + 2] == _ghost) return 2;
+        if (_corners[o + 3] == _ghost) return 3;
+        return -1;
+    }
+
+    // Face f of the new cell t lies on the cavity edge (u, v); the first of the two cells to reach
+    // an edge waits for the second.
+    private void Link(int t, int f, int u, int v)
+    {
+        var key = u < v ? ((long)u << 32) | (uint)v : ((long)v << 32) | (uint)u;
+        if (_openEdges.Remove(key, out var other))
+        {
+            _neighbors[(4 * t) + f] = other >> 2;
+            _neighbors[other] = t;
+        }
+        else
+        {
+            _openEdges.Add(key, (4 * t) + f);
+        }
+    }
+
+    private void ReplaceNeighbor(int t, int old, int replacement)
+    {
+        var o = 4 * t;
+        for (var f = 0; f < 4; f++)
+        {
+            if (_neighbors[o + f] == old)
+            {
+                _neighbors[o + f] = replacement;
+                return;
+            }
+        }
+    }
+
+    private void SetCorners(int t, int a, int b, int c, int d)
+    {
+        var o = 4 * t;
+        _corners[o] = a;
+        _corners[o + 1] = b;
+        _corners[o + 2] = c;
+        _corners[o + 3] = d;
+    }
+
+    private int Allocate()
+    {
+        if (_free.Count > 0)
+        {
+            var reused = _free[^1];
+            _free.RemoveAt(_free.Count - 1);
+            return reused;
+        }
+
+        if (_count == _marks.Length)
+        {
+            Array.Resize(ref _corners, _corners.Length * 2);
+            Array.Resize(ref _neighbors, _neighbors.Length * 2);
+            Array.Resize(ref _marks, _marks.Length * 2);
+        }
+
+        return _count++;
+    }
+
+    private void CollectCells(List<int> cells)
+    {
+        for (var t = 0; t < _count; t++)
+        {
+            if (_corners[4 * t] < 0 || GhostCorner(t) >= 0) continue;
+            cells.AddRange(_corners.AsSpan(4 * t, 4));
+        }
+    }
+
+    // Exact: some axis-aligned step away from a leaves the plane through a, b and c unless the
+    // three are collinear.
+    private static bool Collinear(Vector3d a, Vector3d b, Vector3d c)
+    {
+        var step = Math.Max(1d, Math.Max(Math.Abs(a.X), Math.Max(Math.Abs(a.Y), Math.Abs(a.Z))));
+        return RobustPredicates.Orient3D(a, b, c, a + new Vector3d(step, 0, 0)) == 0
+            && RobustPredicates.Orient3D(a, b, c, a + new Vector3d(0, step, 0)) == 0
+            && RobustPredicates.Orient3D(a, b, c, a + new Vector3d(0, 0, step)) == 0;
+    }
+}
@@ -8,11 +8,15 @@ internal static class MeshPreprocessing
     public static List<Face> PreprocessBoundaryFaces(
         IReadOnlyList<Vector3d> vertices,
         IReadOnlyList<Face> faces,
-        Mesh2TetraOptions options)
+        Mesh2TetraOptions options,
+        CancellationToken cancellationToken = default)
     {
-        var result = faces.ToList();
+        var result = new List<Face>(faces.Count);
+        foreach (var f in faces)
+        {
+            if (!IsDegenerateByArea(vertices[f.A], vertices[f.B], vertices[f.C], options.Epsilon)) result.Add(f);
+        }
 
-        result = result.Where(f => !IsDegenerateByArea(vertices[f.A], vertices[f.B], vertices[f.C], options.Epsilon)).ToList();
         result = RemoveDuplicateFacePairs(result);
 
         if (options.AutoFixFaceOrientation && GeometryPredicates.HasOrientationImbalance(result))
@@ -22,20 +26,23 @@ internal static class MeshPreprocessing
 
         if (options.AutoResolveIntersections)
         {
-            result = SolveIntersectionsByLocalCollapse(vertices, result, options);
+            result = SolveIntersectionsByLocalCollapse(vertices, result, options, cancellationToken);
+            cancellationToken.ThrowIfCancellationRequested();
 
             // final conservative fallback
-            if (GeometryPredicates.HasMeshIntersections(vertices, result))
+            var tree = FaceBoundsTree.Build(vertices, result);
+            if (GeometryPredicates.HasMeshIntersections(vertices, result, tree, exact: options.ExactPredicates))
             {
-                var filtered = RemoveIntersectingFaces(vertices, result);
-                if (filtered.Count >= 4 && !GeometryPredicates.HasMeshIntersections(vertices, filtered))
+                var filtered = RemoveIntersectingFaces(vertices, result, tree, options.ExactPredicates);
+                if (filtered.Count >= 4 && !GeometryPredicates.HasMeshIntersections(vertices, filtered, exact: options.ExactPredicates))
                 {
                     result = filtered;
                 }
             }
         }
 
-        if (options.FailOnSelfIntersections && GeometryPredicates.HasMeshIntersections(vertices, result))
+        cancellationToken.ThrowIfCancellationRequested();
+        if (options.FailOnSelfIntersections && GeometryPredicates.HasMeshIntersections(vertices, result, exact: options.ExactPredicates))
         {
             throw new InvalidOperationException(
                 "Boundary mesh still has self-intersections after preprocessing. " +
@@ -45,69 +52,95 @@ internal static class MeshPreprocessing
         return result;
     }
 
+    // Local edge collapses that reduce the number of intersecting face pairs. The pair set lives in
+    // a BoundaryCollapseState, so a candidate is only tested against the grid neighbours of the
+    // faces it adds. Each pass walks the vertices of intersecting faces and keeps every collapse
+    // that lowers the count; a vertex whose neighbourhood was already changed in the pass waits
+    // for the next one, so independent clusters are repaired together without overlapping edits.
     private static List<Face> SolveIntersectionsByLocalCollapse(
         IReadOnlyList<Vector3d> vertices,
         List<Face> faces,
-        Mesh2TetraOptions options)
+        Mesh2TetraOptions options,
+        CancellationToken cancellationToken)
     {
-        var current = faces;
+        if (!GeometryPredicates.HasMeshIntersections(vertices, faces, exact: options.ExactPredicates))
+        {
+            return faces;
+        }
+
+        var state = new BoundaryCollapseState(vertices, faces, [], options.ExactPredicates);
         var previousCount = int.MaxValue;
+        var touched = new HashSet<int>();
+        var localRows = new List<int>();
+        var localFaces = new List<Face>();
+        var neighbors = new List<int>();
 
         for (var iteration = 0; iteration < options.MaxSolveIntersectionIterations; iteration++)
         {
-            var pairs = GeometryPredicates.FindIntersectingFacePairs(vertices, current);
-            var intersectionCount = pairs.Count * 2;
-            if (intersectionCount == 0)
-            {
-                return current;
-            }
-
-            if (intersectionCount >= previousCount)
+            var intersectionCount = state.IntersectingPairCount;
+            if (intersectionCount == 0 || intersectionCount >= previousCount)
             {
                 break;
             }
 
             previousCount = intersectionCount;
-            var involvedFaceIndices = pairs.SelectMany(p => new[] { p.I, p.J }).Distinct().ToArray();
-            var involvedVertices = involvedFaceIndices
-                .SelectMany(i => new[] { current[i].A, current[i].B, current[i].C })
-                .Distinct()
-                .ToArray();
+            var involvedVertices = new List<int>();
+            var seen = new HashSet<int>();
+            for (var i = 0; i < state.Boundary.Count; i++)
+            {
+                if (!state.IsIntersecting(state.HandleAt(i))) continue;
+                var f = state.Boundary[i];
+                if (seen.Add(f.A)) involvedVertices.Add(f.A);
+                if (seen.Add(f.B)) involvedVertices.Add(f.B);
+                if (seen.Add(f.C)) involvedVertices.Add(f.C);
+            }
 
+            touched.Clear();
             var improved = false;
             foreach (var vertexId in involvedVertices)
             {
-                var localRows = current
-                    .Select((f, idx) => (f, idx))
-                    .Where(x => x.f.A == vertexId || x.f.B == vertexId || x.f.C == vertexId)
-                    .Select(x => x.idx)
-                    .ToList();
+                cancellationToken.ThrowIfCancellationRequested();
+                if (touched.Contains(vertexId)) continue;
+
+                localRows.Clear();
+                foreach (var h in state.FacesAround(vertexId))
+                {
+                    localRows.Add(state.IndexOfHandle(h));
+                }
 
                 if (localRows.Count == 0) continue;
-                var localFaces = localRows.Select(i => current[i]).ToList();
-                var neighbors = localFaces
-                    .SelectMany(f => new[] { f.A, f.B, f.C })
-                    .Where(v => v != vertexId)
-                    .Distinct()
-                    .ToArray();
+                localRows.Sort();
+                localFaces.Clear();
+                neighbors.Clear();
+                foreach (var row in localRows)
+                {
+                    var f = state.Boundary[row];
+                    localFaces.Add(f);
+                    if (f.A != vertexId && !neighbors.Contains(f.A)) neighbors.Add(f.A);
+                    if (f.B != vertexId && !neighbors.Contains(f.B)) neighbors.Add(f.B);
+                    if (f.C != vertexId && !neighbors.Contains(f.C)) neighbors.Add(f.C);
+                }
 
                 foreach (var neighbor in neighbors)
                 {
-                    var candidate = TryLocalCollapse(current, localRows, localFaces, vertexId, neighbor);
-                    if (candidate.Count == 0) continue;
+                    var before = state.IntersectingPairCount;
+                    if (!TryLocalCollapse(state, localRows, localFaces, vertexId, neighbor)) continue;
 
-                    var candidateIntersections = GeometryPredicates.FindIntersectingFacePairs(vertices, candidate).Count * 2;
-                    if (candidateIntersections < intersectionCount)
+                    if (state.IntersectingPairCount < before)
                     {
-                        current = candidate;
+                        state.Commit();
+                        foreach (var f in localFaces)
+                        {
+                            touched.Add(f.A);
+                            touched.Add(f.B);
+                            touched.Add(f.C);
+                        }
+
                         improved = true;
                         break;
                     }
-                }
 
-                if (improved)
-                {
-                    break;
+                    state.Rollback();
                 }
             }
 
@@ -117,11 +150,15 @@ internal static class MeshPreprocessing
             }
         }
 
-        return current;
+        return [.. state.Boundary];
     }
 
-    private static List<Face> TryLocalCollapse(
-        List<Face> faces,
+    // Moves vertexId onto neighborId inside a state edit: the faces around the vertex (localRows,
+    // ascending positions) are removed and every moved face either cancels an existing face with
+    // the same vertices or is appended. Returns false, without an edit, when every moved face
+    // degenerates.
+    private static bool TryLocalCollapse(
+        BoundaryCollapseState state,
         List<int> localRows,
         List<Face> localFaces,
         int vertexId,
@@ -134,30 +171,29 @@ internal static class MeshPreprocessing
 
         if (localNew.Count == 0)
         {
-            return [];
+            return false;
         }
 
-        var result = faces.ToList();
-
-        foreach (var idx in localRows.OrderByDescending(v => v))
+        state.BeginEdit();
+        for (var k = localRows.Count - 1; k >= 0; k--)
         {
-            result.RemoveAt(idx);
+            state.RemoveFaceAt(localRows[k]);
         }
 
         foreach (var f in localNew)
         {
-            var duplicate = result.FindIndex(x => MeshTopology.Canonical(x) == MeshTopology.Canonical(f));
+            var duplicate = state.IndexOfCanonical(f);
             if (duplicate >= 0)
             {
-                result.RemoveAt(duplicate);
+                state.RemoveFaceAt(duplicate);
             }
             else
             {
-                result.Add(f);
+                state.AddFace(f);
             }
         }
 
-        return result;
+        return true;
     }
 
     private static bool IsDegenerateByArea(Vector3d a, Vector3d b, Vector3d c, double eps)
@@ -168,26 +204,38 @@ internal static class MeshPreprocessing
 
     private static List<Face> RemoveDuplicateFacePairs(IReadOnlyList<Face> faces)
     {
-        var buckets = faces
-            .GroupBy(MeshTopology.Canonical)
-            .ToDictionary(g => g.Key, g => g.ToList());
+        // Copies are counted on the first occurrence of each face, so survivors keep input order.
+        var first = new Dictionary<(int, int, int), int>(faces.Count);
+        var copies = new int[faces.Count];
+        for (var i = 0; i < faces.Count; i++)
+        {
+            var key = MeshTopology.Canonical(faces[i]);
+            if (!first.TryAdd(key, i))
+            {
+                copies[first[key]]++;
+            }
+            else
+            {
+                copies[i] = 1;
+            }
+        }
 
         var result = new List<Face>();
-        foreach (var kv in buckets)
+        for (var i = 0; i < faces.Count; i++)
         {
-            if ((kv.Value.Count % 2) == 1)
+            if ((copies[i] % 2) == 1)
             {
-                result.Add(kv.Value[0]);
+                result.Add(faces[i]);
             }
         }
 
         return result;
     }
 
-    private static List<Face> RemoveIntersectingFaces(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces)
+    private static List<Face> RemoveIntersectingFaces(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, FaceBoundsTree tree, bool exact)
     {
         var remove = new bool[faces.Count];
-        var pairs = GeometryPredicates.FindIntersectingFacePairs(vertices, faces);
+        var pairs = GeometryPredicates.FindIntersectingFacePairs(vertices, faces, tree, exact: exact);
         foreach (var p in pairs)
         {
             remove[p.I] = true;
@@ -1,3 +1,4 @@
+using System.Buffers;
 using GenMesh.Mesh2Tetra.Geometry;
 using GenMesh.Mesh2Tetra.Models;
 
@@ -7,23 +8,45 @@ internal static class MeshTopology
 {
     public static List<Face> GetRemainingFaces(IReadOnlyList<Tetrahedron> tetrahedra, IReadOnlyList<Face> boundaryFaces)
     {
-        var allFaces = new List<Face>(tetrahedra.Count * 4 + boundaryFaces.Count);
+        // Two passes over the tet faces instead of materializing them: count, then keep singletons
+        // in the same order (tet faces first, then boundary faces).
+        var counts = new Dictionary<(int, int, int), int>((tetrahedra.Count * 4) + boundaryFaces.Count);
         foreach (var t in tetrahedra)
         {
-            allFaces.AddRange(GetTetFaces(t));
+            for (var k = 0; k < 4; k++)
+            {
+                Count(TetFace(t, k));
+            }
+        }
+
+        foreach (var f in boundaryFaces)
+        {
+            Count(f);
         }
 
-        allFaces.AddRange(boundaryFaces);
+        var result = new List<Face>();
+        foreach (var t in tetrahedra)
+        {
+            for (var k = 0; k < 4; k++)
+            {
+                var f = TetFace(t, k);
+                if (counts[Canonical(f)] == 1) result.Add(f);
+            }
+        }
 
-        var counts = new Dictionary<(int, int, int), int>();
-        foreach (var f in allFaces)
+        foreach (var f in boundaryFaces)
+        {
+            if (counts[Canonical(f)] == 1) result.Add(f);
+        }
+
+        return result;
+
+        void Count(Face f)
         {
             var key = Canonical(f);
             counts.TryGetValue(key, out var c);
             counts[key] = c + 1;
         }
-
-        return allFaces.Where(f => counts[Canonical(f)] == 1).ToList();
     }
 
     public static List<List<Face>> SeparateFaceObjects(IReadOnlyList<Face> faces)
@@ -90,30 +113,73 @@ internal static class MeshTopology
     public static List<Face> FlipOrientation(IReadOnlyList<Face> faces)
         => faces.Select(f => new Face(f.C, f.B, f.A)).ToList();
 
-    public static (List<Vector3d> Vertices, List<Face> Faces, int[] GlobalVertexIds) InsidePoints3D(
+    public static (Vector3d[] Vertices, Face[] Faces, int[] GlobalVertexIds) InsidePoints3D(
         IReadOnlyList<Vector3d> allVertices,
         IReadOnlyList<Face> objectFaces)
     {
-        var globalIds = objectFaces.SelectMany(f => new[] { f.A, f.B, f.C }).Distinct().OrderBy(i => i).ToArray();
-        var g2l = new Dictionary<int, int>(globalIds.Length);
-        for (var i = 0; i < globalIds.Length; i++)
+        // Sorted unique vertex ids from a pooled scratch buffer; local ids are found by binary
+        // search, so no per-object dictionary or per-face arrays are allocated.
+        var scratch = ArrayPool<int>.Shared.Rent(objectFaces.Count * 3);
+        try
         {
-            g2l[globalIds[i]] = i;
-        }
+            var n = 0;
+            foreach (var f in objectFaces)
+            {
+                scratch[n++] = f.A;
+                scratch[n++] = f.B;
+                scratch[n++] = f.C;
+            }
+
+            Array.Sort(scratch, 0, n);
+            var unique = 0;
+            for (var i = 0; i < n; i++)
+            {
+                if (unique == 0 || scratch[i] != scratch[unique - 1]) scratch[unique++] = scratch[i];
+            }
+
+            var globalIds = scratch.AsSpan(0, unique).ToArray();
+            var localVertices = new Vector3d[unique];
+            for (var i = 0; i < unique; i++)
+            {
+                localVertices[i] = allVertices[globalIds[i]];
+            }
+
+            var localFaces = new Face[objectFaces.Count];
+            for (var i = 0; i < localFaces.Length; i++)
+            {
+                var f = objectFaces[i];
+                localFaces[i] = new Face(
+                    Array.BinarySearch(globalIds, f.A),
+                    Array.BinarySearch(globalIds, f.B),
+                    Array.BinarySearch(globalIds, f.C));
+            }
 
-        var localVertices = globalIds.Select(id => allVertices[id]).ToList();
-        var localFaces = objectFaces.Select(f => new Face(g2l[f.A], g2l[f.B], g2l[f.C])).ToList();
-        return (localVertices, localFaces, globalIds);
+            return (localVertices, localFaces, globalIds);
+        }
+        finally
+        {
+            ArrayPool<int>.Shared.Return(scratch);
+        }
     }
 
     public static IEnumerable<Face> GetTetFaces(Tetrahedron t)
     {
-        yield return new Face(t.C, t.B, t.A);
-        yield return new Face(t.B, t.D, t.A);
-        yield return new Face(t.D, t.C, t.A);
-        yield return new Face(t.D, t.B, t.C);
+        for (var k = 0; k < 4; k++)
+        {
+            yield return TetFace(t, k);
+        }
     }
 
+    // Face k (0..3) of a tetrahedron, in GetTetFaces order, without allocating an iterator.
+    public static Face TetFace(Tetrahedron t, int k) => k switch
+    {
+        0 => new Face(t.C, t.B, t.A),
+        1 => new Face(t.B, t.D, t.A),
+        2 => new Face(t.D, t.C, t.A),
+        3 => new Face(t.D, t.B, t.C),
+        _ => throw new ArgumentOutOfRangeException(nameof(k)),
+    };
+
     public static (int, int, int) Canonical(Face f)
     {
         var a = f.A;
@@ -125,9 +191,35 @@ internal static class MeshTopology
         return (a, b, c);
     }
 
-    public static bool ContainsAllVertices(Tetrahedron t, Face f)
+    // Face -> tetrahedra using it, as owners 4 * tetIndex + k (TetFace k); divide by 4 for the
+    // tetrahedron. Chains are in tetrahedron order, so First gives the lowest index.
+    public static CanonicalFaceIndex IndexTetrahedronFaces(IReadOnlyList<Tetrahedron> tetrahedra)
     {
-        var v = t.Vertices;
-        return v.Contains(f.A) && v.Contains(f.B) && v.Contains(f.C);
+        var index = new CanonicalFaceIndex(tetrahedra.Count * 4);
+        for (var t = 0; t < tetrahedra.Count; t++)
+        {
+            for (var k = 0; k < 4; k++)
+            {
+                index.Add(TetFace(tetrahedra[t], k), (t * 4) + k);
+            }
+        }
+
+        return index;
+    }
+
+    // Removes the given positions in one pass, keeping the order of the remaining elements
+    // (instead of one shifting RemoveAt per position).
+    public static void RemoveAtAll<T>(List<T> list, IReadOnlySet<int> positions)
+    {
+        if (positions.Count == 0) return;
+
+        var kept = 0;
+        for (var i = 0; i < list.Count; i++)
+        {
+            if (positions.Contains(i)) continue;
+            list[kept++] = list[i];
+        }
+
+        list.RemoveRange(kept, list.Count - kept);
     }
 }
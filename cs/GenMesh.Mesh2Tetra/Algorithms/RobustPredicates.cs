@@ -0,0 +1,536 @@
+using System.Buffers;
+using GenMesh.Mesh2Tetra.Geometry;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// Exact orientation and intersection predicates for Mesh2TetraOptions.ExactPredicates and the
+// incremental Delaunay engine, after Shewchuk's "Adaptive Precision Floating-Point Arithmetic and
+// Fast Robust Geometric Predicates".
+// Orient3D evaluates the determinant in doubles first and trusts its sign whenever it exceeds the
+// forward error bound; only near-coplanar inputs fall back to expansion arithmetic (sums of
+// non-overlapping doubles, built from error-free TwoSum/TwoProduct), which is exact. The answers
+// do not depend on the scale or the position of the input; the only tolerance left is the relative
+// corner margin of TrianglesCross. Coordinates are assumed to stay clear of overflow and underflow.
+internal static class RobustPredicates
+{
+    // 2^-53, half an ulp of 1.
+    private const double Epsilon = 1d / 9007199254740992d;
+
+    // Shewchuk's o3derrboundA: the floating-point determinant has the correct sign when its
+    // magnitude exceeds this times the permanent.
+    private const double Orient3DErrorBound = (7d + (56d * Epsilon)) * Epsilon;
+
+    // Shewchuk's isperrboundA, the same bound for the in-sphere determinant.
+    private const double InSphereErrorBound = (16d + (224d * Epsilon)) * Epsilon;
+
+    // Exact sign of GeometryPredicates.SignedTetraVolume(a, b, c, d): 1 when d lies on the side the
+    // normal (b - a) x (c - a) points to, -1 on the other side, 0 when the points are coplanar.
+    public static int Orient3D(Vector3d a, Vector3d b, Vector3d c, Vector3d d)
+    {
+        var adx = a.X - d.X;
+        var bdx = b.X - d.X;
+        var cdx = c.X - d.X;
+        var ady = a.Y - d.Y;
+        var bdy = b.Y - d.Y;
+        var cdy = c.Y - d.Y;
+        var adz = a.Z - d.Z;
+        var bdz = b.Z - d.Z;
+        var cdz = c.Z - d.Z;
+
+        var bdxcdy = bdx * cdy;
+        var cdxbdy = cdx * bdy;
+        var cdxady = cdx * ady;
+        var adxcdy = adx * cdy;
+        var adxbdy = adx * bdy;
+        var bdxady = bdx * ady;
+
+        // det[a - d; b - d; c - d], which is -6 times the signed volume.
+        var det = (adz * (bdxcdy - cdxbdy)) + (bdz * (cdxady - adxcdy)) + (cdz * (adxbdy - bdxady));
+        var permanent = ((Math.Abs(bdxcdy) + Math.Abs(cdxbdy)) * Math.Abs(adz))
+            + ((Math.Abs(cdxady) + Math.Abs(adxcdy)) * Math.Abs(bdz))
+            + ((Math.Abs(adxbdy) + Math.Abs(bdxady)) * Math.Abs(cdz));
+        var bound = Orient3DErrorBound * permanent;
+        if (det > bound) return -1;
+        if (-det > bound) return 1;
+        return -Math.Sign(Orient3DExact(a, b, c, d));
+    }
+
+    // Exact sign of the in-sphere test for a tetrahedron with Orient3D(a, b, c, d) > 0: 1 when e lies
+    // strictly inside the sphere through a, b, c and d, -1 outside, 0 on it. Used by the incremental
+    // Delaunay engine; cospherical points (grids, boxes, tessellated spheres) are common there, so
+    // the exact fallback runs often.
+    public static int InSphere(Vector3d a, Vector3d b, Vector3d c, Vector3d d, Vector3d e)
+    {
+        var aex = a.X - e.X;
+        var bex = b.X - e.X;
+        var cex = c.X - e.X;
+        var dex = d.X - e.X;
+        var aey = a.Y - e.Y;
+        var bey = b.Y - e.Y;
+        var cey = c.Y - e.Y;
+        var dey = d.Y - e.Y;
+        var aez = a.Z - e.Z;
+        var bez = b.Z - e.Z;
+        var cez = c.Z - e.Z;
+        var dez = d.Z - e.Z;
+
+        var aexbey = aex * bey;
+        var bexaey = bex * aey;
+        var bexcey = bex * cey;
+        var cexbey = cex * bey;
+        var cexdey = cex * dey;
+        var dexcey = dex * cey;
+        var dexaey = dex * aey;
+        var aexdey = aex * dey;
+        var aexcey = aex * cey;
+        var cexaey = cex * aey;
+        var bexdey = bex * dey;
+        var dexbey = dex * bey;
+        var ab = aexbey - bexaey;
+        var bc = bexcey - cexbey;
+        var cd = cexdey - dexcey;
+        var da = dexaey - aexdey;
+        var ac = aexcey - cexaey;
+        var bd = bexdey - dexbey;
+
+        var abc = (aez * bc) - (bez * ac) + (cez * ab);
+        var bcd = (bez * cd) - (cez * bd) + (dez * bc);
+        var cda = (cez * da) + (dez * ac) + (aez * cd);
+        var dab = (dez * ab) + (aez * bd) + (bez * da);
+
+        var alift = (aex * aex) + (aey * aey) + (aez * aez);
+        var blift = (bex * bex) + (bey * bey) + (bez * bez);
+        var clift = (cex * cex) + (cey * cey) + (cez * cez);
+        var dlift = (dex * dex) + (dey * dey) + (dez * dez);
+
+        // Positive for points inside when Shewchuk's orient3d(a, b, c, d) is positive, which is the
+        // opposite orientation to ours.
+        var det = ((dlift * abc) - (clift * dab)) + ((blift * cda) - (alift * bcd));
+
+        var aezplus = Math.Abs(aez);
+        var bezplus = Math.Abs(bez);
+        var cezplus = Math.Abs(cez);
+        var dezplus = Math.Abs(dez);
+        var ab2 = Math.Abs(aexbey) + Math.Abs(bexaey);
+        var bc2 = Math.Abs(bexcey) + Math.Abs(cexbey);
+        var cd2 = Math.Abs(cexdey) + Math.Abs(dexcey);
+        var da2 = Math.Abs(dexaey) + Math.Abs(aexdey);
+        var ac2 = Math.Abs(aexcey) + Math.Abs(cexaey);
+        var bd2 = Math.Abs(bexdey) + Math.Abs(dexbey);
+        var permanent = (((cd2 * bezplus) + (bd2 * cezplus) + (bc2 * dezplus)) * alift)
+            + (((da2 * cezplus) + (ac2 * dezplus) + (cd2 * aezplus)) * blift)
+            + (((ab2 * dezplus) + (bd2 * aezplus) + (da2 * bezplus)) * clift)
+            + (((bc2 * aezplus) + (ac2 * bezplus) + (ab2 * cezplus)) * dlift);
+        var bound = InSphereErrorBound * permanent;
+        if (det > bound) return -1;
+        if (-det > bound) return 1;
+
+        // Points on a grid or close together subtract exactly, and the determinant of the
+        // differences is much cheaper to expand than the one of the raw coordinates.
+        if (ExactDifference(a, e) && ExactDifference(b, e) && ExactDifference(c, e) && ExactDifference(d, e))
+        {
+            return -Math.Sign(InSphereExactFromDifferences(a - e, b - e, c - e, d - e));
+        }
+
+        return -Math.Sign(InSphereExact(a, b, c, d, e));
+    }
+
+    // Barycentric margin of GeometryPredicates' ignoreCorners test. Inputs are usually decimal, so
+    // faces that touch by design (diagonals of a planar quad, a vertex on an edge) are off by a
+    // rounding error and would count as crossing without it. Being relative, it holds at any scale.
+    private const double CornerMargin = 1e-8;
+
+    // Same question as GeometryPredicates.TriangleTriangleIntersection with ignoreCorners: does an
+    // edge of one face cross the interior of the other, away from its edges by the corner margin?
+    // Faces touching along shared corners or edges do not intersect, and neither do coplanar faces.
+    public static bool TrianglesCross(Vector3d p1, Vector3d p2, Vector3d p3, Vector3d o1, Vector3d o2, Vector3d o3)
+    {
+        var s1 = Orient3D(p1, p2, p3, o1);
+        var s2 = Orient3D(p1, p2, p3, o2);
+        var s3 = Orient3D(p1, p2, p3, o3);
+        if (s1 != 0 && s1 == s2 && s2 == s3) return false;
+
+        var t1 = Orient3D(o1, o2, o3, p1);
+        var t2 = Orient3D(o1, o2, o3, p2);
+        var t3 = Orient3D(o1, o2, o3, p3);
+        if (t1 != 0 && t1 == t2 && t2 == t3) return false;
+
+        return EdgeCrosses(p1, p2, p3, o1, o2, s1, s2)
+            || EdgeCrosses(p1, p2, p3, o2, o3, s2, s3)
+            || EdgeCrosses(p1, p2, p3, o3, o1, s3, s1)
+            || EdgeCrosses(o1, o2, o3, p1, p2, t1, t2)
+            || EdgeCrosses(o1, o2, o3, p2, p3, t2, t3)
+            || EdgeCrosses(o1, o2, o3, p3, p1, t3, t1);
+    }
+
+    // Segment (u, v) against the interior of face abc; su and sv are Orient3D(a, b, c, u) and
+    // Orient3D(a, b, c, v). The segment reaches the plane when the signs differ (an endpoint on
+    // the plane counts, both on it does not), and its line passes through the interior when it
+    // turns the same way around all three edges. The volumes around the edges are proportional to
+    // the barycentric coordinates of the crossing point, which the margin is applied to.
+    private static bool EdgeCrosses(Vector3d a, Vector3d b, Vector3d c, Vector3d u, Vector3d v, int su, int sv)
+    {
+        if (su == sv) return false;
+
+        var side = Orient3D(u, v, a, b);
+        if (side == 0 || Orient3D(u, v, b, c) != side || Orient3D(u, v, c, a) != side) return false;
+
+        var wc = Math.Abs(GeometryPredicates.SignedTetraVolume(u, v, a, b));
+        var wa = Math.Abs(GeometryPredicates.SignedTetraVolume(u, v, b, c));
+        var wb = Math.Abs(GeometryPredicates.SignedTetraVolume(u, v, c, a));
+        var margin = CornerMargin * (wa + wb + wc);
+        return wa >= margin && wb >= margin && wc >= margin;
+    }
+
+    // Shewchuk's orient3dexact: det[a - d; b - d; c - d] from 2x2 minors of the (x, y) coordinates,
+    // without rounding any intermediate. Returns the most significant component of the expansion,
+    // which carries the sign of the determinant.
+    private static double Orient3DExact(Vector3d a, Vector3d b, Vector3d c, Vector3d d)
+    {
+        Span<double> ab = stackalloc double[4];
+        Span<double> bc = stackalloc double[4];
+        Span<double> cd = stackalloc double[4];
+        Span<double> da = stackalloc double[4];
+        Span<double> ac = stackalloc double[4];
+        Span<double> bd = stackalloc double[4];
+        ab = ab[..Minor(a, b, ab)];
+        bc = bc[..Minor(b, c, bc)];
+        cd = cd[..Minor(c, d, cd)];
+        da = da[..Minor(d, a, da)];
+        ac = ac[..Minor(a, c, ac)];
+        bd = bd[..Minor(b, d, bd)];
+
+        Span<double> temp = stackalloc double[8];
+        Span<double> cda = stackalloc double[12];
+        Span<double> dab = stackalloc double[12];
+        Span<double> abc = stackalloc double[12];
+        Span<double> bcd = stackalloc double[12];
+        cda = cda[..Sum(temp[..Sum(cd, da, temp)], ac, cda)];
+        dab = dab[..Sum(temp[..Sum(da, ab, temp)], bd, dab)];
+        Negate(ac);
+        Negate(bd);
+        abc = abc[..Sum(temp[..Sum(ab, bc, temp)], ac, abc)];
+        bcd = bcd[..Sum(temp[..Sum(bc, cd, temp)], bd, bcd)];
+
+        Span<double> aTerm = stackalloc double[24];
+        Span<double> bTerm = stackalloc double[24];
+        Span<double> cTerm = stackalloc double[24];
+        Span<double> dTerm = stackalloc double[24];
+        aTerm = aTerm[..Scale(bcd, a.Z, aTerm)];
+        bTerm = bTerm[..Scale(cda, -b.Z, bTerm)];
+        cTerm = cTerm[..Scale(dab, c.Z, cTerm)];
+        dTerm = dTerm[..Scale(abc, -d.Z, dTerm)];
+
+        Span<double> abTerms = stackalloc double[48];
+        Span<double> cdTerms = stackalloc double[48];
+        Span<double> total = stackalloc double[96];
+        abTerms = abTerms[..Sum(aTerm, bTerm, abTerms)];
+        cdTerms = cdTerms[..Sum(cTerm, dTerm, cdTerms)];
+        return total[Sum(abTerms, cdTerms, total) - 1];
+    }
+
+    // Shewchuk's insphereexact: the in-sphere determinant from 2x2 minors of the (x, y) coordinates,
+    // 3x3 minors with z and 4x4 minors lifted by each point's squared length, without rounding any
+    // intermediate. Returns the most significant component. The worst-case expansions run to
+    // thousands of components, so the large ones live in a pooled buffer rather than on the stack.
+    private static double InSphereExact(Vector3d a, Vector3d b, Vector3d c, Vector3d d, Vector3d e)
+    {
+        Span<double> minors = stackalloc double[40];
+        var ab = minors.Slice(0, 4)[..Minor(a, b, minors.Slice(0, 4))];
+        var bc = minors.Slice(4, 4)[..Minor(b, c, minors.Slice(4, 4))];
+        var cd = minors.Slice(8, 4)[..Minor(c, d, minors.Slice(8, 4))];
+        var de = minors.Slice(12, 4)[..Minor(d, e, minors.Slice(12, 4))];
+        var ea = minors.Slice(16, 4)[..Minor(e, a, minors.Slice(16, 4))];
+        var ac = minors.Slice(20, 4)[..Minor(a, c, minors.Slice(20, 4))];
+        var bd = minors.Slice(24, 4)[..Minor(b, d, minors.Slice(24, 4))];
+        var ce = minors.Slice(28, 4)[..Minor(c, e, minors.Slice(28, 4))];
+        var da = minors.Slice(32, 4)[..Minor(d, a, minors.Slice(32, 4))];
+        var eb = minors.Slice(36, 4)[..Minor(e, b, minors.Slice(36, 4))];
+
+        Span<double> triples = stackalloc double[240];
+        Span<double> scratch = stackalloc double[40];
+        var abc = Minor3(bc, a.Z, ac, -b.Z, ab, c.Z, triples.Slice(0, 24), scratch);
+        var bcd = Minor3(cd, b.Z, bd, -c.Z, bc, d.Z, triples.Slice(24, 24), scratch);
+        var cde = Minor3(de, c.Z, ce, -d.Z, cd, e.Z, triples.Slice(48, 24), scratch);
+        var dea = Minor3(ea, d.Z, da, -e.Z, de, a.Z, triples.Slice(72, 24), scratch);
+        var eab = Minor3(ab, e.Z, eb, -a.Z, ea, b.Z, triples.Slice(96, 24), scratch);
+        var abd = Minor3(bd, a.Z, da, b.Z, ab, d.Z, triples.Slice(120, 24), scratch);
+        var bce = Minor3(ce, b.Z, eb, c.Z, bc, e.Z, triples.Slice(144, 24), scratch);
+        var cda = Minor3(da, c.Z, ac, d.Z, cd, a.Z, triples.Slice(168, 24), scratch);
+        var deb = Minor3(eb, d.Z, bd, e.Z, de, b.Z, triples.Slice(192, 24), scratch);
+        var eac = Minor3(ac, e.Z, ce, a.Z, ea, c.Z, triples.Slice(216, 24), scratch);
+
+        var buffer = ArrayPool<double>.Shared.Rent(InSphereBufferLength);
+        try
+        {
+            var span = buffer.AsSpan(0, InSphereBufferLength);
+            var quad = span[..96];
+            var lifting = span.Slice(96, 2112);
+            var lifted = span.Slice(2208, 5 * 1152);
+            var abdet = span.Slice(7968, 2304);
+            var cddet = span.Slice(10272, 2304);
+            var cdedet = span.Slice(12576, 3456);
+            var det = span.Slice(16032, 5760);
+
+            var adet = lifted[..1152];
+            var bdet = lifted.Slice(1152, 1152);
+            var cdet = lifted.Slice(2304, 1152);
+            var ddet = lifted.Slice(3456, 1152);
+            var edet = lifted.Slice(4608, 1152);
+            adet = adet[..Lifted(Minor4(cde, bce, deb, bcd, quad, lifting), a, adet, lifting)];
+            bdet = bdet[..Lifted(Minor4(dea, cda, eac, cde, quad, lifting), b, bdet, lifting)];
+            cdet = cdet[..Lifted(Minor4(eab, deb, abd, dea, quad, lifting), c, cdet, lifting)];
+            ddet = ddet[..Lifted(Minor4(abc, eac, bce, eab, quad, lifting), d, ddet, lifting)];
+            edet = edet[..Lifted(Minor4(bcd, abd, cda, abc, quad, lifting), e, edet, lifting)];
+
+            abdet = abdet[..MergeSum(adet, bdet, abdet)];
+            cddet = cddet[..MergeSum(cdet, ddet, cddet)];
+            cdedet = cdedet[..MergeSum(cddet, edet, cdedet)];
+            return det[MergeSum(abdet, cdedet, det) - 1];
+        }
+        finally
+        {
+            ArrayPool<double>.Shared.Return(buffer);
+        }
+    }
+
+    // det[a, |a|^2; b, |b|^2; c, |c|^2; d, |d|^2] for differences a..d taken exactly.
+    private static double InSphereExactFromDifferences(Vector3d a, Vector3d b, Vector3d c, Vector3d d)
+    {
+        Span<double> minors = stackalloc double[24];
+        var ab = minors.Slice(0, 4)[..Minor(a, b, minors.Slice(0, 4))];
+        var bc = minors.Slice(4, 4)[..Minor(b, c, minors.Slice(4, 4))];
+        var cd = minors.Slice(8, 4)[..Minor(c, d, minors.Slice(8, 4))];
+        var da = minors.Slice(12, 4)[..Minor(d, a, minors.Slice(12, 4))];
+        var ac = minors.Slice(16, 4)[..Minor(a, c, minors.Slice(16, 4))];
+        var bd = minors.Slice(20, 4)[..Minor(b, d, minors.Slice(20, 4))];
+
+        Span<double> triples = stackalloc double[96];
+        Span<double> scratch = stackalloc double[40];
+        var abc = Minor3(bc, a.Z, ac, -b.Z, ab, c.Z, triples[..24], scratch);
+        var bcd = Minor3(cd, b.Z, bd, -c.Z, bc, d.Z, triples.Slice(24, 24), scratch);
+        var cda = Minor3(da, c.Z, ac, d.Z, cd, a.Z, triples.Slice(48, 24), scratch);
+        var dab = Minor3(ab, d.Z, bd, a.Z, da, b.Z, triples.Slice(72, 24), scratch);
+        Negate(dab);
+        Negate(bcd);
+
+        var buffer = ArrayPool<double>.Shared.Rent(DifferenceBufferLength);
+        try
+        {
+            var span = buffer.AsSpan(0, DifferenceBufferLength);
+            var lifting = span[..360];
+            var terms = span.Slice(360, 4 * 288);
+            var pair = span.Slice(1512, 2 * 576);
+            var det = span.Slice(2664, 1152);
+
+            var dTerm = terms[..LiftedTerm(abc, d, terms[..288], lifting)];
+            var cTerm = terms.Slice(288, 288)[..LiftedTerm(dab, c, terms.Slice(288, 288), lifting)];
+            var bTerm = terms.Slice(576, 288)[..LiftedTerm(cda, b, terms.Slice(576, 288), lifting)];
+            var aTerm = terms.Slice(864, 288)[..LiftedTerm(bcd, a, terms.Slice(864, 288), lifting)];
+            var dc = pair[..MergeSum(dTerm, cTerm, pair[..576])];
+            var ba = pair.Slice(576, 576)[..MergeSum(bTerm, aTerm, pair.Slice(576, 576))];
+            return det[MergeSum(dc, ba, det) - 1];
+        }
+        finally
+        {
+            ArrayPool<double>.Shared.Return(buffer);
+        }
+    }
+
+    // Lifting scratch, the four lifted 3x3 minors, their pairwise sums and the total.
+    private const int DifferenceBufferLength = 360 + (4 * 288) + (2 * 576) + 1152;
+
+    // minor * |p|^2 with |p|^2 expanded exactly (at most 6 components), into h.
+    private static int LiftedTerm(ReadOnlySpan<double> minor, Vector3d p, Span<double> h, Span<double> scratch)
+    {
+        Span<double> lift = stackalloc double[6];
+        TwoProduct(p.X, p.X, out lift[1], out lift[0]);
+        TwoProduct(p.Y, p.Y, out var y, out var yError);
+        TwoProduct(p.Z, p.Z, out var z, out var zError);
+        var n = Grow(lift[..2], yError, lift);
+        n = Grow(lift[..n], y, lift);
+        n = Grow(lift[..n], zError, lift);
+        n = Grow(lift[..n], z, lift);
+
+        // Sum of the minor scaled by each component of the lift.
+        var product = scratch[..48];
+        var total = scratch.Slice(48, 288);
+        var totalLength = Scale(minor, lift[0], total);
+        for (var i = 1; i < n; i++)
+        {
+            var scaled = product[..Scale(minor, lift[i], product)];
+            totalLength = MergeSum(total[..totalLength], scaled, h);
+            h[..totalLength].CopyTo(total);
+        }
+
+        total[..totalLength].CopyTo(h);
+        return totalLength;
+    }
+
+    // a - b is a double.
+    private static bool ExactDifference(Vector3d a, Vector3d b)
+        => TwoDiffIsExact(a.X, b.X) && TwoDiffIsExact(a.Y, b.Y) && TwoDiffIsExact(a.Z, b.Z);
+
+    private static bool TwoDiffIsExact(double a, double b)
+    {
+        var x = a - b;
+        var bVirtual = a - x;
+        var aVirtual = x + bVirtual;
+        return (a - aVirtual) + (bVirtual - b) == 0d;
+    }
+
+    // A 4x4 minor, lifting scratch, the five lifted minors and their partial sums.
+    private const int InSphereBufferLength = 96 + 2112 + (5 * 1152) + 2304 + 2304 + 3456 + 5760;
+
+    // u * su + v * sv + w * sw for 2x2 minors u, v, w and z coordinates s.
+    private static Span<double> Minor3(
+        ReadOnlySpan<double> u, double su, ReadOnlySpan<double> v, double sv, ReadOnlySpan<double> w, double sw, Span<double> h, Span<double> scratch)
+    {
+        var x = scratch[..Scale(u, su, scratch[..8])];
+        var y = scratch.Slice(8, 8)[..Scale(v, sv, scratch.Slice(8, 8))];
+        var xy = scratch.Slice(16, 16)[..MergeSum(x, y, scratch.Slice(16, 16))];
+        var z = scratch.Slice(32, 8)[..Scale(w, sw, scratch.Slice(32, 8))];
+        return h[..MergeSum(xy, z, h)];
+    }
+
+    // (p + q) - (r + s) for 3x3 minors.
+    private static Span<double> Minor4(
+        ReadOnlySpan<double> p, ReadOnlySpan<double> q, ReadOnlySpan<double> r, ReadOnlySpan<double> s, Span<double> h, Span<double> scratch)
+    {
+        var pq = scratch[..MergeSum(p, q, scratch[..48])];
+        var rs = scratch.Slice(48, 48)[..MergeSum(r, s, scratch.Slice(48, 48))];
+        Negate(rs);
+        return h[..MergeSum(pq, rs, h)];
+    }
+
+    // minor * |point|^2, into h; scratch holds the partial products.
+    private static int Lifted(ReadOnlySpan<double> minor, Vector3d point, Span<double> h, Span<double> scratch)
+    {
+        var once = scratch[..192];
+        var x = scratch.Slice(192, 384);
+        var y = scratch.Slice(576, 384);
+        var z = scratch.Slice(960, 384);
+        var xy = scratch.Slice(1344, 768);
+        var xn = Scale(once[..Scale(minor, point.X, once)], point.X, x);
+        var yn = Scale(once[..Scale(minor, point.Y, once)], point.Y, y);
+        var zn = Scale(once[..Scale(minor, point.Z, once)], point.Z, z);
+        var xyn = MergeSum(x[..xn], y[..yn], xy);
+        return MergeSum(xy[..xyn], z[..zn], h);
+    }
+
+    // u.X * v.Y - v.X * u.Y.
+    private static int Minor(Vector3d u, Vector3d v, Span<double> h)
+    {
+        TwoProduct(u.X, v.Y, out h[1], out h[0]);
+        TwoProduct(v.X, u.Y, out var y, out var yError);
+        var n = Grow(h[..2], -yError, h);
+        return Grow(h[..n], -y, h);
+    }
+
+    // e + f; h may start with e.
+    private static int Sum(ReadOnlySpan<double> e, ReadOnlySpan<double> f, Span<double> h)
+    {
+        e.CopyTo(h);
+        var n = e.Length;
+        foreach (var x in f)
+        {
+            n = Grow(h[..n], x, h);
+        }
+
+        return n;
+    }
+
+    // e + f by merging components in order of magnitude (Shewchuk's fast_expansion_sum_zeroelim):
+    // linear in the lengths, where Sum is quadratic. h must not overlap e or f.
+    private static int MergeSum(ReadOnlySpan<double> e, ReadOnlySpan<double> f, Span<double> h)
+    {
+        var i = 0;
+        var j = 0;
+        double q;
+        if (Math.Abs(f[0]) > Math.Abs(e[0])) q = e[i++];
+        else q = f[j++];
+
+        var n = 0;
+        double error;
+        while (i < e.Length && j < f.Length)
+        {
+            if (Math.Abs(f[j]) > Math.Abs(e[i])) TwoSum(q, e[i++], out q, out error);
+            else TwoSum(q, f[j++], out q, out error);
+            if (error != 0d) h[n++] = error;
+        }
+
+        while (i < e.Length)
+        {
+            TwoSum(q, e[i++], out q, out error);
+            if (error != 0d) h[n++] = error;
+        }
+
+        while (j < f.Length)
+        {
+            TwoSum(q, f[j++], out q, out error);
+            if (error != 0d) h[n++] = error;
+        }
+
+        if (q != 0d || n == 0) h[n++] = q;
+        return n;
+    }
+
+    // e + b (Shewchuk's grow_expansion_zeroelim). h may be e itself: every component is read before
+    // the slot is written.
+    private static int Grow(ReadOnlySpan<double> e, double b, Span<double> h)
+    {
+        var q = b;
+        var n = 0;
+        for (var i = 0; i < e.Length; i++)
+        {
+            TwoSum(q, e[i], out q, out var error);
+            if (error != 0d) h[n++] = error;
+        }
+
+        if (q != 0d || n == 0) h[n++] = q;
+        return n;
+    }
+
+    // e * b (Shewchuk's scale_expansion_zeroelim); h must not overlap e.
+    private static int Scale(ReadOnlySpan<double> e, double b, Span<double> h)
+    {
+        var n = 0;
+        TwoProduct(e[0], b, out var q, out var error);
+        if (error != 0d) h[n++] = error;
+        for (var i = 1; i < e.Length; i++)
+        {
+            TwoProduct(e[i], b, out var product, out var productError);
+            TwoSum(q, productError, out var sum, out error);
+            if (error != 0d) h[n++] = error;
+            TwoSum(product, sum, out q, out error);
+            if (error != 0d) h[n++] = error;
+        }
+
+        if (q != 0d || n == 0) h[n++] = q;
+        return n;
+    }
+
+    private static void Negate(Span<double> e)
+    {
+        for (var i = 0; i < e.Length; i++)
+        {
+            e[i] = -e[i];
+        }
+    }
+
+    // x + y = a + b exactly, with x = fl(a + b).
+    private static void TwoSum(double a, double b, out double x, out double y)
+    {
+        x = a + b;
+        var bVirtual = x - a;
+        var aVirtual = x - bVirtual;
+        y = (a - aVirtual) + (b - bVirtual);
+    }
+
+    // x + y = a * b exactly, with x = fl(a * b).
+    private static void TwoProduct(double a, double b, out double x, out double y)
+    {
+        x = a * b;
+        y = Math.FusedMultiplyAdd(a, b, -x);
+    }
+}
@@ -0,0 +1,91 @@
+using System.Numerics;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// Order statistics over a growing row of slots, each occupied or free (a Fenwick tree of
+// occupancy counts). Rank gives the number of occupied slots before a slot and Select the slot of
+// the k-th occupied one, so a list that frees slots instead of shifting its items can still be
+// addressed by position. Every operation costs O(log n); slots are only added or dropped at the
+// end.
+internal sealed class SlotRankIndex
+{
+    private readonly List<int> _tree = [0];
+    private readonly List<bool> _occupied = [];
+
+    // Occupied slots.
+    public int Count { get; private set; }
+
+    public int SlotCount => _occupied.Count;
+
+    public bool IsOccupied(int slot) => _occupied[slot];
+
+    public int Append(bool occupied = true)
+    {
+        var slot = _occupied.Count;
+        var i = slot + 1;
+        _tree.Add((occupied ? 1 : 0) + Prefix(slot) - Prefix(i - (i & -i)));
+        _occupied.Add(occupied);
+        if (occupied) Count++;
+        return slot;
+    }
+
+    public void RemoveLast()
+    {
+        if (_occupied[^1]) Count--;
+        _occupied.RemoveAt(_occupied.Count - 1);
+        _tree.RemoveAt(_tree.Count - 1);
+    }
+
+    public void Set(int slot, bool occupied)
+    {
+        if (_occupied[slot] == occupied) return;
+
+        _occupied[slot] = occupied;
+        var delta = occupied ? 1 : -1;
+        Count += delta;
+        for (var i = slot + 1; i < _tree.Count; i += i & -i)
+        {
+            _tree[i] += delta;
+        }
+    }
+
+    public int Rank(int slot) => Prefix(slot);
+
+    public int Select(int rank)
+    {
+        if ((uint)rank >= (uint)Count) throw new ArgumentOutOfRangeException(nameof(rank));
+
+        var n = _occupied.Count;
+        var slot = 0;
+        var remaining = rank + 1;
+        for (var step = 1 << BitOperations.Log2((uint)n); step > 0; step >>= 1)
+        {
+            if (slot + step <= n && _tree[slot + step] < remaining)
+            {
+                slot += step;
+                remaining -= _tree[slot];
+            }
+        }
+
+        return slot;
+    }
+
+    public void Clear()
+    {
+        _tree.RemoveRange(1, _tree.Count - 1);
+        _occupied.Clear();
+        Count = 0;
+    }
+
+    // Occupied slots among the first count.
+    private int Prefix(int count)
+    {
+        var sum = 0;
+        for (var i = count; i > 0; i -= i & -i)
+        {
+            sum += _tree[i];
+        }
+
+        return sum;
+    }
+}
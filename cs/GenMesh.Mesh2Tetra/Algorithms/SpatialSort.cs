@@ -0,0 +1,130 @@
+using System.Numerics;
+using GenMesh.Mesh2Tetra.Geometry;
+
+namespace GenMesh.Mesh2Tetra.Algorithms;
+
+// Insertion orders for IncrementalDelaunay. A biased randomized insertion order (BRIO, Amenta,
+// Choi and Rote) puts about half of the points in the last round, a quarter in the one before and
+// so on, which keeps the expected cost of randomized insertion; inside a round the points follow a
+// Hilbert curve, so consecutive points are close and the point-location walk stays short.
+internal static class SpatialSort
+{
+    private const int HilbertBits = 16;
+    private const int MinFirstRound = 64;
+    private const int Seed = 0x5EED;
+
+    public static int[] BrioOrder(IReadOnlyList<Vector3d> points)
+    {
+        var n = points.Count;
+        var order = new int[n];
+        if (n == 0) return order;
+
+        var min = points[0];
+        var max = points[0];
+        foreach (var p in points)
+        {
+            min = new Vector3d(Math.Min(min.X, p.X), Math.Min(min.Y, p.Y), Math.Min(min.Z, p.Z));
+            max = new Vector3d(Math.Max(max.X, p.X), Math.Max(max.Y, p.Y), Math.Max(max.Z, p.Z));
+        }
+
+        var extent = Math.Max(max.X - min.X, Math.Max(max.Y - min.Y, max.Z - min.Z));
+        var scale = extent > 0 ? ((1 << HilbertBits) - 1) / extent : 0d;
+
+        var rounds = 1;
+        while (rounds < 32 && n >> rounds >= MinFirstRound)
+        {
+            rounds++;
+        }
+
+        // Round in the top bits, then the Hilbert index.
+        var rng = new Random(Seed);
+        var keys = new ulong[n];
+        for (var i = 0; i < n; i++)
+        {
+            var heads = Math.Min(rounds - 1, BitOperations.TrailingZeroCount(~(uint)rng.Next()));
+            var round = (ulong)(rounds - 1 - heads);
+            var p = points[i];
+            keys[i] = (round << (3 * HilbertBits)) | HilbertIndex(
+                (uint)((p.X - min.X) * scale),
+                (uint)((p.Y - min.Y) * scale),
+                (uint)((p.Z - min.Z) * scale));
+            order[i] = i;
+        }
+
+        Array.Sort(keys, order);
+        return order;
+    }
+
+    // The residual recursion meshes subsets of its parent's points. A subsequence of a BRIO is
+    // still one, so the child inserts its points in the parent's order instead of sorting again;
+    // rank is the parent's insertion position per parent vertex, parentIds the parent vertex of
+    // each child vertex.
+    public static int[] RestrictOrder(int[] rank, IReadOnlyList<int> parentIds)
+    {
+        var keys = new int[parentIds.Count];
+        var order = new int[parentIds.Count];
+        for (var i = 0; i < order.Length; i++)
+        {
+            keys[i] = rank[parentIds[i]];
+            order[i] = i;
+        }
+
+        Array.Sort(keys, order);
+        return order;
+    }
+
+    public static int[] Ranks(int[] order)
+    {
+        var rank = new int[order.Length];
+        for (var i = 0; i < order.Length; i++)
+        {
+            rank[order[i]] = i;
+        }
+
+        return rank;
+    }
+
+    // Position of (x, y, z) along the Hilbert curve through a 2^16 cube (Skilling's transpose
+    // algorithm, then the bits interleaved).
+    private static ulong HilbertIndex(uint x, uint y, uint z)
+    {
+        Span<uint> c = [x, y, z];
+        const uint m = 1u << (HilbertBits - 1);
+        for (var q = m; q > 1; q >>= 1)
+        {
+            var p = q - 1;
+            for (var i = 0; i < 3; i++)
+            {
+                if ((c[i] & q) != 0)
+                {
+                    c[0] ^= p;
+                }
+                else
+                {
+                    var t = (c[0] ^ c[i]) & p;
+                    c[0] ^= t;
+                    c[i] ^= t;
+                }
+            }
+        }
+
+        c[1] ^= c[0];
+        c[2] ^= c[1];
+        var flip = 0u;
+        for (var q = m; q > 1; q >>= 1)
+        {
+            if ((c[2] & q) != 0) flip ^= q - 1;
+        }
+
+        ulong index = 0;
+        for (var bit = HilbertBits - 1; bit >= 0; bit--)
+        {
+            for (var i = 0; i < 3; i++)
+            {
+                index = (index << 1) | (((c[i] ^ flip) >> bit) & 1);
+            }
+        }
+
+        return index;
+    }
+}
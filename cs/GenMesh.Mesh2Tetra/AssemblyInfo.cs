@@ -1,3 +1,4 @@
 using System.Runtime.CompilerServices;
 
 [assembly: InternalsVisibleTo("GenMesh.Mesh2Tetra.Tests")]
+[assembly: InternalsVisibleTo("GenMesh.Mesh2Tetra.Benchmarks")]
@@ -0,0 +1,13 @@
+namespace GenMesh.Mesh2Tetra;
+
+public enum CollapseCandidateOrder
+{
+    // Boundary vertices in order of first use, restarting after every collapse, as in the Matlab
+    // implementation. Regression fixtures are recorded with this order.
+    Sequential,
+
+    // A priority queue of (vertex, neighbour) collapses ranked by the worst shape quality of the
+    // tetrahedra they create; only the touched neighbourhood is rescored after a collapse.
+    // Tends to give better-shaped tetrahedra, and different ones than Sequential.
+    BestShapeFirst,
+}
@@ -0,0 +1,14 @@
+namespace GenMesh.Mesh2Tetra;
+
+// Pipeline phases of Mesh2TetraConverter.Convert, in execution order.
+public enum ConversionPhase
+{
+    // Input validation, boundary preprocessing and the source volume.
+    Preprocessing,
+
+    // Constrained Delaunay tetrahedralization of the interior.
+    Delaunay,
+
+    // Residual-volume fill by boundary edge collapse (including the Delaunay fallback).
+    BoundaryCollapse,
+}
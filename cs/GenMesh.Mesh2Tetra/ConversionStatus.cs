@@ -0,0 +1,14 @@
+namespace GenMesh.Mesh2Tetra;
+
+// How a conversion run by Mesh2TetraConverter.ConvertWithinBudget ended.
+public enum ConversionStatus
+{
+    // Every phase ran to the end; the tetrahedra are what Convert returns.
+    Completed,
+
+    // Mesh2TetraOptions.TimeBudget ran out.
+    TimedOut,
+
+    // Mesh2TetraOptions.CancellationToken was cancelled.
+    Cancelled,
+}
@@ -0,0 +1,51 @@
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+
+namespace GenMesh.Mesh2Tetra.Diagnostics;
+
+// Tracing and metrics for the conversion pipeline. Activities (one per Convert call, one per
+// phase, one per Delaunay component including recursion levels) carry per-phase counts as tags;
+// the Meter aggregates the same counts across conversions. Both cost next to nothing unless a
+// listener is attached, e.g. TraceFileWriter, dotnet-trace or an OpenTelemetry exporter.
+public static class Mesh2TetraDiagnostics
+{
+    public const string ActivitySourceName = "GenMesh.Mesh2Tetra";
+    public const string MeterName = "GenMesh.Mesh2Tetra";
+
+    internal static readonly ActivitySource Source = new(ActivitySourceName);
+    internal static readonly Meter Meter = new(MeterName);
+
+    internal static readonly Histogram<double> PhaseDuration = Meter.CreateHistogram<double>(
+        "mesh2tetra.phase.duration", "ms", "Wall time per conversion phase (tag: phase).");
+
+    internal static readonly Counter<long> CollapseCandidates = Meter.CreateCounter<long>(
+        "mesh2tetra.collapse.candidates", "{candidate}", "Edge-collapse candidates evaluated (tag: outcome).");
+
+    internal static readonly Counter<long> CollapseRetryRounds = Meter.CreateCounter<long>(
+        "mesh2tetra.collapse.retry_rounds", "{round}", "Boundary-collapse rounds that fell back to removing tetrahedra.");
+
+    internal static readonly Histogram<long> DelaunayComponentFaces = Meter.CreateHistogram<long>(
+        "mesh2tetra.delaunay.component_faces", "{face}", "Boundary faces per Delaunay component (tags: depth, outcome).");
+
+    internal static readonly Counter<long> CacheLookups = Meter.CreateCounter<long>(
+        "mesh2tetra.cache.lookups", "{lookup}", "Result-cache lookups (tags: kind = result or component, outcome = hit or miss).");
+
+    internal static PhaseScope StartPhase(ConversionPhase phase) => new(phase, Source.StartActivity(phase.ToString()));
+
+    // Stops the phase activity and records the phase duration when disposed.
+    internal readonly struct PhaseScope(ConversionPhase phase, Activity? activity) : IDisposable
+    {
+        private readonly long _start = Stopwatch.GetTimestamp();
+
+        public Activity? Activity { get; } = activity;
+
+        public void Dispose()
+        {
+            Activity?.Dispose();
+            if (PhaseDuration.Enabled)
+            {
+                PhaseDuration.Record(Stopwatch.GetElapsedTime(_start).TotalMilliseconds, new KeyValuePair<string, object?>("phase", phase.ToString()));
+            }
+        }
+    }
+}
@@ -0,0 +1,136 @@
+using System.Buffers;
+using System.Diagnostics;
+using System.Text;
+using System.Text.Json;
+
+namespace GenMesh.Mesh2Tetra.Diagnostics;
+
+// Records every Mesh2Tetra activity as one JSON line when it stops:
+//   {"name", "id", "parentId", "traceId", "start", "durationMs", "status", "tags": {...},
+//    "events": [{"name", "offsetMs", "tags"}]}
+// Children stop before their parents, so a line's parent may appear later in the file.
+// tools/trace_summary.py turns the file into a flame-style summary.
+public sealed class TraceFileWriter : IDisposable
+{
+    private readonly TextWriter _writer;
+    private readonly bool _ownsWriter;
+    private readonly ActivityListener _listener;
+    private readonly object _gate = new();
+    private bool _disposed;
+
+    public TraceFileWriter(string path)
+        : this(new StreamWriter(path, append: false, new UTF8Encoding(encoderShouldEmitUTF8Identifier: false)), ownsWriter: true)
+    {
+    }
+
+    public TraceFileWriter(TextWriter writer)
+        : this(writer, ownsWriter: false)
+    {
+    }
+
+    private TraceFileWriter(TextWriter writer, bool ownsWriter)
+    {
+        _writer = writer;
+        _ownsWriter = ownsWriter;
+        _listener = new ActivityListener
+        {
+            ShouldListenTo = source => source.Name == Mesh2TetraDiagnostics.ActivitySourceName,
+            Sample = (ref ActivityCreationOptions<ActivityContext> _) => ActivitySamplingResult.AllDataAndRecorded,
+            ActivityStopped = Write,
+        };
+        ActivitySource.AddActivityListener(_listener);
+    }
+
+    public void Dispose()
+    {
+        _listener.Dispose();
+        lock (_gate)
+        {
+            if (_disposed) return;
+            _disposed = true;
+            _writer.Flush();
+            if (_ownsWriter)
+            {
+                _writer.Dispose();
+            }
+        }
+    }
+
+    private void Write(Activity activity)
+    {
+        var buffer = new ArrayBufferWriter<byte>(256);
+        using (var json = new Utf8JsonWriter(buffer))
+        {
+            json.WriteStartObject();
+            json.WriteString("name", activity.OperationName);
+            json.WriteString("id", activity.SpanId.ToHexString());
+            if (activity.ParentSpanId != default)
+            {
+                json.WriteString("parentId", activity.ParentSpanId.ToHexString());
+            }
+            else
+            {
+                json.WriteNull("parentId");
+            }
+
+            json.WriteString("traceId", activity.TraceId.ToHexString());
+            json.WriteString("start", activity.StartTimeUtc);
+            json.WriteNumber("durationMs", activity.Duration.TotalMilliseconds);
+            json.WriteString("status", activity.Status == ActivityStatusCode.Error ? "error" : "ok");
+            WriteTags(json, activity.TagObjects);
+
+            json.WriteStartArray("events");
+            foreach (var e in activity.Events)
+            {
+                json.WriteStartObject();
+                json.WriteString("name", e.Name);
+                json.WriteNumber("offsetMs", (e.Timestamp - activity.StartTimeUtc).TotalMilliseconds);
+                WriteTags(json, e.Tags);
+                json.WriteEndObject();
+            }
+
+            json.WriteEndArray();
+            json.WriteEndObject();
+        }
+
+        var line = Encoding.UTF8.GetString(buffer.WrittenSpan);
+        lock (_gate)
+        {
+            if (!_disposed)
+            {
+                _writer.WriteLine(line);
+            }
+        }
+    }
+
+    private static void WriteTags(Utf8JsonWriter json, IEnumerable<KeyValuePair<string, object?>> tags)
+    {
+        json.WriteStartObject("tags");
+        foreach (var (key, value) in tags)
+        {
+            switch (value)
+            {
+                case null:
+                    json.WriteNull(key);
+                    break;
+                case bool b:
+                    json.WriteBoolean(key, b);
+                    break;
+                case int i:
+                    json.WriteNumber(key, i);
+                    break;
+                case long l:
+                    json.WriteNumber(key, l);
+                    break;
+                case double d:
+                    json.WriteNumber(key, d);
+                    break;
+                default:
+                    json.WriteString(key, value.ToString());
+                    break;
+            }
+        }
+
+        json.WriteEndObject();
+    }
+}
@@ -0,0 +1,18 @@
+using GenMesh.Mesh2Tetra.Geometry;
+
+namespace GenMesh.Mesh2Tetra;
+
+// Unconstrained 3D Delaunay tetrahedralization used by the Delaunay phase for every component and
+// residual recursion level (Mesh2TetraOptions.DelaunayBackend). Implementations must be safe to
+// call from several threads at once.
+public interface IDelaunayBackend
+{
+    // Identifies the backend in result-cache keys: two backends with the same name must produce
+    // the same cells.
+    string Name { get; }
+
+    // Appends the cells of the Delaunay tetrahedralization of points to cells, four indices into
+    // points per cell. Returns false when the points span no volume (fewer than four, or all
+    // coplanar within planeDistanceTolerance).
+    bool TryTetrahedralize(IReadOnlyList<Vector3d> points, double planeDistanceTolerance, List<int> cells);
+}
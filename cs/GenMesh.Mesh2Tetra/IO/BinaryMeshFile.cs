@@ -0,0 +1,266 @@
+using System.Buffers;
+using System.Buffers.Binary;
+using System.IO.MemoryMappedFiles;
+using System.Runtime.InteropServices;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.IO;
+
+// Binary mesh sidecar (.m2tb), shared with tools/mesh_binary.py. All values little-endian:
+//
+//   0  magic "M2TMESH\0"      8 bytes
+//   8  version (1)            uint32
+//  12  flags (0, reserved)    uint32
+//  16  vertex count           int64
+//  24  face count             int64
+//  32  tetrahedron count      int64
+//  40  vertices offset        int64   float64 x, y, z per vertex
+//  48  faces offset           int64   int32 a, b, c per face
+//  56  tetrahedra offset      int64   int32 a, b, c, d per tetrahedron
+//
+// Sections start on 8-byte boundaries. Open maps the file read-only and exposes the sections as
+// memory over the mapping, so nothing is parsed or copied; the memory and the list views are only
+// valid until the file is disposed.
+public sealed class BinaryMeshFile : IDisposable
+{
+    public const string Extension = ".m2tb";
+    public const int Version = 1;
+    public const int HeaderSize = 64;
+
+    private static ReadOnlySpan<byte> Magic => "M2TMESH\0"u8;
+
+    private readonly MemoryMappedFile _file;
+    private readonly MemoryMappedViewAccessor _view;
+    private readonly MappedMemory<double> _coordinates;
+    private readonly MappedMemory<int> _faces;
+    private readonly MappedMemory<int> _tetrahedra;
+    private bool _disposed;
+
+    private unsafe BinaryMeshFile(MemoryMappedFile file, MemoryMappedViewAccessor view, byte* basePointer, Header header)
+    {
+        _file = file;
+        _view = view;
+        _coordinates = new MappedMemory<double>(basePointer + header.VerticesOffset, header.VertexCount * 3);
+        _faces = new MappedMemory<int>(basePointer + header.FacesOffset, header.FaceCount * 3);
+        _tetrahedra = new MappedMemory<int>(basePointer + header.TetrahedraOffset, header.TetrahedronCount * 4);
+        VertexCount = header.VertexCount;
+        FaceCount = header.FaceCount;
+        TetrahedronCount = header.TetrahedronCount;
+        Vertices = new PackedVertexList(_coordinates.Memory);
+        Faces = new PackedFaceList(_faces.Memory);
+    }
+
+    public int VertexCount { get; }
+
+    public int FaceCount { get; }
+
+    public int TetrahedronCount { get; }
+
+    public ReadOnlyMemory<double> Coordinates => _coordinates.Memory;
+
+    public ReadOnlyMemory<int> FaceIndices => _faces.Memory;
+
+    public ReadOnlyMemory<int> TetrahedronIndices => _tetrahedra.Memory;
+
+    public IReadOnlyList<Vector3d> Vertices { get; }
+
+    public IReadOnlyList<Face> Faces { get; }
+
+    public static unsafe BinaryMeshFile Open(string path)
+    {
+        EnsureLittleEndian();
+        var length = new FileInfo(path).Length;
+        if (length < HeaderSize)
+        {
+            throw new InvalidDataException($"'{path}' is too short to be a {Extension} mesh file.");
+        }
+
+        var file = MemoryMappedFile.CreateFromFile(path, FileMode.Open, null, 0, MemoryMappedFileAccess.Read);
+        MemoryMappedViewAccessor? view = null;
+        var acquired = false;
+        try
+        {
+            view = file.CreateViewAccessor(0, 0, MemoryMappedFileAccess.Read);
+            byte* pointer = null;
+            view.SafeMemoryMappedViewHandle.AcquirePointer(ref pointer);
+            acquired = true;
+            pointer += view.PointerOffset;
+
+            var header = ReadHeader(new ReadOnlySpan<byte>(pointer, HeaderSize), length, path);
+            return new BinaryMeshFile(file, view, pointer, header);
+        }
+        catch
+        {
+            if (acquired) view!.SafeMemoryMappedViewHandle.ReleasePointer();
+            view?.Dispose();
+            file.Dispose();
+            throw;
+        }
+    }
+
+    public static void Write(string path, ReadOnlySpan<double> coordinates, ReadOnlySpan<int> faces, ReadOnlySpan<int> tetrahedra = default)
+    {
+        EnsureLittleEndian();
+        if (coordinates.Length % 3 != 0) throw new ArgumentException("Coordinate count must be a multiple of 3.", nameof(coordinates));
+        if (faces.Length % 3 != 0) throw new ArgumentException("Face index count must be a multiple of 3.", nameof(faces));
+        if (tetrahedra.Length % 4 != 0) throw new ArgumentException("Tetrahedron index count must be a multiple of 4.", nameof(tetrahedra));
+
+        Span<byte> header = stackalloc byte[HeaderSize];
+        var (facesOffset, tetrahedraOffset) = FormatHeader(header, coordinates.Length / 3, faces.Length / 3, tetrahedra.Length / 4);
+
+        using var stream = new FileStream(path, FileMode.Create, FileAccess.Write, FileShare.None, 1 << 16);
+        stream.Write(header);
+        stream.Write(MemoryMarshal.AsBytes(coordinates));
+        Pad(stream, facesOffset);
+        stream.Write(MemoryMarshal.AsBytes(faces));
+        Pad(stream, tetrahedraOffset);
+        stream.Write(MemoryMarshal.AsBytes(tetrahedra));
+    }
+
+    public static void Write(string path, IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, IReadOnlyList<Tetrahedron>? tetrahedra = null)
+    {
+        var coordinates = new double[vertices.Count * 3];
+        for (var i = 0; i < vertices.Count; i++)
+        {
+            coordinates[i * 3] = vertices[i].X;
+            coordinates[(i * 3) + 1] = vertices[i].Y;
+            coordinates[(i * 3) + 2] = vertices[i].Z;
+        }
+
+        var faceIndices = new int[faces.Count * 3];
+        for (var i = 0; i < faces.Count; i++)
+        {
+            faceIndices[i * 3] = faces[i].A;
+            faceIndices[(i * 3) + 1] = faces[i].B;
+            faceIndices[(i * 3) + 2] = faces[i].C;
+        }
+
+        tetrahedra ??= [];
+        var tetIndices = new int[tetrahedra.Count * 4];
+        for (var i = 0; i < tetrahedra.Count; i++)
+        {
+            tetIndices[i * 4] = tetrahedra[i].A;
+            tetIndices[(i * 4) + 1] = tetrahedra[i].B;
+            tetIndices[(i * 4) + 2] = tetrahedra[i].C;
+            tetIndices[(i * 4) + 3] = tetrahedra[i].D;
+        }
+
+        Write(path, coordinates, faceIndices, tetIndices);
+    }
+
+    // Fills header for the given counts and returns where the face and tetrahedron sections start
+    // (vertices start right after the header).
+    internal static (long FacesOffset, long TetrahedraOffset) FormatHeader(Span<byte> header, long vertexCount, long faceCount, long tetrahedronCount)
+    {
+        long verticesOffset = HeaderSize;
+        var facesOffset = Align8(verticesOffset + (vertexCount * 3 * sizeof(double)));
+        var tetrahedraOffset = Align8(facesOffset + (faceCount * 3 * sizeof(int)));
+
+        header.Clear();
+        Magic.CopyTo(header);
+        BinaryPrimitives.WriteUInt32LittleEndian(header[8..], Version);
+        BinaryPrimitives.WriteInt64LittleEndian(header[16..], vertexCount);
+        BinaryPrimitives.WriteInt64LittleEndian(header[24..], faceCount);
+        BinaryPrimitives.WriteInt64LittleEndian(header[32..], tetrahedronCount);
+        BinaryPrimitives.WriteInt64LittleEndian(header[40..], verticesOffset);
+        BinaryPrimitives.WriteInt64LittleEndian(header[48..], facesOffset);
+        BinaryPrimitives.WriteInt64LittleEndian(header[56..], tetrahedraOffset);
+        return (facesOffset, tetrahedraOffset);
+    }
+
+    public Tetrahedron GetTetrahedron(int index)
+    {
+        var t = _tetrahedra.Memory.Span.Slice(index * 4, 4);
+        return new Tetrahedron(t[0], t[1], t[2], t[3]);
+    }
+
+    public void Dispose()
+    {
+        if (_disposed) return;
+        _disposed = true;
+        _view.SafeMemoryMappedViewHandle.ReleasePointer();
+        _view.Dispose();
+        _file.Dispose();
+    }
+
+    private static Header ReadHeader(ReadOnlySpan<byte> header, long fileLength, string path)
+    {
+        if (!header[..8].SequenceEqual(Magic))
+        {
+            throw new InvalidDataException($"'{path}' is not a {Extension} mesh file (bad magic).");
+        }
+
+        var version = BinaryPrimitives.ReadUInt32LittleEndian(header[8..]);
+        if (version != Version)
+        {
+            throw new InvalidDataException($"'{path}' has unsupported {Extension} version {version}.");
+        }
+
+        var vertexCount = BinaryPrimitives.ReadInt64LittleEndian(header[16..]);
+        var faceCount = BinaryPrimitives.ReadInt64LittleEndian(header[24..]);
+        var tetCount = BinaryPrimitives.ReadInt64LittleEndian(header[32..]);
+        var verticesOffset = BinaryPrimitives.ReadInt64LittleEndian(header[40..]);
+        var facesOffset = BinaryPrimitives.ReadInt64LittleEndian(header[48..]);
+        var tetrahedraOffset = BinaryPrimitives.ReadInt64LittleEndian(header[56..]);
+
+        CheckSection(vertexCount, 3 * sizeof(double), verticesOffset, "vertex");
+        CheckSection(faceCount, 3 * sizeof(int), facesOffset, "face");
+        CheckSection(tetCount, 4 * sizeof(int), tetrahedraOffset, "tetrahedron");
+        return new Header((int)vertexCount, (int)faceCount, (int)tetCount, verticesOffset, facesOffset, tetrahedraOffset);
+
+        void CheckSection(long count, int recordSize, long offset, string label)
+        {
+            if (count < 0 || count > int.MaxValue / 4 || offset < HeaderSize || (offset % 8) != 0
+                || offset + (count * recordSize) > fileLength)
+            {
+                throw new InvalidDataException($"'{path}' has an invalid {label} section.");
+            }
+        }
+    }
+
+    private static long Align8(long value) => (value + 7) & ~7L;
+
+    // Offsets count from origin, the stream position the file starts at.
+    internal static void Pad(Stream stream, long offset, long origin = 0)
+    {
+        Span<byte> zeros = stackalloc byte[8];
+        zeros.Clear();
+        stream.Write(zeros[..(int)(offset - (stream.Position - origin))]);
+    }
+
+    internal static void EnsureLittleEndian()
+    {
+        if (!BitConverter.IsLittleEndian)
+        {
+            throw new PlatformNotSupportedException($"{Extension} mesh files are only supported on little-endian platforms.");
+        }
+    }
+
+    private readonly record struct Header(
+        int VertexCount,
+        int FaceCount,
+        int TetrahedronCount,
+        long VerticesOffset,
+        long FacesOffset,
+        long TetrahedraOffset);
+
+    // Memory<T> over a region of the mapped view. The mapping is owned by BinaryMeshFile.
+    private sealed unsafe class MappedMemory<T>(byte* pointer, int length) : MemoryManager<T>
+        where T : unmanaged
+    {
+        public ReadOnlyMemory<T> Memory => CreateMemory(length);
+
+        public override Span<T> GetSpan() => new(pointer, length);
+
+        public override MemoryHandle Pin(int elementIndex = 0) => new(pointer + ((long)elementIndex * sizeof(T)));
+
+        public override void Unpin()
+        {
+        }
+
+        protected override void Dispose(bool disposing)
+        {
+        }
+    }
+}
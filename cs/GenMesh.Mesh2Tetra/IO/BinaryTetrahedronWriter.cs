@@ -0,0 +1,106 @@
+using System.Buffers.Binary;
+using System.Runtime.InteropServices;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.IO;
+
+// Streams a conversion result into a .m2tb file (BinaryMeshFile layout): the vertices, no faces,
+// and the tetrahedra appended as components arrive. The tetrahedron count in the header is filled
+// in by Complete, so the stream must be seekable; until then the file reads as zero tetrahedra.
+// The file starts wherever the stream is positioned when Begin is called.
+public sealed class BinaryTetrahedronWriter : ITetrahedronSink, IDisposable
+{
+    private const int TetrahedronCountOffset = 32;
+    private const int BufferInts = 1 << 14;
+
+    private readonly Stream _stream;
+    private readonly bool _leaveOpen;
+    private readonly int[] _buffer = new int[BufferInts];
+    private long _count;
+    private long _origin;
+
+    public BinaryTetrahedronWriter(string path)
+        : this(new FileStream(path, FileMode.Create, FileAccess.ReadWrite, FileShare.None, 1 << 16), leaveOpen: false)
+    {
+    }
+
+    public BinaryTetrahedronWriter(Stream stream, bool leaveOpen = false)
+    {
+        ArgumentNullException.ThrowIfNull(stream);
+        if (!stream.CanSeek) throw new ArgumentException("The stream must be seekable.", nameof(stream));
+        BinaryMeshFile.EnsureLittleEndian();
+        _stream = stream;
+        _leaveOpen = leaveOpen;
+    }
+
+    public long TetrahedronCount => _count;
+
+    public void Begin(IReadOnlyList<Vector3d> vertices)
+    {
+        _origin = _stream.Position;
+        Span<byte> header = stackalloc byte[BinaryMeshFile.HeaderSize];
+        var (_, tetrahedraOffset) = BinaryMeshFile.FormatHeader(header, vertices.Count, 0, 0);
+        _stream.Write(header);
+
+        var coordinates = new double[Math.Min(vertices.Count, BufferInts) * 3];
+        for (var start = 0; start < vertices.Count; start += BufferInts)
+        {
+            var n = Math.Min(BufferInts, vertices.Count - start);
+            for (var i = 0; i < n; i++)
+            {
+                var v = vertices[start + i];
+                coordinates[i * 3] = v.X;
+                coordinates[(i * 3) + 1] = v.Y;
+                coordinates[(i * 3) + 2] = v.Z;
+            }
+
+            _stream.Write(MemoryMarshal.AsBytes(coordinates.AsSpan(0, n * 3)));
+        }
+
+        BinaryMeshFile.Pad(_stream, tetrahedraOffset, _origin);
+    }
+
+    public void WriteComponent(IReadOnlyList<Tetrahedron> tetrahedra)
+    {
+        // BinaryMeshFile reads at most int.MaxValue / 4 tetrahedra.
+        if (_count + tetrahedra.Count > int.MaxValue / 4)
+        {
+            throw new InvalidOperationException($"A {BinaryMeshFile.Extension} file holds at most {int.MaxValue / 4} tetrahedra.");
+        }
+
+        var used = 0;
+        foreach (var t in tetrahedra)
+        {
+            _buffer[used] = t.A;
+            _buffer[used + 1] = t.B;
+            _buffer[used + 2] = t.C;
+            _buffer[used + 3] = t.D;
+            used += 4;
+            if (used == BufferInts)
+            {
+                _stream.Write(MemoryMarshal.AsBytes(_buffer.AsSpan()));
+                used = 0;
+            }
+        }
+
+        _stream.Write(MemoryMarshal.AsBytes(_buffer.AsSpan(0, used)));
+        _count += tetrahedra.Count;
+    }
+
+    public void Complete()
+    {
+        Span<byte> count = stackalloc byte[sizeof(long)];
+        BinaryPrimitives.WriteInt64LittleEndian(count, _count);
+        var end = _stream.Position;
+        _stream.Position = _origin + TetrahedronCountOffset;
+        _stream.Write(count);
+        _stream.Position = end;
+        _stream.Flush();
+    }
+
+    public void Dispose()
+    {
+        if (!_leaveOpen) _stream.Dispose();
+    }
+}
@@ -0,0 +1,70 @@
+using System.Globalization;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.IO;
+
+// Streams a conversion result into a Gmsh MSH 2.2 ASCII file: every vertex as a node, every
+// tetrahedron as a 4-node tetrahedron element (type 4) with physical tag 1 and the component
+// number as elementary tag. The element count is filled in by Complete, so the stream must be
+// seekable. Node and element numbers are 1-based, as Gmsh expects.
+public sealed class GmshTetrahedronWriter : ITetrahedronSink, IDisposable
+{
+    private const int CountWidth = 20;
+
+    private readonly PatchableTextWriter _writer;
+    private long _countPosition;
+    private long _count;
+    private int _component;
+
+    public GmshTetrahedronWriter(string path)
+        : this(new FileStream(path, FileMode.Create, FileAccess.ReadWrite, FileShare.None, 1 << 16), leaveOpen: false)
+    {
+    }
+
+    public GmshTetrahedronWriter(Stream stream, bool leaveOpen = false)
+    {
+        _writer = new PatchableTextWriter(stream, leaveOpen);
+    }
+
+    public long TetrahedronCount => _count;
+
+    public void Begin(IReadOnlyList<Vector3d> vertices)
+    {
+        var text = _writer.Text;
+        text.WriteLine("$MeshFormat");
+        text.WriteLine("2.2 0 8");
+        text.WriteLine("$EndMeshFormat");
+        text.WriteLine("$Nodes");
+        text.WriteLine(vertices.Count.ToString(CultureInfo.InvariantCulture));
+        for (var i = 0; i < vertices.Count; i++)
+        {
+            var v = vertices[i];
+            text.WriteLine(string.Create(CultureInfo.InvariantCulture, $"{i + 1} {v.X:R} {v.Y:R} {v.Z:R}"));
+        }
+
+        text.WriteLine("$EndNodes");
+        text.WriteLine("$Elements");
+        _countPosition = _writer.Reserve(CountWidth);
+    }
+
+    public void WriteComponent(IReadOnlyList<Tetrahedron> tetrahedra)
+    {
+        _component++;
+        var text = _writer.Text;
+        foreach (var t in tetrahedra)
+        {
+            _count++;
+            text.WriteLine(string.Create(CultureInfo.InvariantCulture, $"{_count} 4 2 1 {_component} {t.A + 1} {t.B + 1} {t.C + 1} {t.D + 1}"));
+        }
+    }
+
+    public void Complete()
+    {
+        _writer.Text.WriteLine("$EndElements");
+        _writer.Fill(_countPosition, CountWidth, _count.ToString(CultureInfo.InvariantCulture));
+        _writer.Text.Flush();
+    }
+
+    public void Dispose() => _writer.Dispose();
+}
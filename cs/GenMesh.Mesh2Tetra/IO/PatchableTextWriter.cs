@@ -0,0 +1,43 @@
+using System.Text;
+
+namespace GenMesh.Mesh2Tetra.IO;
+
+// ASCII text over a seekable stream with fixed-width placeholder lines, filled in once the counts
+// they hold are known; the streaming mesh writers only learn the tetrahedron count at the end.
+internal sealed class PatchableTextWriter : IDisposable
+{
+    private readonly Stream _stream;
+
+    public PatchableTextWriter(Stream stream, bool leaveOpen)
+    {
+        ArgumentNullException.ThrowIfNull(stream);
+        if (!stream.CanSeek) throw new ArgumentException("The stream must be seekable.", nameof(stream));
+        _stream = stream;
+        Text = new StreamWriter(stream, new UTF8Encoding(false), 1 << 16, leaveOpen) { NewLine = "\n" };
+    }
+
+    public TextWriter Text { get; }
+
+    // Writes a line of width spaces and returns its position.
+    public long Reserve(int width)
+    {
+        Text.Flush();
+        var position = _stream.Position;
+        Text.Write(new string(' ', width));
+        Text.Write('\n');
+        return position;
+    }
+
+    public void Fill(long position, int width, string value)
+    {
+        if (value.Length > width) throw new InvalidOperationException($"'{value}' does not fit in {width} reserved characters.");
+
+        Text.Flush();
+        var end = _stream.Position;
+        _stream.Position = position;
+        _stream.Write(Encoding.ASCII.GetBytes(value));
+        _stream.Position = end;
+    }
+
+    public void Dispose() => Text.Dispose();
+}
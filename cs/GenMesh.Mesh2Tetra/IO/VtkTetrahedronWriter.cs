@@ -0,0 +1,72 @@
+using System.Globalization;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra.IO;
+
+// Streams a conversion result into a legacy ASCII VTK unstructured grid (ParaView, VisIt): the
+// vertices as POINTS, the tetrahedra as CELLS of type 10 (VTK_TETRA). The CELLS header is filled
+// in by Complete, which also writes CELL_TYPES, so the stream must be seekable.
+public sealed class VtkTetrahedronWriter : ITetrahedronSink, IDisposable
+{
+    private const int HeaderWidth = 48;
+    private const int TetraCellType = 10;
+
+    private readonly PatchableTextWriter _writer;
+    private long _cellsPosition;
+    private long _count;
+
+    public VtkTetrahedronWriter(string path)
+        : this(new FileStream(path, FileMode.Create, FileAccess.ReadWrite, FileShare.None, 1 << 16), leaveOpen: false)
+    {
+    }
+
+    public VtkTetrahedronWriter(Stream stream, bool leaveOpen = false)
+    {
+        _writer = new PatchableTextWriter(stream, leaveOpen);
+    }
+
+    public long TetrahedronCount => _count;
+
+    public void Begin(IReadOnlyList<Vector3d> vertices)
+    {
+        var text = _writer.Text;
+        text.WriteLine("# vtk DataFile Version 3.0");
+        text.WriteLine("GenMesh.Mesh2Tetra tetrahedra");
+        text.WriteLine("ASCII");
+        text.WriteLine("DATASET UNSTRUCTURED_GRID");
+        text.WriteLine(string.Create(CultureInfo.InvariantCulture, $"POINTS {vertices.Count} double"));
+        foreach (var v in vertices)
+        {
+            text.WriteLine(string.Create(CultureInfo.InvariantCulture, $"{v.X:R} {v.Y:R} {v.Z:R}"));
+        }
+
+        _cellsPosition = _writer.Reserve(HeaderWidth);
+    }
+
+    public void WriteComponent(IReadOnlyList<Tetrahedron> tetrahedra)
+    {
+        var text = _writer.Text;
+        foreach (var t in tetrahedra)
+        {
+            text.WriteLine(string.Create(CultureInfo.InvariantCulture, $"4 {t.A} {t.B} {t.C} {t.D}"));
+        }
+
+        _count += tetrahedra.Count;
+    }
+
+    public void Complete()
+    {
+        var text = _writer.Text;
+        text.WriteLine(string.Create(CultureInfo.InvariantCulture, $"CELL_TYPES {_count}"));
+        for (long i = 0; i < _count; i++)
+        {
+            text.WriteLine(TetraCellType);
+        }
+
+        _writer.Fill(_cellsPosition, HeaderWidth, string.Create(CultureInfo.InvariantCulture, $"CELLS {_count} {_count * 5}"));
+        text.Flush();
+    }
+
+    public void Dispose() => _writer.Dispose();
+}
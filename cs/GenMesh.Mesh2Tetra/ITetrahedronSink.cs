@@ -0,0 +1,18 @@
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra;
+
+// Receives the result of the streaming Mesh2TetraConverter.Convert overload component by
+// component. Calls come from the converting thread: Begin once, WriteComponent once per finished
+// component (tetrahedra index the vertices given to Begin; the list is not used by the converter
+// afterwards), then Complete. IO/BinaryTetrahedronWriter, IO/GmshTetrahedronWriter and
+// IO/VtkTetrahedronWriter write the result to a file as it arrives.
+public interface ITetrahedronSink
+{
+    void Begin(IReadOnlyList<Vector3d> vertices);
+
+    void WriteComponent(IReadOnlyList<Tetrahedron> tetrahedra);
+
+    void Complete();
+}
@@ -0,0 +1,18 @@
+using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Geometry;
+
+namespace GenMesh.Mesh2Tetra;
+
+// Built-in incremental Bowyer-Watson engine (Algorithms/IncrementalDelaunay): points inserted in
+// a BRIO/Hilbert order into flat cell arrays, with exact orientation and in-sphere predicates.
+// Allocates a few int arrays instead of an object per vertex and cell, and the residual recursion
+// reuses its parent's insertion order instead of sorting again. planeDistanceTolerance is not
+// needed: coplanar points are decided exactly. Cells of cospherical points can differ from
+// MIConvexHull's (both are Delaunay), so exact-tetrahedra fixtures only hold for the default.
+public sealed class IncrementalDelaunayBackend : IDelaunayBackend
+{
+    public string Name => "Incremental";
+
+    public bool TryTetrahedralize(IReadOnlyList<Vector3d> points, double planeDistanceTolerance, List<int> cells)
+        => IncrementalDelaunay.TryTetrahedralize(points, SpatialSort.BrioOrder(points), cells);
+}
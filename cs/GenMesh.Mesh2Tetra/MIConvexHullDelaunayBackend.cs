@@ -0,0 +1,47 @@
+using GenMesh.Mesh2Tetra.Geometry;
+using MIConvexHull;
+
+namespace GenMesh.Mesh2Tetra;
+
+// MIConvexHull's DelaunayTriangulation, as in the Matlab port. The default backend: regression
+// fixtures with exact tetrahedra are recorded with its cells.
+public sealed class MIConvexHullDelaunayBackend : IDelaunayBackend
+{
+    public string Name => "MIConvexHull";
+
+    public bool TryTetrahedralize(IReadOnlyList<Vector3d> points, double planeDistanceTolerance, List<int> cells)
+    {
+        var dverts = new DVertex[points.Count];
+        for (var i = 0; i < dverts.Length; i++)
+        {
+            dverts[i] = new DVertex(i, points[i]);
+        }
+
+        DelaunayTriangulation<DVertex, DefaultTriangulationCell<DVertex>> triangulation;
+        try
+        {
+            triangulation = DelaunayTriangulation<DVertex, DefaultTriangulationCell<DVertex>>.Create(dverts, planeDistanceTolerance);
+        }
+        catch (ConvexHullGenerationException)
+        {
+            return false;
+        }
+
+        foreach (var cell in triangulation.Cells)
+        {
+            var cv = cell.Vertices;
+            cells.Add(cv[0].Id);
+            cells.Add(cv[1].Id);
+            cells.Add(cv[2].Id);
+            cells.Add(cv[3].Id);
+        }
+
+        return true;
+    }
+
+    private sealed class DVertex(int id, Vector3d p) : IVertex
+    {
+        public int Id { get; } = id;
+        public double[] Position { get; } = [p.X, p.Y, p.Z];
+    }
+}
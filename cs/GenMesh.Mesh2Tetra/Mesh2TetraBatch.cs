@@ -0,0 +1,28 @@
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra;
+
+// One mesh of a batch run. Options default to the batch-wide options passed to ConvertBatchAsync.
+public sealed record Mesh2TetraBatchItem(
+    string Id,
+    IReadOnlyList<Vector3d> Vertices,
+    IReadOnlyList<Face> Faces,
+    Mesh2TetraOptions? Options = null);
+
+// Index is the position of the item in the input stream; results arrive in completion order.
+// Exactly one of Tetrahedra and Error is set. An item that ran out of its TimeBudget (or was
+// cancelled through its options) succeeds with the partial tetrahedra of
+// Mesh2TetraConverter.ConvertWithinBudget and a Status other than Completed.
+public sealed record Mesh2TetraBatchResult(
+    int Index,
+    Mesh2TetraBatchItem Item,
+    IReadOnlyList<Tetrahedron>? Tetrahedra,
+    Exception? Error,
+    TimeSpan Elapsed,
+    ConversionStatus Status = ConversionStatus.Completed)
+{
+    public string Id => Item.Id;
+
+    public bool Succeeded => Error is null;
+}
@@ -1,4 +1,9 @@
+using System.Buffers;
+using System.Diagnostics;
+using System.Runtime.CompilerServices;
+using System.Threading.Channels;
 using GenMesh.Mesh2Tetra.Algorithms;
+using GenMesh.Mesh2Tetra.Diagnostics;
 using GenMesh.Mesh2Tetra.Geometry;
 using GenMesh.Mesh2Tetra.Models;
 
@@ -10,14 +15,237 @@ public static class Mesh2TetraConverter
         IReadOnlyList<Vector3d> vertices,
         IReadOnlyList<Face> faces,
         Mesh2TetraOptions? options = null)
+        => Convert(vertices, faces, options, phaseCompleted: null);
+
+    // phaseCompleted runs on the calling thread right after each pipeline phase; the phase
+    // benchmark uses it to split wall time and allocations between phases.
+    internal static IReadOnlyList<Tetrahedron> Convert(
+        IReadOnlyList<Vector3d> vertices,
+        IReadOnlyList<Face> faces,
+        Mesh2TetraOptions? options,
+        Action<ConversionPhase>? phaseCompleted)
+    {
+        options ??= new Mesh2TetraOptions();
+        using var budget = StartBudget(options);
+        return Run(vertices, faces, options, budget?.Token ?? options.CancellationToken, phaseCompleted, progress: null);
+    }
+
+    // Anytime conversion: runs like Convert, but when Mesh2TetraOptions.TimeBudget runs out or
+    // Mesh2TetraOptions.CancellationToken is cancelled it returns the tetrahedra validated so far
+    // and where it stopped instead of throwing (see Mesh2TetraResult). Other failures still throw.
+    // Only complete results are stored in the result cache.
+    public static Mesh2TetraResult ConvertWithinBudget(
+        IReadOnlyList<Vector3d> vertices,
+        IReadOnlyList<Face> faces,
+        Mesh2TetraOptions? options = null)
+    {
+        options ??= new Mesh2TetraOptions();
+        var sw = Stopwatch.StartNew();
+        using var budget = StartBudget(options);
+        var token = budget?.Token ?? options.CancellationToken;
+        var progress = new RunProgress { ResidualFaces = faces.Count };
+        IReadOnlyList<Tetrahedron> tets;
+        var status = ConversionStatus.Completed;
+        try
+        {
+            tets = Run(vertices, faces, options, token, phaseCompleted: null, progress);
+            progress.ResidualFaces = 0;
+        }
+        catch (OperationCanceledException ex) when (token.IsCancellationRequested)
+        {
+            tets = progress.Tetrahedra;
+            if (ex is CollapseInterruptedException partial)
+            {
+                tets = partial.Tetrahedra;
+                progress.ResidualFaces = partial.ResidualFaces;
+            }
+
+            status = options.CancellationToken.IsCancellationRequested ? ConversionStatus.Cancelled : ConversionStatus.TimedOut;
+            if (options.Verbose)
+            {
+                Console.WriteLine($"[Mesh2Tetra] {status} during {progress.Phase}: returning {tets.Count} tets, {progress.ResidualFaces} residual faces");
+            }
+        }
+
+        // Relative to the preprocessed boundary, or to the input when preprocessing did not finish.
+        var enclosed = Math.Abs(GeometryPredicates.FaceMeshVolume(vertices, progress.BoundaryFaces ?? faces));
+        var fraction = enclosed > 0 ? GeometryPredicates.TetraMeshVolume(vertices, tets) / enclosed : 0d;
+        return new Mesh2TetraResult(
+            tets,
+            status,
+            status == ConversionStatus.Completed ? null : progress.Phase,
+            progress.ResidualFaces,
+            fraction,
+            sw.Elapsed);
+    }
+
+    // The pipeline behind Convert and ConvertWithinBudget; progress, when given, follows the last
+    // finished phase so a stopped run can report it.
+    private static IReadOnlyList<Tetrahedron> Run(
+        IReadOnlyList<Vector3d> vertices,
+        IReadOnlyList<Face> faces,
+        Mesh2TetraOptions options,
+        CancellationToken cancellationToken,
+        Action<ConversionPhase>? phaseCompleted,
+        RunProgress? progress)
+    {
+        using var activity = Mesh2TetraDiagnostics.Source.StartActivity("Convert");
+        activity?.SetTag("vertices", vertices.Count);
+        activity?.SetTag("faces", faces.Count);
+
+        var cache = options.ResultCache;
+        var cacheKey = cache is null ? null : Mesh2TetraResultCache.ResultKey(vertices, faces, options);
+        if (cache is not null && cache.TryGet(cacheKey!, "result", out var cached))
+        {
+            activity?.SetTag("cache", "hit");
+            activity?.SetTag("tetrahedra", cached.Count);
+            if (options.Verbose)
+            {
+                Console.WriteLine($"[Mesh2Tetra] Result cache hit: {cached.Count} tets");
+            }
+
+            return cached;
+        }
+
+        var phase = ConversionPhase.Preprocessing;
+        try
+        {
+            var boundaryFaces = Preprocess(vertices, faces, options, cancellationToken);
+            phaseCompleted?.Invoke(ConversionPhase.Preprocessing);
+            progress?.Finished(ConversionPhase.Delaunay, boundaryFaces, [], boundaryFaces.Count);
+
+            phase = ConversionPhase.Delaunay;
+            var (delaunayTets, remainingFaces) = Delaunay(vertices, boundaryFaces, options, cancellationToken);
+            phaseCompleted?.Invoke(ConversionPhase.Delaunay);
+            progress?.Finished(ConversionPhase.BoundaryCollapse, boundaryFaces, delaunayTets, remainingFaces.Count);
+
+            phase = ConversionPhase.BoundaryCollapse;
+            var final = FillResidual(vertices, remainingFaces, delaunayTets, options, cancellationToken);
+            phaseCompleted?.Invoke(ConversionPhase.BoundaryCollapse);
+            if (options.Verbose)
+            {
+                Console.WriteLine($"[Mesh2Tetra] Final tets: {final.Count}");
+            }
+
+            activity?.SetTag("tetrahedra", final.Count);
+            cache?.Store(cacheKey!, final);
+            return final;
+        }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            activity?.SetTag("stoppedIn", phase.ToString());
+            activity?.SetStatus(ActivityStatusCode.Error, "Stopped before the conversion finished.");
+            throw;
+        }
+    }
+
+    // Linked to options.CancellationToken and cancelled once options.TimeBudget has passed; null
+    // without a budget, when the caller's token is used as is.
+    private static CancellationTokenSource? StartBudget(Mesh2TetraOptions options)
+    {
+        if (options.TimeBudget is not { } budget) return null;
+        if (budget < TimeSpan.Zero)
+        {
+            throw new ArgumentOutOfRangeException(nameof(options), $"TimeBudget must not be negative, got {budget}.");
+        }
+
+        // A zero budget stops at the first check rather than whenever the timer fires.
+        var source = CancellationTokenSource.CreateLinkedTokenSource(options.CancellationToken);
+        if (budget == TimeSpan.Zero) source.Cancel();
+        else source.CancelAfter(budget);
+        return source;
+    }
+
+    // Streaming output: the preprocessed boundary is split into its connected face objects, each
+    // goes through the Delaunay and boundary-collapse phases on its own, and its tetrahedra are
+    // handed to the sink as soon as it is finished, so only one component's tetrahedra are held at
+    // a time. Delaunay meshes face objects independently anyway; the boundary collapse, which
+    // Convert runs over all residual faces at once, runs per component here, so multi-component
+    // meshes can get different (equally valid) tetrahedra. The result cache is not used. Returns
+    // the number of tetrahedra written; the sink is not completed when the conversion throws,
+    // including when it is cancelled or runs out of Mesh2TetraOptions.TimeBudget.
+    public static long Convert(
+        IReadOnlyList<Vector3d> vertices,
+        IReadOnlyList<Face> faces,
+        ITetrahedronSink sink,
+        Mesh2TetraOptions? options = null)
     {
+        ArgumentNullException.ThrowIfNull(sink);
         options ??= new Mesh2TetraOptions();
+        using var activity = Mesh2TetraDiagnostics.Source.StartActivity("Convert");
+        activity?.SetTag("vertices", vertices.Count);
+        activity?.SetTag("faces", faces.Count);
+        activity?.SetTag("streaming", true);
+        using var budget = StartBudget(options);
+        var token = budget?.Token ?? options.CancellationToken;
+
+        var boundaryFaces = Preprocess(vertices, faces, options, token);
+        // Inputs of finished steps are dropped right away, so peak memory follows the largest
+        // component rather than the whole mesh.
+        var components = InputOrderComponents(boundaryFaces);
+        boundaryFaces = [];
+
+        sink.Begin(vertices);
+        long total = 0;
+        for (var i = 0; i < components.Count; i++)
+        {
+            var (delaunayTets, remainingFaces) = Delaunay(vertices, components[i], options, token);
+            components[i] = [];
+            var tets = FillResidual(vertices, remainingFaces, delaunayTets, options, token);
+            sink.WriteComponent(tets);
+            total += tets.Count;
+        }
+
+        sink.Complete();
+        if (options.Verbose)
+        {
+            Console.WriteLine($"[Mesh2Tetra] Final tets: {total} in {components.Count} component(s)");
+        }
+
+        activity?.SetTag("tetrahedra", total);
+        activity?.SetTag("components", components.Count);
+        return total;
+    }
+
+    // The face objects of the boundary, each keeping the preprocessed face order (the collapse
+    // phase depends on it), so a single-object mesh streams exactly the Convert result.
+    private static List<List<Face>> InputOrderComponents(IReadOnlyList<Face> faces)
+    {
+        var objects = MeshTopology.SeparateFaceObjects(faces);
+        if (objects.Count <= 1) return objects.Count == 0 ? objects : [[.. faces]];
+
+        var owner = new Dictionary<Face, int>();
+        for (var i = 0; i < objects.Count; i++)
+        {
+            foreach (var face in objects[i])
+            {
+                owner[face] = i;
+            }
+
+            objects[i].Clear();
+        }
+
+        foreach (var face in faces)
+        {
+            objects[owner[face]].Add(face);
+        }
+
+        return objects;
+    }
+
+    private static IReadOnlyList<Face> Preprocess(
+        IReadOnlyList<Vector3d> vertices,
+        IReadOnlyList<Face> faces,
+        Mesh2TetraOptions options,
+        CancellationToken cancellationToken)
+    {
+        using var phase = Mesh2TetraDiagnostics.StartPhase(ConversionPhase.Preprocessing);
         if (options.CheckInput)
         {
             MeshValidation.ValidateInput(vertices, faces);
         }
 
-        var boundaryFaces = MeshPreprocessing.PreprocessBoundaryFaces(vertices, faces, options);
+        var boundaryFaces = MeshPreprocessing.PreprocessBoundaryFaces(vertices, faces, options, cancellationToken);
 
         var sourceVolume = GeometryPredicates.FaceMeshVolume(vertices, boundaryFaces);
         if (options.Verbose)
@@ -26,17 +254,40 @@ public static class Mesh2TetraConverter
             Console.WriteLine($"[Mesh2Tetra] Boundary faces after preprocessing: {boundaryFaces.Count}");
         }
 
-        var (delaunayTets, remainingFaces) = DelaunayInside3D.Build(vertices, boundaryFaces, options);
+        phase.Activity?.SetTag("boundaryFaces", boundaryFaces.Count);
+        return boundaryFaces;
+    }
+
+    private static (IReadOnlyList<Tetrahedron> Tetrahedra, IReadOnlyList<Face> RemainingFaces) Delaunay(
+        IReadOnlyList<Vector3d> vertices,
+        IReadOnlyList<Face> boundaryFaces,
+        Mesh2TetraOptions options,
+        CancellationToken cancellationToken)
+    {
+        using var phase = Mesh2TetraDiagnostics.StartPhase(ConversionPhase.Delaunay);
+        var (delaunayTets, remainingFaces) = DelaunayInside3D.Build(vertices, boundaryFaces, options, cancellationToken);
         if (options.Verbose)
         {
             Console.WriteLine($"[Mesh2Tetra] Delaunay tets: {delaunayTets.Count}");
             Console.WriteLine($"[Mesh2Tetra] Residual faces: {remainingFaces.Count}");
         }
 
-        IReadOnlyList<Tetrahedron> final;
+        phase.Activity?.SetTag("tetrahedra", delaunayTets.Count);
+        phase.Activity?.SetTag("residualFaces", remainingFaces.Count);
+        return (delaunayTets, remainingFaces);
+    }
+
+    private static IReadOnlyList<Tetrahedron> FillResidual(
+        IReadOnlyList<Vector3d> vertices,
+        IReadOnlyList<Face> remainingFaces,
+        IReadOnlyList<Tetrahedron> delaunayTets,
+        Mesh2TetraOptions options,
+        CancellationToken cancellationToken)
+    {
+        using var phase = Mesh2TetraDiagnostics.StartPhase(ConversionPhase.BoundaryCollapse);
         try
         {
-            final = BoundaryCollapse3D.FillResidualVolume(vertices, remainingFaces, delaunayTets, options);
+            return BoundaryCollapse3D.FillResidualVolume(vertices, remainingFaces, delaunayTets, options, cancellationToken);
         }
         catch (InvalidOperationException ex) when (ex.Message.Contains("Boundary collapse failed", StringComparison.OrdinalIgnoreCase))
         {
@@ -44,19 +295,195 @@ public static class Mesh2TetraConverter
             // when boundary-collapse heuristics cannot make progress.
             if (delaunayTets.Count > 0)
             {
-                final = delaunayTets;
+                phase.Activity?.SetTag("fallback", true);
+                return delaunayTets;
             }
-            else
+
+            throw;
+        }
+    }
+
+    // Flat-buffer entry points: coordinates hold x, y, z per vertex and faces hold three vertex
+    // indices per triangle. The Memory overload reads the caller's buffers in place for the whole
+    // run and appends four vertex indices per tetrahedron to the writer. Both return the number of
+    // tetrahedra written.
+    public static int Convert(
+        ReadOnlyMemory<double> coordinates,
+        ReadOnlyMemory<int> faces,
+        IBufferWriter<int> tetrahedra,
+        Mesh2TetraOptions? options = null)
+    {
+        ArgumentNullException.ThrowIfNull(tetrahedra);
+        var tets = Convert(new PackedVertexList(coordinates), new PackedFaceList(faces), options);
+        var destination = tetrahedra.GetSpan(tets.Count * 4);
+        WriteTetrahedra(tets, destination);
+        tetrahedra.Advance(tets.Count * 4);
+        return tets.Count;
+    }
+
+    // Span inputs are copied once into pooled buffers. Throws ArgumentException when the
+    // destination cannot hold the result; use the IBufferWriter overload when the size is unknown.
+    public static int Convert(
+        ReadOnlySpan<double> coordinates,
+        ReadOnlySpan<int> faces,
+        Span<int> tetrahedra,
+        Mesh2TetraOptions? options = null)
+    {
+        var coordinateBuffer = ArrayPool<double>.Shared.Rent(coordinates.Length);
+        var faceBuffer = ArrayPool<int>.Shared.Rent(faces.Length);
+        try
+        {
+            coordinates.CopyTo(coordinateBuffer);
+            faces.CopyTo(faceBuffer);
+            var tets = Convert(
+                new PackedVertexList(coordinateBuffer.AsMemory(0, coordinates.Length)),
+                new PackedFaceList(faceBuffer.AsMemory(0, faces.Length)),
+                options);
+
+            if (tets.Count * 4 > tetrahedra.Length)
             {
-                throw;
+                throw new ArgumentException(
+                    $"Destination holds {tetrahedra.Length / 4} tetrahedra but the conversion produced {tets.Count}.",
+                    nameof(tetrahedra));
             }
+
+            WriteTetrahedra(tets, tetrahedra);
+            return tets.Count;
         }
+        finally
+        {
+            ArrayPool<double>.Shared.Return(coordinateBuffer);
+            ArrayPool<int>.Shared.Return(faceBuffer);
+        }
+    }
 
-        if (options.Verbose)
+    public static IAsyncEnumerable<Mesh2TetraBatchResult> ConvertBatchAsync(
+        IEnumerable<Mesh2TetraBatchItem> items,
+        Mesh2TetraOptions? options = null,
+        int maxConcurrency = -1,
+        CancellationToken cancellationToken = default)
+        => ConvertBatchAsync(ToAsyncEnumerable(items), options, maxConcurrency, cancellationToken);
+
+    // Converts each item on a bounded pool of workers and yields results as meshes finish, so a
+    // long stream never holds more than maxConcurrency finished results in memory. A mesh that
+    // fails is reported through Mesh2TetraBatchResult.Error and does not stop the batch.
+    // maxConcurrency -1 uses Environment.ProcessorCount.
+    public static async IAsyncEnumerable<Mesh2TetraBatchResult> ConvertBatchAsync(
+        IAsyncEnumerable<Mesh2TetraBatchItem> items,
+        Mesh2TetraOptions? options = null,
+        int maxConcurrency = -1,
+        [EnumeratorCancellation] CancellationToken cancellationToken = default)
+    {
+        if (maxConcurrency == 0 || maxConcurrency < -1)
         {
-            Console.WriteLine($"[Mesh2Tetra] Final tets: {final.Count}");
+            throw new ArgumentOutOfRangeException(nameof(maxConcurrency), "Use a positive worker count or -1 for one worker per processor.");
         }
 
-        return final;
+        options ??= new Mesh2TetraOptions();
+        var workers = maxConcurrency == -1 ? Environment.ProcessorCount : maxConcurrency;
+        var results = Channel.CreateBounded<Mesh2TetraBatchResult>(new BoundedChannelOptions(workers) { SingleReader = true });
+        using var stop = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+
+        var pump = Task.Run(async () =>
+        {
+            try
+            {
+                var parallel = new ParallelOptions { MaxDegreeOfParallelism = workers, CancellationToken = stop.Token };
+                await Parallel.ForEachAsync(WithIndex(items, stop.Token), parallel, async (entry, token) =>
+                {
+                    var result = ConvertItem(entry.Index, entry.Item, options);
+                    await results.Writer.WriteAsync(result, token).ConfigureAwait(false);
+                }).ConfigureAwait(false);
+                results.Writer.TryComplete();
+            }
+            catch (Exception ex)
+            {
+                results.Writer.TryComplete(ex);
+            }
+        });
+
+        try
+        {
+            await foreach (var result in results.Reader.ReadAllAsync(cancellationToken).ConfigureAwait(false))
+            {
+                yield return result;
+            }
+        }
+        finally
+        {
+            // Early disposal or cancellation: stop scheduling new items and let running ones drain.
+            stop.Cancel();
+            await pump.ConfigureAwait(false);
+        }
+    }
+
+    private static void WriteTetrahedra(IReadOnlyList<Tetrahedron> tets, Span<int> destination)
+    {
+        for (var i = 0; i < tets.Count; i++)
+        {
+            var t = tets[i];
+            var o = i * 4;
+            destination[o] = t.A;
+            destination[o + 1] = t.B;
+            destination[o + 2] = t.C;
+            destination[o + 3] = t.D;
+        }
+    }
+
+    private static Mesh2TetraBatchResult ConvertItem(int index, Mesh2TetraBatchItem item, Mesh2TetraOptions options)
+    {
+        var sw = Stopwatch.StartNew();
+        using var activity = Mesh2TetraDiagnostics.Source.StartActivity("BatchItem");
+        activity?.SetTag("id", item.Id);
+        try
+        {
+            var result = ConvertWithinBudget(item.Vertices, item.Faces, item.Options ?? options);
+            activity?.SetTag("status", result.Status.ToString());
+            return new Mesh2TetraBatchResult(index, item, result.Tetrahedra, null, sw.Elapsed, result.Status);
+        }
+        catch (Exception ex)
+        {
+            activity?.SetStatus(ActivityStatusCode.Error, ex.Message);
+            return new Mesh2TetraBatchResult(index, item, null, ex, sw.Elapsed);
+        }
+    }
+
+    private static async IAsyncEnumerable<(int Index, Mesh2TetraBatchItem Item)> WithIndex(
+        IAsyncEnumerable<Mesh2TetraBatchItem> items,
+        [EnumeratorCancellation] CancellationToken cancellationToken)
+    {
+        var index = 0;
+        await foreach (var item in items.WithCancellation(cancellationToken).ConfigureAwait(false))
+        {
+            yield return (index++, item);
+        }
+    }
+
+#pragma warning disable CS1998 // Synchronous source exposed through the async batch pipeline.
+    private static async IAsyncEnumerable<Mesh2TetraBatchItem> ToAsyncEnumerable(IEnumerable<Mesh2TetraBatchItem> items)
+    {
+        foreach (var item in items)
+        {
+            yield return item;
+        }
+    }
+#pragma warning restore CS1998
+
+    // How far a ConvertWithinBudget run got: the phase running now, and the boundary, tetrahedra
+    // and open residual faces left by the phases before it.
+    private sealed class RunProgress
+    {
+        public ConversionPhase Phase { get; private set; } = ConversionPhase.Preprocessing;
+        public IReadOnlyList<Face>? BoundaryFaces { get; private set; }
+        public IReadOnlyList<Tetrahedron> Tetrahedra { get; private set; } = [];
+        public int ResidualFaces { get; set; }
+
+        public void Finished(ConversionPhase next, IReadOnlyList<Face> boundaryFaces, IReadOnlyList<Tetrahedron> tetrahedra, int residualFaces)
+        {
+            Phase = next;
+            BoundaryFaces = boundaryFaces;
+            Tetrahedra = tetrahedra;
+            ResidualFaces = residualFaces;
+        }
     }
 }
@@ -11,4 +11,46 @@ public sealed class Mesh2TetraOptions
     public double Epsilon { get; init; } = 1e-8;
     public double PlaneDistanceTolerance { get; init; } = 1e-10;
     public int MaxDelaunayRecursionDepth { get; init; } = 8;
+
+    // Decide face intersections and collapse orientation with exact adaptive predicates, and
+    // compare volumes relative to the mesh instead of with absolute tolerances, so results do not
+    // depend on the scale or position of the input (large-coordinate CAD meshes). Off by default
+    // because the Matlab reference uses the fixed tolerances.
+    public bool ExactPredicates { get; init; }
+
+    // Delaunay tetrahedralization of the Delaunay phase. MIConvexHull by default, as in the Matlab
+    // port; IncrementalDelaunayBackend is the built-in faster engine for large inputs.
+    public IDelaunayBackend DelaunayBackend { get; init; } = new MIConvexHullDelaunayBackend();
+
+    // Order in which the boundary-collapse phase tries edge collapses; see CollapseCandidateOrder.
+    public CollapseCandidateOrder CollapseCandidateOrder { get; init; } = CollapseCandidateOrder.Sequential;
+
+    // 1 validates edge-collapse candidates one at a time. Larger values validate a window of
+    // upcoming candidates concurrently on that many threads, each against its own replica of the
+    // residual boundary, and commit the first one in serial order that passes, so output is
+    // identical to the serial run. -1 uses Environment.ProcessorCount. Sequential order only.
+    public int SpeculativeCollapseWorkers { get; init; } = 1;
+
+    // 1 keeps Delaunay meshing serial; larger values mesh disjoint components and their residual
+    // recursion concurrently on at most this many threads. -1 uses Environment.ProcessorCount.
+    // Output is identical to the serial run.
+    public int MaxDegreeOfParallelism { get; init; } = 1;
+
+    // 0 tetrahedralizes each Delaunay component in one piece. A positive value (at least 4) splits
+    // components with more points into k-d cells of at most this many points, which are
+    // tetrahedralized independently (concurrently under MaxDegreeOfParallelism) and stitched
+    // together by the residual recursion. Bounds the memory per worker; the volume is unchanged,
+    // the tetrahedra near cell boundaries may differ from the undivided run.
+    public int MaxSubdomainPoints { get; init; }
+
+    // Stop a conversion early: on cancellation, or once TimeBudget has passed since the conversion
+    // started (null for no limit). Convert then throws OperationCanceledException;
+    // ConvertWithinBudget returns the tetrahedra validated so far with a status instead. A
+    // conversion that finishes in time is unaffected.
+    public CancellationToken CancellationToken { get; init; }
+    public TimeSpan? TimeBudget { get; init; }
+
+    // On-disk cache of whole results and of Delaunay components; null disables caching. One
+    // instance can be shared by any number of conversions and threads.
+    public Mesh2TetraResultCache? ResultCache { get; init; }
 }
@@ -0,0 +1,19 @@
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra;
+
+// Result of Mesh2TetraConverter.ConvertWithinBudget. A stopped conversion returns the tetrahedra
+// it had validated: none when it stopped during preprocessing or Delaunay meshing, the Delaunay
+// tetrahedra plus the accepted collapses when it stopped during boundary collapse. They never
+// overlap and lie inside the boundary, but leave ResidualFaces boundary faces unclosed and only
+// fill VolumeFraction of the enclosed volume. StoppedIn is the phase that was running.
+public sealed record Mesh2TetraResult(
+    IReadOnlyList<Tetrahedron> Tetrahedra,
+    ConversionStatus Status,
+    ConversionPhase? StoppedIn,
+    int ResidualFaces,
+    double VolumeFraction,
+    TimeSpan Elapsed)
+{
+    public bool IsComplete => Status == ConversionStatus.Completed;
+}
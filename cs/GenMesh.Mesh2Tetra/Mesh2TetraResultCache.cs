@@ -0,0 +1,334 @@
+using System.Buffers.Binary;
+using System.Diagnostics.CodeAnalysis;
+using System.Reflection;
+using System.Security.Cryptography;
+using System.Text;
+using GenMesh.Mesh2Tetra.Diagnostics;
+using GenMesh.Mesh2Tetra.Geometry;
+using GenMesh.Mesh2Tetra.Models;
+
+namespace GenMesh.Mesh2Tetra;
+
+// Optional on-disk cache of conversion results, used by every Convert call whose options carry it
+// (Mesh2TetraOptions.ResultCache). Entries are keyed by a SHA-256 of the input mesh and of the
+// options that affect the output, so a repeated mesh returns its stored tetrahedra without running
+// the pipeline. Delaunay components are cached the same way in their local vertex numbering, so an
+// assembly whose parts were converted before only recomputes the parts that changed.
+//
+// One file per entry. Reading an entry refreshes its timestamp, and when the directory grows past
+// MaxBytes the least recently used entries are deleted. Entries are written to a temporary file and
+// renamed into place, so several processes can share a directory; unreadable entries are misses.
+public sealed class Mesh2TetraResultCache
+{
+    public const long DefaultMaxBytes = 1L << 30;
+    public const string EntryExtension = ".m2tc";
+
+    // Entry file: magic, format version (int32), tetrahedron count (int32), then a, b, c, d (int32)
+    // per tetrahedron, little-endian.
+    private const int FormatVersion = 1;
+    private const int HeaderSize = 16;
+
+    private static ReadOnlySpan<byte> Magic => "M2TCACHE"u8;
+
+    // Results depend on the library build as much as on the input.
+    private static readonly string KeySalt = $"GenMesh.Mesh2Tetra {typeof(Mesh2TetraResultCache).Assembly.GetCustomAttribute<AssemblyInformationalVersionAttribute>()?.InformationalVersion}";
+
+    private readonly object _gate = new();
+    private long _sizeBytes;
+
+    public Mesh2TetraResultCache(string directoryPath, long maxBytes = DefaultMaxBytes)
+    {
+        ArgumentException.ThrowIfNullOrEmpty(directoryPath);
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(maxBytes);
+
+        DirectoryPath = Path.GetFullPath(directoryPath);
+        MaxBytes = maxBytes;
+        Directory.CreateDirectory(DirectoryPath);
+        _sizeBytes = Entries().Sum(e => e.Length);
+    }
+
+    public string DirectoryPath { get; }
+
+    public long MaxBytes { get; }
+
+    // Size of the entries this instance found or wrote; entries written by other processes are
+    // counted at the next eviction.
+    public long SizeBytes
+    {
+        get
+        {
+            lock (_gate) return _sizeBytes;
+        }
+    }
+
+    public void Clear()
+    {
+        lock (_gate)
+        {
+            foreach (var entry in Entries())
+            {
+                TryDelete(entry.FullName);
+            }
+
+            _sizeBytes = 0;
+        }
+    }
+
+    internal static string ResultKey(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, Mesh2TetraOptions options)
+    {
+        using var hash = new KeyHash("result");
+        hash.Add(options.CheckInput);
+        hash.Add(options.AutoFixFaceOrientation);
+        hash.Add(options.AutoResolveIntersections);
+        hash.Add(options.FailOnSelfIntersections);
+        hash.Add(options.MaxSolveIntersectionIterations);
+        hash.Add(options.Epsilon);
+        hash.Add(options.PlaneDistanceTolerance);
+        hash.Add(options.MaxDelaunayRecursionDepth);
+        hash.Add(options.ExactPredicates);
+        hash.Add(options.DelaunayBackend.Name);
+        hash.Add(options.MaxSubdomainPoints);
+        hash.Add((int)options.CollapseCandidateOrder);
+        hash.Add(vertices, faces);
+        return hash.Finish();
+    }
+
+    // A Delaunay component in local numbering; remainingDepth is how many more levels of residual
+    // recursion the component may use, subdomainPoints the decomposition limit at its level. With
+    // decomposition on anywhere, every level orients its cells, so that is keyed separately.
+    internal static string ComponentKey(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces, Mesh2TetraOptions options, int remainingDepth, int subdomainPoints)
+    {
+        using var hash = new KeyHash("component");
+        hash.Add(options.Epsilon);
+        hash.Add(options.PlaneDistanceTolerance);
+        hash.Add(options.ExactPredicates);
+        hash.Add(options.DelaunayBackend.Name);
+        hash.Add(subdomainPoints);
+        hash.Add(options.MaxSubdomainPoints > 0);
+        hash.Add(remainingDepth);
+        hash.Add(vertices, faces);
+        return hash.Finish();
+    }
+
+    internal string EntryPath(string key) => Path.Combine(DirectoryPath, key + EntryExtension);
+
+    internal bool TryGet(string key, string kind, [NotNullWhen(true)] out List<Tetrahedron>? tetrahedra)
+    {
+        tetrahedra = Read(EntryPath(key));
+        RecordLookup(kind, tetrahedra is not null);
+        return tetrahedra is not null;
+    }
+
+    internal void Store(string key, IReadOnlyList<Tetrahedron> tetrahedra)
+    {
+        var bytes = new byte[HeaderSize + (tetrahedra.Count * 16)];
+        Magic.CopyTo(bytes);
+        BinaryPrimitives.WriteInt32LittleEndian(bytes.AsSpan(8), FormatVersion);
+        BinaryPrimitives.WriteInt32LittleEndian(bytes.AsSpan(12), tetrahedra.Count);
+        for (var i = 0; i < tetrahedra.Count; i++)
+        {
+            var t = tetrahedra[i];
+            var o = HeaderSize + (i * 16);
+            BinaryPrimitives.WriteInt32LittleEndian(bytes.AsSpan(o), t.A);
+            BinaryPrimitives.WriteInt32LittleEndian(bytes.AsSpan(o + 4), t.B);
+            BinaryPrimitives.WriteInt32LittleEndian(bytes.AsSpan(o + 8), t.C);
+            BinaryPrimitives.WriteInt32LittleEndian(bytes.AsSpan(o + 12), t.D);
+        }
+
+        var path = EntryPath(key);
+        var temp = Path.Combine(DirectoryPath, $"{key}.{Guid.NewGuid():N}.tmp");
+        try
+        {
+            var replaced = File.Exists(path) ? new FileInfo(path).Length : 0;
+            File.WriteAllBytes(temp, bytes);
+            File.Move(temp, path, overwrite: true);
+
+            lock (_gate)
+            {
+                _sizeBytes += bytes.Length - replaced;
+                if (_sizeBytes > MaxBytes) Evict();
+            }
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            // The cache is best effort; a failed write only costs the next lookup.
+            TryDelete(temp);
+        }
+    }
+
+    private List<Tetrahedron>? Read(string path)
+    {
+        byte[] bytes;
+        try
+        {
+            bytes = File.ReadAllBytes(path);
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            return null;
+        }
+
+        var span = bytes.AsSpan();
+        if (span.Length < HeaderSize
+            || !span[..8].SequenceEqual(Magic)
+            || BinaryPrimitives.ReadInt32LittleEndian(span[8..]) != FormatVersion
+            || span.Length != HeaderSize + ((long)BinaryPrimitives.ReadInt32LittleEndian(span[12..]) * 16))
+        {
+            TryDelete(path);
+            return null;
+        }
+
+        try
+        {
+            File.SetLastWriteTimeUtc(path, DateTime.UtcNow);
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            // Evicted or locked meanwhile; the entry is still good for this lookup.
+        }
+
+        var count = BinaryPrimitives.ReadInt32LittleEndian(span[12..]);
+        var tetrahedra = new List<Tetrahedron>(count);
+        for (var i = 0; i < count; i++)
+        {
+            var o = HeaderSize + (i * 16);
+            tetrahedra.Add(new Tetrahedron(
+                BinaryPrimitives.ReadInt32LittleEndian(span[o..]),
+                BinaryPrimitives.ReadInt32LittleEndian(span[(o + 4)..]),
+                BinaryPrimitives.ReadInt32LittleEndian(span[(o + 8)..]),
+                BinaryPrimitives.ReadInt32LittleEndian(span[(o + 12)..])));
+        }
+
+        return tetrahedra;
+    }
+
+    // Oldest entries first until the directory fits; caller holds _gate.
+    private void Evict()
+    {
+        var entries = Entries().OrderBy(e => e.LastWriteTimeUtc).ToList();
+        var total = entries.Sum(e => e.Length);
+        foreach (var entry in entries)
+        {
+            if (total <= MaxBytes) break;
+            if (TryDelete(entry.FullName)) total -= entry.Length;
+        }
+
+        _sizeBytes = total;
+    }
+
+    private IEnumerable<FileInfo> Entries()
+    {
+        try
+        {
+            return new DirectoryInfo(DirectoryPath).GetFiles("*" + EntryExtension);
+        }
+        catch (DirectoryNotFoundException)
+        {
+            return [];
+        }
+    }
+
+    private static bool TryDelete(string path)
+    {
+        try
+        {
+            File.Delete(path);
+            return true;
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            return false;
+        }
+    }
+
+    private static void RecordLookup(string kind, bool hit)
+    {
+        if (Mesh2TetraDiagnostics.CacheLookups.Enabled)
+        {
+            Mesh2TetraDiagnostics.CacheLookups.Add(
+                1,
+                new KeyValuePair<string, object?>("kind", kind),
+                new KeyValuePair<string, object?>("outcome", hit ? "hit" : "miss"));
+        }
+    }
+
+    // SHA-256 over little-endian values. Coordinates are canonicalized so -0 and 0 hash alike.
+    private sealed class KeyHash : IDisposable
+    {
+        private readonly IncrementalHash _hash = IncrementalHash.CreateHash(HashAlgorithmName.SHA256);
+        private readonly byte[] _buffer = new byte[8192];
+        private int _used;
+
+        public KeyHash(string kind)
+        {
+            var salt = Encoding.UTF8.GetBytes($"{KeySalt}\n{kind}\n");
+            _hash.AppendData(salt);
+        }
+
+        public void Add(bool value) => Add(value ? 1 : 0);
+
+        public void Add(int value)
+        {
+            Reserve(4);
+            BinaryPrimitives.WriteInt32LittleEndian(_buffer.AsSpan(_used), value);
+            _used += 4;
+        }
+
+        public void Add(double value)
+        {
+            Reserve(8);
+            BinaryPrimitives.WriteDoubleLittleEndian(_buffer.AsSpan(_used), value == 0d ? 0d : value);
+            _used += 8;
+        }
+
+        public void Add(string value)
+        {
+            var bytes = Encoding.UTF8.GetBytes(value);
+            Add(bytes.Length);
+            Reserve(bytes.Length);
+            if (bytes.Length > _buffer.Length - _used)
+            {
+                _hash.AppendData(bytes);
+                return;
+            }
+
+            bytes.CopyTo(_buffer, _used);
+            _used += bytes.Length;
+        }
+
+        public void Add(IReadOnlyList<Vector3d> vertices, IReadOnlyList<Face> faces)
+        {
+            Add(vertices.Count);
+            foreach (var v in vertices)
+            {
+                Add(v.X);
+                Add(v.Y);
+                Add(v.Z);
+            }
+
+            Add(faces.Count);
+            foreach (var f in faces)
+            {
+                Add(f.A);
+                Add(f.B);
+                Add(f.C);
+            }
+        }
+
+        public string Finish()
+        {
+            _hash.AppendData(_buffer, 0, _used);
+            _used = 0;
+            return Convert.ToHexString(_hash.GetHashAndReset()).ToLowerInvariant();
+        }
+
+        public void Dispose() => _hash.Dispose();
+
+        private void Reserve(int bytes)
+        {
+            if (_used + bytes <= _buffer.Length) return;
+            _hash.AppendData(_buffer, 0, _used);
+            _used = 0;
+        }
+    }
+}
@@ -0,0 +1,110 @@
+using System.Collections;
+using System.Runtime.InteropServices;
+using GenMesh.Mesh2Tetra.Geometry;
+
+namespace GenMesh.Mesh2Tetra.Models;
+
+// Read-only list views over flat caller buffers (x, y, z per vertex; a, b, c per face) so the
+// flat Convert overloads can run the pipeline without copying the input into Vector3d/Face lists.
+// Array-backed memory is indexed directly; other memory goes through its span.
+internal sealed class PackedVertexList : IReadOnlyList<Vector3d>
+{
+    private readonly ReadOnlyMemory<double> _coordinates;
+    private readonly double[]? _array;
+    private readonly int _offset;
+
+    public PackedVertexList(ReadOnlyMemory<double> coordinates)
+    {
+        if (coordinates.Length % 3 != 0)
+        {
+            throw new ArgumentException("Coordinate buffer length must be a multiple of 3 (x, y, z per vertex).", nameof(coordinates));
+        }
+
+        _coordinates = coordinates;
+        if (MemoryMarshal.TryGetArray(coordinates, out var segment))
+        {
+            _array = segment.Array;
+            _offset = segment.Offset;
+        }
+
+        Count = coordinates.Length / 3;
+    }
+
+    public int Count { get; }
+
+    public Vector3d this[int index]
+    {
+        get
+        {
+            if ((uint)index >= (uint)Count) throw new ArgumentOutOfRangeException(nameof(index));
+            if (_array is not null)
+            {
+                var o = _offset + (index * 3);
+                return new Vector3d(_array[o], _array[o + 1], _array[o + 2]);
+            }
+
+            return MemoryMarshal.Cast<double, Vector3d>(_coordinates.Span)[index];
+        }
+    }
+
+    public IEnumerator<Vector3d> GetEnumerator()
+    {
+        for (var i = 0; i < Count; i++)
+        {
+            yield return this[i];
+        }
+    }
+
+    IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+}
+
+internal sealed class PackedFaceList : IReadOnlyList<Face>
+{
+    private readonly ReadOnlyMemory<int> _indices;
+    private readonly int[]? _array;
+    private readonly int _offset;
+
+    public PackedFaceList(ReadOnlyMemory<int> indices)
+    {
+        if (indices.Length % 3 != 0)
+        {
+            throw new ArgumentException("Face index buffer length must be a multiple of 3 (one triangle per 3 indices).", nameof(indices));
+        }
+
+        _indices = indices;
+        if (MemoryMarshal.TryGetArray(indices, out var segment))
+        {
+            _array = segment.Array;
+            _offset = segment.Offset;
+        }
+
+        Count = indices.Length / 3;
+    }
+
+    public int Count { get; }
+
+    public Face this[int index]
+    {
+        get
+        {
+            if ((uint)index >= (uint)Count) throw new ArgumentOutOfRangeException(nameof(index));
+            if (_array is not null)
+            {
+                var o = _offset + (index * 3);
+                return new Face(_array[o], _array[o + 1], _array[o + 2]);
+            }
+
+            return MemoryMarshal.Cast<int, Face>(_indices.Span)[index];
+        }
+    }
+
+    public IEnumerator<Face> GetEnumerator()
+    {
+        for (var i = 0; i < Count; i++)
+        {
+            yield return this[i];
+        }
+    }
+
+    IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+}
@@ -7,12 +7,9 @@ Usage:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path
-import json
 import sys
 
-ROOT = Path(__file__).resolve().parents[1]
-FIXTURES_DIR = ROOT / "GenMesh.Mesh2Tetra.Tests" / "Fixtures"
+import fixture_index
 
 
 @dataclass(frozen=True)
@@ -35,29 +32,11 @@ QUEUE: tuple[QueueItem, ...] = (
 )
 
 
-def detect_mode(expected: dict) -> str:
-    if expected.get("expectedExceptionContains"):
-        return "fail-fast"
-    if expected.get("exactTetrahedra") is not None:
-        return "deterministic"
-    if expected.get("tetraCount") is not None:
-        return "count+volume"
-    return "volume-only"
-
-
 def load_fixtures() -> dict[str, str]:
-    if not FIXTURES_DIR.exists():
-        raise FileNotFoundError(f"Fixture directory not found: {FIXTURES_DIR}")
-
-    results: dict[str, str] = {}
-    for path in sorted(FIXTURES_DIR.glob("*.json")):
-        data = json.loads(path.read_text())
-        name = str(data.get("name", "")).strip()
-        if not name:
-            continue
-        expected = data.get("expected", {})
-        results[name] = detect_mode(expected)
-    return results
+    if not fixture_index.FIXTURES.exists():
+        raise FileNotFoundError(f"Fixture directory not found: {fixture_index.FIXTURES}")
+
+    return {s.name: s.mode for s in fixture_index.load_index().values() if s.name}
 
 
 def main() -> int:
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Move fixture meshes between inline JSON arrays and .m2tb binary sidecars.
+
+`to-binary` writes <fixture>.m2tb next to each fixture JSON (vertices, faces and, when present,
+expected.exactTetrahedra) and replaces the inline arrays with a reference to the sidecar.
+`to-json` inlines the sidecar again and removes it (unless --keep-sidecar).
+
+Examples:
+  python tools/convert_fixture_binary.py to-binary GenMesh.Mesh2Tetra.Tests/Fixtures/big_case.json
+  python tools/convert_fixture_binary.py to-binary --min-faces 50000
+  python tools/convert_fixture_binary.py to-json GenMesh.Mesh2Tetra.Tests/Fixtures/big_case.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+import mesh_binary
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_DIR = ROOT / "GenMesh.Mesh2Tetra.Tests" / "Fixtures"
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Convert fixture meshes between inline JSON and .m2tb sidecars.")
+    p.add_argument("direction", choices=["to-binary", "to-json"])
+    p.add_argument("fixtures", nargs="*", type=Path, help="Fixture JSON files (default: every fixture)")
+    p.add_argument("--min-faces", type=int, default=0, help="to-binary: only convert fixtures with at least this many faces")
+    p.add_argument("--keep-sidecar", action="store_true", help="to-json: keep the .m2tb file")
+    return p.parse_args(argv)
+
+
+def write_fixture(path: Path, data: dict) -> None:
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def to_binary(path: Path, data: dict, min_faces: int) -> bool:
+    fi = data["input"]
+    if "binary" in fi or len(fi["faces"]) < min_faces:
+        return False
+
+    expected = data["expected"]
+    exact = expected.pop("exactTetrahedra", None)
+    sidecar = path.with_suffix(mesh_binary.EXTENSION)
+    mesh_binary.write_mesh(sidecar, fi["vertices"], fi["faces"], exact)
+
+    data["input"] = {"binary": sidecar.name}
+    if exact is not None:
+        expected["exactTetrahedraInBinary"] = True
+    write_fixture(path, data)
+    return True
+
+
+def to_json(path: Path, data: dict, keep_sidecar: bool) -> bool:
+    sidecar = mesh_binary.sidecar_path(path, data)
+    if sidecar is None:
+        return False
+
+    mesh = mesh_binary.open_mesh(sidecar)
+    data["input"] = {"vertices": mesh.vertices.tolist(), "faces": mesh.faces.tolist()}
+    expected = data["expected"]
+    if expected.pop("exactTetrahedraInBinary", False):
+        expected["exactTetrahedra"] = mesh.tets.tolist()
+    del mesh
+
+    write_fixture(path, data)
+    if not keep_sidecar:
+        sidecar.unlink()
+    return True
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    paths = args.fixtures or sorted(FIXTURE_DIR.glob("*.json"))
+
+    converted = 0
+    for path in paths:
+        try:
+            data = json.loads(path.read_text())
+            if args.direction == "to-binary":
+                changed = to_binary(path, data, args.min_faces)
+            else:
+                changed = to_json(path, data, args.keep_sidecar)
+        except Exception as exc:  # noqa: BLE001
+            print(f"{path.name}: conversion failed: {exc}", file=sys.stderr)
+            return 2
+
+        if changed:
+            converted += 1
+            print(f"Converted {path.name} ({args.direction})")
+
+    print(f"{converted} fixture(s) converted.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,181 @@
+"""Shared index of the regression fixtures, so tools do not each parse the whole corpus.
+
+Every fixture is summarised once (name, vertex/face counts, assertion mode, content hash) and the
+summaries are kept in .cache/fixture_index.json together with the modification time and size of
+the fixture and its binary sidecar. `load_index` re-reads only fixtures whose stamps changed, and
+parses those in a process pool, so a run over an unchanged corpus only stats the files.
+
+Usage from another tool:
+  import fixture_index
+  for summary in fixture_index.load_index().values():
+      ...
+
+Running this file directly rebuilds the index and prints how many fixtures were re-read.
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import sys
+from typing import Callable, Iterable, TypeVar
+
+import mesh_binary
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURES = ROOT / "GenMesh.Mesh2Tetra.Tests" / "Fixtures"
+INDEX = ROOT / ".cache" / "fixture_index.json"
+
+# Bump when FixtureSummary or the way it is computed changes; older index files are discarded.
+INDEX_VERSION = 1
+
+# Below this many files a process pool costs more than it saves.
+MIN_PARALLEL = 8
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class FixtureSummary:
+    file: str
+    name: str
+    vertices: int
+    faces: int
+    mode: str  # assertion mode, see assertion_mode
+    hash: str  # sha256 of the fixture JSON and its binary sidecar
+    stamp: list[int]  # mtime_ns and size of the fixture, then of the sidecar when there is one
+    sidecar: str | None = None
+    error: str | None = None  # set when the fixture could not be summarised
+
+
+def assertion_mode(expected: dict) -> str:
+    if expected.get("expectedExceptionContains"):
+        return "fail-fast"
+    if expected.get("exactTetrahedra") is not None or expected.get("exactTetrahedraInBinary"):
+        return "deterministic"
+    if expected.get("tetraCount") is not None:
+        return "count+volume"
+    return "volume-only"
+
+
+def file_stamp(path: Path, sidecar: str | None) -> list[int]:
+    st = path.stat()
+    stamp = [st.st_mtime_ns, st.st_size]
+    if sidecar is not None:
+        try:
+            st = (path.parent / sidecar).stat()
+            stamp += [st.st_mtime_ns, st.st_size]
+        except OSError:
+            stamp += [-1, -1]
+    return stamp
+
+
+def summarize(path: Path) -> FixtureSummary:
+    raw = path.read_bytes()
+    h = hashlib.sha256(raw)
+    sidecar = None
+    try:
+        data = json.loads(raw)
+        sidecar_file = mesh_binary.sidecar_path(path, data)
+        if sidecar_file is not None:
+            sidecar = sidecar_file.name
+            with sidecar_file.open("rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    h.update(block)
+            header = mesh_binary.read_header(sidecar_file)
+            vertices, faces = header.vertex_count, header.face_count
+        else:
+            vertices = len(data["input"]["vertices"])
+            faces = len(data["input"]["faces"])
+        name = str(data.get("name", "")).strip()
+        mode = assertion_mode(data.get("expected", {}))
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+        return FixtureSummary(path.name, "", 0, 0, "", h.hexdigest(), file_stamp(path, sidecar), sidecar, f"{path.name}: {exc}")
+
+    return FixtureSummary(path.name, name, vertices, faces, mode, h.hexdigest(), file_stamp(path, sidecar), sidecar)
+
+
+def parallel_map(fn: Callable[[T], R], items: Iterable[T], jobs: int | None = None) -> list[R]:
+    """Map fn over items in a process pool (fn must be a module-level function), in order."""
+    items = list(items)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(items) < MIN_PARALLEL:
+        return [fn(item) for item in items]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as pool:
+        return list(pool.map(fn, items, chunksize=max(1, len(items) // (4 * jobs))))
+
+
+def _read_index(path: Path) -> dict[str, FixtureSummary]:
+    try:
+        data = json.loads(path.read_text())
+        if data.get("version") != INDEX_VERSION:
+            return {}
+        return {entry["file"]: FixtureSummary(**entry) for entry in data["fixtures"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def _write_index(path: Path, index: dict[str, FixtureSummary]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "fixtures": [asdict(s) for s in index.values()]}, indent=1))
+        os.replace(tmp, path)
+    except OSError as exc:
+        print(f"warning: could not write {path}: {exc}", file=sys.stderr)
+
+
+def load_index(fixtures_dir: Path = FIXTURES, index_path: Path = INDEX, jobs: int | None = None,
+               refresh: bool = False) -> dict[str, FixtureSummary]:
+    """Summaries of every *.json fixture by file name, sorted by file name.
+
+    Fixtures whose stamps match the index are taken from it; the others are summarised in
+    parallel and the index is rewritten. refresh=True re-reads every fixture.
+    """
+    cached = {} if refresh else _read_index(index_path)
+    paths = sorted(fixtures_dir.glob("*.json"))
+
+    index: dict[str, FixtureSummary] = {}
+    stale: list[Path] = []
+    for path in paths:
+        entry = cached.get(path.name)
+        if entry is not None and entry.stamp == file_stamp(path, entry.sidecar):
+            index[path.name] = entry
+        else:
+            stale.append(path)
+
+    for summary in parallel_map(summarize, stale, jobs):
+        index[summary.file] = summary
+
+    index = {name: index[name] for name in sorted(index)}
+    if stale or len(index) != len(cached):
+        _write_index(index_path, index)
+    return index
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Rebuild the shared fixture index.")
+    p.add_argument("--refresh", action="store_true", help="Re-read every fixture, not only changed ones")
+    p.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    before = {} if args.refresh else _read_index(INDEX)
+    index = load_index(jobs=args.jobs, refresh=args.refresh)
+    reread = sum(1 for name, s in index.items() if before.get(name) != s)
+    errors = [s.error for s in index.values() if s.error]
+    for e in errors:
+        print(f"error: {e}", file=sys.stderr)
+    print(f"Indexed {len(index)} fixtures ({reread} re-read).")
+    return 2 if errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -2,35 +2,22 @@
 """Generate a markdown catalog for Mesh2Tetra JSON fixtures."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+import fixture_index
+
 ROOT = Path(__file__).resolve().parents[1]
-FIXTURES_DIR = ROOT / "GenMesh.Mesh2Tetra.Tests" / "Fixtures"
 OUTPUT = ROOT / "FixtureCatalog.md"
 
 
-def classify_expected(expected: dict) -> str:
-    if expected.get("expectedExceptionContains"):
-        return "fail-fast"
-    if expected.get("exactTetrahedra") is not None:
-        return "deterministic"
-    if expected.get("tetraCount") is not None:
-        return "count+volume"
-    return "volume-only"
-
-
-def row_for_fixture(path: Path) -> tuple[str, str, int, int, str]:
-    data = json.loads(path.read_text())
-    name = data["name"]
-    vertices = len(data["input"]["vertices"])
-    faces = len(data["input"]["faces"])
-    expected_type = classify_expected(data["expected"])
-    return name, path.name, vertices, faces, expected_type
-
-
 def main() -> int:
-    rows = [row_for_fixture(path) for path in sorted(FIXTURES_DIR.glob("*.json"))]
+    index = fixture_index.load_index()
+    errors = [s.error for s in index.values() if s.error]
+    if errors:
+        for e in errors:
+            print(f"error: {e}")
+        return 2
+    rows = list(index.values())
 
     lines = [
         "# Fixture Catalog",
@@ -41,8 +28,8 @@ def main() -> int:
         "|---|---|---:|---:|---|",
     ]
 
-    for name, file_name, vertices, faces, expected_type in rows:
-        lines.append(f"| `{name}` | `{file_name}` | {vertices} | {faces} | {expected_type} |")
+    for s in rows:
+        lines.append(f"| `{s.name}` | `{s.file}` | {s.vertices} | {s.faces} | {s.mode} |")
 
     lines.extend([
         "",
@@ -12,13 +12,26 @@ Expected input JSON (example):
 
 - `faces` and `tetrahedra` may be 1-based (Matlab style) or 0-based.
 - For `--mode failfast`, omit `tetrahedra` and set `expectedExceptionContains`.
+- `--binary` stores the mesh (and exact tetrahedra) in a .m2tb sidecar next to the fixture
+  JSON instead of inline arrays; use it for large cases.
+- `--stream` reads the export incrementally (see json_rows.py) for exports too large to load:
+  rows are validated and spilled to temporary binary files chunk by chunk, 1-based indices are
+  detected from the running minimum and shifted while the output is written, `tetraVolume` is
+  computed from the tetrahedra when absent, and the fixture JSON is written compactly (or as a
+  sidecar with `--binary`). Peak memory is a few chunks regardless of the export size. Needs NumPy.
 """
 from __future__ import annotations
 
 import argparse
+from contextlib import ExitStack
 import json
 from pathlib import Path
 import sys
+import tempfile
+from typing import Any, Iterator
+
+import json_rows
+import mesh_binary
 
 ROOT = Path(__file__).resolve().parents[1]
 FIXTURE_DIR = ROOT / "GenMesh.Mesh2Tetra.Tests" / "Fixtures"
@@ -38,6 +51,10 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument("--allow-self-intersections", dest="fail_on_self_intersections", action="store_false")
     parser.add_argument("--expected-exception-contains", default="self-intersections")
     parser.add_argument("--force", action="store_true", help="Overwrite if target fixture exists")
+    parser.add_argument("--binary", action="store_true", help="Write the mesh to a .m2tb sidecar instead of inline JSON")
+    parser.add_argument("--stream", action="store_true", help="Parse the export incrementally and write compact JSON")
+    parser.add_argument("--chunk-chars", type=int, default=json_rows.DEFAULT_CHUNK_CHARS,
+                        help="--stream: characters read per chunk (default: 4 Mi)")
     return parser.parse_args(argv)
 
 
@@ -61,13 +78,17 @@ def load_input(path: Path) -> dict:
     return data
 
 
-def build_fixture(data: dict, args: argparse.Namespace) -> dict:
+def fixture_name(data: dict, args: argparse.Namespace) -> str:
     name = args.out_name or str(data.get("name", "")).strip()
     if not name:
         raise ValueError("Fixture name missing: provide 'name' in input or --out-name")
     if any(c in name for c in "\\/ "):
         raise ValueError("Fixture name must not include slashes or spaces")
+    return name
+
 
+def build_fixture(data: dict, args: argparse.Namespace) -> dict:
+    name = fixture_name(data, args)
     vertices = data.get("vertices")
     faces = data.get("faces")
 
@@ -81,7 +102,16 @@ def build_fixture(data: dict, args: argparse.Namespace) -> dict:
             raise ValueError(f"vertices[{i}] must be [x,y,z] numeric")
 
     faces_0 = maybe_to_zero_based(faces, 3, "faces")
+    tetrahedra = data.get("tetrahedra")
+    tetrahedra_0 = None
+    if tetrahedra is not None and args.mode != "failfast":
+        tetrahedra_0 = maybe_to_zero_based(tetrahedra, 4, "tetrahedra")
+    return assemble_fixture(name, vertices, faces_0, tetrahedra_0,
+                            None if tetrahedra_0 is None else len(tetrahedra_0), data, args)
+
 
+def assemble_fixture(name: str, vertices: Any, faces: Any, tetrahedra: Any, tetrahedra_count: int | None,
+                     data: dict, args: argparse.Namespace) -> dict:
     expected: dict[str, object] = {
         "tetraVolume": float(data.get("tetraVolume", 0.0)),
         "volumeTolerance": float(args.volume_tolerance),
@@ -93,18 +123,16 @@ def build_fixture(data: dict, args: argparse.Namespace) -> dict:
         expected["expectedExceptionContains"] = args.expected_exception_contains
     else:
         tetra_count = data.get("tetraCount")
-        tetrahedra = data.get("tetrahedra")
 
         if args.mode in {"deterministic", "count"} and tetra_count is None and tetrahedra is None:
             raise ValueError("mode requires tetraCount or tetrahedra in input JSON")
 
         if tetrahedra is not None:
-            tetrahedra_0 = maybe_to_zero_based(tetrahedra, 4, "tetrahedra")
             if args.mode == "deterministic":
-                expected["exactTetrahedra"] = tetrahedra_0
-                expected["tetraCount"] = len(tetrahedra_0)
+                expected["exactTetrahedra"] = tetrahedra
+                expected["tetraCount"] = tetrahedra_count
             elif args.mode == "count" and tetra_count is None:
-                expected["tetraCount"] = len(tetrahedra_0)
+                expected["tetraCount"] = tetrahedra_count
 
         if tetra_count is not None:
             if not isinstance(tetra_count, int) or tetra_count < 0:
@@ -118,7 +146,7 @@ def build_fixture(data: dict, args: argparse.Namespace) -> dict:
         "name": name,
         "input": {
             "vertices": vertices,
-            "faces": faces_0,
+            "faces": faces,
         },
         "expected": expected,
         "options": {
@@ -132,6 +160,156 @@ def build_fixture(data: dict, args: argparse.Namespace) -> dict:
     }
 
 
+ROW_SPECS = {
+    "vertices": json_rows.RowSpec(3, integer=False),
+    "faces": json_rows.RowSpec(3, integer=True),
+    "tetrahedra": json_rows.RowSpec(4, integer=True),
+}
+SPILL_ROWS = 1 << 16
+INT32_MIN, INT32_MAX = -(1 << 31), (1 << 31) - 1
+
+
+class Spill:
+    """One row array of a streamed export, kept in a temporary little-endian binary file."""
+
+    def __init__(self, path: Path, spec: json_rows.RowSpec) -> None:
+        self.path = path
+        self.spec = spec
+        self.dtype = "<i4" if spec.integer else "<f8"
+        self.handle = path.open("wb")
+        self.present = False
+        self.rows = 0
+        self.min: int | None = None
+        self.max: int | None = None
+        self.offset = 0  # 1 once the indices turned out to be 1-based
+
+    def append(self, rows: Any) -> None:
+        self.present = True
+        if len(rows) == 0:
+            return
+        if self.spec.integer:
+            low, high = int(rows.min()), int(rows.max())
+            if low < INT32_MIN or high > INT32_MAX:
+                raise ValueError(f"{self.path.stem}: index outside the int32 range")
+            self.min = low if self.min is None else min(self.min, low)
+            self.max = high if self.max is None else max(self.max, high)
+        self.handle.write(rows.astype(self.dtype).tobytes())
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        self.handle.close()
+
+    def chunks(self) -> Iterator[Any]:
+        """Rows in chunks of SPILL_ROWS, 1-based indices already shifted to 0-based."""
+        import numpy as np
+
+        if self.rows == 0:
+            return
+        data = np.memmap(self.path, dtype=self.dtype, mode="r", shape=(self.rows, self.spec.width))
+        for start in range(0, self.rows, SPILL_ROWS):
+            chunk = data[start:start + SPILL_ROWS]
+            yield chunk - self.offset if self.offset else np.array(chunk)
+
+
+class StreamedExport:
+    """Scalar members and spilled row arrays of an export read with --stream."""
+
+    PLACEHOLDER = "\0stream:{}\0"
+
+    def __init__(self, scalars: dict, spills: dict[str, Spill]) -> None:
+        self.scalars = scalars
+        self.spills = spills
+
+    def tetra_volume(self) -> float:
+        import numpy as np
+
+        vertices = np.memmap(self.spills["vertices"].path, dtype="<f8", mode="r",
+                             shape=(self.spills["vertices"].rows, 3))
+        total = 0.0
+        for t in self.spills["tetrahedra"].chunks():
+            a = vertices[t[:, 0]]
+            edges = np.stack([vertices[t[:, 1]] - a, vertices[t[:, 2]] - a, vertices[t[:, 3]] - a], axis=1)
+            total += float(np.abs(np.linalg.det(edges)).sum()) / 6.0
+        return total
+
+    def write_json(self, path: Path, fixture: dict) -> None:
+        """Compact fixture JSON with the row arrays streamed in place of their placeholders."""
+        import numpy as np  # noqa: F401 - chunks() needs it
+
+        text = json.dumps(fixture, separators=(",", ":"))
+        with path.open("w", encoding="utf-8") as f:
+            for key, spill in self.spills.items():
+                marker = json.dumps(self.PLACEHOLDER.format(key))
+                if marker not in text:
+                    continue
+                head, text = text.split(marker, 1)
+                f.write(head)
+                f.write("[")
+                for i, chunk in enumerate(spill.chunks()):
+                    if i:
+                        f.write(",")
+                    f.write(json.dumps(chunk.tolist(), separators=(",", ":"))[1:-1])
+                f.write("]")
+            f.write(text + "\n")
+
+    def write_binary(self, path: Path, exact: bool) -> None:
+        v, f, t = self.spills["vertices"], self.spills["faces"], self.spills["tetrahedra"]
+        mesh_binary.write_mesh_chunks(
+            path, v.rows, f.rows, t.rows if exact else 0,
+            (c.astype("<f8").tobytes() for c in v.chunks()),
+            (c.astype("<i4").tobytes() for c in f.chunks()),
+            (c.astype("<i4").tobytes() for c in t.chunks()) if exact else [])
+
+
+def stream_input(path: Path, workdir: Path, chunk_chars: int) -> StreamedExport:
+    try:
+        import numpy  # noqa: F401
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise RuntimeError("--stream requires NumPy (pip install -r tools/requirements.txt)") from exc
+
+    scalars: dict = {}
+    spills = {key: Spill(workdir / f"{key}.bin", spec) for key, spec in ROW_SPECS.items()}
+    try:
+        with path.open(encoding="utf-8") as f:
+            for member in json_rows.iter_members(f, ROW_SPECS, chunk_chars):
+                if member.rows is not None:
+                    spills[member.key].append(member.rows)
+                elif member.key in ROW_SPECS:
+                    raise ValueError(f"{member.key} must be an array of rows")
+                else:
+                    scalars[member.key] = member.value
+    finally:
+        for spill in spills.values():
+            spill.close()
+    return StreamedExport(scalars, spills)
+
+
+def build_streamed_fixture(export: StreamedExport, args: argparse.Namespace) -> dict:
+    data = dict(export.scalars)
+    name = fixture_name(data, args)
+    vertices, faces, tetrahedra = (export.spills[k] for k in ("vertices", "faces", "tetrahedra"))
+    if vertices.rows < 4:
+        raise ValueError("vertices must be an array with at least 4 entries")
+    if faces.rows < 4:
+        raise ValueError("faces must be an array with at least 4 entries")
+
+    use_tetrahedra = tetrahedra.present and args.mode != "failfast"
+    for spill in (faces, tetrahedra) if use_tetrahedra else (faces,):
+        if spill.rows == 0:
+            continue
+        spill.offset = 1 if spill.min >= 1 else 0
+        if spill.min - spill.offset < 0 or spill.max - spill.offset >= vertices.rows:
+            raise ValueError(f"{spill.path.stem}: indices must be in [0, {vertices.rows}) or [1, {vertices.rows}]")
+
+    if use_tetrahedra and "tetraVolume" not in data and args.mode != "failfast":
+        data["tetraVolume"] = export.tetra_volume()
+
+    placeholder = StreamedExport.PLACEHOLDER.format
+    return assemble_fixture(name, placeholder("vertices"), placeholder("faces"),
+                            placeholder("tetrahedra") if use_tetrahedra else None,
+                            tetrahedra.rows if use_tetrahedra else None, data, args)
+
+
 def main(argv: list[str]) -> int:
     args = parse_args(argv)
     src = Path(args.input)
@@ -139,21 +317,43 @@ def main(argv: list[str]) -> int:
         print(f"Input file not found: {src}", file=sys.stderr)
         return 2
 
-    try:
-        data = load_input(src)
-        fixture = build_fixture(data, args)
-    except Exception as exc:  # noqa: BLE001
-        print(f"Import failed: {exc}", file=sys.stderr)
-        return 3
-
-    out = FIXTURE_DIR / f"{fixture['name']}.json"
-    if out.exists() and not args.force:
-        print(f"Fixture exists: {out}. Use --force to overwrite.", file=sys.stderr)
-        return 4
-
-    out.write_text(json.dumps(fixture, indent=2) + "\n")
-    print(f"Created fixture: {out.relative_to(ROOT)}")
-    return 0
+    with ExitStack() as stack:
+        streamed = None
+        try:
+            if args.stream:
+                workdir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="m2t-import-")))
+                streamed = stream_input(src, workdir, args.chunk_chars)
+                fixture = build_streamed_fixture(streamed, args)
+            else:
+                data = load_input(src)
+                fixture = build_fixture(data, args)
+        except Exception as exc:  # noqa: BLE001
+            print(f"Import failed: {exc}", file=sys.stderr)
+            return 3
+
+        out = FIXTURE_DIR / f"{fixture['name']}.json"
+        if out.exists() and not args.force:
+            print(f"Fixture exists: {out}. Use --force to overwrite.", file=sys.stderr)
+            return 4
+
+        if args.binary:
+            sidecar = out.with_suffix(mesh_binary.EXTENSION)
+            exact = fixture["expected"].pop("exactTetrahedra", None)
+            if streamed is not None:
+                streamed.write_binary(sidecar, exact is not None)
+            else:
+                mesh_binary.write_mesh(sidecar, fixture["input"]["vertices"], fixture["input"]["faces"], exact)
+            fixture["input"] = {"binary": sidecar.name}
+            if exact is not None:
+                fixture["expected"]["exactTetrahedraInBinary"] = True
+            print(f"Wrote sidecar: {sidecar.relative_to(ROOT)}")
+
+        if streamed is not None:
+            streamed.write_json(out, fixture)
+        else:
+            out.write_text(json.dumps(fixture, indent=2) + "\n")
+        print(f"Created fixture: {out.relative_to(ROOT)}")
+        return 0
 
 
 if __name__ == "__main__":
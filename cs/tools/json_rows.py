@@ -0,0 +1,175 @@
+"""Incremental reader for JSON objects whose large members are arrays of fixed-width numeric rows.
+
+Matlab exports look like {"name": ..., "vertices": [[x, y, z], ...], "faces": [[a, b, c], ...]}.
+`iter_members` reads such an object in bounded chunks of text: members listed in `row_keys` are
+yielded as NumPy arrays of at most a chunk's worth of rows, every other member is decoded whole
+with `json` (they are expected to be small). Rows are validated with one regular expression per
+chunk and converted with NumPy, so nothing is parsed in a per-number Python loop.
+
+Requires NumPy.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import re
+from typing import IO, Any, Iterator
+
+DEFAULT_CHUNK_CHARS = 4 << 20
+
+_INT = r"-?(?:0|[1-9]\d*)"
+_NUM = r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?"
+_WS = re.compile(r"\s*")
+_ARRAY_END = re.compile(r"\]\s*\]")
+_TO_SPACES = str.maketrans("[],", "   ")
+_NUMBER_TAIL = re.compile(r"[-+.eE0-9]*")
+_DECODER = json.JSONDecoder()
+
+
+@dataclass(frozen=True)
+class RowSpec:
+    width: int
+    integer: bool
+
+
+@dataclass(frozen=True)
+class Member:
+    key: str
+    value: Any = None  # decoded value of an ordinary member
+    rows: Any = None  # numpy array (n, width) for a chunk of a row member; n may be 0
+
+
+def _rows_pattern(spec: RowSpec) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    number = _INT if spec.integer else _NUM
+    row = rf"\[\s*{number}(?:\s*,\s*{number}){{{spec.width - 1}}}\s*\]"
+    # Possessive repeats (Python 3.11+): a backtracking repeat keeps state for every row matched.
+    first = re.compile(rf"\s*{row}(?:\s*,\s*{row})*+\s*")
+    rest = re.compile(rf"(?:\s*,\s*{row})++\s*")
+    return first, rest
+
+
+class _Buffer:
+    def __init__(self, stream: IO[str], chunk_chars: int) -> None:
+        self.stream = stream
+        self.chunk_chars = chunk_chars
+        self.text = ""
+        self.pos = 0
+        self.consumed = 0  # characters dropped from the front of text
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        data = self.stream.read(self.chunk_chars)
+        if not data:
+            self.eof = True
+            return False
+        self.consumed += self.pos
+        self.text = self.text[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def where(self) -> str:
+        return f"character {self.consumed + self.pos}"
+
+    def peek(self) -> str:
+        """Next non-whitespace character (skipped), or "" at the end of the input."""
+        while True:
+            self.pos = _WS.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"expected {char!r} at {self.where()}, found {found or 'end of input'!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode one complete JSON value, reading more input until it is unambiguous."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise ValueError(f"invalid JSON value at {self.where()}") from None
+            # A number cut off by the chunk boundary decodes as a shorter number ("0." as 0), so
+            # read on while the rest of the buffer could still belong to it.
+            number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if number and _NUMBER_TAIL.fullmatch(self.text, end) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_members(stream: IO[str], row_keys: dict[str, RowSpec],
+                 chunk_chars: int = DEFAULT_CHUNK_CHARS) -> Iterator[Member]:
+    """Yield the members of the top-level JSON object in `stream` in file order."""
+    import numpy as np
+
+    buf = _Buffer(stream, chunk_chars)
+    patterns = {key: _rows_pattern(spec) for key, spec in row_keys.items()}
+    buf.expect("{")
+    if buf.peek() == "}":
+        buf.pos += 1
+        return
+
+    while True:
+        key = buf.value()
+        if not isinstance(key, str):
+            raise ValueError(f"object key expected before {buf.where()}")
+        buf.expect(":")
+
+        spec = row_keys.get(key)
+        if spec is None or buf.peek() != "[":
+            yield Member(key, value=buf.value())
+        else:
+            yield from _iter_rows(buf, key, spec, patterns[key], np)
+
+        if buf.peek() == ",":
+            buf.pos += 1
+            continue
+        buf.expect("}")
+        if buf.peek():
+            raise ValueError(f"unexpected data after the top-level object at {buf.where()}")
+        return
+
+
+def _iter_rows(buf: _Buffer, key: str, spec: RowSpec, patterns: tuple[re.Pattern[str], re.Pattern[str]],
+               np: Any) -> Iterator[Member]:
+    dtype = np.int64 if spec.integer else np.float64
+    first_pattern, rest_pattern = patterns
+    buf.expect("[")
+    first = True
+    while True:
+        if buf.peek() == "]":
+            buf.pos += 1
+            if first:
+                yield Member(key, rows=np.zeros((0, spec.width), dtype=dtype))
+            return
+
+        # Rows contain no brackets, so "]]" ends the array and otherwise the last "]" in the
+        # buffer ends the last complete row.
+        end_match = _ARRAY_END.search(buf.text, buf.pos)
+        end = end_match.start() + 1 if end_match else buf.text.rfind("]", buf.pos) + 1
+        if end == 0 or (end_match is None and end - buf.pos < buf.chunk_chars // 2 and not buf.eof):
+            if buf.fill():
+                continue
+            if end == 0:
+                raise ValueError(f"{key}: unterminated array at {buf.where()}")
+
+        segment = buf.text[buf.pos:end]
+        if not (first_pattern if first else rest_pattern).fullmatch(segment):
+            raise ValueError(f"{key}: rows must be arrays of {spec.width} "
+                             f"{'integers' if spec.integer else 'numbers'} (near {buf.where()})")
+        values = np.array(segment.translate(_TO_SPACES).split(), dtype=dtype)
+        buf.pos = end
+        first = False
+        yield Member(key, rows=values.reshape(-1, spec.width))
+        if end_match is not None:
+            buf.pos = end_match.end()
+            return
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Convert NumPy surface meshes with a resident converter process, without serializing the arrays.
+
+`Mesh2TetraClient` starts the batch host (GenMesh.Mesh2Tetra.BatchHost) once and keeps it running.
+For every mesh it lays out a .m2tb file in shared memory (/dev/shm when available, the temp
+directory otherwise), copies the vertex and face arrays into its mapped sections, and sends the
+host one JSON line naming that file and an output file. The host maps the input read-only, runs
+Mesh2TetraConverter.Convert and writes the tetrahedra to the output file, which the client maps
+back as an (n, 4) int32 array. Only the short control lines cross the pipe, so the per-mesh
+overhead is that of two small file mappings and one pipe round trip.
+
+Example:
+  from mesh2tetra_client import Mesh2TetraClient
+
+  with Mesh2TetraClient() as client:
+      tets = client.convert(vertices, faces)          # vertices (n, 3) float, faces (m, 3) int
+      tets = client.convert(vertices, faces, epsilon=1e-9, check_input=False)
+
+  python tools/mesh2tetra_client.py mesh.json [--repeat 100]   # times a fixture-format mesh
+
+Requires NumPy and a built batch host (`--build` / `build=True` builds it).
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    print("mesh2tetra_client.py requires NumPy: pip install -r tools/requirements.txt", file=sys.stderr)
+    raise SystemExit(2)
+
+import mesh_binary
+from run_batch import HOST_DLL, ROOT, build_host
+
+SHARED_MEMORY = Path("/dev/shm")
+
+# Keyword arguments of convert() and the request option they set (see BatchHost/BatchRequest.cs).
+OPTION_NAMES = {
+    "check_input": "checkInput",
+    "auto_resolve_intersections": "autoResolveIntersections",
+    "fail_on_self_intersections": "failOnSelfIntersections",
+    "plane_distance_tolerance": "planeDistanceTolerance",
+    "epsilon": "epsilon",
+    "time_budget_ms": "timeBudgetMs",
+}
+
+
+class ConversionError(RuntimeError):
+    """The host answered a request with an error (e.g. a self-intersecting input)."""
+
+    def __init__(self, error: str, message: str) -> None:
+        super().__init__(f"{error}: {message}")
+        self.error = error
+
+
+class PartialConversion(ConversionError):
+    """The conversion ran out of its time_budget_ms; tets holds the tetrahedra validated so far."""
+
+    def __init__(self, status: str, tets: np.ndarray) -> None:
+        super().__init__(status, f"stopped early with {len(tets)} tetrahedra")
+        self.status = status
+        self.tets = tets
+
+
+class Mesh2TetraClient:
+    def __init__(self, workers: int = 1, build: bool = False, host_dll: Path = HOST_DLL,
+                 directory: Path | None = None) -> None:
+        if build and build_host() != 0:
+            raise RuntimeError("dotnet build of the batch host failed")
+
+        base = directory or (SHARED_MEMORY if SHARED_MEMORY.is_dir() else None)
+        self._dir = Path(tempfile.mkdtemp(prefix="mesh2tetra-", dir=base))
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._host = subprocess.Popen(
+            ["dotnet", str(host_dll), "--workers", str(workers)],
+            cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1)
+
+    def convert(self, vertices: Any, faces: Any, **options: Any) -> np.ndarray:
+        """Tetrahedra of the closed surface (vertices (n, 3), faces (m, 3), 0-based) as an (k, 4)
+        int32 array. Options are the snake_case names in OPTION_NAMES. With time_budget_ms a
+        conversion that runs out of time raises PartialConversion carrying the partial result."""
+        vertices = np.asarray(vertices)
+        faces = np.asarray(faces)
+        if vertices.ndim != 2 or vertices.shape[1] != 3:
+            raise ValueError("vertices must have shape (n, 3)")
+        if faces.ndim != 2 or faces.shape[1] != 3:
+            raise ValueError("faces must have shape (m, 3)")
+        unknown = set(options) - set(OPTION_NAMES)
+        if unknown:
+            raise TypeError(f"unknown options: {sorted(unknown)}")
+
+        with self._lock:
+            request_id = f"m{next(self._ids)}"
+            source = self._dir / f"{request_id}-in{mesh_binary.EXTENSION}"
+            target = self._dir / f"{request_id}-out{mesh_binary.EXTENSION}"
+            try:
+                mesh = mesh_binary.create_mesh(source, vertices.shape[0], faces.shape[0])
+                mesh.vertices[:] = vertices
+                mesh.faces[:] = faces
+                del mesh
+
+                response = self._request({
+                    "id": request_id,
+                    "input": {"binary": str(source)},
+                    "options": {OPTION_NAMES[k]: v for k, v in options.items()},
+                    "output": str(target),
+                })
+                if not response["ok"]:
+                    raise ConversionError(response["error"], response["message"])
+
+                # The mapping outlives the file name, so the output can be unlinked right away.
+                tets = mesh_binary.open_mesh(target).tets
+                if response.get("status", "Completed") != "Completed":
+                    raise PartialConversion(response["status"], tets)
+                return tets
+            finally:
+                source.unlink(missing_ok=True)
+                target.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        if self._host.poll() is None:
+            assert self._host.stdin is not None
+            self._host.stdin.close()
+            self._host.wait()
+        for path in self._dir.glob("*"):
+            path.unlink(missing_ok=True)
+        self._dir.rmdir()
+
+    def __enter__(self) -> Mesh2TetraClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _request(self, request: dict) -> dict:
+        assert self._host.stdin is not None and self._host.stdout is not None
+        self._host.stdin.write(json.dumps(request) + "\n")
+        line = self._host.stdout.readline()
+        if not line:
+            raise RuntimeError(f"batch host exited with code {self._host.wait()}")
+        response = json.loads(line)
+        if response.get("id") != request["id"]:
+            raise RuntimeError(f"unexpected response {response.get('id')!r} for {request['id']!r}")
+        return response
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Convert a fixture-format mesh through the shared-memory client.")
+    p.add_argument("mesh", type=Path, help="Fixture-format JSON file with inline vertices and faces")
+    p.add_argument("--repeat", type=int, default=1, help="Convert the mesh this many times and report timings")
+    p.add_argument("--build", action="store_true", help="Run `dotnet build` of the batch host first")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    data = json.loads(args.mesh.read_text())
+    vertices = np.asarray(data["input"]["vertices"], dtype=np.float64)
+    faces = np.asarray(data["input"]["faces"], dtype=np.int32)
+
+    with Mesh2TetraClient(build=args.build) as client:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            tets = client.convert(vertices, faces)
+            times.append(time.perf_counter() - start)
+
+    print(f"{tets.shape[0]} tetrahedra; per call: first {times[0] * 1e3:.2f} ms, "
+          f"best {min(times) * 1e3:.3f} ms over {len(times)} call(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,174 @@
+"""Read and write the .m2tb binary mesh sidecar format.
+
+Layout (little-endian), shared with GenMesh.Mesh2Tetra/IO/BinaryMeshFile.cs:
+
+  offset  field
+       0  magic b"M2TMESH\\0"
+       8  version (uint32, currently 1)
+      12  flags (uint32, reserved, 0)
+      16  vertex count, face count, tetrahedron count (int64 each)
+      40  vertices, faces, tetrahedra section offsets (int64 each, 8-byte aligned)
+      64  float64 x, y, z per vertex | int32 a, b, c per face | int32 a, b, c, d per tetrahedron
+
+A fixture JSON refers to its sidecar with "input": {"binary": "<name>.m2tb"}. When
+"expected.exactTetrahedraInBinary" is true, the tetrahedron section holds the exact tetrahedra.
+
+`read_header` only reads the 64-byte header. `open_mesh` maps the sections with NumPy `memmap`
+(nothing is parsed or copied) and needs NumPy, as does `create_mesh`, which lays out an empty file
+and maps its sections writable for the caller to fill; `write_mesh` works with or without NumPy.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+import struct
+import sys
+from typing import Any, Iterable, Sequence
+
+EXTENSION = ".m2tb"
+MAGIC = b"M2TMESH\0"
+VERSION = 1
+HEADER = struct.Struct("<8sII6q")
+
+
+@dataclass(frozen=True)
+class MeshHeader:
+    vertex_count: int
+    face_count: int
+    tet_count: int
+    vertices_offset: int
+    faces_offset: int
+    tets_offset: int
+
+
+@dataclass(frozen=True)
+class BinaryMesh:
+    header: MeshHeader
+    vertices: Any  # numpy.memmap, shape (vertex_count, 3), float64
+    faces: Any  # numpy.memmap, shape (face_count, 3), int32
+    tets: Any  # numpy.memmap, shape (tet_count, 4), int32
+
+
+def _align8(value: int) -> int:
+    return (value + 7) & ~7
+
+
+def read_header(path: Path) -> MeshHeader:
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        raw = f.read(HEADER.size)
+    if len(raw) < HEADER.size:
+        raise ValueError(f"{path.name}: too short to be a {EXTENSION} file")
+
+    magic, version, _flags, nv, nf, nt, ov, of, ot = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path.name}: not a {EXTENSION} file (bad magic)")
+    if version != VERSION:
+        raise ValueError(f"{path.name}: unsupported {EXTENSION} version {version}")
+
+    header = MeshHeader(nv, nf, nt, ov, of, ot)
+    for label, count, width, offset in (("vertex", nv, 24, ov), ("face", nf, 12, of), ("tetrahedron", nt, 16, ot)):
+        if count < 0 or offset < HEADER.size or offset % 8 or offset + count * width > size:
+            raise ValueError(f"{path.name}: invalid {label} section")
+    return header
+
+
+def _numpy(action: str) -> Any:
+    try:
+        import numpy as np
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise RuntimeError(f"{action} {EXTENSION} mesh data requires NumPy (pip install numpy)") from exc
+    return np
+
+
+def _map_sections(path: Path, header: MeshHeader, mode: str) -> BinaryMesh:
+    np = _numpy("Mapping")
+
+    def section(dtype: str, offset: int, rows: int, width: int) -> Any:
+        if rows == 0:
+            return np.zeros((0, width), dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=(rows, width))
+
+    return BinaryMesh(
+        header,
+        section("<f8", header.vertices_offset, header.vertex_count, 3),
+        section("<i4", header.faces_offset, header.face_count, 3),
+        section("<i4", header.tets_offset, header.tet_count, 4),
+    )
+
+
+def open_mesh(path: Path) -> BinaryMesh:
+    _numpy("Reading")
+    return _map_sections(path, read_header(path), "r")
+
+
+def create_mesh(path: Path, vertex_count: int, face_count: int, tet_count: int = 0) -> BinaryMesh:
+    """Create a sidecar of the given size and map its sections writable (zero-filled), e.g.
+    `mesh.vertices[:] = points`. The mapping is shared, so other processes see the writes at once."""
+    _numpy("Writing")
+    vertices_offset = HEADER.size
+    faces_offset = _align8(vertices_offset + vertex_count * 24)
+    tets_offset = _align8(faces_offset + face_count * 12)
+    header = MeshHeader(vertex_count, face_count, tet_count, vertices_offset, faces_offset, tets_offset)
+
+    with path.open("wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, vertex_count, face_count, tet_count,
+                            vertices_offset, faces_offset, tets_offset))
+        f.truncate(tets_offset + tet_count * 16)
+    return _map_sections(path, header, "r+")
+
+
+def _flat(typecode: str, rows: Any, width: int) -> array:
+    """Pack rows (nested sequences or a NumPy array) into a little-endian array."""
+    if hasattr(rows, "astype"):
+        dtype = "<f8" if typecode == "d" else "<i4"
+        packed = array(typecode)
+        packed.frombytes(rows.astype(dtype, copy=False).reshape(-1, width).tobytes())
+        return packed
+
+    packed = array(typecode)
+    for i, row in enumerate(rows):
+        if len(row) != width:
+            raise ValueError(f"row {i} must have {width} entries")
+        packed.extend(row)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed
+
+
+def write_mesh(path: Path, vertices: Any, faces: Any, tets: Sequence[Sequence[int]] | Any | None = None) -> MeshHeader:
+    coords = _flat("d", vertices, 3)
+    face_idx = _flat("i", faces, 3)
+    tet_idx = _flat("i", tets if tets is not None else [], 4)
+    return write_mesh_chunks(path, len(coords) // 3, len(face_idx) // 3, len(tet_idx) // 4,
+                             [coords.tobytes()], [face_idx.tobytes()], [tet_idx.tobytes()])
+
+
+def write_mesh_chunks(path: Path, vertex_count: int, face_count: int, tet_count: int,
+                      vertices: Iterable[bytes], faces: Iterable[bytes], tets: Iterable[bytes]) -> MeshHeader:
+    """Write a sidecar whose sections arrive as chunks of little-endian bytes (float64 x, y, z and
+    int32 indices, e.g. `rows.astype("<f8").tobytes()`), for meshes too large to hold in memory."""
+    vertices_offset = HEADER.size
+    faces_offset = _align8(vertices_offset + vertex_count * 24)
+    tets_offset = _align8(faces_offset + face_count * 12)
+    header = MeshHeader(vertex_count, face_count, tet_count, vertices_offset, faces_offset, tets_offset)
+
+    with path.open("wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, vertex_count, face_count, tet_count,
+                            vertices_offset, faces_offset, tets_offset))
+        for label, chunks, end in (("vertex", vertices, vertices_offset + vertex_count * 24),
+                                   ("face", faces, faces_offset + face_count * 12),
+                                   ("tetrahedron", tets, tets_offset + tet_count * 16)):
+            f.write(b"\0" * (_align8(f.tell()) - f.tell()))
+            for chunk in chunks:
+                f.write(chunk)
+            if f.tell() != end:
+                raise ValueError(f"{path.name}: {label} section does not match its count")
+    return header
+
+
+def sidecar_path(fixture_path: Path, data: dict) -> Path | None:
+    """Return the sidecar referenced by a fixture's input block, or None for inline input."""
+    binary = data.get("input", {}).get("binary")
+    return fixture_path.parent / binary if binary else None
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Convert a directory of fixture-format JSON meshes through one long-lived converter process.
+
+The .NET batch host (GenMesh.Mesh2Tetra.BatchHost) is started once and fed one request per
+mesh over stdin, so `dotnet` startup and JIT are paid once per run instead of once per mesh.
+Responses arrive as meshes finish. Fixtures that carry an "expected" block are checked against
+it (tetra count, volume within tolerance, expected exception text).
+
+Examples:
+  python tools/run_batch.py
+  python tools/run_batch.py path/to/meshes --workers 8 --output results.jsonl
+  python tools/run_batch.py --no-check --emit-tetrahedra --output tets.jsonl
+  python tools/run_batch.py --trace trace.jsonl && python tools/trace_summary.py trace.jsonl
+  python tools/run_batch.py path/to/meshes --cache ~/.cache/mesh2tetra --cache-max-mb 4096
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURES = ROOT / "GenMesh.Mesh2Tetra.Tests" / "Fixtures"
+HOST_PROJECT = ROOT / "GenMesh.Mesh2Tetra.BatchHost"
+HOST_DLL = HOST_PROJECT / "bin" / "Release" / "net10.0" / "GenMesh.Mesh2Tetra.BatchHost.dll"
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Batch-convert fixture-format meshes in one converter process.")
+    p.add_argument("directory", nargs="?", type=Path, default=FIXTURES, help="Directory of fixture-format JSON files")
+    p.add_argument("--pattern", default="*.json", help="Glob pattern inside the directory (default: *.json)")
+    p.add_argument("--workers", type=int, default=-1, help="Converter worker count (-1 = one per processor)")
+    p.add_argument("--output", type=Path, help="Write every host response to this JSON Lines file")
+    p.add_argument("--emit-tetrahedra", action="store_true", help="Include tetra index lists in responses")
+    p.add_argument("--trace", type=Path, help="Write conversion activities to this JSON Lines file (see trace_summary.py)")
+    p.add_argument("--cache", type=Path, help="Reuse results from (and store them in) this cache directory")
+    p.add_argument("--cache-max-mb", type=int, help="Size limit of the cache directory (default: 1024)")
+    p.add_argument("--no-check", action="store_true", help="Do not compare results with fixture expectations")
+    p.add_argument("--no-build", action="store_true", help="Skip `dotnet build` of the batch host")
+    return p.parse_args(argv)
+
+
+def build_host() -> int:
+    cmd = ["dotnet", "build", str(HOST_PROJECT), "-c", "Release", "--nologo", "-v", "quiet"]
+    print(f"$ {' '.join(cmd)}")
+    return subprocess.run(cmd, cwd=ROOT).returncode
+
+
+def check(response: dict, expected: dict | None) -> str | None:
+    """Return a mismatch description, or None when the response satisfies the expectations."""
+    if not expected:
+        return None
+
+    exception = expected.get("expectedExceptionContains")
+    if exception:
+        if response["ok"]:
+            return f"expected exception containing {exception!r}, got {response['tetraCount']} tets"
+        if exception.lower() not in response["message"].lower():
+            return f"expected exception containing {exception!r}, got {response['message']!r}"
+        return None
+
+    if not response["ok"]:
+        return f"{response['error']}: {response['message']}"
+
+    count = expected.get("tetraCount")
+    if count is not None and response["tetraCount"] != count:
+        return f"tetraCount {response['tetraCount']} != {count}"
+
+    delta = abs(response["tetraVolume"] - expected["tetraVolume"])
+    if delta > expected.get("volumeTolerance", 1e-8):
+        return f"tetraVolume {response['tetraVolume']:.12g} != {expected['tetraVolume']:.12g}"
+
+    return None
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+
+    paths = sorted(args.directory.glob(args.pattern))
+    if not paths:
+        print(f"No files matching {args.pattern} in {args.directory}")
+        return 1
+
+    if not args.no_build:
+        rc = build_host()
+        if rc != 0:
+            return rc
+
+    cmd = ["dotnet", str(HOST_DLL), "--workers", str(args.workers)]
+    if args.emit_tetrahedra:
+        cmd.append("--emit-tetrahedra")
+    if args.trace:
+        cmd += ["--trace", str(args.trace.resolve())]
+    if args.cache:
+        cmd += ["--cache", str(args.cache.resolve())]
+        if args.cache_max_mb is not None:
+            cmd += ["--cache-max-mb", str(args.cache_max_mb)]
+
+    ids = {str(path.relative_to(args.directory)): path for path in paths}
+    host = subprocess.Popen(cmd, cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1)
+
+    # Feed requests from a separate thread so a full stdout pipe can never block the host while
+    # this process is still writing to its stdin.
+    def feed() -> None:
+        assert host.stdin is not None
+        for request_id, path in ids.items():
+            host.stdin.write(json.dumps({"id": request_id, "path": str(path.resolve())}) + "\n")
+        host.stdin.close()
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+
+    out = args.output.open("w") if args.output else None
+    failures = 0
+    answered = 0
+    total_ms = 0.0
+    try:
+        assert host.stdout is not None
+        for line in host.stdout:
+            response = json.loads(line)
+            answered += 1
+            total_ms += response.get("elapsedMs", 0.0)
+            if out:
+                out.write(line)
+
+            expected = None
+            if not args.no_check and response["id"] in ids:
+                expected = json.loads(ids[response["id"]].read_text()).get("expected")
+            mismatch = check(response, expected)
+            if mismatch:
+                failures += 1
+                print(f"FAIL {response['id']}: {mismatch}")
+            elif response["ok"]:
+                print(f"ok   {response['id']}: {response['tetraCount']} tets in {response['elapsedMs']:.1f} ms")
+            else:
+                print(f"err  {response['id']}: {response['error']}: {response['message']}")
+    finally:
+        if out:
+            out.close()
+
+    feeder.join()
+    rc = host.wait()
+    if rc != 0:
+        print(f"\nBatch host exited with code {rc}.")
+        return rc
+
+    missing = len(ids) - answered
+    print(f"\n{answered}/{len(ids)} meshes answered, {failures} failed checks, {total_ms / 1000:.2f} s converter time.")
+    return 1 if failures or missing else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Run the per-phase conversion benchmark and compare it against a recorded baseline.
+
+The benchmark (`GenMesh.Mesh2Tetra.Benchmarks phases`) times preprocessing, Delaunay and
+boundary collapse on every fixture and on synthetic UV spheres, recording the median and fastest
+wall time, the allocated bytes and the tetra count per case. Wall-time checks use the fastest run,
+which is much less sensitive to machine noise than the median. This script:
+
+  - records a baseline with --update-baseline (run it on the reference machine and commit the file);
+  - otherwise fails when a phase is slower than baseline * (1 + --threshold) and also at least
+    --min-ms slower, when a phase allocates more than baseline * (1 + --alloc-threshold), when
+    the tetra count of a case changes, or when a case that used to convert now fails.
+
+Examples:
+  python tools/run_benchmarks.py --update-baseline
+  python tools/run_benchmarks.py
+  python tools/run_benchmarks.py --threshold 0.5 --filter sphere
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+BENCH_PROJECT = ROOT / "GenMesh.Mesh2Tetra.Benchmarks"
+BENCH_DLL = BENCH_PROJECT / "bin" / "Release" / "net10.0" / "GenMesh.Mesh2Tetra.Benchmarks.dll"
+BASELINE = BENCH_PROJECT / "baseline.json"
+
+# Allocation growth below this is treated as noise (runtime and GC bookkeeping).
+MIN_ALLOC_BYTES = 64 * 1024
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Per-phase benchmark with a regression check against a baseline.")
+    p.add_argument("--baseline", type=Path, default=BASELINE, help="Baseline JSON file")
+    p.add_argument("--update-baseline", action="store_true", help="Record the current results as the baseline")
+    p.add_argument("--threshold", type=float, default=0.25, help="Allowed relative wall-time growth per phase (default: 0.25)")
+    p.add_argument("--min-ms", type=float, default=2.0, help="Ignore wall-time growth smaller than this (default: 2.0 ms)")
+    p.add_argument("--alloc-threshold", type=float, default=0.10, help="Allowed relative allocation growth per phase (default: 0.10)")
+    p.add_argument("--sizes", help="Synthetic sphere face counts, e.g. 1000,4000 (default: the benchmark's own)")
+    p.add_argument("--repeat", type=int, default=5, help="Timed runs per case after one warm-up run (default: 5)")
+    p.add_argument("--filter", help="Only run cases whose name contains this text")
+    p.add_argument("--no-build", action="store_true", help="Skip `dotnet build` of the benchmark project")
+    return p.parse_args(argv)
+
+
+def build() -> int:
+    cmd = ["dotnet", "build", str(BENCH_PROJECT), "-c", "Release", "--nologo", "-v", "quiet"]
+    print(f"$ {' '.join(cmd)}")
+    return subprocess.run(cmd, cwd=ROOT).returncode
+
+
+def run_benchmark(args: argparse.Namespace, output: Path) -> int:
+    cmd = ["dotnet", str(BENCH_DLL), "phases", "--repeat", str(args.repeat), "--output", str(output)]
+    if args.sizes:
+        cmd += ["--sizes", args.sizes]
+    if args.filter:
+        cmd += ["--filter", args.filter]
+    print(f"$ {' '.join(cmd)}")
+    return subprocess.run(cmd, cwd=ROOT).returncode
+
+
+def compare(baseline: dict, current: dict, args: argparse.Namespace) -> tuple[list[str], list[str]]:
+    """Return (regressions, notes)."""
+    regressions: list[str] = []
+    notes: list[str] = []
+
+    for key in ("runtime", "os", "processorCount"):
+        if baseline.get(key) != current.get(key):
+            notes.append(f"{key} differs from the baseline: {baseline.get(key)!r} -> {current.get(key)!r}")
+
+    base_cases = {c["name"]: c for c in baseline["cases"]}
+    for case in current["cases"]:
+        name = case["name"]
+        base = base_cases.pop(name, None)
+        if base is None:
+            notes.append(f"{name}: not in the baseline")
+            continue
+        if case["error"] is not None:
+            if base["error"] is None:
+                regressions.append(f"{name}: conversion now fails: {case['error']}")
+            continue
+        if base["error"] is not None:
+            notes.append(f"{name}: converts now (failed in the baseline)")
+            continue
+        if case["tetrahedra"] != base["tetrahedra"]:
+            regressions.append(f"{name}: tetra count {base['tetrahedra']} -> {case['tetrahedra']}")
+
+        for phase, sample in case["phases"].items():
+            ref = base["phases"].get(phase)
+            if ref is None:
+                continue
+            ms, ref_ms = sample["minMilliseconds"], ref["minMilliseconds"]
+            if ms > ref_ms * (1 + args.threshold) and ms - ref_ms >= args.min_ms:
+                regressions.append(f"{name}/{phase}: {ref_ms:.3f} ms -> {ms:.3f} ms (+{(ms / ref_ms - 1) * 100:.0f}%)")
+            alloc, ref_alloc = sample["allocatedBytes"], ref["allocatedBytes"]
+            if alloc > ref_alloc * (1 + args.alloc_threshold) and alloc - ref_alloc >= MIN_ALLOC_BYTES:
+                regressions.append(f"{name}/{phase}: allocated {ref_alloc / 1024:.0f} KB -> {alloc / 1024:.0f} KB")
+
+    if not args.filter:
+        notes.extend(f"{name}: in the baseline but not run" for name in sorted(base_cases))
+    return regressions, notes
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+
+    if not args.update_baseline and not args.baseline.exists():
+        print(f"No baseline at {args.baseline}. Record one with: python tools/run_benchmarks.py --update-baseline")
+        return 2
+
+    if not args.no_build:
+        rc = build()
+        if rc != 0:
+            return rc
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "phases.json"
+        rc = run_benchmark(args, output)
+        if rc != 0:
+            return rc
+        current = json.loads(output.read_text())
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline} ({len(current['cases'])} cases).")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions, notes = compare(baseline, current, args)
+    for note in notes:
+        print(f"note: {note}")
+
+    if regressions:
+        print("Benchmark regressions:")
+        for r in regressions:
+            print(f" - {r}")
+        return 1
+
+    print(f"No benchmark regressions ({len(current['cases'])} cases, threshold {args.threshold:.0%}).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -6,9 +6,13 @@ Default checks:
 2) Fixture catalog freshness
 3) dotnet test
 
+Optional:
+4) --bench: per-phase benchmark against the recorded baseline (tools/run_benchmarks.py)
+
 Examples:
   python tools/run_regression_gate.py
   python tools/run_regression_gate.py --skip-dotnet
+  python tools/run_regression_gate.py --bench --bench-threshold 0.3
 """
 
 from __future__ import annotations
@@ -44,6 +48,8 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Run regression gate checks for Mesh2Tetra.")
     p.add_argument("--skip-dotnet", action="store_true", help="Skip dotnet test execution")
     p.add_argument("--skip-catalog", action="store_true", help="Skip fixture catalog freshness check")
+    p.add_argument("--bench", action="store_true", help="Fail when a conversion phase regresses against the benchmark baseline")
+    p.add_argument("--bench-threshold", type=float, default=0.25, help="Allowed relative wall-time growth per phase (default: 0.25)")
     return p.parse_args(argv)
 
 
@@ -64,6 +70,11 @@ def main(argv: list[str]) -> int:
         if rc != 0:
             return rc
 
+    if args.bench:
+        rc = run([sys.executable, "tools/run_benchmarks.py", "--threshold", str(args.bench_threshold)], ROOT)
+        if rc != 0:
+            return rc
+
     print("\nRegression gate passed.")
     return 0
 
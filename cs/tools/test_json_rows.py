@@ -0,0 +1,47 @@
+"""Tests for json_rows. Run from cs/tools: python -m unittest test_json_rows"""
+from __future__ import annotations
+
+import io
+import unittest
+
+import numpy as np
+
+from json_rows import RowSpec, iter_members
+
+ROW_KEYS = {"vertices": RowSpec(3, integer=False), "faces": RowSpec(3, integer=True)}
+
+DOCUMENT = (
+    '{"name": "split numbers", "scale": 1.0e-3,\n'
+    ' "vertices": [[0.0, 0.5, -1.25e2], [1E+1, 0.166666666666, 3], [-0.001, 2.5e-7, 10]],\n'
+    ' "faces": [[0, 1, 2], [2, 1, 0]],\n'
+    ' "tetraVolume": 0.16666666666666666, "tetraCount": 12, "tolerance": -1.5E-12,\n'
+    ' "flags": [true, null, 7.25], "last": 3}'
+)
+
+
+def parse(text: str, chunk_chars: int) -> dict:
+    members: dict = {}
+    for member in iter_members(io.StringIO(text), ROW_KEYS, chunk_chars=chunk_chars):
+        if member.rows is not None:
+            members.setdefault(member.key, []).append(member.rows)
+        else:
+            members[member.key] = member.value
+    for key in ROW_KEYS:
+        if key in members:
+            members[key] = np.concatenate(members[key]).tolist()
+    return members
+
+
+class IterMembersTests(unittest.TestCase):
+    def test_chunk_boundaries_do_not_change_the_result(self) -> None:
+        expected = parse(DOCUMENT, len(DOCUMENT) + 1)
+        self.assertEqual(expected["tetraVolume"], 0.16666666666666666)
+        self.assertEqual(expected["tolerance"], -1.5e-12)
+        self.assertEqual(expected["vertices"][1], [10.0, 0.166666666666, 3.0])
+        for chunk_chars in range(1, len(DOCUMENT) + 1):
+            with self.subTest(chunk_chars=chunk_chars):
+                self.assertEqual(parse(DOCUMENT, chunk_chars), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
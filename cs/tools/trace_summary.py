@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Summarize a Mesh2Tetra activity trace (JSON Lines from TraceFileWriter / BatchHost --trace).
+
+Prints a flame-style call tree aggregated over all meshes (total and self time per stack of
+activity names, e.g. Convert > Delaunay > DelaunayComponent > DelaunayComponent), followed by
+the slowest meshes with the counts that usually explain them: boundary-collapse candidates and
+rejections per reason, retry rounds, Delaunay recursion depth and component sizes.
+
+`--folded` prints folded stacks ("a;b;c <microseconds>") instead, for flamegraph.pl or speedscope.
+
+Examples:
+  python tools/run_batch.py --trace trace.jsonl
+  python tools/trace_summary.py trace.jsonl
+  python tools/trace_summary.py trace.jsonl --mesh matlab_irregular_closed_shell_dense_01.json
+  python tools/trace_summary.py trace.jsonl --folded > trace.folded
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import sys
+
+
+@dataclass
+class Span:
+    name: str
+    id: str
+    parent_id: str | None
+    duration_ms: float
+    status: str
+    tags: dict
+    events: list
+    children: list["Span"] = field(default_factory=list)
+
+    @property
+    def self_ms(self) -> float:
+        return max(0.0, self.duration_ms - sum(c.duration_ms for c in self.children))
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+@dataclass
+class Node:
+    total_ms: float = 0.0
+    self_ms: float = 0.0
+    calls: int = 0
+    children: dict[str, "Node"] = field(default_factory=dict)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Flame-style summary of a Mesh2Tetra activity trace.")
+    p.add_argument("trace", type=Path, help="JSON Lines trace file")
+    p.add_argument("--mesh", help="Only summarize the mesh with this id")
+    p.add_argument("--slowest", type=int, default=10, help="Number of slowest meshes to detail (default: 10)")
+    p.add_argument("--min-percent", type=float, default=0.5, help="Hide tree nodes below this share of total time")
+    p.add_argument("--folded", action="store_true", help="Print folded stacks for flame graph tools")
+    return p.parse_args(argv)
+
+
+def load(path: Path) -> list[Span]:
+    """Return the root spans (one per mesh) with their children attached in start order."""
+    spans: dict[str, Span] = {}
+    order: list[tuple[str, Span]] = []
+    with path.open(encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                raw = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path.name}:{line_number}: {exc}") from exc
+            span = Span(raw["name"], raw["id"], raw.get("parentId"), raw["durationMs"], raw.get("status", "ok"),
+                        raw.get("tags", {}), raw.get("events", []))
+            spans[span.id] = span
+            order.append((raw["start"], span))
+
+    roots = []
+    for _, span in sorted(order, key=lambda x: x[0]):
+        parent = spans.get(span.parent_id) if span.parent_id else None
+        if parent is None:
+            roots.append(span)
+        else:
+            parent.children.append(span)
+    return roots
+
+
+def mesh_id(root: Span, index: int) -> str:
+    return str(root.tags.get("id") or f"{root.name}#{index}")
+
+
+def aggregate(roots: list[Span]) -> Node:
+    top = Node()
+    for root in roots:
+        add(top, root)
+        top.total_ms += root.duration_ms
+    return top
+
+
+def add(parent: Node, span: Span) -> None:
+    node = parent.children.setdefault(span.name, Node())
+    node.total_ms += span.duration_ms
+    node.self_ms += span.self_ms
+    node.calls += 1
+    for child in span.children:
+        add(node, child)
+
+
+def print_tree(top: Node, min_percent: float) -> None:
+    total = top.total_ms or 1.0
+    print(f"{'total ms':>12} {'self ms':>10} {'calls':>7}  {'share':<22} stack")
+
+    def visit(name: str, node: Node, depth: int) -> None:
+        share = node.total_ms / total * 100
+        if share < min_percent:
+            return
+        bar = "#" * max(1, round(share / 5))
+        print(f"{node.total_ms:12.2f} {node.self_ms:10.2f} {node.calls:7d}  {share:5.1f}% {bar:<15} {'  ' * depth}{name}")
+        for child_name, child in sorted(node.children.items(), key=lambda kv: -kv[1].total_ms):
+            visit(child_name, child, depth + 1)
+
+    for name, node in sorted(top.children.items(), key=lambda kv: -kv[1].total_ms):
+        visit(name, node, 0)
+
+
+def print_folded(roots: list[Span]) -> None:
+    stacks: dict[str, float] = {}
+
+    def visit(span: Span, prefix: str) -> None:
+        stack = f"{prefix};{span.name}" if prefix else span.name
+        stacks[stack] = stacks.get(stack, 0.0) + span.self_ms
+        for child in span.children:
+            visit(child, stack)
+
+    for root in roots:
+        visit(root, "")
+    for stack, ms in sorted(stacks.items()):
+        print(f"{stack} {round(ms * 1000)}")
+
+
+def mesh_details(root: Span) -> str:
+    phases = {s.name: s.duration_ms for s in root.walk() if s.name in ("Preprocessing", "Delaunay", "BoundaryCollapse")}
+    parts = [", ".join(f"{name} {ms:.1f} ms" for name, ms in phases.items())]
+
+    components = [s for s in root.walk() if s.name == "DelaunayComponent"]
+    if components:
+        depth = max(int(s.tags.get("depth", 0)) for s in components)
+        largest = max(int(s.tags.get("faces", 0)) for s in components)
+        outcomes: dict[str, int] = {}
+        for s in components:
+            outcomes[s.tags.get("outcome", "?")] = outcomes.get(s.tags.get("outcome", "?"), 0) + 1
+        parts.append(f"Delaunay: {len(components)} components, max depth {depth}, largest {largest} faces, "
+                     + ", ".join(f"{k} {v}" for k, v in sorted(outcomes.items())))
+
+    for s in root.walk():
+        if s.name != "BoundaryCollapse" or "candidates" not in s.tags:
+            continue
+        rejected = {k.split(".", 1)[1]: v for k, v in s.tags.items()
+                    if k.startswith("candidates.") and k != "candidates.accepted" and v}
+        line = (f"collapse: {s.tags['candidates']} candidates, {s.tags.get('candidates.accepted', 0)} accepted, "
+                f"{s.tags.get('retryRounds', 0)} retry rounds")
+        if rejected:
+            line += "; rejected " + ", ".join(f"{k} {v}" for k, v in sorted(rejected.items(), key=lambda kv: -kv[1]))
+        if s.tags.get("exhausted"):
+            line += "; exhausted"
+        if s.tags.get("fallback"):
+            line += "; kept Delaunay result"
+        parts.append(line)
+
+    return "\n      ".join(parts)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    try:
+        roots = load(args.trace)
+    except (OSError, ValueError, KeyError) as exc:
+        print(f"Cannot read trace: {exc}", file=sys.stderr)
+        return 2
+
+    named = [(mesh_id(root, i), root) for i, root in enumerate(roots)]
+    if args.mesh:
+        named = [(name, root) for name, root in named if name == args.mesh]
+        if not named:
+            print(f"No mesh with id {args.mesh!r} in {args.trace}", file=sys.stderr)
+            return 1
+    roots = [root for _, root in named]
+
+    if args.folded:
+        print_folded(roots)
+        return 0
+
+    top = aggregate(roots)
+    durations = sorted(root.duration_ms for root in roots)
+    median = durations[len(durations) // 2] if durations else 0.0
+    print(f"{len(roots)} mesh(es), {top.total_ms:.1f} ms in total, median {median:.2f} ms per mesh\n")
+    print_tree(top, args.min_percent)
+
+    print("\nSlowest meshes (x median):")
+    for name, root in sorted(named, key=lambda x: -x[1].duration_ms)[: args.slowest]:
+        ratio = root.duration_ms / median if median else 0.0
+        status = "" if root.status == "ok" else f" [{root.status}]"
+        print(f"  {root.duration_ms:10.2f} ms  x{ratio:<7.1f} {name}{status}")
+        print(f"      {mesh_details(root)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -1,17 +1,41 @@
 #!/usr/bin/env python3
-"""Lightweight validator for JSON regression fixtures.
+"""Validator for JSON regression fixtures.
+
+Mesh arrays are checked with NumPy array operations: shape, dtype, finiteness, index range,
+repeated-index faces and exact-tetrahedron indices. Two topology checks run on the face array
+and are reported as warnings (errors with --strict), because fail-fast and cleanup fixtures
+break them on purpose:
+  - orientation balance: every directed edge a->b is matched by as many b->a edges
+    (same rule as GeometryPredicates.HasOrientationImbalance);
+  - closed manifold: every undirected edge is shared by exactly two faces.
+
+Fixtures are listed through the shared fixture index (fixture_index.py), and results are cached
+by content hash (fixture JSON + binary sidecar + this validator's source), so unchanged fixtures
+are skipped on the next run. Changed fixtures are validated in a process pool.
 
 Usage:
-  python cs/tools/validate_fixtures.py
+  python cs/tools/validate_fixtures.py [--strict] [--no-cache] [--jobs N]
 """
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
 from pathlib import Path
 import sys
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    print("validate_fixtures.py requires NumPy: pip install -r tools/requirements.txt", file=sys.stderr)
+    raise SystemExit(2)
+
+import fixture_index
+import mesh_binary
+
 ROOT = Path(__file__).resolve().parents[1]
-FIXTURES = ROOT / "GenMesh.Mesh2Tetra.Tests" / "Fixtures"
+FIXTURES = fixture_index.FIXTURES
+CACHE = ROOT / ".cache" / "validate_fixtures.json"
 
 REQUIRED_TOP = {"name", "input", "expected", "options"}
 REQUIRED_INPUT = {"vertices", "faces"}
@@ -23,7 +47,112 @@ def fail(path: Path, message: str) -> None:
     raise ValueError(f"{path.name}: {message}")
 
 
-def validate_fixture(path: Path) -> None:
+def as_rows(path: Path, label: str, rows: object, width: int, kind: str) -> np.ndarray:
+    """Convert nested JSON rows into a (n, width) array whose dtype kind is `kind` ('f' or 'i')."""
+    if not isinstance(rows, list):
+        fail(path, f"{label} must be an array")
+    try:
+        array = np.asarray(rows)
+    except ValueError:
+        fail(path, f"{label} rows must all have {width} entries")
+
+    if array.size == 0:
+        return array.reshape(0, width).astype(np.float64 if kind == "f" else np.int64)
+    if array.ndim != 2 or array.shape[1] != width:
+        fail(path, f"{label} must be rows of {width} entries")
+
+    # JSON ints and floats both satisfy a float array; faces must be ints (no floats, no bools).
+    if kind == "f" and array.dtype.kind in "iuf":
+        return array.astype(np.float64, copy=False)
+    if kind == "i" and array.dtype.kind in "iu":
+        return array
+    fail(path, f"{label} must be {'numeric' if kind == 'f' else 'integer'}")
+
+
+def check_indices(path: Path, label: str, indices: np.ndarray, n_vertices: int) -> None:
+    if indices.size == 0:
+        return
+    bad = np.flatnonzero(((indices < 0) | (indices >= n_vertices)).any(axis=1))
+    if bad.size:
+        fail(path, f"{label}[{bad[0]}] has out-of-range indices ({bad.size} rows)")
+
+
+def check_mesh(path: Path, vertices: np.ndarray, faces: np.ndarray, epsilon: float) -> list[str]:
+    """Array-level checks; returns topology warnings."""
+    if vertices.shape[0] < 4:
+        fail(path, "input.vertices must have at least 4 entries")
+    if faces.shape[0] < 4:
+        fail(path, "input.faces must have at least 4 entries")
+
+    bad = np.flatnonzero(~np.isfinite(vertices).all(axis=1))
+    if bad.size:
+        fail(path, f"vertex[{bad[0]}] is not finite ({bad.size} rows)")
+
+    check_indices(path, "face", faces, vertices.shape[0])
+
+    a, b, c = faces[:, 0], faces[:, 1], faces[:, 2]
+    bad = np.flatnonzero((a == b) | (b == c) | (a == c))
+    if bad.size:
+        fail(path, f"face[{bad[0]}] repeats a vertex ({bad.size} rows)")
+
+    warnings: list[str] = []
+
+    # Twice the face area, as in MeshPreprocessing.IsDegenerateByArea.
+    p, q, r = vertices[a], vertices[b], vertices[c]
+    area2 = np.linalg.norm(np.cross(q - p, r - p), axis=1)
+    degenerate = np.flatnonzero(area2 <= epsilon)
+    if degenerate.size:
+        warnings.append(f"{degenerate.size} zero-area face(s), first face[{degenerate[0]}]")
+
+    # Directed edges encoded as from * n + to; counts of each edge and of its reverse must match.
+    n = np.int64(vertices.shape[0])
+    src = faces.astype(np.int64)
+    dst = np.roll(src, -1, axis=1)
+    directed = (src * n + dst).ravel()
+    keys, counts = np.unique(directed, return_counts=True)
+    reverse = (keys % n) * n + keys // n
+    at = np.searchsorted(keys, reverse)
+    at_clipped = np.minimum(at, keys.size - 1)
+    reverse_counts = np.where(keys[at_clipped] == reverse, counts[at_clipped], 0)
+    unbalanced = int(np.count_nonzero(counts != reverse_counts))
+    if unbalanced:
+        warnings.append(f"orientation imbalance on {unbalanced} directed edge(s)")
+
+    undirected = (np.minimum(src, dst) * n + np.maximum(src, dst)).ravel()
+    _, uses = np.unique(undirected, return_counts=True)
+    open_edges = int(np.count_nonzero(uses == 1))
+    non_manifold = int(np.count_nonzero(uses > 2))
+    if open_edges or non_manifold:
+        warnings.append(f"not a closed manifold: {open_edges} boundary edge(s), {non_manifold} edge(s) shared by 3+ faces")
+
+    return warnings
+
+
+def load_mesh(path: Path, data: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """Return (vertices, faces, sidecar tetrahedra or None)."""
+    fi = data["input"]
+    if "binary" not in fi:
+        missing = REQUIRED_INPUT - set(fi.keys())
+        if missing:
+            fail(path, f"input missing keys: {sorted(missing)}")
+        return as_rows(path, "input.vertices", fi["vertices"], 3, "f"), as_rows(path, "input.faces", fi["faces"], 3, "i"), None
+
+    if set(fi.keys()) != {"binary"}:
+        fail(path, "input must only contain 'binary' when a sidecar is used")
+    if not isinstance(fi["binary"], str) or not fi["binary"].endswith(mesh_binary.EXTENSION):
+        fail(path, f"input.binary must be a {mesh_binary.EXTENSION} file name")
+
+    sidecar = mesh_binary.sidecar_path(path, data)
+    if not sidecar.exists():
+        fail(path, f"binary sidecar not found: {sidecar.name}")
+    try:
+        mesh = mesh_binary.open_mesh(sidecar)
+    except ValueError as exc:
+        fail(path, str(exc))
+    return mesh.vertices, mesh.faces, mesh.tets
+
+
+def validate_fixture(path: Path) -> list[str]:
     data = json.loads(path.read_text())
 
     missing = REQUIRED_TOP - set(data.keys())
@@ -33,28 +162,18 @@ def validate_fixture(path: Path) -> None:
     if not isinstance(data["name"], str) or not data["name"].strip():
         fail(path, "name must be a non-empty string")
 
-    fi = data["input"]
-    missing = REQUIRED_INPUT - set(fi.keys())
+    options = data["options"]
+    missing = REQUIRED_OPTIONS - set(options.keys())
     if missing:
-        fail(path, f"input missing keys: {sorted(missing)}")
-
-    vertices = fi["vertices"]
-    faces = fi["faces"]
-    if not isinstance(vertices, list) or len(vertices) < 4:
-        fail(path, "input.vertices must be an array with at least 4 entries")
-    if not isinstance(faces, list) or len(faces) < 4:
-        fail(path, "input.faces must be an array with at least 4 entries")
-
-    for i, v in enumerate(vertices):
-        if not (isinstance(v, list) and len(v) == 3 and all(isinstance(x, (int, float)) for x in v)):
-            fail(path, f"vertex[{i}] must be [x,y,z] numeric")
-
-    n_vertices = len(vertices)
-    for i, f in enumerate(faces):
-        if not (isinstance(f, list) and len(f) == 3 and all(isinstance(x, int) for x in f)):
-            fail(path, f"face[{i}] must be [a,b,c] integer indices")
-        if any(x < 0 or x >= n_vertices for x in f):
-            fail(path, f"face[{i}] has out-of-range indices")
+        fail(path, f"options missing keys: {sorted(missing)}")
+
+    for key in ("planeDistanceTolerance", "epsilon"):
+        if not isinstance(options[key], (int, float)) or options[key] < 0:
+            fail(path, f"options.{key} must be non-negative numeric")
+
+    vertices, faces, binary_tets = load_mesh(path, data)
+    warnings = check_mesh(path, vertices, faces, float(options["epsilon"]))
+    n_vertices = vertices.shape[0]
 
     expected = data["expected"]
     missing = REQUIRED_EXPECTED - set(expected.keys())
@@ -68,28 +187,33 @@ def validate_fixture(path: Path) -> None:
 
     tetra_count = expected.get("tetraCount")
     exact = expected.get("exactTetrahedra")
+    exact_in_binary = expected.get("exactTetrahedraInBinary", False)
     exception = expected.get("expectedExceptionContains")
 
     if tetra_count is not None and (not isinstance(tetra_count, int) or tetra_count < 0):
         fail(path, "expected.tetraCount must be null/omitted or a non-negative integer")
 
-    if exact is not None:
-        if not isinstance(exact, list):
-            fail(path, "expected.exactTetrahedra must be an array when present")
-        for i, tet in enumerate(exact):
-            if not (isinstance(tet, list) and len(tet) == 4 and all(isinstance(x, int) for x in tet)):
-                fail(path, f"expected.exactTetrahedra[{i}] must be [a,b,c,d] integer indices")
-        if tetra_count is not None and tetra_count != len(exact):
-            fail(path, "expected.tetraCount must equal expected.exactTetrahedra length when both are present")
+    if not isinstance(exact_in_binary, bool):
+        fail(path, "expected.exactTetrahedraInBinary must be boolean when present")
+    if exact_in_binary:
+        if binary_tets is None:
+            fail(path, "expected.exactTetrahedraInBinary requires a binary input")
+        if exact is not None:
+            fail(path, "expected.exactTetrahedra must be omitted when exactTetrahedraInBinary is set")
+        exact_rows = binary_tets
+    elif exact is not None:
+        exact_rows = as_rows(path, "expected.exactTetrahedra", exact, 4, "i")
+    else:
+        exact_rows = None
+
+    if exact_rows is not None:
+        check_indices(path, "expected.exactTetrahedra", exact_rows, n_vertices)
+        if tetra_count is not None and tetra_count != exact_rows.shape[0]:
+            fail(path, "expected.tetraCount must equal the number of exact tetrahedra when both are present")
 
     if exception is not None and (not isinstance(exception, str) or not exception.strip()):
         fail(path, "expected.expectedExceptionContains must be a non-empty string when present")
 
-    options = data["options"]
-    missing = REQUIRED_OPTIONS - set(options.keys())
-    if missing:
-        fail(path, f"options missing keys: {sorted(missing)}")
-
     if not isinstance(options["checkInput"], bool):
         fail(path, "options.checkInput must be boolean")
 
@@ -107,23 +231,86 @@ def validate_fixture(path: Path) -> None:
     if legacy is None and auto_resolve is None and fail_on is None:
         fail(path, "options must include checkSelfIntersections or explicit autoResolveIntersections/failOnSelfIntersections flags")
 
-    for key in ("planeDistanceTolerance", "epsilon"):
-        if not isinstance(options[key], (int, float)) or options[key] < 0:
-            fail(path, f"options.{key} must be non-negative numeric")
+    return warnings
+
+
+def validate_or_error(path: Path) -> tuple[list[str], str | None]:
+    """validate_fixture for a worker process: (warnings, None) or ([], error message)."""
+    try:
+        return validate_fixture(path), None
+    except Exception as exc:  # noqa: BLE001
+        return [], str(exc)
 
 
-def main() -> int:
-    fixture_files = sorted(FIXTURES.glob("*.json"))
-    if not fixture_files:
+def load_cache() -> dict:
+    try:
+        return json.loads(CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: dict) -> None:
+    try:
+        CACHE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE.write_text(json.dumps(cache, indent=1, sort_keys=True))
+    except OSError as exc:
+        print(f"warning: could not write {CACHE}: {exc}", file=sys.stderr)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Validate Mesh2Tetra regression fixtures.")
+    p.add_argument("--strict", action="store_true", help="Treat topology warnings as errors")
+    p.add_argument("--no-cache", action="store_true", help="Revalidate every fixture and do not update the cache")
+    p.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    index = fixture_index.load_index(FIXTURES, jobs=args.jobs, refresh=args.no_cache)
+    if not index:
         print("No fixture files found.")
         return 1
 
+    # Changing this file or the binary reader invalidates every cached result.
+    salt = hashlib.sha256(Path(__file__).read_bytes() + Path(mesh_binary.__file__).read_bytes()).hexdigest()
+    cache = {} if args.no_cache else load_cache()
+    fresh: dict[str, dict] = {}
+
     errors = []
-    for path in fixture_files:
-        try:
-            validate_fixture(path)
-        except Exception as exc:  # noqa: BLE001
-            errors.append(str(exc))
+    results: dict[str, list[str]] = {}
+    stale: list[str] = []
+    for key, summary in index.items():
+        if summary.error:
+            errors.append(summary.error)
+            continue
+        digest = hashlib.sha256((salt + summary.hash).encode()).hexdigest()
+        fresh[key] = {"hash": digest}
+        cached = cache.get(key)
+        if cached is not None and cached.get("hash") == digest:
+            results[key] = cached["warnings"]
+        else:
+            stale.append(key)
+
+    skipped = len(results)
+    checked = fixture_index.parallel_map(validate_or_error, [FIXTURES / key for key in stale], args.jobs)
+    for key, (warnings, error) in zip(stale, checked):
+        if error is not None:
+            errors.append(error)
+            del fresh[key]
+        else:
+            results[key] = warnings
+
+    for key in sorted(results):
+        fresh[key]["warnings"] = results[key]
+        for w in results[key]:
+            if args.strict:
+                errors.append(f"{key}: {w}")
+            else:
+                print(f"warning: {key}: {w}")
+
+    if not args.no_cache:
+        save_cache(fresh)
 
     if errors:
         print("Fixture validation failed:")
@@ -131,9 +318,9 @@ def main() -> int:
             print(f" - {e}")
         return 2
 
-    print(f"Validated {len(fixture_files)} fixtures successfully.")
+    print(f"Validated {len(index)} fixtures successfully ({skipped} unchanged, cached).")
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(main(sys.argv[1:]))